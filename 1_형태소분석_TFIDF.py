@@ -11,6 +11,7 @@ import logging
 from pathlib import Path
 from typing import Optional
 
+from corpus_storage import read_table
 from morphological_analysis import MorphologicalAnalyzer
 from tfidf_analysis import TFIDFAnalyzer, FrequencyAnalyzer
 
@@ -27,10 +28,11 @@ def load_data(csv_path: str,
               id_column: Optional[str] = None,
               encoding: str = 'utf-8') -> pd.DataFrame:
     """
-    CSV 파일에서 데이터 로드
+    CSV 또는 Parquet(corpus_storage 데이터셋)에서 데이터 로드
+    텍스트 / ID 컬럼만 읽어서 큰 말뭉치도 빠르게 로드
     
     Args:
-        csv_path: CSV 파일 경로
+        csv_path: CSV 파일, Parquet 파일 또는 Parquet 데이터셋 디렉토리 경로
         text_column: 텍스트 컬럼명
         id_column: ID 컬럼명
         encoding: 파일 인코딩
@@ -40,11 +42,13 @@ def load_data(csv_path: str,
     """
     logger.info(f"데이터 로딩 중: {csv_path}")
     
+    # 필요한 컬럼만 읽기 (나머지 컬럼은 파싱하지 않음)
+    columns = [text_column] + ([id_column] if id_column else [])
     try:
-        df = pd.read_csv(csv_path, encoding=encoding)
+        df = read_table(csv_path, columns=columns, encoding=encoding)
     except UnicodeDecodeError:
         logger.warning("UTF-8 인코딩 실패, cp949 시도 중...")
-        df = pd.read_csv(csv_path, encoding='cp949')
+        df = read_table(csv_path, columns=columns, encoding='cp949')
     
     if text_column not in df.columns:
         raise ValueError(f"텍스트 컬럼 '{text_column}'을 찾을 수 없습니다.")
@@ -70,7 +74,7 @@ def main():
     parser = argparse.ArgumentParser(description='형태소 분석 및 TF-IDF 분석 (실행 순서 1)')
     
     parser.add_argument('--input', type=str, required=True,
-                       help='입력 CSV 파일 경로')
+                       help='입력 CSV 파일 또는 Parquet 데이터셋 경로')
     parser.add_argument('--text_column', type=str, default='content',
                        help='텍스트 컬럼명 (기본값: content)')
     parser.add_argument('--id_column', type=str, default=None,
@@ -11,6 +11,9 @@ from typing import List, Dict, Tuple, Optional
 import logging
 from pathlib import Path
 
+from corpus_storage import read_table
+from near_duplicate import drop_near_duplicates
+
 # BERTopic 및 관련 라이브러리
 from bertopic import BERTopic
 from sentence_transformers import SentenceTransformer
@@ -63,10 +66,11 @@ def load_data(csv_path: str,
               id_column: Optional[str] = None,
               encoding: str = 'utf-8') -> pd.DataFrame:
     """
-    CSV 파일에서 데이터 로드
+    CSV 또는 Parquet(corpus_storage 데이터셋)에서 데이터 로드
+    텍스트 / ID 컬럼만 읽어서 큰 말뭉치도 빠르게 로드
     
     Args:
-        csv_path: CSV 파일 경로
+        csv_path: CSV 파일, Parquet 파일 또는 Parquet 데이터셋 디렉토리 경로
         text_column: 텍스트 컬럼명 (기본값: "content")
         id_column: ID 컬럼명 (None이면 인덱스 사용)
         encoding: 파일 인코딩 (기본값: 'utf-8')
@@ -76,13 +80,14 @@ def load_data(csv_path: str,
     """
     logger.info(f"데이터 로딩 중: {csv_path}")
     
-    # CSV 파일 읽기
+    # 필요한 컬럼만 읽기 (나머지 컬럼은 파싱하지 않음)
+    columns = [text_column] + ([id_column] if id_column else [])
     try:
-        df = pd.read_csv(csv_path, encoding=encoding)
+        df = read_table(csv_path, columns=columns, encoding=encoding)
     except UnicodeDecodeError:
         # UTF-8 실패 시 다른 인코딩 시도
         logger.warning("UTF-8 인코딩 실패, cp949 시도 중...")
-        df = pd.read_csv(csv_path, encoding='cp949')
+        df = read_table(csv_path, columns=columns, encoding='cp949')
     
     # 텍스트 컬럼 확인
     if text_column not in df.columns:
@@ -450,12 +455,13 @@ def main(csv_path: str,
         save_model: bool = False,
         load_model: Optional[str] = None,
         print_summary: bool = True,
-        top_n_topics: int = 10) -> Tuple[pd.DataFrame, pd.DataFrame]:
+        top_n_topics: int = 10,
+        dedup_threshold: Optional[float] = None) -> Tuple[pd.DataFrame, pd.DataFrame]:
     """
     전체 파이프라인 실행
     
     Args:
-        csv_path: 입력 CSV 파일 경로
+        csv_path: 입력 CSV 파일 또는 Parquet 데이터셋 경로
         text_column: 텍스트 컬럼명
         id_column: ID 컬럼명
         output_dir: 출력 디렉토리
@@ -464,6 +470,7 @@ def main(csv_path: str,
         load_model: 저장된 모델 로드 경로
         print_summary: 요약 정보 출력 여부
         top_n_topics: 출력할 상위 토픽 수
+        dedup_threshold: 근사 중복 제거 Jaccard 임계값 (None이면 제거 안 함)
     
     Returns:
         (df_topics, df_topic_info) 튜플
@@ -471,6 +478,10 @@ def main(csv_path: str,
     # 1. 데이터 로드
     df = load_data(csv_path, text_column=text_column, id_column=id_column)
     
+    # 재게시글/크로스포스트가 토픽을 왜곡하지 않도록 근사 중복 제거 (선택적)
+    if dedup_threshold is not None:
+        df, _ = drop_near_duplicates(df, text_column='content', threshold=dedup_threshold)
+    
     # 2. 클러스터링 실행
     model_path = None
     if save_model:
@@ -508,7 +519,7 @@ if __name__ == "__main__":
     
     parser = argparse.ArgumentParser(description='BERTopic 클러스터링 (실행 순서 3)')
     parser.add_argument('--input', type=str, required=True,
-                       help='입력 CSV 파일 경로')
+                       help='입력 CSV 파일 또는 Parquet 데이터셋 경로')
     parser.add_argument('--text_column', type=str, default='content',
                        help='텍스트 컬럼명 (기본값: content)')
     parser.add_argument('--id_column', type=str, default=None,
@@ -520,6 +531,8 @@ if __name__ == "__main__":
                        help='임베딩 모델 이름')
     parser.add_argument('--save_model', action='store_true',
                        help='모델 저장 여부')
+    parser.add_argument('--dedup_threshold', type=float, default=None,
+                       help='근사 중복 제거 Jaccard 임계값 (예: 0.8, 기본값: 제거 안 함)')
     
     args = parser.parse_args()
     
@@ -530,7 +543,8 @@ if __name__ == "__main__":
         id_column=args.id_column,
         output_dir=args.output_dir,
         embedding_model_name=args.embedding_model,
-        save_model=args.save_model
+        save_model=args.save_model,
+        dedup_threshold=args.dedup_threshold
     )
     
     print(f"\n클러스터링 완료! 결과는 {args.output_dir} 디렉토리에 저장되었습니다.")
@@ -17,6 +17,7 @@ from sentiment_analysis import SentimentAnalyzer
 from morphological_analysis import MorphologicalAnalyzer
 from tfidf_analysis import TFIDFAnalyzer, FrequencyAnalyzer
 from cam_visualization import CAMVisualizer
+from near_duplicate import drop_near_duplicates
 
 # BERTopic 클러스터링 모듈 import
 import sys
@@ -57,6 +58,8 @@ def main():
     parser.add_argument('--embedding_model', type=str, 
                        default='jhgan/ko-sroberta-multitask',
                        help='임베딩 모델 이름 (BERTopic용)')
+    parser.add_argument('--dedup_threshold', type=float, default=None,
+                       help='근사 중복 제거 Jaccard 임계값 (예: 0.8, 기본값: 제거 안 함)')
     
     args = parser.parse_args()
     
@@ -79,6 +82,11 @@ def main():
         df['id'] = df.index
     
     df = df.dropna(subset=[args.text_column])
+    
+    # 재게시글/크로스포스트 근사 중복 제거 (형태소 분석 / BERTopic 작업량 감소)
+    if args.dedup_threshold is not None:
+        df, _ = drop_near_duplicates(df, text_column=args.text_column, threshold=args.dedup_threshold)
+    
     texts = df[args.text_column].tolist()
     
     logger.info(f"데이터 로드 완료: {len(texts)}개 문서")
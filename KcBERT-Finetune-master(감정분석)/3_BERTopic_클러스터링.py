@@ -9,8 +9,13 @@ import pandas as pd
 import numpy as np
 from typing import List, Dict, Tuple, Optional
 import logging
+import sys
 from pathlib import Path
 
+# corpus_storage 는 저장소 루트 모듈 (이 폴더의 스크립트는 루트 분석 스크립트의 사본)
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+from corpus_storage import read_table  # noqa: E402
+
 # BERTopic 및 관련 라이브러리
 from bertopic import BERTopic
 from sentence_transformers import SentenceTransformer
@@ -63,10 +68,11 @@ def load_data(csv_path: str,
               id_column: Optional[str] = None,
               encoding: str = 'utf-8') -> pd.DataFrame:
     """
-    CSV 파일에서 데이터 로드
+    CSV 또는 Parquet(corpus_storage 데이터셋)에서 데이터 로드
+    텍스트 / ID 컬럼만 읽어서 큰 말뭉치도 빠르게 로드
     
     Args:
-        csv_path: CSV 파일 경로
+        csv_path: CSV 파일, Parquet 파일 또는 Parquet 데이터셋 디렉토리 경로
         text_column: 텍스트 컬럼명 (기본값: "content")
         id_column: ID 컬럼명 (None이면 인덱스 사용)
         encoding: 파일 인코딩 (기본값: 'utf-8')
@@ -76,13 +82,14 @@ def load_data(csv_path: str,
     """
     logger.info(f"데이터 로딩 중: {csv_path}")
     
-    # CSV 파일 읽기
+    # 필요한 컬럼만 읽기 (나머지 컬럼은 파싱하지 않음)
+    columns = [text_column] + ([id_column] if id_column else [])
     try:
-        df = pd.read_csv(csv_path, encoding=encoding)
+        df = read_table(csv_path, columns=columns, encoding=encoding)
     except UnicodeDecodeError:
         # UTF-8 실패 시 다른 인코딩 시도
         logger.warning("UTF-8 인코딩 실패, cp949 시도 중...")
-        df = pd.read_csv(csv_path, encoding='cp949')
+        df = read_table(csv_path, columns=columns, encoding='cp949')
     
     # 텍스트 컬럼 확인
     if text_column not in df.columns:
@@ -455,7 +462,7 @@ def main(csv_path: str,
     전체 파이프라인 실행
     
     Args:
-        csv_path: 입력 CSV 파일 경로
+        csv_path: 입력 CSV 파일 또는 Parquet 데이터셋 경로
         text_column: 텍스트 컬럼명
         id_column: ID 컬럼명
         output_dir: 출력 디렉토리
@@ -508,7 +515,7 @@ if __name__ == "__main__":
     
     parser = argparse.ArgumentParser(description='BERTopic 클러스터링 (실행 순서 3)')
     parser.add_argument('--input', type=str, required=True,
-                       help='입력 CSV 파일 경로')
+                       help='입력 CSV 파일 또는 Parquet 데이터셋 경로')
     parser.add_argument('--text_column', type=str, default='content',
                        help='텍스트 컬럼명 (기본값: content)')
     parser.add_argument('--id_column', type=str, default=None,
@@ -8,9 +8,13 @@ CSV 파일을 입력받아 KcELECTRA 모델로 감정분석을 수행합니다.
 import pandas as pd
 import argparse
 import logging
+import sys
 from pathlib import Path
 from typing import Optional
 
+# corpus_storage 는 저장소 루트 모듈 (이 폴더의 스크립트는 루트 분석 스크립트의 사본)
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+from corpus_storage import read_table  # noqa: E402
 from sentiment_analysis import SentimentAnalyzer
 
 # 로깅 설정
@@ -26,10 +30,11 @@ def load_data(csv_path: str,
               id_column: Optional[str] = None,
               encoding: str = 'utf-8') -> pd.DataFrame:
     """
-    CSV 파일에서 데이터 로드
+    CSV 또는 Parquet(corpus_storage 데이터셋)에서 데이터 로드
+    텍스트 / ID 컬럼만 읽어서 큰 말뭉치도 빠르게 로드
     
     Args:
-        csv_path: CSV 파일 경로
+        csv_path: CSV 파일, Parquet 파일 또는 Parquet 데이터셋 디렉토리 경로
         text_column: 텍스트 컬럼명
         id_column: ID 컬럼명
         encoding: 파일 인코딩
@@ -39,11 +44,13 @@ def load_data(csv_path: str,
     """
     logger.info(f"데이터 로딩 중: {csv_path}")
     
+    # 필요한 컬럼만 읽기 (나머지 컬럼은 파싱하지 않음)
+    columns = [text_column] + ([id_column] if id_column else [])
     try:
-        df = pd.read_csv(csv_path, encoding=encoding)
+        df = read_table(csv_path, columns=columns, encoding=encoding)
     except UnicodeDecodeError:
         logger.warning("UTF-8 인코딩 실패, cp949 시도 중...")
-        df = pd.read_csv(csv_path, encoding='cp949')
+        df = read_table(csv_path, columns=columns, encoding='cp949')
     
     if text_column not in df.columns:
         raise ValueError(f"텍스트 컬럼 '{text_column}'을 찾을 수 없습니다.")
@@ -69,7 +76,7 @@ def main():
     parser = argparse.ArgumentParser(description='감정분석 (실행 순서 4)')
     
     parser.add_argument('--input', type=str, required=True,
-                       help='입력 CSV 파일 경로')
+                       help='입력 CSV 파일 또는 Parquet 데이터셋 경로')
     parser.add_argument('--text_column', type=str, default='content',
                        help='텍스트 컬럼명 (기본값: content)')
     parser.add_argument('--id_column', type=str, default=None,
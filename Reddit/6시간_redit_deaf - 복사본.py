@@ -1,16 +1,12 @@
-import requests
 import pandas as pd  # pyright: ignore[reportMissingImports]
 from datetime import datetime
 import time
 import os
-import json
- 
-BASE_URL = "https://www.reddit.com"
- 
-# Reddit 권장 형태: 자기용도 + Reddit 계정명 같이 써주면 좋음
-HEADERS = {
-    "User-Agent": "MyRedditResearchScript/0.1 by u_yourusername"
-}
+import argparse
+
+from crawl_state import CrawlStateStore, find_dataset_csvs
+from reddit_client import BASE_URL, get_json
+from reddit_comments import fetch_post_comments
  
 # 서브레딧 크롤링 설정
 SUBREDDIT = "deaf"  # r/hardofhearing
@@ -30,62 +26,24 @@ SLEEP_SEC = 3.0            # 요청 간 기본 딜레이(초) - 레이트 리밋
 COMMENT_SLEEP_SEC = 3.0    # 댓글 수집 간 딜레이(초) - 429 방지
  
 MAX_RETRIES_429 = 5        # 429 나왔을 때 재시도 최대 횟수 증가
+STATE_DB = "reddit_crawl_state.db"  # 커서/수집 ID/토큰 진행 상황 저장소 (재시작 시 이어서 수집)
  
  
 def fetch_comments(post_permalink, max_retries=3):
     """게시글의 댓글을 가져오는 함수 (429 에러 처리 포함)"""
-    for attempt in range(max_retries):
-        try:
-            comment_url = f"{BASE_URL}{post_permalink}.json"
-            res = requests.get(comment_url, headers=HEADERS, timeout=15)
-            
-            if res.status_code == 429:
-                # 429 에러 시 더 긴 대기
-                wait_time = COMMENT_SLEEP_SEC * (2 ** attempt) + 10  # 최소 10초 추가
-                time.sleep(wait_time)
-                if attempt < max_retries - 1:
-                    continue
-                else:
-                    return ""  # 최대 재시도 횟수 초과
-            elif res.status_code != 200:
-                return ""
-            
-            # JSON 디코딩 에러 방지
-            try:
-                if not res.text or not res.text.strip():
-                    if attempt < max_retries - 1:
-                        time.sleep(COMMENT_SLEEP_SEC)
-                        continue
-                    return ""
-                data = res.json()
-            except json.JSONDecodeError as e:
-                print(f"  JSON 디코딩 실패 (응답 길이: {len(res.text)}): {str(e)[:100]}")
-                if attempt < max_retries - 1:
-                    time.sleep(COMMENT_SLEEP_SEC * (attempt + 1))
-                    continue
-                return ""
-            if len(data) < 2:
-                return ""
-            
-            # 두 번째 항목이 댓글 리스트
-            comments_data = data[1].get("data", {}).get("children", [])
-            comments_text = []
-            
-            for comment_item in comments_data:
-                if comment_item.get("kind") == "more":
-                    continue
-                comment_data = comment_item.get("data", {})
-                body = comment_data.get("body", "").strip()
-                if body:
-                    comments_text.append(body)
-            
-            return "\n\n".join(comments_text) if comments_text else ""
-        except Exception as e:
-            if attempt < max_retries - 1:
-                time.sleep(COMMENT_SLEEP_SEC * (attempt + 1))
-                continue
-            return ""
-    return ""
+    # 공유 세션(keep-alive) + 429 백오프 + 빈 응답/JSON 오류 재시도는 reddit_client 에서 처리
+    # 대댓글과 "more" 스텁에 숨은 댓글까지 트리 순서대로 수집 (reddit_comments)
+    comments = fetch_post_comments(
+        post_permalink,
+        max_retries=max_retries,
+        backoff_sec=COMMENT_SLEEP_SEC,
+        extra_wait=10,  # 429 에러 시 최소 10초 추가
+    )
+    if not comments:
+        return ""
+
+    comments_text = [c["body"].strip() for c in comments if c["body"].strip()]
+    return "\n\n".join(comments_text) if comments_text else ""
 
 
 def fetch_subreddit_with_backoff(subreddit, sort_type="new", max_pages=25, sleep_sec=2.0):
@@ -99,34 +57,25 @@ def fetch_subreddit_with_backoff(subreddit, sort_type="new", max_pages=25, sleep
     url = f"{BASE_URL}/r/{subreddit}/{sort_type}.json"
  
     for page in range(max_pages):
-        for attempt in range(MAX_RETRIES_429):
-            params = {
-                "limit": 100,
-            }
-            if after:
-                params["after"] = after
- 
-            print(f"[r/{subreddit}/{sort_type}] PAGE {page+1}, attempt {attempt+1} 요청 중...")
-            res = requests.get(url, headers=HEADERS, params=params)
- 
-            if res.status_code == 429:
-                # Too Many Requests → 지수 백오프
-                wait_time = sleep_sec * (2 ** attempt)
-                print(f"  > 429 (레이트리밋). {wait_time}초 대기 후 재시도.")
-                time.sleep(wait_time)
-                continue  # 같은 page 다시 시도
-            elif res.status_code != 200:
-                print(f"  > 요청 실패: {res.status_code}, 이 쿼리 중단.")
-                return all_rows
-            else:
-                # 정상 응답
-                break
-        else:
-            # MAX_RETRIES_429 번 모두 429면 이 쿼리는 더 진행 안 함
-            print("  > 429가 계속 발생해서 이 쿼리는 더 이상 진행 안 함.")
+        params = {
+            "limit": 100,
+        }
+        if after:
+            params["after"] = after
+ 
+        print(f"[r/{subreddit}/{sort_type}] PAGE {page+1} 요청 중...")
+        body = get_json(
+            url,
+            params=params,
+            max_retries=MAX_RETRIES_429,
+            backoff_sec=sleep_sec,
+            label=f"[r/{subreddit}/{sort_type}]",
+        )
+        if body is None:
+            print("  > 요청 실패 또는 429 반복, 이 쿼리 중단.")
             return all_rows
  
-        data = res.json().get("data", {})
+        data = body.get("data", {})
         children = data.get("children", [])
         if not children:
             print("  > 더 이상 결과 없음 (children 비어있음).")
@@ -187,11 +136,13 @@ def fetch_subreddit_many_by_tokens(
     max_pages_per_token=25,
     sleep_sec=2.0,
     output_filename=None,
+    state_path=STATE_DB,
 ):
     """
     여러 토큰으로 서브레딧 게시글을 수집 (토큰마다 연속적으로 크롤링하여 더 많은 결과 수집).
     429를 고려해서 살살 수집하는 버전.
-    토큰마다 중간 저장을 수행하여 중단되어도 데이터 손실 방지.
+    토큰마다 중간 저장 + 상태 저장소(SQLite) 커밋을 수행하여,
+    중단 후 재시작하면 마지막 after 커서 / 수집 ID / 완료 토큰부터 바로 이어서 수집.
     """
     if sub_tokens is None:
         sub_tokens = [""]
@@ -204,20 +155,34 @@ def fetch_subreddit_many_by_tokens(
     print(f"총 예상 페이지: {len(sub_tokens)} × {max_pages_per_token} = {len(sub_tokens) * max_pages_per_token}페이지\n")
     print(f"중간 저장 파일: {output_filename}\n")
  
+    state = CrawlStateStore(state_path)
+    # 지난 실행이 CSV append 후 커밋 전에 죽었다면 커밋 안 된 꼬리를 잘라냄
+    truncated = state.recover_output(output_filename)
+    if truncated:
+        print(f"  커밋되지 않은 중간 저장분 {truncated}바이트 정리 완료")
+ 
     all_rows = []
-    seen_post_ids = set()
-    global_after = None  # 전역 after 토큰으로 연속 크롤링
+    global_after = state.get_cursor(subreddit, sort_type)  # 전역 after 토큰으로 연속 크롤링 (재시작 시 이어서)
+    if global_after:
+        print(f"[r/{subreddit}] 이전 실행에서 이어서 시작: after={global_after}, 기존 수집 키 {state.count_seen_posts(subreddit):,}개")
+
+    def is_seen(pid, url):
+        return state.is_seen(subreddit, pid) or state.is_seen(subreddit, url)
  
     for token_idx, token in enumerate(sub_tokens):
         token_label = f"토큰 '{token}'" if token else "전체 최신순"
+        if state.is_token_done(subreddit, sort_type, token):
+            print(f"[r/{subreddit}] {token_label} 은 이전 실행에서 완료됨 → 건너뜀")
+            continue
         print(f"\n[r/{subreddit}] {token_label} 실행 ({token_idx+1}/{len(sub_tokens)})")
  
-        rows, last_after = fetch_subreddit_with_backoff_continuation(
+        rows, last_after, _ = fetch_subreddit_with_backoff_continuation(
             subreddit,
             sort_type=sort_type,
             max_pages=max_pages_per_token,
             start_after=global_after,  # 이전 토큰의 마지막 위치에서 이어서 시작
             sleep_sec=sleep_sec,
+            is_seen=is_seen,  # 이미 수집한 게시글은 댓글 요청도 건너뜀
         )
         
         global_after = last_after  # 다음 토큰을 위한 after 업데이트
@@ -225,14 +190,15 @@ def fetch_subreddit_many_by_tokens(
         new_count = 0
         duplicate_count = 0  # 중복으로 제외된 게시글 수
         new_rows_for_save = []
+        pending_keys = set()  # 이번 토큰 안에서의 중복 (아직 커밋 전)
         
         for r in rows:
             pid = r.get("post_id")
             url = r.get("url", "")
             # post_id와 url 둘 다 체크하여 중복 방지
-            if pid and str(pid) not in seen_post_ids and url not in seen_post_ids:
-                seen_post_ids.add(str(pid))
-                seen_post_ids.add(url)
+            if pid and str(pid) not in pending_keys and url not in pending_keys and not is_seen(pid, url):
+                pending_keys.add(str(pid))
+                pending_keys.add(url)
                 all_rows.append(r)
                 new_rows_for_save.append(r)
                 new_count += 1
@@ -245,12 +211,12 @@ def fetch_subreddit_many_by_tokens(
         print(f"  - 신규 수집: {new_count}개")
         print(f"  - 누적: {len(all_rows)}개")
         
-        # 토큰마다 중간 저장 (new3.csv에 새로 수집한 데이터만 저장, new2.csv는 절대 훼손하지 않음)
+        # 토큰마다 중간 저장 (이번 실행에서 새로 수집한 데이터만 append)
         if new_rows_for_save:
             try:
                 new_df = pd.DataFrame(new_rows_for_save)
                 # 헤더는 첫 저장 시만, 이후는 append
-                file_exists = os.path.exists(output_filename)
+                file_exists = os.path.exists(output_filename) and os.path.getsize(output_filename) > 0
                 new_df.to_csv(
                     output_filename,
                     mode="a" if file_exists else "w",
@@ -260,31 +226,31 @@ def fetch_subreddit_many_by_tokens(
                 )
                 print(f"  중간 저장 완료: {output_filename} (추가 {len(new_rows_for_save)}개, 누적: {len(all_rows)}개)")
             except Exception as e:
+                # 저장 실패 시 커밋하지 않음 → 재시작하면 이 토큰부터 다시 수집
                 print(f"  중간 저장 실패 (무시하고 계속): {e}")
+                time.sleep(sleep_sec)
+                continue
+ 
+        # CSV append 직후 상태 커밋 (seen 등록 + 커서 + 토큰 완료 + 파일 크기)
+        state.commit_token(subreddit, sort_type, token, new_rows_for_save, last_after, output_path=output_filename)
  
         # 토큰 사이에도 살짝 쉬어주기
         time.sleep(sleep_sec)
  
-    # 최종 저장 (new3.csv에 새로 수집한 데이터만 저장, new2.csv는 절대 훼손하지 않음)
-    try:
-        if all_rows:
-            final_df = pd.DataFrame(all_rows)
-            if "url" in final_df.columns:
-                final_df = final_df.drop_duplicates(subset=["url"])
-            # new3.csv에 새로 수집한 데이터만 저장 (기존 데이터는 포함하지 않음)
-            final_df.to_csv(output_filename, index=False, encoding="utf-8-sig")
-            print(f"\n최종 저장 완료: {output_filename} (새로 수집한 데이터 {len(final_df):,}개)")
-    except Exception as e:
-        print(f"\n최종 저장 실패: {e}")
- 
+    state.close()
+    print(f"\n최종 저장 완료: {output_filename} (이번 실행에서 새로 수집한 데이터 {len(all_rows):,}개)")
     print(f"\n[r/{subreddit}] 최종 수집 개수: {len(all_rows):,}개\n")
     return all_rows
  
  
-def fetch_subreddit_with_backoff_continuation(subreddit, sort_type="new", max_pages=25, start_after=None, sleep_sec=2.0):
+def fetch_subreddit_with_backoff_continuation(subreddit, sort_type="new", max_pages=25, start_after=None, sleep_sec=2.0, is_seen=None, stop_at_utc=None):
     """
     /r/{subreddit}/{sort}.json 에서 게시글을 페이징하면서 수집 (이전 위치에서 이어서 시작 가능).
     429(Too Many Requests) 나오면 지수 백오프로 잠깐 기다렸다가 재시도.
+    is_seen(post_id, url) 이 True 인 게시글은 댓글 요청 없이 건너뜀.
+    stop_at_utc 를 주면 created_utc 가 그 이하인 게시글을 만나는 순간 페이징 중단 (증분 모드).
+    반환값 (행 리스트, 마지막 after, complete) - complete 는 stop_at_utc 또는 목록 끝까지 닿았는지
+    (요청 실패 / max_pages 소진으로 멈추면 False).
     """
     all_rows = []
     after = start_after  # 이전 위치에서 시작
@@ -292,59 +258,30 @@ def fetch_subreddit_with_backoff_continuation(subreddit, sort_type="new", max_pa
     url = f"{BASE_URL}/r/{subreddit}/{sort_type}.json"
  
     for page in range(max_pages):
-        for attempt in range(MAX_RETRIES_429):
-            params = {
-                "limit": 100,
-            }
-            if after:
-                params["after"] = after
- 
-            print(f"[r/{subreddit}/{sort_type}] PAGE {page+1}, attempt {attempt+1} 요청 중...")
-            res = requests.get(url, headers=HEADERS, params=params)
- 
-            if res.status_code == 429:
-                # Too Many Requests → 지수 백오프 (더 긴 대기)
-                wait_time = sleep_sec * (2 ** attempt) + 15  # 최소 15초 추가
-                print(f"  > 429 (레이트리밋). {wait_time}초 대기 후 재시도...")
-                time.sleep(wait_time)
-                continue  # 같은 page 다시 시도
-            elif res.status_code != 200:
-                print(f"  > 요청 실패: {res.status_code}, 이 쿼리 중단.")
-                return all_rows, after
-            else:
-                # 정상 응답 - JSON 디코딩 확인
-                try:
-                    if not res.text or not res.text.strip():
-                        print(f"  > 빈 응답 수신. 재시도...")
-                        time.sleep(sleep_sec)
-                        continue
-                    # JSON 파싱 시도
-                    res.json()  # 유효성 확인만
-                    break
-                except json.JSONDecodeError as e:
-                    print(f"  > JSON 디코딩 실패 (응답 길이: {len(res.text)}): {str(e)[:100]}")
-                    if attempt < MAX_RETRIES_429 - 1:
-                        time.sleep(sleep_sec * (attempt + 1))
-                        continue
-                    else:
-                        print(f"  > JSON 디코딩 실패로 인한 중단.")
-                        return all_rows, after
-        else:
-            # MAX_RETRIES_429 번 모두 429면 더 긴 대기 후 계속 진행
-            print(f"  > 429가 {MAX_RETRIES_429}번 연속 발생. 120초 대기 후 계속 진행...")
-            time.sleep(120)  # 2분 대기
-            # 중단하지 않고 계속 진행
+        params = {
+            "limit": 100,
+        }
+        if after:
+            params["after"] = after
+ 
+        print(f"[r/{subreddit}/{sort_type}] PAGE {page+1} 요청 중...")
+        body = get_json(
+            url,
+            params=params,
+            max_retries=MAX_RETRIES_429,
+            backoff_sec=sleep_sec,
+            extra_wait=15,  # 429 시 최소 15초 추가
+            label=f"[r/{subreddit}/{sort_type}]",
+        )
+        if body is None:
+            print("  > 요청 실패 또는 429 반복, 이 쿼리 중단.")
+            return all_rows, after, False
  
-        # JSON 파싱 (위에서 유효성 확인 완료)
-        try:
-            data = res.json().get("data", {})
-        except json.JSONDecodeError as e:
-            print(f"  > JSON 파싱 중 에러: {str(e)[:100]}")
-            break  # 이 페이지는 건너뛰고 다음으로
+        data = body.get("data", {})
         children = data.get("children", [])
         if not children:
             print("  > 더 이상 결과 없음 (children 비어있음).")
-            break
+            return all_rows, after, True
 
         for c in children:
             d = c.get("data", {})
@@ -355,6 +292,15 @@ def fetch_subreddit_with_backoff_continuation(subreddit, sort_type="new", max_pa
             created = d.get("created_utc", None)
             permalink = d.get("permalink", "")
 
+            # sort=new 이므로 watermark 이하 게시글부터는 전부 이전에 수집한 구간
+            if stop_at_utc is not None and created is not None and created <= stop_at_utc:
+                print(f"  > watermark({datetime.utcfromtimestamp(stop_at_utc)}) 도달 → 페이징 중단.")
+                return all_rows, after, True
+
+            # 이미 수집한 게시글이면 댓글 요청 없이 건너뜀 (재시작 시 중복 요청 방지)
+            if is_seen is not None and is_seen(post_id, BASE_URL + permalink):
+                continue
+
             if created is not None:
                 date_str = datetime.utcfromtimestamp(created).strftime("%Y-%m-%d %H:%M:%S")
             else:
@@ -387,24 +333,121 @@ def fetch_subreddit_with_backoff_continuation(subreddit, sort_type="new", max_pa
         after = data.get("after")
         if not after:
             print("  > after 토큰 없음 → 마지막 페이지.")
-            break
+            return all_rows, after, True
 
         time.sleep(sleep_sec)
 
-    return all_rows, after
+    return all_rows, after, False
+
+
+def fetch_subreddit_incremental(
+    subreddit,
+    sort_type="new",
+    max_pages=25,
+    sleep_sec=2.0,
+    output_filename=None,
+    state_path=STATE_DB,
+    seed_files=None,
+):
+    """
+    증분 모드: 지난 실행 이후 새로 올라온 게시글만 수집해서 output_filename 에 이어 붙임.
+    서브레딧/정렬별 created_utc watermark 에 닿으면 페이징을 멈추므로 보통 요청 몇 번이면 끝난다.
+    watermark 가 없으면 output_filename + seed_files(기본: 데이터_레딧/ 스냅샷)로 초기화.
+    """
+    if output_filename is None:
+        output_filename = f"reddit_{subreddit}_subreddit_{sort_type}.csv"
+    if seed_files is None:
+        seed_files = find_dataset_csvs(subreddit)
+
+    scope = f"r/{subreddit}/{sort_type}"
+    state = CrawlStateStore(state_path)
+    truncated = state.recover_output(output_filename)
+    if truncated:
+        print(f"  커밋되지 않은 중간 저장분 {truncated}바이트 정리 완료")
+
+    watermark = state.get_watermark(scope)
+    if watermark is None:
+        for path in [output_filename] + list(seed_files):
+            if not os.path.exists(path) or os.path.getsize(path) == 0:
+                continue
+            try:
+                existing = pd.read_csv(path, usecols=lambda c: c in ("post_id", "url", "date"), dtype=str)
+            except pd.errors.EmptyDataError:  # 헤더도 없는 빈 스냅샷
+                continue
+            watermark = state.seed_watermark(scope, subreddit, existing.to_dict("records"))
+            print(f"[r/{subreddit}] 기존 데이터로 watermark 초기화: {os.path.basename(path)} ({len(existing):,}행)")
+    if not watermark:
+        print(f"[r/{subreddit}] watermark 없음 → 최대 {max_pages}페이지까지 전체 수집")
+    else:
+        print(f"[r/{subreddit}] watermark: {datetime.utcfromtimestamp(watermark)} (UTC) 이후 게시글만 수집")
+
+    rows, _, complete = fetch_subreddit_with_backoff_continuation(
+        subreddit,
+        sort_type=sort_type,
+        max_pages=max_pages,
+        sleep_sec=sleep_sec,
+        is_seen=lambda pid, url: state.is_seen(subreddit, pid) or state.is_seen(subreddit, url),
+        stop_at_utc=watermark,
+    )
+
+    # 페이지 경계에서 같은 게시글이 두 번 나올 수 있어서 한 번 더 정리
+    new_rows = list({r["url"]: r for r in rows}.values())
+    if new_rows:
+        file_exists = os.path.exists(output_filename) and os.path.getsize(output_filename) > 0
+        pd.DataFrame(new_rows).to_csv(
+            output_filename,
+            mode="a" if file_exists else "w",
+            header=not file_exists,
+            index=False,
+            encoding="utf-8-sig"
+        )
+    # watermark 는 이전 watermark(또는 목록 끝)까지 다 본 경우에만 올림
+    # → 요청 실패 / max_pages 로 중간에 멈추면 그대로 두고, 다음 실행에서 위부터 다시 훑으며
+    #   이번에 저장한 게시글은 seen 으로 건너뛰고 빠진 구간만 수집
+    state.commit_incremental(scope, subreddit, new_rows, output_path=output_filename, advance_watermark=complete)
+    if not complete and watermark is None:
+        # 첫 전체 수집이 중간에 멈춤 → 0 을 기록해서 다음 실행이 이 불완전한 CSV 로 watermark 를 초기화하지 않게 함
+        state.set_watermark(scope, 0.0)
+    new_watermark = state.get_watermark(scope)
+    state.close()
+
+    print(f"\n[r/{subreddit}] 증분 수집 완료: 신규 {len(new_rows):,}개 → {output_filename}")
+    if new_watermark is not None:
+        print(f"  watermark: {datetime.utcfromtimestamp(new_watermark)} (UTC)")
+    if not complete:
+        print("  ⚠️ 이전 watermark 까지 닿지 못해 watermark 를 그대로 둡니다 (다음 실행에서 빠진 구간을 이어서 수집)")
+    return new_rows
 
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=f"r/{SUBREDDIT} 서브레딧 크롤러")
+    parser.add_argument("--incremental", action="store_true",
+                        help="지난 실행 이후(created_utc watermark) 새 게시글만 수집해서 기존 CSV 에 이어 붙임")
+    parser.add_argument("--rate", type=float,
+                        help="초당 요청 수 - 주면 SLEEP_SEC / COMMENT_SLEEP_SEC 를 모두 1/rate 초로 (crawl_orchestrator 도메인 예산)")
+    args = parser.parse_args()
+    if args.rate:
+        SLEEP_SEC = COMMENT_SLEEP_SEC = 1 / args.rate
+
     output_name = f"reddit_{SUBREDDIT}_subreddit_deaf_26.csv"
     
-    all_data = fetch_subreddit_many_by_tokens(
-        SUBREDDIT,
-        sort_type=SORT_TYPE,
-        sub_tokens=SUB_TOKENS,
-        max_pages_per_token=MAX_PAGES_PER_TOKEN,
-        sleep_sec=SLEEP_SEC,
-        output_filename=output_name,  # 중간 저장 파일명 전달
-    )
+    if args.incremental:
+        all_data = fetch_subreddit_incremental(
+            SUBREDDIT,
+            sort_type=SORT_TYPE,
+            max_pages=MAX_PAGES_PER_TOKEN,
+            sleep_sec=SLEEP_SEC,
+            output_filename=output_name,
+        )
+    else:
+        all_data = fetch_subreddit_many_by_tokens(
+            SUBREDDIT,
+            sort_type=SORT_TYPE,
+            sub_tokens=SUB_TOKENS,
+            max_pages_per_token=MAX_PAGES_PER_TOKEN,
+            sleep_sec=SLEEP_SEC,
+            output_filename=output_name,  # 중간 저장 파일명 전달
+        )
     
     # 최종 결과 출력
     df = pd.DataFrame(all_data)
@@ -0,0 +1,60 @@
+"""
+비동기 Reddit 수집기 처리량 벤치마크 (오프라인, 가짜 서버 사용)
+
+동시성 1(기존 순차 수집과 동일한 흐름)과 동시성 N 을 같은 가짜 서버에 돌려
+소요 시간 / 초당 요청 수를 비교하고, 두 결과 행이 동일한지 확인한다.
+
+실행:
+    python bench_reddit_async.py --concurrency 8 --latency 0.05
+"""
+import argparse
+import asyncio
+import time
+
+from mock_reddit_server import start_mock_server
+from reddit_async import collect_keywords
+
+
+def run_once(base_url, keywords, sub_tokens, pages, concurrency):
+    start = time.perf_counter()
+    rows = asyncio.run(collect_keywords(
+        keywords,
+        sub_tokens,
+        max_pages_per_subquery=pages,
+        concurrency=concurrency,
+        rate=1000.0,   # 벤치마크에선 버킷이 병목이 되지 않도록 충분히 크게
+        burst=concurrency,
+        base_url=base_url,
+    ))
+    elapsed = time.perf_counter() - start
+    return rows, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="비동기 Reddit 수집기 벤치마크")
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--latency", type=float, default=0.05, help="가짜 서버 요청당 지연(초)")
+    parser.add_argument("--pages", type=int, default=3, help="서브쿼리당 페이지 수")
+    args = parser.parse_args()
+
+    keywords = ["deaf", "misheard"]
+    sub_tokens = ["", "a", "e", "i", "o", "u"]
+    n_requests = len(keywords) * len(sub_tokens) * args.pages
+
+    server, base_url = start_mock_server(latency=args.latency, pages=args.pages)
+    try:
+        serial_rows, serial_sec = run_once(base_url, keywords, sub_tokens, args.pages, 1)
+        async_rows, async_sec = run_once(base_url, keywords, sub_tokens, args.pages, args.concurrency)
+    finally:
+        server.shutdown()
+
+    print("\n========== 벤치마크 결과 ==========")
+    print(f"요청 수: {n_requests}, 서버 지연: {args.latency}초")
+    print(f"동시성 1 : {serial_sec:.2f}초 ({n_requests / serial_sec:.1f} req/s)")
+    print(f"동시성 {args.concurrency} : {async_sec:.2f}초 ({n_requests / async_sec:.1f} req/s)")
+    print(f"속도 향상: {serial_sec / async_sec:.1f}배")
+    print(f"결과 행 동일 여부: {serial_rows == async_rows} ({len(async_rows)}행)")
+
+
+if __name__ == "__main__":
+    main()
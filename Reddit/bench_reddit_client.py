@@ -0,0 +1,57 @@
+"""
+공유 Session(reddit_client) vs 매번 requests.get 마이크로 벤치마크 (오프라인, 가짜 서버 사용)
+
+같은 가짜 Reddit 서버에 동일한 요청을 순차로 보내서 초당 요청 수를 비교한다.
+로컬 스텁은 TLS 가 없으므로 실제 reddit.com 에서는 핸드셰이크 비용만큼 차이가 더 커진다.
+
+실행:
+    python bench_reddit_client.py --requests 300
+"""
+import argparse
+import time
+
+import requests
+
+from mock_reddit_server import start_mock_server
+from reddit_client import HEADERS, create_session
+
+
+def bench(label, fetch, n_requests):
+    start = time.perf_counter()
+    for i in range(n_requests):
+        res = fetch(i)
+        res.raise_for_status()
+        res.json()
+    elapsed = time.perf_counter() - start
+    print(f"{label:<22}: {elapsed:.2f}초 ({n_requests / elapsed:.1f} req/s)")
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Reddit 공용 클라이언트 벤치마크")
+    parser.add_argument("--requests", type=int, default=300)
+    parser.add_argument("--latency", type=float, default=0.0, help="가짜 서버 요청당 지연(초)")
+    args = parser.parse_args()
+
+    server, base_url = start_mock_server(latency=args.latency)
+    url = f"{base_url}/search.json"
+    try:
+        before = bench(
+            "requests.get (기존)",
+            lambda i: requests.get(url, headers=HEADERS, params={"q": f"q{i % 10}", "limit": 25}),
+            args.requests,
+        )
+        session = create_session()
+        after = bench(
+            "공유 Session (신규)",
+            lambda i: session.get(url, params={"q": f"q{i % 10}", "limit": 25}),
+            args.requests,
+        )
+    finally:
+        server.shutdown()
+
+    print(f"속도 향상: {before / after:.2f}배")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""
+번역 엔진 비교 벤치마크 (translation_backends)
+
+같은 원문 묶음을 엔진별로 번역해서 처리량(문서/초, 글자/초)과 실패 수를 비교하고
+첫 문서 번역 결과를 나란히 출력한다. 캐시는 쓰지 않는다.
+
+- fake   : 네트워크 없는 기준선 (--fake_latency 로 요청당 지연 흉내)
+- local  : --local_model 로 지정한 MarianMT / NLLB 체크포인트 (CPU 코어로 배치 추론)
+- gemini / google : 실제 API 호출 (요금 / 레이트리밋 주의)
+
+실행:
+    python bench_translators.py --engines fake local --local_model models/opus-mt-tc-big-en-ko --rows 200
+    python bench_translators.py --input 한글화.csv --engines local gemini --rows 50
+"""
+import argparse
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+
+from batch_translate import pack_batches
+from translation_backends import ENGINES, create_translator
+
+
+def sample_texts(input_path, column, rows):
+    if input_path:
+        df = pd.read_csv(input_path, usecols=[column])
+        texts = [t for t in df[column].dropna().astype(str) if t.strip()]
+        return texts[:rows]
+    short = "I can't hear my coworkers in meetings. Does anyone use live captions at work?"
+    long_post = "\n\n".join(
+        "I was diagnosed with moderate hearing loss last year. My audiologist suggested hearing aids, "
+        "but I'm worried about the cost and whether they will help with tinnitus." for _ in range(4)
+    )
+    return [long_post if i % 10 == 0 else short for i in range(rows)]
+
+
+def bench(name, translator, texts, concurrency):
+    tasks = pack_batches(list(enumerate(texts)), translator.max_batch_tokens, len(texts))
+    outputs = [""] * len(texts)
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        results = executor.map(lambda rows: translator.translate_batch([t for _, t in rows]), tasks)
+        for rows, translated in zip(tasks, results):
+            for (i, _), out in zip(rows, translated):
+                outputs[i] = out
+    elapsed = time.perf_counter() - start
+    chars = sum(len(t) for t in texts)
+    failed = sum(1 for out in outputs if not out)
+    print(f"{name:<8} {elapsed:>8.2f} {len(texts) / elapsed:>10.2f} {chars / elapsed:>11.0f} "
+          f"{failed:>6} {concurrency:>6}")
+    return outputs
+
+
+def main():
+    parser = argparse.ArgumentParser(description="번역 엔진 비교 벤치마크")
+    parser.add_argument("--engines", nargs="+", choices=ENGINES, default=["fake"], help="비교할 엔진")
+    parser.add_argument("--input", default=None, help="원문 CSV (없으면 가짜 게시글 사용)")
+    parser.add_argument("--column", default="content", help="원문 컬럼명")
+    parser.add_argument("--rows", type=int, default=100, help="번역할 문서 수")
+    parser.add_argument("--local_model", default=None, help="local 엔진 체크포인트 디렉토리")
+    parser.add_argument("--num_threads", type=int, default=None, help="local 엔진 torch CPU 스레드 수")
+    parser.add_argument("--fake_latency", type=float, default=0.3, help="fake 엔진 요청당 지연(초)")
+    parser.add_argument("--concurrency", type=int, default=None, help="워커 수 (기본값: 엔진 권장값)")
+    args = parser.parse_args()
+
+    texts = sample_texts(args.input, args.column, args.rows)
+    print(f"문서 {len(texts)}개, 총 {sum(len(t) for t in texts):,}자\n")
+
+    engine_kwargs = {
+        "fake": {"latency": args.fake_latency},
+        "local": {"model_path": args.local_model, "num_threads": args.num_threads},
+    }
+    samples = {}
+    print(f"{'엔진':<8} {'시간(초)':>8} {'문서/초':>10} {'글자/초':>11} {'실패':>6} {'워커':>6}")
+    for name in args.engines:
+        if name == "local" and not args.local_model:
+            print(f"{name:<8} --local_model 이 없어 건너뜀")
+            continue
+        translator = create_translator(name, **engine_kwargs.get(name, {}))
+        outputs = bench(name, translator, texts, args.concurrency or translator.max_concurrency)
+        samples[translator.engine] = outputs[0]
+
+    print("\n========== 첫 문서 번역 비교 ==========")
+    print(f"[원문]\n{texts[0][:300]}\n")
+    for engine, output in samples.items():
+        print(f"[{engine}]\n{output[:300]}\n")
+
+
+if __name__ == "__main__":
+    main()
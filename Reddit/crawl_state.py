@@ -0,0 +1,261 @@
+"""
+서브레딧 크롤러용 영속 크롤 상태 저장소 (SQLite, WAL 모드)
+
+프로세스가 중간에 죽어도
+- 서브레딧/정렬별 마지막 after 커서
+- 이미 수집한 post_id / url
+- 토큰별 진행 상황(완료 여부, 페이지/행 수)
+이 남아 있어서, 재시작 시 출력 CSV 를 다시 읽지 않고 바로 이어서 수집할 수 있다.
+
+출력 CSV 의 커밋된 바이트 크기도 같이 기록해서, append 직후 커밋 전에 죽은 경우
+재시작 시 커밋되지 않은 꼬리 부분을 잘라내 중복 행이 생기지 않게 한다.
+
+증분 모드용으로 키워드/서브레딧별 created_utc 최고 수위(watermark)도 저장한다.
+sort=new 로 페이징하다가 watermark 이하 게시글을 만나면 거기서 멈추면 된다.
+watermark 가 없으면 기존 CSV(데이터_레딧/ 등)의 date 최댓값으로 초기화할 수 있다.
+
+사용 예:
+    state = CrawlStateStore("reddit_crawl_state.db")
+    after = state.get_cursor("deaf", "new")
+    if not state.is_seen("deaf", post_id): ...
+    state.commit_token("deaf", "new", token, rows, last_after, output_path="out.csv")
+"""
+import calendar
+import glob
+import os
+import sqlite3
+import time
+
+DEFAULT_STATE_DB = "reddit_crawl_state.db"
+DATASET_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "데이터_레딧")
+DATE_FORMAT = "%Y-%m-%d %H:%M:%S"  # CSV date 컬럼 형식 (UTC)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS cursors (
+    subreddit  TEXT NOT NULL,
+    sort_type  TEXT NOT NULL,
+    after      TEXT,
+    updated_at REAL NOT NULL,
+    PRIMARY KEY (subreddit, sort_type)
+);
+CREATE TABLE IF NOT EXISTS seen_posts (
+    subreddit  TEXT NOT NULL,
+    key        TEXT NOT NULL,  -- post_id 또는 url
+    PRIMARY KEY (subreddit, key)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS token_progress (
+    subreddit  TEXT NOT NULL,
+    sort_type  TEXT NOT NULL,
+    token      TEXT NOT NULL,
+    done       INTEGER NOT NULL DEFAULT 0,
+    rows       INTEGER NOT NULL DEFAULT 0,
+    last_after TEXT,
+    updated_at REAL NOT NULL,
+    PRIMARY KEY (subreddit, sort_type, token)
+);
+CREATE TABLE IF NOT EXISTS outputs (
+    path           TEXT PRIMARY KEY,
+    committed_size INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS watermarks (
+    scope       TEXT PRIMARY KEY,  -- 예: "r/deaf/new", "search/deaf"
+    created_utc REAL NOT NULL,
+    updated_at  REAL NOT NULL
+);
+"""
+
+
+def date_to_utc(date_str):
+    """CSV date 문자열(UTC) → epoch 초. 형식이 다르거나 비어 있으면 None"""
+    if not isinstance(date_str, str) or not date_str:
+        return None
+    try:
+        return float(calendar.timegm(time.strptime(date_str[:19], DATE_FORMAT)))
+    except ValueError:
+        return None
+
+
+def find_dataset_csvs(name, dataset_dir=DATASET_DIR):
+    """데이터_레딧/ 에서 reddit_{name}_*.csv 스냅샷 목록 (대소문자 무시)"""
+    prefix = f"reddit_{name.lower()}_"
+    return sorted(
+        p for p in glob.glob(os.path.join(dataset_dir, "*.csv"))
+        if os.path.basename(p).lower().startswith(prefix)
+    )
+
+
+class CrawlStateStore:
+    """SQLite(WAL) 기반 크롤 상태 저장소"""
+
+    def __init__(self, db_path: str = DEFAULT_STATE_DB):
+        self.db_path = db_path
+        self.conn = sqlite3.connect(db_path)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")  # WAL 에서는 NORMAL 도 커밋 단위로 안전
+        self.conn.executescript(SCHEMA)
+        self.conn.commit()
+
+    def close(self):
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    # ---------- after 커서 ----------
+    def get_cursor(self, subreddit: str, sort_type: str):
+        row = self.conn.execute(
+            "SELECT after FROM cursors WHERE subreddit = ? AND sort_type = ?",
+            (subreddit, sort_type),
+        ).fetchone()
+        return row[0] if row else None
+
+    def _set_cursor(self, subreddit: str, sort_type: str, after):
+        self.conn.execute(
+            "INSERT INTO cursors (subreddit, sort_type, after, updated_at) VALUES (?, ?, ?, ?) "
+            "ON CONFLICT(subreddit, sort_type) DO UPDATE SET after = excluded.after, updated_at = excluded.updated_at",
+            (subreddit, sort_type, after, time.time()),
+        )
+
+    # ---------- 수집한 게시글 ----------
+    def is_seen(self, subreddit: str, key) -> bool:
+        """post_id 또는 url 이 이미 저장됐는지 (PK 인덱스 조회 1번)"""
+        if not key:
+            return False
+        return self.conn.execute(
+            "SELECT 1 FROM seen_posts WHERE subreddit = ? AND key = ?",
+            (subreddit, str(key)),
+        ).fetchone() is not None
+
+    def count_seen_posts(self, subreddit: str) -> int:
+        return self.conn.execute(
+            "SELECT COUNT(*) FROM seen_posts WHERE subreddit = ?", (subreddit,)
+        ).fetchone()[0]
+
+    def _mark_seen(self, subreddit: str, rows):
+        keys = []
+        for r in rows:
+            if r.get("post_id"):
+                keys.append((subreddit, str(r["post_id"])))
+            if r.get("url"):
+                keys.append((subreddit, r["url"]))
+        self.conn.executemany(
+            "INSERT OR IGNORE INTO seen_posts (subreddit, key) VALUES (?, ?)", keys
+        )
+
+    # ---------- 토큰 진행 상황 ----------
+    def is_token_done(self, subreddit: str, sort_type: str, token: str) -> bool:
+        row = self.conn.execute(
+            "SELECT done FROM token_progress WHERE subreddit = ? AND sort_type = ? AND token = ?",
+            (subreddit, sort_type, token),
+        ).fetchone()
+        return bool(row and row[0])
+
+    # ---------- 출력 파일 ----------
+    def recover_output(self, path: str):
+        """
+        마지막 커밋 이후 append 된(커밋 안 된) 꼬리를 잘라냄. 잘라낸 바이트 수 반환.
+        처음 보는 파일이면 현재 크기를 커밋된 크기로 등록만 한다.
+        """
+        abs_path = os.path.abspath(path)
+        size = os.path.getsize(path) if os.path.exists(path) else 0
+        row = self.conn.execute(
+            "SELECT committed_size FROM outputs WHERE path = ?", (abs_path,)
+        ).fetchone()
+        if row is None:
+            with self.conn:
+                self._set_output_size(abs_path, size)
+            return 0
+        if size <= row[0]:
+            return 0
+        with open(path, "r+b") as f:
+            f.truncate(row[0])
+        return size - row[0]
+
+    def _set_output_size(self, abs_path: str, size: int):
+        self.conn.execute(
+            "INSERT INTO outputs (path, committed_size) VALUES (?, ?) "
+            "ON CONFLICT(path) DO UPDATE SET committed_size = excluded.committed_size",
+            (abs_path, size),
+        )
+
+    # ---------- created_utc watermark (증분 모드) ----------
+    def get_watermark(self, scope: str):
+        row = self.conn.execute(
+            "SELECT created_utc FROM watermarks WHERE scope = ?", (scope,)
+        ).fetchone()
+        return row[0] if row else None
+
+    def _set_watermark(self, scope: str, created_utc: float):
+        """기존 값보다 클 때만 올린다 (watermark 는 절대 뒤로 가지 않음)"""
+        self.conn.execute(
+            "INSERT INTO watermarks (scope, created_utc, updated_at) VALUES (?, ?, ?) "
+            "ON CONFLICT(scope) DO UPDATE SET "
+            "created_utc = MAX(created_utc, excluded.created_utc), updated_at = excluded.updated_at",
+            (scope, created_utc, time.time()),
+        )
+
+    def set_watermark(self, scope: str, created_utc):
+        if created_utc is None:
+            return
+        with self.conn:
+            self._set_watermark(scope, created_utc)
+
+    def seed_watermark(self, scope: str, subreddit: str, rows):
+        """
+        watermark 가 없을 때 기존 데이터 행(post_id / url / date)으로 초기화.
+        행들은 seen 으로도 등록한다. 설정된 watermark 반환 (date 가 하나도 없으면 None).
+        """
+        rows = list(rows)
+        stamps = [t for t in (date_to_utc(r.get("date")) for r in rows) if t is not None]
+        with self.conn:
+            self._mark_seen(subreddit, rows)
+            if stamps:
+                self._set_watermark(scope, max(stamps))
+        return self.get_watermark(scope)
+
+    def commit_incremental(self, scope: str, subreddit: str, rows, output_path=None, advance_watermark=True):
+        """
+        증분 수집 결과를 한 트랜잭션으로 기록
+        (신규 게시글 seen 등록 + watermark 를 신규 행 date 최댓값으로 + 출력 파일 크기).
+        advance_watermark=False 면 watermark 는 그대로 둔다 - 페이징이 이전 watermark 나 목록 끝까지
+        닿지 못하고 멈춘 경우(요청 실패 / max_pages 소진), 올리면 그 사이 게시글을 영영 건너뛰게 됨.
+        이때 저장한 행의 date 최댓값은 "{scope}#pending" 에 모아 두었다가, 다음에 끝까지 닿은 실행에서
+        함께 반영한다 (그 실행에서는 이미 저장한 최신 게시글을 seen 으로 건너뛰므로).
+        """
+        stamps = [t for t in (date_to_utc(r.get("date")) for r in rows) if t is not None]
+        pending_scope = f"{scope}#pending"
+        with self.conn:
+            self._mark_seen(subreddit, rows)
+            if advance_watermark:
+                pending = self.get_watermark(pending_scope)
+                if pending is not None:
+                    stamps.append(pending)
+                    self.conn.execute("DELETE FROM watermarks WHERE scope = ?", (pending_scope,))
+                if stamps:
+                    self._set_watermark(scope, max(stamps))
+            elif stamps:
+                self._set_watermark(pending_scope, max(stamps))
+            if output_path and os.path.exists(output_path):
+                self._set_output_size(os.path.abspath(output_path), os.path.getsize(output_path))
+
+    def commit_token(self, subreddit: str, sort_type: str, token: str, rows, last_after, output_path=None):
+        """
+        토큰 하나를 마친 결과를 한 트랜잭션으로 기록
+        (신규 게시글 seen 등록 + after 커서 갱신 + 토큰 완료 표시 + 출력 파일 크기).
+        출력 CSV 에 행을 append 한 직후 호출한다.
+        """
+        with self.conn:
+            self._mark_seen(subreddit, rows)
+            self._set_cursor(subreddit, sort_type, last_after)
+            if output_path and os.path.exists(output_path):
+                self._set_output_size(os.path.abspath(output_path), os.path.getsize(output_path))
+            self.conn.execute(
+                "INSERT INTO token_progress (subreddit, sort_type, token, done, rows, last_after, updated_at) "
+                "VALUES (?, ?, ?, 1, ?, ?, ?) "
+                "ON CONFLICT(subreddit, sort_type, token) DO UPDATE SET "
+                "done = 1, rows = excluded.rows, last_after = excluded.last_after, updated_at = excluded.updated_at",
+                (subreddit, sort_type, token, len(rows), last_after, time.time()),
+            )
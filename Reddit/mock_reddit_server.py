@@ -0,0 +1,193 @@
+"""
+오프라인 테스트/벤치마크용 가짜 Reddit 서버 (표준 라이브러리만 사용)
+
+- /search.json : q / after / limit 파라미터로 결정적인(deterministic) 검색 결과 페이징
+- /r/{subreddit}/{sort}.json : 서브레딧 목록 페이징 (검색과 같은 형식)
+- /r/{subreddit}/comments/{post_id}/....json : [게시글, 댓글 트리] 형식의 댓글 응답
+  (마지막에 "more" 스텁 1개 포함)
+- /api/morechildren.json : children 파라미터의 id 들을 평평한 댓글 리스트로 확장
+- 응답마다 X-Ratelimit-Used / Remaining / Reset 헤더를 붙여줌
+- latency 로 실제 네트워크 왕복 시간을 흉내냄
+
+사용 예:
+    server, base_url = start_mock_server(latency=0.05)
+    ...  # base_url 을 수집기의 base_url 로 넘김
+    server.shutdown()
+"""
+import hashlib
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+DEFAULT_LATENCY = 0.05     # 요청당 지연(초)
+DEFAULT_PAGES = 5          # 쿼리당 페이지 수
+POST_POOL_SIZE = 5000      # 서브쿼리끼리 post_id 가 겹치도록 하는 전체 게시글 풀 크기
+RATE_WINDOW_SEC = 600      # 레이트리밋 윈도우(초)
+RATE_WINDOW_REQUESTS = 100000  # 윈도우당 허용 요청 수 (벤치마크에선 사실상 무제한)
+COMMENTS_PER_POST = 4      # 게시글당 최상위 댓글 수
+MORE_PER_POST = 6          # 게시글당 "more" 스텁에 숨겨진 최상위 댓글 수
+
+
+def _query_seed(query):
+    return int(hashlib.md5(query.encode("utf-8")).hexdigest()[:8], 16)
+
+
+def fake_comment(comment_id, parent_id, body):
+    return {"kind": "t1", "data": {
+        "id": comment_id, "name": f"t1_{comment_id}", "parent_id": parent_id,
+        "body": body, "score": 1, "replies": "",
+    }}
+
+
+def fake_comments(post_id, n_comments=COMMENTS_PER_POST, n_more=MORE_PER_POST):
+    """게시글 하나에 대한 댓글 트리 (두 번째 댓글마다 대댓글 1개, 마지막에 more 스텁)"""
+    children = []
+    for i in range(n_comments):
+        reply = ""
+        if i % 2 == 1:
+            reply = {"kind": "Listing", "data": {"children": [{
+                "kind": "t1",
+                "data": {"id": f"{post_id}_c{i}_r", "body": f"reply to comment {i}", "score": 1, "replies": ""},
+            }]}}
+        children.append({
+            "kind": "t1",
+            "data": {"id": f"{post_id}_c{i}", "body": f"comment {i} on {post_id}", "score": i, "replies": reply},
+        })
+    if n_more:
+        children.append({"kind": "more", "data": {
+            "count": n_more,
+            "parent_id": f"t3_{post_id}",
+            "children": [f"{post_id}_m{i}" for i in range(n_more)],
+        }})
+    return children
+
+
+def fake_post(n):
+    """풀 인덱스 n 에 해당하는 가짜 게시글 data"""
+    post_id = f"p{n:05d}"
+    return {
+        "id": post_id,
+        "title": f"mock title {n}",
+        "selftext": f"mock content {n}",
+        "created_utc": 1700000000 - n * 60,
+        "permalink": f"/r/mock/comments/{post_id}/mock_title_{n}/",
+    }
+
+
+class MockRedditHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive 지원 (Content-Length 항상 전송)
+    wbufsize = -1                  # 헤더+본문을 한 번에 전송 (Nagle/지연 ACK 로 40ms 씩 밀리는 것 방지)
+    disable_nagle_algorithm = True
+    latency = DEFAULT_LATENCY
+    pages = DEFAULT_PAGES
+    window_start = time.monotonic()
+    window_used = 0
+    lock = threading.Lock()
+
+    def log_message(self, format, *args):
+        pass
+
+    def _rate_headers(self):
+        cls = type(self)
+        with cls.lock:
+            now = time.monotonic()
+            if now - cls.window_start >= RATE_WINDOW_SEC:
+                cls.window_start = now
+                cls.window_used = 0
+            cls.window_used += 1
+            used = cls.window_used
+            reset = int(RATE_WINDOW_SEC - (now - cls.window_start))
+        return {
+            "X-Ratelimit-Used": str(used),
+            "X-Ratelimit-Remaining": str(max(RATE_WINDOW_REQUESTS - used, 0)),
+            "X-Ratelimit-Reset": str(max(reset, 1)),
+        }
+
+    def _send_json(self, status, body):
+        payload = json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        for key, value in self._rate_headers().items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def _listing(self, seed, params):
+        limit = int(params.get("limit", ["100"])[0])
+        after = params.get("after", [None])[0]
+        page = int(after.split("_")[1]) if after else 0
+
+        if page >= self.pages:
+            children = []
+        else:
+            start = seed % POST_POOL_SIZE + page * limit
+            children = [
+                {"kind": "t3", "data": fake_post((start + i) % POST_POOL_SIZE)}
+                for i in range(limit)
+            ]
+        next_after = f"page_{page + 1}" if page + 1 < self.pages else None
+        return {"kind": "Listing", "data": {"after": next_after, "children": children}}
+
+    def do_GET(self):
+        time.sleep(self.latency)
+        parsed = urlparse(self.path)
+        params = parse_qs(parsed.query)
+
+        if parsed.path == "/search.json":
+            query = params.get("q", [""])[0]
+            self._send_json(200, self._listing(_query_seed(query), params))
+            return
+
+        if parsed.path == "/api/morechildren.json":
+            link_id = params.get("link_id", [""])[0]
+            ids = [i for i in params.get("children", [""])[0].split(",") if i]
+            things = [fake_comment(i, link_id, f"more comment {i}") for i in ids]
+            self._send_json(200, {"json": {"errors": [], "data": {"things": things}}})
+            return
+
+        parts = parsed.path.strip("/").split("/")
+        if len(parts) >= 4 and parts[0] == "r" and parts[2] == "comments":
+            post_id = parts[3]
+            post_listing = {"kind": "Listing", "data": {"children": [{"kind": "t3", "data": {"id": post_id}}]}}
+            comment_listing = {"kind": "Listing", "data": {"children": fake_comments(post_id)}}
+            self._send_json(200, [post_listing, comment_listing])
+            return
+        if len(parts) == 3 and parts[0] == "r" and parts[2].endswith(".json"):
+            self._send_json(200, self._listing(_query_seed(parts[1]), params))
+            return
+
+        self._send_json(404, {"error": 404})
+
+
+class MockRedditServer(ThreadingHTTPServer):
+    # 기본 backlog(5)로는 동시 접속 시 SYN 재전송 지연이 생겨 벤치마크가 왜곡됨
+    request_queue_size = 128
+    daemon_threads = True
+
+
+def start_mock_server(host="127.0.0.1", port=0, latency=DEFAULT_LATENCY, pages=DEFAULT_PAGES):
+    """백그라운드 스레드에서 가짜 서버 실행 후 (server, base_url) 반환"""
+    handler = type("ConfiguredMockRedditHandler", (MockRedditHandler,), {
+        "latency": latency,
+        "pages": pages,
+        "window_start": time.monotonic(),
+        "window_used": 0,
+        "lock": threading.Lock(),
+    })
+    server = MockRedditServer((host, port), handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    return server, f"http://{host}:{server.server_address[1]}"
+
+
+if __name__ == "__main__":
+    server, base_url = start_mock_server(port=8765)
+    print(f"가짜 Reddit 서버 실행 중: {base_url} (Ctrl+C 로 종료)")
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        server.shutdown()
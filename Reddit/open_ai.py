@@ -1,10 +1,13 @@
 # translate_fill_csv_gemini.py
 
+import argparse
 import os
-import time
 import pandas as pd
 from dotenv import load_dotenv
-import google.generativeai as genai  # pyright: ignore[reportMissingImports]
+
+from translate_pipeline import CHECKPOINT_FILE, run_translation, save_csv
+from translation_backends import ENGINES, GEMINI_MODEL, Translator, create_translator
+from translation_cache import DEFAULT_CACHE_DB, TranslationCache
 
 
 # =========================
@@ -12,51 +15,41 @@ import google.generativeai as genai  # pyright: ignore[reportMissingImports]
 # =========================
 load_dotenv()
 
-# 환경 변수에서 API 키 가져오기 (환경 변수 이름: GOOGLE_API_KEY)
+# 환경 변수에서 API 키 가져오기 (환경 변수 이름: GOOGLE_API_KEY, gemini 엔진에서만 필요)
 GOOGLE_API_KEY = os.getenv("GOOGLE_API_KEY")
 
 # 환경 변수가 없으면 직접 API 키 입력 (보안상 .env 파일 사용 권장)
 if not GOOGLE_API_KEY:
     GOOGLE_API_KEY = ""
 
-if not GOOGLE_API_KEY:
-    raise ValueError("Google API 키가 설정되지 않았습니다. 환경 변수 GOOGLE_API_KEY를 설정하거나 코드에 직접 입력하세요.")
-
-genai.configure(api_key=GOOGLE_API_KEY)
-
 # Gemini 모델 선택 (속도 빠른 버전)
-MODEL_NAME = "gemini-2.5-flash"
-model = genai.GenerativeModel(MODEL_NAME)
+MODEL_NAME = GEMINI_MODEL
+
+SOURCE_LANG = "en"
+TARGET_LANG = "ko"
 
 
 # =========================
-# 1) 번역 함수 (영어 → 한국어)
+# 1) 번역 엔진 (영어 → 한국어)
 # =========================
-def translate_with_gemini(text: str) -> str:
+def build_translator(engine: str = "gemini", local_model: str | None = None, sleep_sec: float = 0.2) -> Translator:
     """
-    Google Gemini를 사용해 영어 텍스트를 한국어로 번역.
-    - Reddit 스타일의 긴 글도 그대로 번역
-    - 요약 금지, 전체 번역
+    - engine: "gemini" | "google" | "local" | "fake" (translation_backends.py)
+    - local_model: engine="local" 일 때 MarianMT / NLLB 체크포인트 디렉토리
+    - sleep_sec: API 엔진의 최소 요청 간격 (429/할당량 오류가 나면 자동으로 늘어났다가 다시 줄어듦)
+    번역 캐시 키에는 translator.engine 이 들어가서 모델을 바꾸면 캐시도 따로 쌓인다.
     """
-    if not isinstance(text, str) or text.strip() == "":
-        return ""
-
-    prompt = f"""
-You are a professional English-to-Korean translator.
-
-- Input is a Reddit-style English post about hearing loss, deafness, or mishearing.
-- Translate into NATURAL and fluent Korean.
-- Do NOT summarize or shorten. Translate EVERYTHING.
-- Preserve paragraph breaks and list formatting as much as possible.
-- Do NOT add explanations. Output ONLY the Korean translation.
-
-[ENGLISH ORIGINAL]
-{text}
-"""
-
-    response = model.generate_content(prompt)
-    ko = (response.text or "").strip()
-    return ko
+    if engine == "gemini":
+        # Reddit 스타일의 긴 글도 요약 없이 전체 번역 (프롬프트는 batch_translate.INSTRUCTIONS)
+        return create_translator("gemini", model_name=MODEL_NAME, api_key=GOOGLE_API_KEY or None,
+                                 min_interval=sleep_sec)
+    if engine == "google":
+        return create_translator("google", min_interval=sleep_sec)
+    if engine == "local":
+        if not local_model:
+            raise ValueError("local 엔진은 --local_model 로 체크포인트 경로를 지정해야 합니다.")
+        return create_translator("local", model_path=local_model)
+    return create_translator(engine)
 
 
 # =========================
@@ -69,6 +62,11 @@ def fill_korean_column(
     ko_col: str = "content_한글",
     max_rows: int | None = None,
     sleep_sec: float = 1.0,
+    cache_path: str = DEFAULT_CACHE_DB,
+    translator: Translator | None = None,
+    concurrency: int | None = None,
+    checkpoint_path: str = CHECKPOINT_FILE,
+    resume: bool = False,
 ):
     """
     - input_csv_path: 원본 CSV 경로
@@ -76,8 +74,16 @@ def fill_korean_column(
     - content_col: 영어 원문 컬럼명
     - ko_col: 한국어 번역 컬럼명
     - max_rows: 테스트용으로 일부만 돌리고 싶을 때 개수 지정 (None이면 전체)
-    - sleep_sec: API 호출 사이 텀 (요금·Rate limit 완화용)
+    - sleep_sec: translator 를 안 넘겼을 때 만드는 Gemini 엔진의 최소 요청 간격
+    - cache_path: 번역 캐시(SQLite) 경로. 이미 번역한 원문은 API 를 호출하지 않음
+    - translator: 번역 엔진 (None 이면 Gemini, 짧은 글 여러 개를 한 요청으로 묶어서 번역)
+    - concurrency: 동시에 번역하는 워커 수 (None 이면 엔진 권장값 translator.max_concurrency)
+    - checkpoint_path: 끝난 행을 바로바로 기록하는 체크포인트(JSONL) 경로
+    - resume: True 면 체크포인트에 있는 행은 건너뛰고 이어서 번역
     """
+    if translator is None:
+        translator = build_translator("gemini", sleep_sec=sleep_sec)
+    cache = TranslationCache(cache_path)
 
     print(f"CSV 불러오는 중: {input_csv_path}")
     df = pd.read_csv(input_csv_path)
@@ -89,29 +95,31 @@ def fill_korean_column(
     if max_rows is not None:
         target_idx = target_idx[:max_rows]
 
-    print(f"번역 대상 행 수: {len(target_idx)}")
-
-    for i, idx in enumerate(target_idx, start=1):
-        en_text = str(df.at[idx, content_col])
-
-        # 디버깅/안심용: 원문 길이 출력 (셀 전체 기준)
-        print(f"\n[{i}/{len(target_idx)}] index={idx}")
-        print(f"  영어 길이: {len(en_text)}자")
-
-        try:
-            ko_text = translate_with_gemini(en_text)
-            df.at[idx, ko_col] = ko_text
-            print("  ✅ 번역 완료")
-        except Exception as e:
-            print(f"  ❌ 번역 실패: {e}")
-            # 필요하다면 실패 표시 남기기
-            # df.at[idx, ko_col] = f"[번역 실패] {e}"
-
-        time.sleep(sleep_sec)
+    print(f"번역 대상 행 수: {len(target_idx)} (엔진: {translator.engine})")
+
+    def translate_many(texts):
+        # 캐시에 없는 원문만 엔진에 넘김
+        return cache.translate_batch(texts, translator.translate_batch, SOURCE_LANG, TARGET_LANG, translator.engine)
+
+    stats = run_translation(
+        df,
+        {content_col: ko_col},
+        translate_many,
+        checkpoint_path=checkpoint_path,
+        concurrency=concurrency or translator.max_concurrency,
+        resume=resume,
+        index=target_idx,
+        max_task_tokens=translator.max_batch_tokens,
+    )
+    print(f"\n번역 {stats['translated']}건 / 체크포인트 복원 {stats['restored']}건 / 실패 {stats['failed']}건")
+    if hasattr(translator, "batch"):
+        print(f"API 요청 {translator.batch.requests}회 (구분자 누락 재요청 {translator.batch.retries}회)")
 
-    # 최종 CSV 저장
-    df.to_csv(output_csv_path, index=False, encoding="utf-8-sig")
+    # 최종 CSV 저장 (끝난 행은 체크포인트에 이미 남아 있음)
+    save_csv(df, output_csv_path)
     print(f"\n저장 완료: {output_csv_path}")
+    print(cache.summary())
+    cache.close()
 
 
 # =========================
@@ -119,16 +127,27 @@ def fill_korean_column(
 # =========================
 if __name__ == "__main__":
     # ⚠ 파일 이름/경로는 네 환경에 맞게 바꿔줘
-    input_path = "한글화.csv"
-    output_path = "reddit_한글화_번역완료.csv"
-
-    # 먼저 2~3개만 테스트해보고 전체 돌리는 걸 추천
+    parser = argparse.ArgumentParser(description="content_한글 컬럼 채우기 (병렬 번역, 엔진 선택 가능)")
+    parser.add_argument("--input", default="한글화.csv", help="입력 CSV")
+    parser.add_argument("--output", default="reddit_한글화_번역완료.csv", help="출력 CSV")
+    parser.add_argument("--max_rows", type=int, default=None, help="테스트용 번역 행 수 (기본값: 전체)")
+    parser.add_argument("--engine", choices=ENGINES, default="gemini", help="번역 엔진 (기본값: gemini)")
+    parser.add_argument("--local_model", default=None, help="local 엔진의 MarianMT / NLLB 체크포인트 디렉토리")
+    parser.add_argument("--concurrency", type=int, default=None, help="동시 요청 워커 수 (기본값: 엔진 권장값)")
+    parser.add_argument("--checkpoint", default=CHECKPOINT_FILE, help="번역 체크포인트(JSONL)")
+    parser.add_argument("--resume", action="store_true", help="체크포인트에 있는 행은 건너뛰고 이어서 번역")
+    args = parser.parse_args()
+
+    # 먼저 --max_rows 2~3 으로 테스트해보고 전체 돌리는 걸 추천
     fill_korean_column(
-        input_csv_path=input_path,
-        output_csv_path=output_path,
+        input_csv_path=args.input,
+        output_csv_path=args.output,
         content_col="content",
         ko_col="content_한글",
-        max_rows=None,       # 전체 돌릴 땐 None으로 바꾸기
-        sleep_sec=0.2,
+        max_rows=args.max_rows,
+        translator=build_translator(args.engine, args.local_model, sleep_sec=0.2),
+        concurrency=args.concurrency,
+        checkpoint_path=args.checkpoint,
+        resume=args.resume,
     )
 
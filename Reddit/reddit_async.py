@@ -0,0 +1,280 @@
+"""
+asyncio 기반 Reddit 검색 수집기
+
+- 키워드 × 서브토큰 서브쿼리를 동시에 여러 개 실행
+- 모든 요청이 하나의 토큰 버킷(TokenBucket)을 공유
+- Reddit 응답 헤더(X-Ratelimit-Remaining / X-Ratelimit-Reset)로 속도를 실시간 조정
+- 결과 행 형식은 기존 reddit_crawling.py 와 동일
+  (post_id, title, content, date, url, keyword, sub_token)
+"""
+import asyncio
+import time
+from datetime import datetime
+
+import aiohttp
+
+BASE_URL = "https://www.reddit.com"
+
+HEADERS = {
+    "User-Agent": "MyRedditResearchScript/0.1 by u_yourusername"
+}
+
+MAX_CONCURRENCY = 8          # 동시에 진행할 서브쿼리 수
+REQUESTS_PER_SEC = 1.0       # 헤더를 받기 전 초기 요청 속도
+BURST = 5                    # 토큰 버킷 최대 용량
+MIN_REQUESTS_PER_SEC = 0.05  # 남은 요청이 0이어도 이 속도 밑으로는 안 내려감
+MAX_RETRIES_429 = 3          # 429 나왔을 때 재시도 최대 횟수
+REQUEST_TIMEOUT = 30         # 요청 타임아웃(초)
+
+
+class TokenBucket:
+    """
+    모든 코루틴이 공유하는 토큰 버킷 레이트리미터.
+    Reddit 이 알려주는 남은 요청 수 / 리셋까지 남은 시간으로 속도를 재계산한다.
+    """
+
+    def __init__(self, rate: float = REQUESTS_PER_SEC, capacity: int = BURST):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = float(capacity)
+        self.updated = time.monotonic()
+        self.blocked_until = 0.0
+        self._lock = asyncio.Lock()
+
+    def _refill(self, now: float):
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    async def acquire(self):
+        """토큰 1개를 얻을 때까지 대기 (락을 잡은 순서대로 공정하게 배분)"""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                if now < self.blocked_until:
+                    await asyncio.sleep(self.blocked_until - now)
+                    continue
+                self._refill(now)
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+    def update_from_headers(self, headers):
+        """X-Ratelimit-Remaining / X-Ratelimit-Reset 헤더로 속도 갱신"""
+        remaining = headers.get("X-Ratelimit-Remaining")
+        reset = headers.get("X-Ratelimit-Reset")
+        if remaining is None or reset is None:
+            return
+        try:
+            remaining = float(remaining)
+            reset = float(reset)
+        except ValueError:
+            return
+
+        now = time.monotonic()
+        self._refill(now)
+        if remaining < 1:
+            # 이번 윈도우 예산 소진 → 리셋 시점까지 전체 정지
+            self.tokens = 0.0
+            self.blocked_until = max(self.blocked_until, now + reset)
+            return
+        if reset > 0:
+            self.rate = max(remaining / reset, MIN_REQUESTS_PER_SEC)
+        self.tokens = min(self.tokens, remaining)
+
+    def block_for(self, seconds: float):
+        """429 등으로 일정 시간 전체 요청을 멈춰야 할 때 사용"""
+        self.blocked_until = max(self.blocked_until, time.monotonic() + seconds)
+        self.tokens = 0.0
+
+
+def parse_post(d, base_url=BASE_URL):
+    """검색 결과 children[].data 하나를 기존 CSV 행 형식으로 변환"""
+    created = d.get("created_utc", None)
+    if created is not None:
+        date_str = datetime.utcfromtimestamp(created).strftime("%Y-%m-%d %H:%M:%S")
+    else:
+        date_str = None
+
+    return {
+        "post_id": d.get("id"),
+        "title": d.get("title", "") or "",
+        "content": d.get("selftext", "") or "",
+        "date": date_str,
+        "url": base_url + d.get("permalink", ""),
+    }
+
+
+async def get_json_with_backoff(session, bucket, url, params=None, label=""):
+    """
+    버킷에서 토큰을 받아 GET 요청 후 JSON 반환.
+    429 는 Retry-After / 리셋 헤더(없으면 지수 백오프)만큼 버킷 전체를 멈추고 재시도.
+    실패하면 None 반환.
+    """
+    for attempt in range(MAX_RETRIES_429):
+        await bucket.acquire()
+        try:
+            async with session.get(url, params=params) as res:
+                bucket.update_from_headers(res.headers)
+
+                if res.status == 429:
+                    retry_after = res.headers.get("Retry-After") or res.headers.get("X-Ratelimit-Reset")
+                    try:
+                        wait_time = float(retry_after)
+                    except (TypeError, ValueError):
+                        wait_time = (1 / bucket.rate) * (2 ** attempt)
+                    print(f"  > {label} 429 (레이트리밋). {wait_time:.1f}초 대기 후 재시도.")
+                    bucket.block_for(wait_time)
+                    continue
+                if res.status != 200:
+                    print(f"  > {label} 요청 실패: {res.status}, 이 쿼리 중단.")
+                    return None
+                return await res.json(content_type=None)
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            print(f"  > {label} 네트워크 오류: {e}. 재시도.")
+            await asyncio.sleep(2 ** attempt)
+
+    print(f"  > {label} 재시도 {MAX_RETRIES_429}번 모두 실패해서 이 쿼리는 더 이상 진행 안 함.")
+    return None
+
+
+async def fetch_search_async(session, bucket, query, max_pages=3, base_url=BASE_URL, since_utc=None):
+    """
+    /search.json 에서 단일 쿼리로 페이징 (after 커서 때문에 쿼리 내부 페이지는 순차).
+    since_utc 를 주면 created_utc 가 그 이하인 게시글을 만나는 순간 멈춤 (sort=new 증분 모드).
+    반환값 (행 리스트, complete) - complete 는 since_utc 또는 검색 결과 끝까지 닿았는지
+    (요청 실패 / max_pages 소진으로 멈추면 False).
+    """
+    all_rows = []
+    after = None
+
+    for page in range(max_pages):
+        params = {
+            "q": query,
+            "limit": 100,
+            "sort": "new",
+            "type": "link",
+            "t": "all",  # 전체 기간
+        }
+        if after:
+            params["after"] = after
+
+        body = await get_json_with_backoff(
+            session, bucket, f"{base_url}/search.json", params=params,
+            label=f"[QUERY='{query}'] PAGE {page+1}",
+        )
+        if body is None:
+            return all_rows, False
+
+        data = body.get("data", {})
+        children = data.get("children", [])
+        if not children:
+            return all_rows, True
+
+        reached = False
+        for c in children:
+            d = c.get("data", {})
+            created = d.get("created_utc")
+            if since_utc is not None and created is not None and created <= since_utc:
+                reached = True
+                break
+            all_rows.append(parse_post(d, base_url))
+        if reached:
+            return all_rows, True
+
+        after = data.get("after")
+        if not after:
+            return all_rows, True
+
+    return all_rows, False
+
+
+async def fetch_keyword_many_by_subtokens_async(
+    session,
+    bucket,
+    semaphore,
+    keyword,
+    sub_tokens,
+    max_pages_per_subquery=3,
+    base_url=BASE_URL,
+    since_utc=None,
+):
+    """
+    keyword + sub_token 서브쿼리를 동시에 실행하고,
+    서브토큰 순서대로 post_id 중복을 제거해 기존 동기 버전과 같은 행을 반환.
+    반환값 (행 리스트, complete) - complete 는 모든 서브쿼리가 끝까지 닿았는지.
+    """
+
+    async def run_subquery(token):
+        query = keyword if token == "" else f"{keyword} {token}"
+        async with semaphore:
+            rows, complete = await fetch_search_async(
+                session, bucket, query,
+                max_pages=max_pages_per_subquery,
+                base_url=base_url,
+                since_utc=since_utc,
+            )
+        print(f"[{keyword}] 서브쿼리 '{query}' 완료: {len(rows)}개" + ("" if complete else " (중간에 멈춤)"))
+        return rows, complete
+
+    results = await asyncio.gather(*(run_subquery(t) for t in sub_tokens))
+
+    all_rows = []
+    seen_post_ids = set()
+    for token, (rows, _) in zip(sub_tokens, results):
+        for r in rows:
+            pid = r.get("post_id")
+            if pid and pid not in seen_post_ids:
+                seen_post_ids.add(pid)
+                r["keyword"] = keyword
+                r["sub_token"] = token
+                all_rows.append(r)
+
+    print(f"[{keyword}] 최종 수집 개수: {len(all_rows)}개")
+    return all_rows, all(complete for _, complete in results)
+
+
+async def collect_keywords(
+    keywords,
+    sub_tokens,
+    max_pages_per_subquery=3,
+    concurrency=MAX_CONCURRENCY,
+    rate=REQUESTS_PER_SEC,
+    burst=BURST,
+    base_url=BASE_URL,
+    headers=None,
+    since_by_keyword=None,
+    incomplete_keywords=None,
+):
+    """
+    모든 키워드 × 서브토큰을 하나의 세션/버킷/세마포어로 동시에 수집.
+    since_by_keyword({키워드: created_utc}) 를 주면 키워드별로 그 시점 이후 게시글만 수집.
+    incomplete_keywords(set) 를 주면 since / 결과 끝까지 닿지 못한 서브쿼리가 있는 키워드를 여기에 추가
+    (증분 모드에서 그 키워드의 watermark 를 올리지 않기 위해).
+    반환값은 키워드 순서대로 이어 붙인 행 리스트.
+    """
+    since_by_keyword = since_by_keyword or {}
+    bucket = TokenBucket(rate=rate, capacity=burst)
+    semaphore = asyncio.Semaphore(concurrency)
+    timeout = aiohttp.ClientTimeout(total=REQUEST_TIMEOUT)
+    connector = aiohttp.TCPConnector(limit=concurrency)
+
+    async with aiohttp.ClientSession(
+        headers=headers or HEADERS, timeout=timeout, connector=connector
+    ) as session:
+        per_keyword = await asyncio.gather(*(
+            fetch_keyword_many_by_subtokens_async(
+                session, bucket, semaphore, kw, sub_tokens,
+                max_pages_per_subquery=max_pages_per_subquery,
+                base_url=base_url,
+                since_utc=since_by_keyword.get(kw),
+            )
+            for kw in keywords
+        ))
+
+    all_rows = []
+    for kw, (rows, complete) in zip(keywords, per_keyword):
+        all_rows.extend(rows)
+        if not complete and incomplete_keywords is not None:
+            incomplete_keywords.add(kw)
+    return all_rows
@@ -0,0 +1,168 @@
+"""
+Reddit 공용 HTTP 클라이언트
+
+모든 Reddit 스크립트가 하나의 requests.Session 을 공유하도록 해서
+- keep-alive 로 TLS 핸드셰이크를 페이지/댓글마다 반복하지 않고
+- gzip 응답을 받고
+- 커넥션 풀 크기와 재시도/백오프 정책을 한 곳에서 관리한다.
+
+사용 예:
+    from reddit_client import get_json
+    data = get_json(f"{BASE_URL}/r/deaf/new.json", params={"limit": 100})
+"""
+import json
+import threading
+import time
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+BASE_URL = "https://www.reddit.com"
+
+# Reddit 권장 형태: 자기용도 + Reddit 계정명 같이 써주면 좋음
+HEADERS = {
+    "User-Agent": "MyRedditResearchScript/0.1 by u_yourusername",
+    "Accept": "application/json",
+    "Accept-Encoding": "gzip, deflate",
+    "Connection": "keep-alive",
+}
+
+POOL_CONNECTIONS = 4        # 호스트별 커넥션 풀 개수 (www.reddit.com 위주라 작게)
+POOL_MAXSIZE = 16           # 풀당 유지할 최대 커넥션 수 (스레드 동시 요청 수 이상으로)
+REQUEST_TIMEOUT = 15        # 요청 타임아웃(초)
+CONNECT_RETRIES = 3         # 연결 오류 / 5xx 재시도 횟수 (urllib3 레벨)
+MAX_RETRIES_429 = 5         # 429 재시도 횟수 (애플리케이션 레벨)
+BACKOFF_SEC = 2.0           # 429 지수 백오프 기본 대기(초)
+
+_session = None
+_session_lock = threading.Lock()
+
+
+class RateLimiter:
+    """
+    여러 스레드가 공유하는 최소 요청 간격 리미터.
+    각 스레드가 따로 sleep 하는 대신 전체 요청 속도를 1 / min_interval 로 맞춘다.
+    """
+
+    def __init__(self, min_interval: float):
+        self.min_interval = min_interval
+        self._next_at = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        with self._lock:
+            now = time.monotonic()
+            wait = self._next_at - now
+            self._next_at = max(now, self._next_at) + self.min_interval
+        if wait > 0:
+            time.sleep(wait)
+
+
+def create_session(headers=None, pool_connections=POOL_CONNECTIONS, pool_maxsize=POOL_MAXSIZE):
+    """
+    keep-alive / gzip / 커넥션 풀 / 5xx 재시도가 설정된 Session 생성.
+    429 는 대기 시간을 스크립트별로 조절해야 해서 get_with_backoff 에서 따로 처리한다.
+    """
+    session = requests.Session()
+    session.headers.update(HEADERS)
+    if headers:
+        session.headers.update(headers)
+
+    retry = Retry(
+        total=CONNECT_RETRIES,
+        connect=CONNECT_RETRIES,
+        read=CONNECT_RETRIES,
+        status_forcelist=[500, 502, 503, 504],
+        allowed_methods=["GET"],
+        backoff_factor=1.0,
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        max_retries=retry,
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def get_session():
+    """프로세스 전체에서 공유하는 Session (처음 호출 시 생성)"""
+    global _session
+    with _session_lock:
+        if _session is None:
+            _session = create_session()
+    return _session
+
+
+def get_with_backoff(
+    url,
+    params=None,
+    max_retries=MAX_RETRIES_429,
+    backoff_sec=BACKOFF_SEC,
+    extra_wait=0.0,
+    timeout=REQUEST_TIMEOUT,
+    session=None,
+    limiter=None,
+    label="",
+):
+    """
+    공유 Session 으로 GET 요청.
+    429 면 Retry-After 헤더(없으면 backoff_sec * 2^attempt + extra_wait)만큼 쉬고 재시도.
+    limiter(RateLimiter)를 주면 매 시도 전에 토큰을 받는다.
+    200 응답이면 Response, 그 외(다른 상태코드 / 재시도 초과 / 네트워크 오류)는 None 반환.
+    """
+    session = session or get_session()
+
+    for attempt in range(max_retries):
+        if limiter is not None:
+            limiter.acquire()
+        try:
+            res = session.get(url, params=params, timeout=timeout)
+        except requests.RequestException as e:
+            print(f"  > {label} 네트워크 오류: {str(e)[:100]}")
+            if attempt < max_retries - 1:
+                time.sleep(backoff_sec * (attempt + 1))
+                continue
+            return None
+
+        if res.status_code == 429:
+            try:
+                wait_time = float(res.headers.get("Retry-After"))
+            except (TypeError, ValueError):
+                wait_time = backoff_sec * (2 ** attempt) + extra_wait
+            print(f"  > {label} 429 (레이트리밋). {wait_time}초 대기 후 재시도.")
+            time.sleep(wait_time)
+            continue
+        if res.status_code != 200:
+            print(f"  > {label} 요청 실패: {res.status_code}")
+            return None
+        return res
+
+    print(f"  > {label} 429가 {max_retries}번 연속 발생해서 중단.")
+    return None
+
+
+def get_json(url, params=None, decode_retries=2, **kwargs):
+    """
+    get_with_backoff + JSON 파싱.
+    빈 응답이나 JSON 디코딩 실패는 decode_retries 번까지 다시 요청하고, 그래도 안 되면 None.
+    """
+    label = kwargs.get("label", "")
+    for attempt in range(decode_retries + 1):
+        res = get_with_backoff(url, params=params, **kwargs)
+        if res is None:
+            return None
+        if not res.text or not res.text.strip():
+            print(f"  > {label} 빈 응답 수신.")
+        else:
+            try:
+                return res.json()
+            except json.JSONDecodeError as e:
+                print(f"  > {label} JSON 디코딩 실패 (응답 길이: {len(res.text)}): {str(e)[:100]}")
+        if attempt < decode_retries:
+            time.sleep(BACKOFF_SEC * (attempt + 1))
+    return None
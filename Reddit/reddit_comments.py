@@ -0,0 +1,185 @@
+"""
+Reddit 댓글 트리 평탄화 + "more" 스텁 확장
+
+- iter_comments : 재귀 없이 스택으로 댓글 트리를 순회하는 제너레이터
+  (원래 트리 순서 = 전위 순회 순서, depth / parent_id / score 포함)
+- "more" 스텁은 버리지 않고 모아서 /api/morechildren 로 최대 100개씩 한 번에 확장
+- "continue this thread" 스텁(children 이 빈 more)은 부모 댓글 기준 하위 트리를 따로 요청
+
+사용 예:
+    from reddit_comments import fetch_post_comments
+    comments = fetch_post_comments("/r/deaf/comments/abc123/title/")
+    bodies = [c["body"] for c in comments]
+"""
+from reddit_client import BASE_URL, get_json
+
+MORECHILDREN_BATCH = 100   # /api/morechildren 한 번에 넘길 수 있는 최대 id 수
+MAX_MORE_REQUESTS = 20     # 게시글 하나당 more 확장에 쓸 최대 추가 요청 수
+SKIP_BODIES = {"[deleted]", "[removed]"}
+
+
+def iter_comments(children, more=None, depth=0, parent_id=None):
+    """
+    댓글 children 리스트를 스택으로 순회하며 댓글 dict 를 하나씩 yield.
+    yield 형식: {"id", "parent_id", "depth", "score", "author", "body"}
+    more 리스트를 넘기면 만난 "more" 스텁을 {"parent_id", "depth", "children"} 로 추가한다.
+    """
+    # (노드, 깊이, 부모 id) 를 역순으로 쌓아서 pop 순서가 원래 순서와 같도록
+    stack = [(c, depth, parent_id) for c in reversed(children or [])]
+    while stack:
+        node, d, parent = stack.pop()
+        kind = node.get("kind")
+        data = node.get("data") or {}
+
+        if kind == "more":
+            if more is not None:
+                more.append({
+                    "parent_id": data.get("parent_id") or parent,
+                    "depth": d,
+                    "children": data.get("children") or [],
+                })
+            continue
+        if kind != "t1":  # 't1'이 댓글을 의미
+            continue
+
+        name = data.get("name") or f"t1_{data.get('id')}"
+        yield {
+            "id": data.get("id"),
+            "parent_id": data.get("parent_id") or parent,
+            "depth": d,
+            "score": data.get("score"),
+            "author": data.get("author"),
+            "body": data.get("body") or "",
+        }
+
+        # 대댓글이 없으면 replies 가 "" 로 온다
+        replies = data.get("replies")
+        if isinstance(replies, dict):
+            sub = replies.get("data", {}).get("children") or []
+            stack.extend((c, d + 1, name) for c in reversed(sub))
+
+
+def _morechildren_things(link_id, ids, base_url=BASE_URL, **request_kwargs):
+    """/api/morechildren 호출 1번. 실패하면 None, 성공하면 things 리스트"""
+    data = get_json(
+        f"{base_url}/api/morechildren.json",
+        params={
+            "api_type": "json",
+            "link_id": link_id,
+            "children": ",".join(ids),
+            "raw_json": 1,
+        },
+        **request_kwargs,
+    )
+    if not isinstance(data, dict):
+        return None
+    return data.get("json", {}).get("data", {}).get("things", [])
+
+
+def expand_more(link_id, more, known_depths, post_json_url, base_url=BASE_URL,
+                max_requests=MAX_MORE_REQUESTS, **request_kwargs):
+    """
+    모아둔 more 스텁을 확장해서 추가 댓글 dict 를 yield.
+    - children id 가 있는 스텁: id 를 모아 MORECHILDREN_BATCH 개씩 /api/morechildren 요청
+      (응답은 평평한 리스트라 parent_id 로 depth 를 다시 계산)
+    - children 이 빈 스텁("continue this thread"): 부모 댓글 하위 트리를 직접 요청
+    확장 결과에 또 more 가 있으면 큐에 다시 넣고, max_requests 를 넘으면 멈춘다.
+    known_depths 는 {"t1_xxx" 또는 "t3_xxx": depth} 로, 호출 중 갱신된다.
+    """
+    pending_ids = []
+    continue_parents = []
+    requests_used = 0
+
+    def enqueue(stubs):
+        for stub in stubs:
+            if stub["children"]:
+                pending_ids.extend(stub["children"])
+            elif stub["parent_id"] and stub["parent_id"].startswith("t1_"):
+                continue_parents.append(stub["parent_id"])
+
+    enqueue(more)
+    while (pending_ids or continue_parents) and requests_used < max_requests:
+        new_more = []
+        if pending_ids:
+            batch = pending_ids[:MORECHILDREN_BATCH]
+            del pending_ids[:MORECHILDREN_BATCH]
+            things = _morechildren_things(link_id, batch, base_url=base_url, **request_kwargs)
+            requests_used += 1
+            if things is None:
+                continue
+            for thing in things:
+                data = thing.get("data") or {}
+                parent = data.get("parent_id")
+                depth = known_depths.get(parent, -1) + 1
+                if thing.get("kind") == "more":
+                    new_more.append({"parent_id": parent, "depth": depth, "children": data.get("children") or []})
+                    continue
+                if thing.get("kind") != "t1":
+                    continue
+                known_depths[data.get("name") or f"t1_{data.get('id')}"] = depth
+                yield {
+                    "id": data.get("id"),
+                    "parent_id": parent,
+                    "depth": depth,
+                    "score": data.get("score"),
+                    "author": data.get("author"),
+                    "body": data.get("body") or "",
+                }
+        else:
+            parent = continue_parents.pop(0)
+            data = get_json(f"{post_json_url[:-len('.json')]}/{parent[3:]}.json", **request_kwargs)
+            requests_used += 1
+            if not isinstance(data, list) or len(data) < 2:
+                continue
+            # 응답의 첫 댓글은 부모 자신이라 건너뛰고, 그 아래만 이어 붙인다
+            base_depth = known_depths.get(parent, 0)
+            roots = data[1].get("data", {}).get("children", [])
+            for c in iter_comments(roots, more=new_more, depth=base_depth):
+                if c["id"] == parent[3:]:
+                    continue
+                known_depths[f"t1_{c['id']}"] = c["depth"]
+                yield c
+        enqueue(new_more)
+
+    if pending_ids or continue_parents:
+        print(f"  > [{link_id}] more 확장 요청 한도({max_requests}) 도달, 남은 스텁은 건너뜀.")
+
+
+def to_json_url(post_url, base_url=BASE_URL):
+    """게시글 URL 또는 permalink 를 댓글 JSON URL 로 변환"""
+    url = post_url.split("?")[0].rstrip("/")
+    if url.startswith("/"):
+        url = base_url + url
+    return url + ".json"
+
+
+def fetch_post_comments(post_url, expand=True, max_more_requests=MAX_MORE_REQUESTS,
+                        base_url=BASE_URL, **request_kwargs):
+    """
+    게시글 하나의 모든 댓글을 트리 순서대로 담은 리스트 반환 (more 스텁까지 확장).
+    삭제/제거된 댓글은 빠진다. 첫 요청이 실패하면 None.
+    request_kwargs 는 reddit_client.get_json 으로 그대로 전달 (max_retries, limiter 등).
+    """
+    json_url = to_json_url(post_url, base_url)
+    data = get_json(json_url, **request_kwargs)
+    if not isinstance(data, list) or len(data) < 2:
+        return None
+
+    posts = data[0].get("data", {}).get("children", [])
+    post_id = posts[0].get("data", {}).get("id") if posts else None
+    link_id = f"t3_{post_id}"
+
+    more = []
+    known_depths = {link_id: -1}
+    comments = []
+    for c in iter_comments(data[1].get("data", {}).get("children", []), more=more, parent_id=link_id):
+        known_depths[f"t1_{c['id']}"] = c["depth"]
+        comments.append(c)
+
+    if expand and more and post_id:
+        comments.extend(expand_more(
+            link_id, more, known_depths, json_url,
+            base_url=base_url, max_requests=max_more_requests, **request_kwargs,
+        ))
+
+    return [c for c in comments if c["body"] and c["body"] not in SKIP_BODIES]
@@ -1,7 +1,11 @@
-import requests
+import argparse
+import asyncio
+import os
+
 import pandas as pd
-from datetime import datetime
-import time
+
+from crawl_state import CrawlStateStore, date_to_utc
+from reddit_async import collect_keywords
  
 BASE_URL = "https://www.reddit.com"
  
@@ -15,147 +19,77 @@ KEYWORDS = ["deaf", "misheard","HearingLoss","hardofhearing"]
 # 서브 쿼리용 토큰 (너무 많이 쓰면 또 429 맞음, 일단 모음만)
 SUB_TOKENS = ["", "a" , "b" , "c" , "d" , "e" , "f" , "g" , "h" , "i" , "j" , "k" , "l" , "m" , "n" , "o" , "p" , "q" , "r" , "s" , "t" , "u" , "v" , "w" , "x" , "y" , "z"]   # ""는 그냥 keyword 단독
  
-MAX_PAGES_PER_SUBQUERY = 50   # 각 쿼리당 최대 3페이지 (= 300개)
-SLEEP_SEC = 2.0              # 요청 간 기본 딜레이(초)
- 
-MAX_RETRIES_429 = 3          # 429 나왔을 때 재시도 최대 횟수
- 
- 
-def fetch_search_with_backoff(query, max_pages=3, sleep_sec=2.0):
-    """
-    /search.json 에서 단순 쿼리로 페이징 돌리는 함수.
-    429(Too Many Requests) 나오면 지수 백오프로 잠깐 기다렸다가 재시도.
-    """
-    all_rows = []
-    after = None
- 
-    for page in range(max_pages):
-        for attempt in range(MAX_RETRIES_429):
-            params = {
-                "q": query,
-                "limit": 100,
-                "sort": "new",
-                "type": "link",
-                "t": "all",  # 전체 기간
-            }
-            if after:
-                params["after"] = after
- 
-            print(f"[QUERY='{query}'] PAGE {page+1}, attempt {attempt+1} 요청 중...")
-            res = requests.get(f"{BASE_URL}/search.json", headers=HEADERS, params=params)
- 
-            if res.status_code == 429:
-                # Too Many Requests → 지수 백오프
-                wait_time = sleep_sec * (2 ** attempt)
-                print(f"  > 429 (레이트리밋). {wait_time}초 대기 후 재시도.")
-                time.sleep(wait_time)
-                continue  # 같은 page 다시 시도
-            elif res.status_code != 200:
-                print(f"  > 요청 실패: {res.status_code}, 이 쿼리 중단.")
-                return all_rows
-            else:
-                # 정상 응답
-                break
-        else:
-            # MAX_RETRIES_429 번 모두 429면 이 쿼리는 더 진행 안 함
-            print("  > 429가 계속 발생해서 이 쿼리는 더 이상 진행 안 함.")
-            return all_rows
- 
-        data = res.json().get("data", {})
-        children = data.get("children", [])
-        if not children:
-            print("  > 더 이상 결과 없음 (children 비어있음).")
-            break
- 
-        for c in children:
-            d = c.get("data", {})
-            post_id = d.get("id")
- 
-            title = d.get("title", "") or ""
-            content = d.get("selftext", "") or ""
-            created = d.get("created_utc", None)
- 
-            if created is not None:
-                date_str = datetime.utcfromtimestamp(created).strftime("%Y-%m-%d %H:%M:%S")
-            else:
-                date_str = None
- 
-            all_rows.append({
-                "post_id": post_id,
-                "title": title,
-                "content": content,
-                "date": date_str,
-                "url": BASE_URL + d.get("permalink", "")
-            })
- 
-        after = data.get("after")
-        if not after:
-            print("  > after 토큰 없음 → 마지막 페이지.")
-            break
- 
-        time.sleep(sleep_sec)
- 
-    return all_rows
- 
- 
-def fetch_keyword_many_by_subtokens_with_backoff(
-    keyword,
-    sub_tokens,
-    max_pages_per_subquery=3,
-    sleep_sec=2.0,
-):
+MAX_PAGES_PER_SUBQUERY = 50   # 각 쿼리당 최대 50페이지 (= 5000개)
+MAX_CONCURRENCY = 8           # 동시에 진행할 서브쿼리 수
+REQUESTS_PER_SEC = 0.5        # 초기 요청 속도 (이후 X-Ratelimit 헤더로 자동 조정)
+
+OUTPUT_NAME = "reddit_global_deaf_misheard_multisearch_backoff.csv"
+STATE_DB = "reddit_crawl_state.db"  # 키워드별 created_utc watermark 저장소 (--incremental)
+
+
+def load_watermarks(state, output_name, keywords):
     """
-    keyword + sub_token 쿼리를 여러 개 던지면서 최대한 많은 글 수집.
-    429를 고려해서 살살 수집하는 버전.
+    키워드별 watermark 를 읽고, 없으면 기존 출력 CSV 의 키워드별 date 최댓값으로 초기화.
     """
-    print(f"\n========== 키워드 '{keyword}' 수집 시작 ==========")
- 
-    all_rows = []
-    seen_post_ids = set()
- 
-    for token in sub_tokens:
-        # ""이면 그냥 keyword만, 아니면 "keyword token"
-        query = keyword if token == "" else f"{keyword} {token}"
-        print(f"\n[{keyword}] 서브쿼리 '{query}' 실행")
- 
-        rows = fetch_search_with_backoff(
-            query,
-            max_pages=max_pages_per_subquery,
-            sleep_sec=sleep_sec,
-        )
- 
-        new_count = 0
-        for r in rows:
-            pid = r.get("post_id")
-            if pid and pid not in seen_post_ids:
-                seen_post_ids.add(pid)
-                r["keyword"] = keyword
-                r["sub_token"] = token
-                all_rows.append(r)
-                new_count += 1
- 
-        print(f"[{keyword}] 서브쿼리 '{query}'에서 신규 수집: {new_count}개, 누적: {len(all_rows)}개")
- 
-        # 서브쿼리 사이에도 살짝 쉬어주기
-        time.sleep(sleep_sec)
- 
-    print(f"[{keyword}] 최종 수집 개수: {len(all_rows)}개\n")
-    return all_rows
+    existing = None
+    since = {}
+    for kw in keywords:
+        scope = f"search/{kw}"
+        since[kw] = state.get_watermark(scope)
+        if since[kw] is not None:
+            continue
+        if existing is None:
+            existing = pd.read_csv(output_name, dtype=str) if os.path.exists(output_name) else pd.DataFrame()
+        if "keyword" in existing.columns:
+            rows = existing.loc[existing["keyword"] == kw, ["post_id", "url", "date"]].to_dict("records")
+            since[kw] = state.seed_watermark(scope, scope, rows)
+    return since
+
+
+def merge_into_existing(new_df, output_name):
+    """기존 출력 CSV 뒤에 새 결과를 이어 붙임 (중복은 저장 전에 (keyword, post_id) 기준으로 제거)"""
+    if not os.path.exists(output_name):
+        return new_df
+    old_df = pd.read_csv(output_name, dtype={"post_id": str})
+    return pd.concat([old_df, new_df], ignore_index=True)
  
  
 if __name__ == "__main__":
-    all_data = []
- 
-    for kw in KEYWORDS:
-        rows = fetch_keyword_many_by_subtokens_with_backoff(
-            kw,
-            sub_tokens=SUB_TOKENS,
-            max_pages_per_subquery=MAX_PAGES_PER_SUBQUERY,
-            sleep_sec=SLEEP_SEC,
-        )
-        all_data.extend(rows)
+    parser = argparse.ArgumentParser(description="Reddit 키워드 검색 수집기")
+    parser.add_argument("--incremental", action="store_true",
+                        help="키워드별 created_utc watermark 이후 게시글만 수집해서 기존 CSV 에 합침")
+    parser.add_argument("--rate", type=float, default=REQUESTS_PER_SEC,
+                        help="초기 초당 요청 수 (이후 X-Ratelimit 헤더로 자동 조정)")
+    parser.add_argument("--concurrency", type=int, default=MAX_CONCURRENCY, help="동시에 진행할 서브쿼리 수")
+    args = parser.parse_args()
+
+    output_name = OUTPUT_NAME
+    state = None
+    since_by_keyword = None
+    if args.incremental:
+        state = CrawlStateStore(STATE_DB)
+        since_by_keyword = load_watermarks(state, output_name, KEYWORDS)
+        for kw, since in since_by_keyword.items():
+            print(f"[{kw}] watermark: {pd.to_datetime(since, unit='s') if since else '없음 (전체 수집)'}")
+
+    # 키워드 × 서브토큰 서브쿼리를 공유 레이트리미터 아래에서 동시에 수집
+    incomplete = set()
+    all_data = asyncio.run(collect_keywords(
+        KEYWORDS,
+        SUB_TOKENS,
+        max_pages_per_subquery=MAX_PAGES_PER_SUBQUERY,
+        concurrency=args.concurrency,
+        rate=args.rate,
+        base_url=BASE_URL,
+        headers=HEADERS,
+        since_by_keyword=since_by_keyword,
+        incomplete_keywords=incomplete,
+    ))
  
     df = pd.DataFrame(all_data)
+    if args.incremental:
+        print("신규 수집 개수:", len(df))
+        df = merge_into_existing(df, output_name)
  
     if {"keyword", "post_id"}.issubset(df.columns):
         df = df.drop_duplicates(subset=["keyword", "post_id"])
@@ -163,6 +97,25 @@ if __name__ == "__main__":
     print("총 수집 개수:", len(df))
     print(df.head())
  
-    output_name = "reddit_global_deaf_misheard_multisearch_backoff.csv"
     df.to_csv(output_name, index=False, encoding="utf-8-sig")
     print(f"CSV 저장 완료: {output_name}")
+
+    # 저장이 끝난 뒤에만 watermark 를 올림 (저장 전에 죽으면 다음 실행에서 같은 구간을 다시 수집)
+    # 서브쿼리 하나라도 이전 watermark / 결과 끝까지 닿지 못한 키워드(요청 실패, 페이지 수 제한)는
+    # watermark 를 그대로 둠 → 다음 실행에서 빠진 구간을 다시 훑고, 중복은 (keyword, post_id) 로 제거
+    if state is not None:
+        newest = {}
+        for r in all_data:
+            created = date_to_utc(r.get("date"))
+            if created is not None:
+                newest[r["keyword"]] = max(created, newest.get(r["keyword"], created))
+        for kw, created in newest.items():
+            if kw in incomplete:
+                print(f"⚠️ [{kw}] 중간에 멈춘 서브쿼리가 있어 watermark 를 올리지 않습니다.")
+                continue
+            state.set_watermark(f"search/{kw}", created)
+        # 첫 전체 수집이 중간에 멈춘 키워드는 0 을 기록 (다음 실행이 불완전한 CSV 로 watermark 를 초기화하지 않게)
+        for kw in incomplete:
+            if since_by_keyword.get(kw) is None:
+                state.set_watermark(f"search/{kw}", 0.0)
+        state.close()
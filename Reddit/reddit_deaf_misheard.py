@@ -1,14 +1,8 @@
-import requests
 import pandas as pd
 from datetime import datetime
 import time
- 
-BASE_URL = "https://www.reddit.com"
- 
-# Reddit 권장 형태: 자기용도 + Reddit 계정명 같이 써주면 좋음
-HEADERS = {
-    "User-Agent": "MyRedditResearchScript/0.1 by u_yourusername"
-}
+
+from reddit_client import BASE_URL, get_json
  
 KEYWORDS = ["deaf", "misheard"]
  
@@ -30,38 +24,30 @@ def fetch_search_with_backoff(query, max_pages=3, sleep_sec=2.0):
     after = None
  
     for page in range(max_pages):
-        for attempt in range(MAX_RETRIES_429):
-            params = {
-                "q": query,
-                "limit": 100,
-                "sort": "new",
-                "type": "link",
-                "t": "all",  # 전체 기간
-            }
-            if after:
-                params["after"] = after
- 
-            print(f"[QUERY='{query}'] PAGE {page+1}, attempt {attempt+1} 요청 중...")
-            res = requests.get(f"{BASE_URL}/search.json", headers=HEADERS, params=params)
- 
-            if res.status_code == 429:
-                # Too Many Requests → 지수 백오프
-                wait_time = sleep_sec * (2 ** attempt)
-                print(f"  > 429 (레이트리밋). {wait_time}초 대기 후 재시도.")
-                time.sleep(wait_time)
-                continue  # 같은 page 다시 시도
-            elif res.status_code != 200:
-                print(f"  > 요청 실패: {res.status_code}, 이 쿼리 중단.")
-                return all_rows
-            else:
-                # 정상 응답
-                break
-        else:
-            # MAX_RETRIES_429 번 모두 429면 이 쿼리는 더 진행 안 함
-            print("  > 429가 계속 발생해서 이 쿼리는 더 이상 진행 안 함.")
+        params = {
+            "q": query,
+            "limit": 100,
+            "sort": "new",
+            "type": "link",
+            "t": "all",  # 전체 기간
+        }
+        if after:
+            params["after"] = after
+ 
+        print(f"[QUERY='{query}'] PAGE {page+1} 요청 중...")
+        # 공유 세션(keep-alive) + 429 지수 백오프는 reddit_client 에서 처리
+        body = get_json(
+            f"{BASE_URL}/search.json",
+            params=params,
+            max_retries=MAX_RETRIES_429,
+            backoff_sec=sleep_sec,
+            label=f"[QUERY='{query}']",
+        )
+        if body is None:
+            print("  > 요청 실패 또는 429 반복, 이 쿼리 중단.")
             return all_rows
  
-        data = res.json().get("data", {})
+        data = body.get("data", {})
         children = data.get("children", [])
         if not children:
             print("  > 더 이상 결과 없음 (children 비어있음).")
@@ -1,25 +1,34 @@
+import argparse
 import pandas as pd  # pyright: ignore[reportMissingImports]
-import time
-from tqdm import tqdm
+
+from translate_pipeline import CONCURRENCY, run_translation, save_csv
+from translation_backends import GoogleWebTranslator
+from translation_cache import TranslationCache
+
+INPUT_FILE = './data/reddit_deaf_misheard.csv'
+OUTPUT_FILE = 'reddit_deaf_misheard_한글화.csv'
+CHECKPOINT_FILE = OUTPUT_FILE + '.checkpoint.jsonl'
+SLEEP_SEC = 0.2  # 전체 워커가 공유하는 최소 요청 간격 (레이트리밋이 걸리면 자동으로 늘어남)
+
+parser = argparse.ArgumentParser(description="Google 번역으로 title/content 한글 컬럼 추가 (병렬)")
+parser.add_argument("--input", default=INPUT_FILE, help="입력 CSV")
+parser.add_argument("--output", default=OUTPUT_FILE, help="출력 CSV")
+parser.add_argument("--checkpoint", default=CHECKPOINT_FILE, help="번역 체크포인트(JSONL)")
+parser.add_argument("--concurrency", type=int, default=CONCURRENCY, help="동시 요청 워커 수")
+parser.add_argument("--resume", action="store_true", help="체크포인트에 있는 행은 건너뛰고 이어서 번역")
+args = parser.parse_args()
  
 # deep_translator가 없으면 googletrans 사용 시도, 둘 다 없으면 번역 기능 비활성화
+# (5000자 넘는 글은 문단/문장 경계로 나눠서 번역, 429 가 나면 전체 워커의 요청 간격을 같이 늘림)
 try:
-    from deep_translator import GoogleTranslator
-    translator = GoogleTranslator(source='en', target='ko')
-    USE_DEEP_TRANSLATOR = True
+    translator = GoogleWebTranslator(source='en', target='ko', min_interval=SLEEP_SEC)
 except ImportError:
-    try:
-        from googletrans import Translator
-        translator = Translator()
-        USE_DEEP_TRANSLATOR = False
-        print("deep_translator를 찾을 수 없어 googletrans를 사용합니다.")
-    except ImportError:
-        translator = None
-        print("⚠️ 번역 라이브러리를 찾을 수 없습니다. 번역 기능을 사용할 수 없습니다.")
-        print("설치 명령: pip install deep-translator 또는 pip install googletrans==4.0.0rc1")
- 
+    translator = None
+    print("⚠️ 번역 라이브러리를 찾을 수 없습니다. 번역 기능을 사용할 수 없습니다.")
+    print("설치 명령: pip install deep-translator 또는 pip install googletrans==4.0.0rc1")
+
 # CSV 파일 읽기
-df = pd.read_csv('./data/reddit_deaf_misheard.csv')
+df = pd.read_csv(args.input)
  
 print(f"원본 데이터: {len(df)}건")
 print(f"컬럼: {df.columns.tolist()}\n")
@@ -29,63 +38,43 @@ if translator is None:
     df.to_csv('reddit_hardofhearing_subreddit_7시간_한글화.csv', index=False, encoding='utf-8-sig')
     exit(0)
  
+# 번역 캐시 (원문 해시 + 언어 + 엔진 기준, 이미 번역한 텍스트는 다시 요청하지 않음)
+cache = TranslationCache()
+ 
 # 번역할 컬럼들
 translation_columns = ['title', 'content']  # 번역할 컬럼명
- 
-# 각 번역 컬럼에 대해 번역본 컬럼 추가
+columns = {}
 for col in translation_columns:
     if col not in df.columns:
         print(f"경고: '{col}' 컬럼이 없습니다. 건너뜁니다.")
         continue
-   
-    translated_col = f"{col}_한글"
-    print(f"'{col}' 컬럼 번역 중...")
-   
-    translated_values = []
-   
-    for idx, value in enumerate(tqdm(df[col], desc=f"{col} 번역 중", unit="건")):
-        if pd.isna(value) or str(value).strip() == "":
-            translated_values.append("")
-        else:
-            try:
-                # 텍스트가 너무 길면 잘라서 번역 (5000자 단위)
-                text = str(value)
-                if len(text) > 5000:
-                    # 긴 텍스트는 분할해서 번역 후 합치기
-                    chunks = [text[i:i+5000] for i in range(0, len(text), 5000)]
-                    translated_chunks = []
-                    for chunk in chunks:
-                        if USE_DEEP_TRANSLATOR:
-                            translated_chunk = translator.translate(chunk)
-                        else:
-                            # googletrans 사용
-                            translated_chunk = translator.translate(chunk, dest='ko').text
-                        translated_chunks.append(translated_chunk)
-                        time.sleep(0.5)  # API 레이트 리밋 방지
-                    translated_text = " ".join(translated_chunks)
-                else:
-                    if USE_DEEP_TRANSLATOR:
-                        translated_text = translator.translate(text)
-                    else:
-                        # googletrans 사용
-                        translated_text = translator.translate(text, dest='ko').text
-               
-                translated_values.append(translated_text)
-            except Exception as e:
-                print(f"\n  [{idx}] 번역 실패: {str(e)[:100]}")
-                translated_values.append("")  # 번역 실패 시 빈 문자열
-           
-            # API 레이트 리밋 방지
-            time.sleep(0.2)
-   
-    # 번역된 컬럼 추가 (원본 컬럼 바로 옆에)
-    col_idx = df.columns.get_loc(col)
-    df.insert(col_idx + 1, translated_col, translated_values)
-    print(f"  완료: '{translated_col}' 컬럼 추가됨\n")
- 
+    columns[col] = f"{col}_한글"
+
+
+def translate_many(texts):
+    """워커 하나가 맡은 원문 묶음 번역 (캐시에 없을 때만 API 호출, 실패한 항목은 빈 문자열)"""
+    return cache.translate_batch(texts, translator.translate_batch, 'en', 'ko', translator.engine)
+
+
+# 번역된 컬럼은 원본 컬럼 바로 옆에 추가, 끝난 행은 체크포인트에 바로 기록
+print(f"{list(columns)} 컬럼 번역 중... (워커 {args.concurrency}개)")
+stats = run_translation(
+    df,
+    columns,
+    translate_many,
+    checkpoint_path=args.checkpoint,
+    concurrency=args.concurrency,
+    resume=args.resume,
+    only_empty=False,
+)
+print(f"  완료: {list(columns.values())} 컬럼 추가됨 "
+      f"(번역 {stats['translated']}건 / 체크포인트 복원 {stats['restored']}건 / 실패 {stats['failed']}건)\n")
+
 # 결과 저장
-output_file = 'reddit_deaf_misheard_한글화.csv'
-df.to_csv(output_file, index=False, encoding='utf-8-sig')
+output_file = args.output
+save_csv(df, output_file)
 print(f"번역 완료! 저장 파일: {output_file}")
 print(f"최종 데이터: {len(df)}건")
-print(f"최종 컬럼: {df.columns.tolist()}")
\ No newline at end of file
+print(f"최종 컬럼: {df.columns.tolist()}")
+print(cache.summary())
+cache.close()
\ No newline at end of file
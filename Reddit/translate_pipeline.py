@@ -0,0 +1,191 @@
+"""
+병렬 번역 파이프라인 (워커 풀 + 적응형 레이트리밋 + 체크포인트)
+
+- 번역 대상 행을 rows_per_task 개씩 묶어 워커 concurrency 개가 동시에 번역
+- 429 / 할당량 초과 오류가 나면 AdaptiveRateLimiter 가 전체 요청 간격을 늘리고,
+  성공이 이어지면 다시 min_interval 까지 천천히 줄임
+- 끝난 행은 (컬럼, 행 index, 원문 해시, 번역문) 을 체크포인트(JSONL)에 한 줄씩 바로 기록(flush)
+  → 중간에 죽어도 resume=True 로 다시 실행하면 체크포인트에 있는 행은 건너뜀
+  (원문 해시가 다른 행은 CSV 가 바뀐 것으로 보고 다시 번역)
+- open_ai.py(Gemini 배치 번역) 와 reddit_hangul.py(Google 번역) 가 같이 사용한다.
+
+사용 예:
+    limiter = AdaptiveRateLimiter(0.2)
+    run_translation(df, {"content": "content_한글"}, translate_many,
+                    checkpoint_path="translation_checkpoint.jsonl", concurrency=4, resume=True)
+"""
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+import pandas as pd
+from tqdm import tqdm
+
+from batch_translate import is_rate_limit_error, pack_batches
+from reddit_client import RateLimiter
+from translation_cache import text_hash
+
+CHECKPOINT_FILE = "translation_checkpoint.jsonl"
+CONCURRENCY = 4             # 동시에 번역 요청을 보내는 워커 수
+ROWS_PER_TASK = 20          # 워커 하나가 한 번에 맡는 행 수 (배치 번역이면 대략 요청 1~2회 분량)
+MAX_INTERVAL = 60.0         # 레이트리밋이 계속 걸릴 때 늘어날 수 있는 최대 요청 간격(초)
+MAX_RATE_LIMIT_RETRIES = 5  # 429 / 할당량 오류 재시도 횟수
+
+
+class AdaptiveRateLimiter(RateLimiter):
+    """
+    429 / 할당량 오류에 맞춰 요청 간격을 조절하는 RateLimiter.
+    backoff() 하면 간격을 2배로 늘리고 모든 워커를 잠시 멈추고,
+    success() 가 불릴 때마다 간격을 10%씩 줄여서 min_interval 로 돌아간다.
+    """
+
+    def __init__(self, min_interval: float, max_interval: float = MAX_INTERVAL):
+        super().__init__(min_interval)
+        self.base_interval = min_interval
+        self.max_interval = max_interval
+        self.backoffs = 0
+
+    def backoff(self, wait: float = None):
+        with self._lock:
+            self.min_interval = min(self.max_interval, max(self.min_interval * 2, 1.0))
+            pause = wait if wait is not None else self.min_interval
+            self._next_at = max(self._next_at, time.monotonic() + pause)
+            self.backoffs += 1
+        print(f"  > 레이트리밋 감지: 요청 간격 {self.min_interval:.1f}초로 늘림 ({pause:.1f}초 대기)")
+
+    def success(self):
+        with self._lock:
+            if self.min_interval > self.base_interval:
+                self.min_interval = max(self.base_interval, self.min_interval * 0.9)
+
+
+def rate_limited(fn, limiter, max_retries: int = MAX_RATE_LIMIT_RETRIES):
+    """fn 호출 전에 limiter 토큰을 받고, 레이트리밋 오류면 backoff 후 재시도하는 래퍼"""
+    def wrapper(*args, **kwargs):
+        for attempt in range(max_retries + 1):
+            limiter.acquire()
+            try:
+                result = fn(*args, **kwargs)
+            except Exception as e:
+                if attempt < max_retries and is_rate_limit_error(e):
+                    limiter.backoff()
+                    continue
+                raise
+            limiter.success()
+            return result
+    return wrapper
+
+
+def load_checkpoint(checkpoint_path: str) -> dict:
+    """
+    체크포인트(JSONL)에서 {(컬럼, 행 index): (원문 해시, 번역문)} 을 읽어옴.
+    중단되면서 잘린 마지막 줄은 무시한다.
+    """
+    done = {}
+    if not os.path.exists(checkpoint_path):
+        return done
+    with open(checkpoint_path, encoding="utf-8") as f:
+        for line in f:
+            try:
+                rec = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            done[(rec["column"], rec["index"])] = (rec["hash"], rec["translated"])
+    return done
+
+
+def _index_key(idx):
+    # numpy 정수 index 도 JSON 에 그대로 쓸 수 있게 파이썬 기본형으로
+    return idx.item() if hasattr(idx, "item") else idx
+
+
+def run_translation(df: pd.DataFrame,
+                    columns: dict,
+                    translate_many,
+                    checkpoint_path: str = CHECKPOINT_FILE,
+                    concurrency: int = CONCURRENCY,
+                    resume: bool = False,
+                    rows_per_task: int = ROWS_PER_TASK,
+                    only_empty: bool = True,
+                    index=None,
+                    max_task_tokens: int = None) -> dict:
+    """
+    df 의 원문 컬럼들을 병렬로 번역해서 번역 컬럼에 채움 (df 를 직접 수정)
+
+    - columns: {원문 컬럼: 번역 컬럼}
+    - translate_many: 원문 리스트 → 번역문 리스트 (실패한 항목은 빈 문자열)
+    - resume: True 면 체크포인트에 있는 행은 다시 번역하지 않고 그대로 채움
+    - only_empty: True 면 번역 컬럼이 이미 채워진 행은 건너뜀
+    - index: 번역 대상 행 index (None 이면 전체 행, 테스트로 일부만 돌릴 때)
+    - max_task_tokens: 작업 하나의 원문 토큰 상한 (보통 Translator.max_batch_tokens, None 이면 행 수로만 자름)
+    반환값은 {"restored", "translated", "failed"} 건수.
+    """
+    done = load_checkpoint(checkpoint_path) if resume else {}
+    stats = {"restored": 0, "translated": 0, "failed": 0}
+
+    tasks = []
+    for src, dst in columns.items():
+        if dst not in df.columns:
+            df.insert(df.columns.get_loc(src) + 1, dst, "")
+        df[dst] = df[dst].astype(object)  # 전부 비어 있으면 float 컬럼이라 문자열 대입이 안 됨
+        todo = []
+        values = df[src] if index is None else df.loc[index, src]
+        for idx, value in values.items():
+            if pd.isna(value) or str(value).strip() == "":
+                continue
+            current = df.at[idx, dst]
+            if only_empty and isinstance(current, str) and current.strip():
+                continue
+            text = str(value)
+            saved = done.get((src, _index_key(idx)))
+            if saved is not None and saved[0] == text_hash(text):
+                df.at[idx, dst] = saved[1]
+                stats["restored"] += 1
+                continue
+            todo.append((idx, text))
+        for rows in pack_batches(todo, max_task_tokens or float("inf"), rows_per_task):
+            tasks.append((src, dst, rows))
+
+    if resume:
+        print(f"체크포인트에서 {stats['restored']}개 행 복원, "
+              f"남은 행 {sum(len(rows) for _, _, rows in tasks)}개")
+
+    def work(rows):
+        return translate_many([text for _, text in rows])
+
+    with open(checkpoint_path, "a" if resume else "w", encoding="utf-8") as f, \
+            ThreadPoolExecutor(max_workers=concurrency) as executor:
+        futures = {executor.submit(work, rows): (src, dst, rows) for src, dst, rows in tasks}
+        progress = tqdm(total=sum(len(rows) for _, _, rows in tasks), desc="번역 중", unit="건")
+        for future in as_completed(futures):
+            src, dst, rows = futures[future]
+            try:
+                results = future.result()
+            except Exception as e:
+                print(f"\n  번역 실패 ({len(rows)}건): {str(e)[:100]}")
+                results = [""] * len(rows)
+            # 쓰기는 메인 스레드 하나에서만 (단일 writer)
+            for (idx, text), translated in zip(rows, results):
+                if not translated:
+                    stats["failed"] += 1  # 체크포인트에 안 남기므로 resume 때 다시 시도
+                    continue
+                df.at[idx, dst] = translated
+                f.write(json.dumps({"column": src, "index": _index_key(idx), "hash": text_hash(text),
+                                    "translated": translated}, ensure_ascii=False) + "\n")
+                stats["translated"] += 1
+            f.flush()
+            progress.update(len(rows))
+        progress.close()
+
+    if stats["failed"]:
+        print(f"⚠️ 번역 실패 {stats['failed']}건 - resume 으로 다시 실행하면 이 행만 재시도합니다.")
+    return stats
+
+
+def save_csv(df: pd.DataFrame, output_path: str):
+    """임시 파일에 쓴 뒤 교체 (저장 도중 죽어도 이전 결과 파일이 깨지지 않음)"""
+    tmp_path = output_path + ".tmp"
+    df.to_csv(tmp_path, index=False, encoding="utf-8-sig")
+    os.replace(tmp_path, output_path)
+
@@ -0,0 +1,251 @@
+"""
+번역 엔진(백엔드) 공통 인터페이스와 어댑터
+
+모든 엔진은 Translator 를 상속해서 아래를 제공한다.
+- engine           : 번역 캐시 키에 들어가는 엔진 이름 (예: "gemini/gemini-2.5-flash")
+- max_batch_tokens : translate_batch 한 번에 넘기기 좋은 원문 토큰 양 (워커 작업 단위 크기)
+- min_interval     : 요청 사이 최소 간격(초). 429 가 나면 AdaptiveRateLimiter 가 자동으로 늘림
+- max_concurrency  : 동시에 돌리기 좋은 워커 수
+- translate_batch(texts) → 같은 순서의 번역문 리스트 (빈 원문 / 실패한 항목은 빈 문자열)
+
+엔진:
+    gemini : Gemini LLM. 짧은 글 여러 개를 한 요청으로 묶어서 번역 (batch_translate.BatchTranslator)
+    google : deep_translator(우선) / googletrans 무료 Google 번역
+    local  : 디스크에 받아 둔 MarianMT / NLLB 체크포인트로 배치 추론 (네트워크 없음)
+    fake   : 오프라인 테스트용 가짜 LLM (원문 앞에 "[KO] " 만 붙임)
+
+사용 예:
+    translator = create_translator("local", model_path="models/opus-mt-tc-big-en-ko")
+    ko_list = translator.translate_batch(en_list)
+"""
+import os
+from abc import ABC, abstractmethod
+
+from batch_translate import (
+    MAX_BATCH_TOKENS,
+    BatchTranslator,
+    FakeLLMBackend,
+    GeminiBackend,
+    join_segments,
+    segment_texts,
+    split_text,
+)
+from translate_pipeline import CONCURRENCY, AdaptiveRateLimiter, rate_limited
+
+ENGINES = ("gemini", "google", "local", "fake")
+GEMINI_MODEL = "gemini-2.5-flash"
+GOOGLE_MAX_CHARS = 5000          # Google 번역 웹 API 한 번에 넣을 수 있는 최대 글자 수
+
+LOCAL_BATCH_SIZE = 16            # 로컬 모델 추론 배치 크기 (조각 수)
+LOCAL_MAX_INPUT_TOKENS = 400     # 로컬 모델에 넣을 조각 최대 토큰 (Marian/NLLB 최대 길이 512 보다 여유 있게)
+LOCAL_NUM_BEAMS = 2
+NLLB_LANGS = ("eng_Latn", "kor_Hang")
+MARIAN_TARGET_TOKENS = (">>kor<<", ">>kor_Hang<<")  # 다국어 Marian 모델의 대상 언어 토큰
+
+
+class Translator(ABC):
+    """번역 엔진 공통 인터페이스 (translate_batch 를 구현하지 않은 엔진은 생성할 때 TypeError)"""
+
+    engine = "base"
+    max_batch_tokens = MAX_BATCH_TOKENS
+    min_interval = 0.0
+    max_concurrency = 1
+
+    @abstractmethod
+    def translate_batch(self, texts):
+        """texts 와 같은 순서의 번역문 리스트 (빈 원문 / 실패한 항목은 빈 문자열)"""
+
+    def translate(self, text: str) -> str:
+        return self.translate_batch([text])[0]
+
+
+class LLMTranslator(Translator):
+    """프롬프트 기반 LLM 엔진 (문서 묶기 / 구분자 분리 / 레이트리밋은 BatchTranslator 가 처리)"""
+
+    def __init__(self, backend, min_interval: float = 0.2, max_concurrency: int = CONCURRENCY,
+                 max_batch_tokens: int = MAX_BATCH_TOKENS):
+        self.engine = backend.engine
+        self.min_interval = min_interval
+        self.max_concurrency = max_concurrency
+        self.max_batch_tokens = max_batch_tokens
+        self.limiter = AdaptiveRateLimiter(min_interval)
+        self.batch = BatchTranslator(backend, max_batch_tokens=max_batch_tokens, limiter=self.limiter)
+
+    def translate_batch(self, texts):
+        return self.batch.translate_many(texts)
+
+
+class GeminiTranslator(LLMTranslator):
+    """Google Gemini (google.generativeai) 엔진"""
+
+    def __init__(self, model_name: str = GEMINI_MODEL, api_key: str = None, model=None, **kwargs):
+        if model is None:
+            import google.generativeai as genai  # pyright: ignore[reportMissingImports]
+            api_key = api_key or os.getenv("GOOGLE_API_KEY")
+            if not api_key:
+                raise ValueError("Google API 키가 설정되지 않았습니다. 환경 변수 GOOGLE_API_KEY를 설정하거나 코드에 직접 입력하세요.")
+            genai.configure(api_key=api_key)
+            model = genai.GenerativeModel(model_name)
+        self.model = model
+        super().__init__(GeminiBackend(model_name, model=model), **kwargs)
+
+
+class FakeTranslator(LLMTranslator):
+    """오프라인 테스트 / 벤치마크 기준선용 가짜 LLM 엔진"""
+
+    def __init__(self, drop_every: int = 0, latency: float = 0.0, **kwargs):
+        kwargs.setdefault("min_interval", 0.0)
+        super().__init__(FakeLLMBackend(drop_every=drop_every, latency=latency), **kwargs)
+
+
+class GoogleWebTranslator(Translator):
+    """deep_translator(우선) 또는 googletrans 로 한 건씩 번역. 둘 다 없으면 ImportError"""
+
+    max_batch_tokens = GOOGLE_MAX_CHARS // 4
+
+    def __init__(self, source: str = "en", target: str = "ko",
+                 min_interval: float = 0.2, max_concurrency: int = CONCURRENCY):
+        try:
+            from deep_translator import GoogleTranslator
+            self.client = GoogleTranslator(source=source, target=target)
+            self.use_deep_translator = True
+        except ImportError:
+            from googletrans import Translator as GoogleTrans
+            self.client = GoogleTrans()
+            self.use_deep_translator = False
+            print("deep_translator를 찾을 수 없어 googletrans를 사용합니다.")
+        self.target = target
+        self.engine = "google/deep_translator" if self.use_deep_translator else "google/googletrans"
+        self.min_interval = min_interval
+        self.max_concurrency = max_concurrency
+        self.limiter = AdaptiveRateLimiter(min_interval)
+        self._translate_chunk = rate_limited(self._request, self.limiter)
+
+    def _request(self, chunk: str) -> str:
+        if self.use_deep_translator:
+            return self.client.translate(chunk)
+        return self.client.translate(chunk, dest=self.target).text
+
+    def translate_text(self, text: str) -> str:
+        """5000자 넘으면 문단/문장 경계로 나눠서 번역 후 원래 구분자로 다시 합침"""
+        return "".join(
+            (chunk if not chunk.strip() else self._translate_chunk(chunk)) + sep
+            for chunk, sep in split_text(text, GOOGLE_MAX_CHARS)
+        )
+
+    def translate_batch(self, texts):
+        results = []
+        for text in texts:
+            if not isinstance(text, str) or not text.strip():
+                results.append("")
+                continue
+            try:
+                results.append(self.translate_text(text) or "")
+            except Exception as e:
+                print(f"\n  번역 실패: {str(e)[:100]}")
+                results.append("")
+        return results
+
+
+class LocalSeq2SeqTranslator(Translator):
+    """
+    디스크에 받아 둔 MarianMT / NLLB 체크포인트로 배치 추론 (네트워크 호출 없음)
+
+    - 긴 글은 토크나이저 기준 max_input_tokens 이하로 문단/문장 경계에서 잘라서 번역
+    - 길이가 비슷한 조각끼리 batch_size 개씩 묶어서 패딩 낭비를 줄임
+    - NLLB(M2M100 계열)는 src_lang / forced_bos_token_id 를, 다국어 Marian 은 >>kor<< 토큰을 자동 설정
+    """
+
+    max_concurrency = 1  # 한 프로세스 안에서는 torch 가 코어를 나눠 쓰므로 워커 1개가 가장 빠름
+
+    def __init__(self, model_path: str, device: str = None, batch_size: int = LOCAL_BATCH_SIZE,
+                 max_input_tokens: int = LOCAL_MAX_INPUT_TOKENS, num_beams: int = LOCAL_NUM_BEAMS,
+                 num_threads: int = None, src_lang: str = None, tgt_lang: str = None):
+        """
+        Args:
+            model_path: 로컬 체크포인트 디렉토리 (예: models/opus-mt-tc-big-en-ko, models/nllb-200-distilled-600M)
+            device: 'cuda' 또는 'cpu' (None이면 자동 선택)
+            batch_size: 추론 배치 크기 (조각 수)
+            max_input_tokens: 조각 하나의 최대 토큰 수
+            num_beams: 빔 서치 크기 (1 이면 greedy, 가장 빠름)
+            num_threads: torch CPU 스레드 수 (None이면 torch 기본값)
+            src_lang / tgt_lang: NLLB 언어 코드 (None이면 eng_Latn / kor_Hang)
+        """
+        import torch
+        from transformers import AutoModelForSeq2SeqLM, AutoTokenizer
+
+        self.torch = torch
+        if num_threads:
+            torch.set_num_threads(num_threads)
+        self.device = device if device else ("cuda" if torch.cuda.is_available() else "cpu")
+
+        self.model = AutoModelForSeq2SeqLM.from_pretrained(model_path, local_files_only=True)
+        if self.model.config.model_type == "m2m_100" and src_lang is None:
+            src_lang, tgt_lang = NLLB_LANGS
+        tokenizer_kwargs = {"src_lang": src_lang} if src_lang else {}
+        self.tokenizer = AutoTokenizer.from_pretrained(model_path, local_files_only=True, **tokenizer_kwargs)
+        self.model.to(self.device)
+        self.model.eval()
+
+        # 한국어 출력은 원문보다 토큰이 많아질 수 있지만 모델 최대 위치(Marian 512, NLLB 1024)는 넘지 않게
+        max_positions = getattr(self.model.config, "max_position_embeddings", None) or max_input_tokens * 2
+        self.generate_kwargs = {"num_beams": num_beams,
+                                "max_new_tokens": min(max_input_tokens * 2, max_positions - 2)}
+        if tgt_lang:
+            self.generate_kwargs["forced_bos_token_id"] = self.tokenizer.convert_tokens_to_ids(tgt_lang)
+        vocab = self.tokenizer.get_vocab()
+        self.prefix = next((f"{token} " for token in MARIAN_TARGET_TOKENS if token in vocab), "")
+
+        self.engine = f"local/{os.path.basename(os.path.normpath(model_path))}"
+        self.batch_size = batch_size
+        self.max_input_tokens = max_input_tokens
+        self.max_batch_tokens = batch_size * max_input_tokens
+
+    def count_tokens(self, text: str) -> int:
+        return len(self.tokenizer(text, add_special_tokens=False)["input_ids"])
+
+    def _generate(self, chunks):
+        encoded = self.tokenizer(
+            [self.prefix + chunk for chunk in chunks],
+            padding=True,
+            truncation=True,
+            max_length=self.max_input_tokens + 8,
+            return_tensors="pt",
+        )
+        encoded = {k: v.to(self.device) for k, v in encoded.items()}
+        with self.torch.inference_mode():
+            output = self.model.generate(**encoded, **self.generate_kwargs)
+        return self.tokenizer.batch_decode(output, skip_special_tokens=True)
+
+    def translate_batch(self, texts):
+        pending = {i: text for i, text in enumerate(texts) if isinstance(text, str) and text.strip()}
+        segments, layout = segment_texts(pending, self.max_input_tokens, self.count_tokens)
+
+        ordered = sorted(segments, key=lambda seg: len(seg[1]))
+        translated = {}
+        for start in range(0, len(ordered), self.batch_size):
+            batch = ordered[start:start + self.batch_size]
+            for (seg_id, _), output in zip(batch, self._generate([chunk for _, chunk in batch])):
+                translated[seg_id] = output.strip()
+
+        joined = join_segments(layout, translated)
+        return [joined.get(i, "") for i in range(len(texts))]
+
+
+def create_translator(name: str, **kwargs) -> Translator:
+    """
+    이름으로 번역 엔진 생성
+
+    Args:
+        name: "gemini" | "google" | "local" | "fake"
+        **kwargs: 엔진별 생성자 인자 (local 은 model_path 필수)
+    """
+    if name == "gemini":
+        return GeminiTranslator(**kwargs)
+    if name == "google":
+        return GoogleWebTranslator(**kwargs)
+    if name == "local":
+        return LocalSeq2SeqTranslator(**kwargs)
+    if name == "fake":
+        return FakeTranslator(**kwargs)
+    raise ValueError(f"알 수 없는 번역 엔진: {name} (가능: {', '.join(ENGINES)})")
@@ -0,0 +1,138 @@
+"""
+번역 결과 영구 캐시 (SQLite, WAL 모드)
+
+(정규화한 원문 해시, 원본 언어, 대상 언어, 엔진/모델) 을 키로 번역문을 저장해서
+병합/재크롤링한 CSV 를 다시 번역해도 이미 번역한 텍스트는 API 를 호출하지 않는다.
+open_ai.py(Gemini / 로컬 모델) 와 reddit_hangul.py(Google 번역) 가 같이 사용한다.
+
+사용 예:
+    cache = TranslationCache("translation_cache.db")
+    ko = cache.translate(text, translate_fn, "en", "ko", "gemini/gemini-2.5-flash")
+    print(cache.summary())
+"""
+import hashlib
+import re
+import sqlite3
+import threading
+import time
+import unicodedata
+
+DEFAULT_CACHE_DB = "translation_cache.db"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS translations (
+    text_hash   TEXT NOT NULL,
+    source_lang TEXT NOT NULL,
+    target_lang TEXT NOT NULL,
+    engine      TEXT NOT NULL,  -- 예: "gemini/gemini-2.5-flash", "google/deep_translator"
+    translated  TEXT NOT NULL,
+    created_at  REAL NOT NULL,
+    PRIMARY KEY (text_hash, source_lang, target_lang, engine)
+) WITHOUT ROWID;
+"""
+
+
+def normalize_text(text: str) -> str:
+    """
+    번역 결과가 달라지지 않는 차이(유니코드 조합형, 줄바꿈 문자, 줄 끝 공백, 연속 공백)를 없앰
+    """
+    text = unicodedata.normalize("NFC", text).replace("\r\n", "\n").replace("\r", "\n")
+    text = re.sub(r"[ \t]+", " ", text)
+    text = re.sub(r" *\n *", "\n", text)
+    return text.strip()
+
+
+def text_hash(text: str) -> str:
+    return hashlib.sha256(normalize_text(text).encode("utf-8")).hexdigest()
+
+
+class TranslationCache:
+    """SQLite(WAL) 기반 번역 캐시 (여러 스레드에서 같이 써도 됨)"""
+
+    def __init__(self, db_path: str = DEFAULT_CACHE_DB):
+        self.db_path = db_path
+        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(SCHEMA)
+        self.conn.commit()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def close(self):
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def get(self, text: str, source_lang: str, target_lang: str, engine: str):
+        """캐시된 번역문 (없으면 None). 적중/미스 횟수도 같이 센다."""
+        key = (text_hash(text), source_lang, target_lang, engine)
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT translated FROM translations "
+                "WHERE text_hash = ? AND source_lang = ? AND target_lang = ? AND engine = ?",
+                key,
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            return row[0]
+
+    def put(self, text: str, source_lang: str, target_lang: str, engine: str, translated: str):
+        """번역문 저장. 빈 번역문(실패)은 저장하지 않아서 다음 실행에 다시 시도된다."""
+        if not translated or not translated.strip():
+            return
+        with self._lock, self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO translations "
+                "(text_hash, source_lang, target_lang, engine, translated, created_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (text_hash(text), source_lang, target_lang, engine, translated, time.time()),
+            )
+
+    def translate(self, text: str, translate_fn, source_lang: str, target_lang: str, engine: str) -> str:
+        """캐시에 있으면 그대로 반환, 없으면 translate_fn(text) 호출 후 저장"""
+        cached = self.get(text, source_lang, target_lang, engine)
+        if cached is not None:
+            return cached
+        translated = translate_fn(text)
+        self.put(text, source_lang, target_lang, engine, translated)
+        return translated
+
+    def translate_batch(self, texts, translate_batch_fn, source_lang: str, target_lang: str, engine: str):
+        """
+        캐시에 없는 원문만 모아서 translate_batch_fn(원문 리스트) 를 한 번 호출하고 저장.
+        반환값은 texts 와 같은 순서의 번역문 리스트 (실패한 항목은 빈 문자열).
+        """
+        results = [self.get(text, source_lang, target_lang, engine) for text in texts]
+        missing = [i for i, cached in enumerate(results) if cached is None]
+        if missing:
+            translated = translate_batch_fn([texts[i] for i in missing])
+            for i, value in zip(missing, translated):
+                self.put(texts[i], source_lang, target_lang, engine, value)
+                results[i] = value or ""
+        return results
+
+    def count(self) -> int:
+        with self._lock:
+            return self.conn.execute("SELECT COUNT(*) FROM translations").fetchone()[0]
+
+    def stats(self) -> dict:
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+            "entries": self.count(),
+        }
+
+    def summary(self) -> str:
+        s = self.stats()
+        return (f"번역 캐시: 적중 {s['hits']:,}건 / 미스(API 호출) {s['misses']:,}건 "
+                f"(적중률 {s['hit_rate']:.1%}, 저장된 번역 {s['entries']:,}건)")
@@ -1,20 +1,27 @@
-import pandas as pd
-import requests
-import time
+import argparse
+import json
+import os
 import re
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+import pandas as pd
 from tqdm import tqdm
-from datetime import datetime
+
+from reddit_client import RateLimiter
+from reddit_comments import fetch_post_comments
 
 # --- 설정 ---
 INPUT_FILE = "combined_cleaned_final.csv"
 OUTPUT_FILE = "final_with_numbered_comments.csv"
 
-# Reddit API 요청 시 필수
-HEADERS = {
-    "User-Agent": "MyRedditResearchScript/0.3 by u_yourusername"
-}
-SLEEP_SEC = 0.1  # (필수) 각 게시글 요청 사이의 딜레이
+CHECKPOINT_FILE = "comments_checkpoint.jsonl"  # 게시글별 댓글 수집 결과 (완료되는 대로 append)
+
+SLEEP_SEC = 0.1  # (필수) 요청 사이 최소 간격 - 모든 워커가 공유
 MAX_RETRIES_429 = 3
+CONCURRENCY = 8  # 동시에 댓글을 가져올 워커(스레드) 수
+
+# 워커 수와 상관없이 전체 요청 속도를 1 / SLEEP_SEC 로 제한
+LIMITER = RateLimiter(SLEEP_SEC)
 
 # --- 텍스트 클리닝 함수 (원본) ---
 def clean_text(text):
@@ -27,72 +34,20 @@ def clean_text(text):
     text = re.sub(r'\s+', ' ', text).strip()
     return text
 
-# --- 댓글 파싱을 위한 재귀 함수 ---
-def flatten_comments(comment_children, all_bodies):
-    """
-    트리 구조의 댓글(children)을 받아, 모든 댓글 본문(body)을
-    all_bodies 리스트에 재귀적으로 추가합니다.
-    """
-    if not isinstance(comment_children, list):
-        return
-
-    for comment in comment_children:
-        if comment.get("kind") != "t1": # 't1'이 댓글을 의미
-            continue
-            
-        data = comment.get("data", {})
-        body = data.get("body")
-        
-        if body and body != "[deleted]" and body != "[removed]":
-            all_bodies.append(body)
-            
-        # 대댓글(replies)이 있으면, 그 replies의 children에 대해 재귀 호출
-        replies_data = data.get("replies", {}).get("data", {})
-        children = replies_data.get("children", [])
-        if children:
-            flatten_comments(children, all_bodies)
-
-
+# --- 게시글 하나의 댓글 수집 ---
 def fetch_comments_for_post(post_url):
     """
     게시글 URL 하나를 받아서, 모든 댓글 본문(body)의 [리스트]를 반환합니다.
-    (변경점: 문자열 대신 리스트 반환)
+    대댓글과 "more" 스텁에 숨은 댓글까지 트리 순서대로 포함합니다 (reddit_comments).
+    요청 자체가 실패하면 None 을 반환해서 --resume 때 다시 시도되도록 합니다.
     """
-    try:
-        json_url = post_url.split('?')[0]
-        if json_url.endswith('/'):
-            json_url = json_url[:-1]
-        json_url += ".json"
-    except Exception:
-        return [] # 오류 시 빈 리스트 반환
-
-    # API 요청 (지수 백오프 적용)
-    for attempt in range(MAX_RETRIES_429):
-        res = requests.get(json_url, headers=HEADERS)
-        
-        if res.status_code == 429:
-            wait_time = SLEEP_SEC * (2 ** attempt)
-            time.sleep(wait_time)
-            continue
-        elif res.status_code != 200:
-            return [] # 오류 시 빈 리스트 반환
-        else:
-            break
-    else:
-        return [] # 429 최대 재시도 실패 시 빈 리스트 반환
-
-    # JSON 파싱 및 댓글 추출
-    try:
-        data = res.json()
-        comment_children = data[1].get("data", {}).get("children", [])
-        
-        all_comment_bodies = [] # [댓글1, 댓글2, ...]
-        flatten_comments(comment_children, all_comment_bodies)
-        
-        return all_comment_bodies # (중요) 리스트 자체를 반환
-        
-    except Exception as e:
-        return [] # 파싱 오류 시 빈 리스트 반환
+    # API 요청 (공유 세션 + 공유 레이트리미터 + 지수 백오프는 reddit_client 에서 처리)
+    comments = fetch_post_comments(
+        post_url, max_retries=MAX_RETRIES_429, backoff_sec=SLEEP_SEC, limiter=LIMITER
+    )
+    if comments is None:
+        return None # 오류 / 429 최대 재시도 실패
+    return [c["body"] for c in comments] # (중요) 리스트 자체를 반환
 
 # --- (신규) 댓글 리스트를 번호 매겨 포맷팅하는 함수 ---
 def format_comments(comment_list):
@@ -134,27 +89,85 @@ def combine_content_and_comments(row):
     else: # 댓글이 없으면 원본 content만 반환
         return content
 
+# --- (신규) 체크포인트 읽기 ---
+def load_checkpoint(checkpoint_path):
+    """
+    체크포인트(JSONL)에서 {url: 댓글 리스트} 를 읽어옵니다.
+    중단되면서 잘린 마지막 줄은 무시합니다.
+    """
+    done = {}
+    if not os.path.exists(checkpoint_path):
+        return done
+    with open(checkpoint_path, encoding="utf-8") as f:
+        for line in f:
+            try:
+                rec = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            done[rec["url"]] = rec["comments"]
+    return done
+
+
+# --- (신규) 병렬 댓글 수집 ---
+def fetch_all_comments(urls, checkpoint_path=CHECKPOINT_FILE, concurrency=CONCURRENCY, resume=False):
+    """
+    여러 게시글의 댓글을 워커 concurrency 개로 동시에 수집합니다.
+    끝나는 순서대로 체크포인트에 한 줄씩 기록하고(flush), resume=True 면
+    체크포인트에 이미 있는 URL 은 건너뜁니다. 반환값은 {url: 댓글 리스트}.
+    """
+    done = load_checkpoint(checkpoint_path) if resume else {}
+    todo = list(dict.fromkeys(u for u in urls if isinstance(u, str) and u not in done))
+    if resume:
+        print(f"체크포인트에서 {len(done)}개 게시글 복원, 남은 게시글 {len(todo)}개")
+
+    failed = 0
+    with open(checkpoint_path, "a" if resume else "w", encoding="utf-8") as f, \
+            ThreadPoolExecutor(max_workers=concurrency) as executor:
+        futures = {executor.submit(fetch_comments_for_post, u): u for u in todo}
+        for future in tqdm(as_completed(futures), total=len(futures), desc="댓글 수집 중"):
+            url = futures[future]
+            comments = future.result()
+            if comments is None:
+                failed += 1  # 체크포인트에 안 남기므로 --resume 때 다시 시도
+                continue
+            # 쓰기는 메인 스레드 하나에서만 (단일 writer)
+            f.write(json.dumps({"url": url, "comments": comments}, ensure_ascii=False) + "\n")
+            f.flush()
+            done[url] = comments
+
+    if failed:
+        print(f"⚠️ 요청 실패 {failed}개 - --resume 으로 다시 실행하면 이 게시글만 재시도합니다.")
+    return done
+
+
 if __name__ == "__main__":
-    
-    print(f"'{INPUT_FILE}' 파일을 읽어옵니다...")
+    parser = argparse.ArgumentParser(description="Reddit 게시글 댓글 병렬 수집 및 content 병합")
+    parser.add_argument("--input", default=INPUT_FILE, help="입력 CSV (url, content 컬럼 필요)")
+    parser.add_argument("--output", default=OUTPUT_FILE, help="출력 CSV")
+    parser.add_argument("--checkpoint", default=CHECKPOINT_FILE, help="댓글 수집 체크포인트(JSONL)")
+    parser.add_argument("--concurrency", type=int, default=CONCURRENCY, help="동시 요청 워커 수")
+    parser.add_argument("--resume", action="store_true", help="체크포인트에 있는 게시글은 건너뛰고 이어서 수집")
+    args = parser.parse_args()
+
+    print(f"'{args.input}' 파일을 읽어옵니다...")
     try:
-        df = pd.read_csv(INPUT_FILE)
+        df = pd.read_csv(args.input)
     except FileNotFoundError:
-        print(f"!! 오류: '{INPUT_FILE}'을 찾을 수 없습니다. 스크립트를 종료합니다.")
+        print(f"!! 오류: '{args.input}'을 찾을 수 없습니다. 스크립트를 종료합니다.")
         exit()
 
-    print(f"총 {len(df)}개의 게시글에 대해 댓글 수집을 시작합니다.")
-    print(f"각 요청당 {SLEEP_SEC}초 대기하므로, 예상 완료 시간은 약 {len(df) * SLEEP_SEC / 60:.1f} 분입니다.")
-    
-    tqdm.pandas(desc="댓글 수집 중")
-
-    def apply_fetch_with_sleep(url):
-        result_list = fetch_comments_for_post(url) # 댓글 [리스트]를 받음
-        time.sleep(SLEEP_SEC) # API 예의
-        return result_list
+    print(f"총 {len(df)}개의 게시글에 대해 댓글 수집을 시작합니다. (워커 {args.concurrency}개)")
+    print(f"요청 간 최소 {SLEEP_SEC}초 간격이므로, 예상 완료 시간은 최대 약 {len(df) * SLEEP_SEC / 60:.1f} 분입니다.")
 
     # 1. 'comments_list' 컬럼 생성 (각 셀이 [리스트]임)
-    df['comments_list'] = df['url'].progress_apply(apply_fetch_with_sleep)
+    comments_by_url = fetch_all_comments(
+        df['url'].tolist(),
+        checkpoint_path=args.checkpoint,
+        concurrency=args.concurrency,
+        resume=args.resume,
+    )
+    # 실패한 게시글 / url 이 비어 있는 행은 댓글 없이 (content 만) 저장
+    df['comments_list'] = df['url'].map(lambda u: comments_by_url.get(u) or [])
 
     print("댓글 수집 완료. 포맷팅을 시작합니다...")
 
@@ -169,9 +182,9 @@ if __name__ == "__main__":
     final_cols = ['keyword', 'title', 'content', 'date', 'url']
     df_final = df[final_cols].copy() # .copy()로 경고 방지
 
-    df_final.to_csv(OUTPUT_FILE, index=False, encoding="utf-8-sig")
+    df_final.to_csv(args.output, index=False, encoding="utf-8-sig")
     
-    print(f"\n✅ 모든 작업 완료! 파일 저장: {OUTPUT_FILE}")
+    print(f"\n✅ 모든 작업 완료! 파일 저장: {args.output}")
     
     # 샘플 확인
     print("\n--- 최종 결과 샘플 (첫 번째 행의 content) ---")
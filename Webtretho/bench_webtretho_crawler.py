@@ -0,0 +1,153 @@
+"""
+webtretho_crawler 점검 / 벤치마크 (오프라인, 저장해 둔 HTML 픽스처 + 가짜 webtretho 서버 사용)
+
+1) fixtures/webtretho_thread.html 에서 제목 / 본문(스크립트 / 댓글 제외) 추출,
+   fixtures/webtretho_thread_js.html(본문을 JS 로 그리는 페이지)은 본문 없음 → 브라우저 폴백 대상
+2) 로그인 쿠키가 있어야 본문을 주는 가짜 서버에 계정 2개 쿠키로 요청
+   → 계정별 세션에 요청이 반씩 나뉘는지, JS 페이지만 폴백으로 잡히는지, 쿠키가 없으면 모두 폴백인지
+3) 섹션별 진행 상황: 목록 합치기 / 건너뜀 기록이 다시 읽어도 유지되는지
+4) 속도: 글 --pages 개를 동시 요청 1개(노트북처럼 하나씩) vs --concurrency 개
+
+실행:
+    python bench_webtretho_crawler.py --pages 300 --concurrency 16 --latency 0.05
+"""
+import argparse
+import asyncio
+import os
+import tempfile
+import threading
+import time
+from http.cookies import SimpleCookie
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from webtretho_crawler import SectionProgress, fetch_threads_async, parse_thread_page
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+SESSION_COOKIE = 'wtt_session'
+ACCOUNTS = ['account-a', 'account-b']
+JS_EVERY = 10   # 이 번호의 배수 글은 본문을 JS 로 그리는 페이지
+
+
+def read_fixture(name):
+    with open(os.path.join(FIXTURE_DIR, name), encoding='utf-8') as f:
+        return f.read()
+
+
+class FakeWebtretho:
+    """/post/{번호} 요청에 로그인 쿠키가 있으면 글 픽스처, 없거나 JS 글이면 JS 껍데기 페이지를 돌려주는 서버"""
+
+    def __init__(self, latency):
+        thread_body = read_fixture('webtretho_thread.html').encode('utf-8')
+        js_body = read_fixture('webtretho_thread_js.html').encode('utf-8')
+        self.requests = {}   # 세션 쿠키 값(없으면 None) → 요청 수
+        self.lock = threading.Lock()
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                time.sleep(latency)
+                cookie = SimpleCookie(self.headers.get('Cookie', '')).get(SESSION_COOKIE)
+                account = cookie.value if cookie else None
+                with fake.lock:
+                    fake.requests[account] = fake.requests.get(account, 0) + 1
+                post_no = int(self.path.rsplit('/', 1)[-1])
+                logged_in = account in ACCOUNTS
+                body = thread_body if logged_in and post_no % JS_EVERY else js_body
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/html; charset=utf-8')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.base = f"http://127.0.0.1:{self.server.server_address[1]}"
+
+    def shutdown(self):
+        self.server.shutdown()
+
+
+def check(name, ok):
+    print(f"{'✅' if ok else '❌'} {name}")
+    return ok
+
+
+def run(site, pages, cookie_sets, concurrency):
+    site.requests = {}
+    records = []
+    tasks = [('Máy lọc không khí', f"{site.base}/post/{i}", '12/03/2024') for i in range(pages)]
+    start = time.perf_counter()
+    fallback = asyncio.run(fetch_threads_async(
+        tasks, cookie_sets, lambda *result: records.append(result), concurrency, referer=site.base))
+    return records, fallback, time.perf_counter() - start, dict(site.requests)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="webtretho_crawler 점검 / 벤치마크")
+    parser.add_argument('--pages', type=int, default=300, help="속도 측정에 쓸 글 수")
+    parser.add_argument('--latency', type=float, default=0.05, help="가짜 서버 요청당 지연(초)")
+    parser.add_argument('--concurrency', type=int, default=16)
+    args = parser.parse_args()
+
+    results = []
+    # 1) 파싱
+    title, content = parse_thread_page(read_fixture('webtretho_thread.html'))
+    results.append(check(f"제목: {title}", title == 'Máy lọc không khí có thật sự cần thiết cho căn hộ chung cư?'))
+    results.append(check(f"본문 {len(content)}자 (스크립트 / 댓글 제외)",
+                         content.startswith('Nhà mình ở chung cư tầng 15')
+                         and content.endswith('có cần màng lọc HEPA không ạ?')
+                         and 'googletag' not in content and 'Sharp' not in content))
+    results.append(check("JS 페이지는 본문 없음 (브라우저 폴백 대상)",
+                         parse_thread_page(read_fixture('webtretho_thread_js.html')) == (None, None)))
+
+    # 2) 계정별 쿠키 세션
+    site = FakeWebtretho(0)
+    try:
+        cookie_sets = [[{'name': SESSION_COOKIE, 'value': account, 'domain': '.webtretho.vn'}] for account in ACCOUNTS]
+        records, fallback, _, requests = run(site, 100, cookie_sets, 8)
+        results.append(check(f"계정별 요청 {requests}", requests == {account: 50 for account in ACCOUNTS}))
+        js_urls = {f"{site.base}/post/{i}" for i in range(0, 100, JS_EVERY)}
+        results.append(check(f"HTTP {len(records)}건 / 폴백 {len(fallback)}건 (JS 페이지만)",
+                             len(records) == 90 and {url for _, url, _ in fallback} == js_urls))
+        _, fallback, _, requests = run(site, 20, [[]], 8)
+        results.append(check(f"쿠키 없이는 모두 폴백 ({len(fallback)}/20)", len(fallback) == 20 and None in requests))
+    finally:
+        site.shutdown()
+
+    # 3) 섹션별 진행 상황
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, 'progress.json')
+        progress = SectionProgress(path)
+        progress.set_urls('Nấm mốc', [('u1', 'd1'), ('u2', 'd2')])
+        progress.mark_skipped('Nấm mốc', 'u2')
+        progress.set_urls('Nấm mốc', [('u3', 'd3'), ('u1', 'd1')])   # --relist: 새 글 u3, u2 는 검색에서 빠짐
+        reloaded = SectionProgress(path)
+        results.append(check("목록 합치기 / 건너뜀 기록 유지",
+                             reloaded.url_dates('Nấm mốc') == [('u3', 'd3'), ('u1', 'd1'), ('u2', 'd2')]
+                             and reloaded.is_skipped('Nấm mốc', 'u2') and not reloaded.is_skipped('Nấm mốc', 'u1')
+                             and reloaded.url_dates('Mùi hôi') is None))
+
+    # 4) 속도
+    site = FakeWebtretho(args.latency)
+    timings = {}
+    try:
+        for concurrency in (1, args.concurrency):
+            records, fallback, sec, _ = run(site, args.pages, cookie_sets, concurrency)
+            timings[concurrency] = (sec, len(records), len(fallback))
+    finally:
+        site.shutdown()
+
+    print("\n========== 벤치마크 결과 ==========")
+    print(f"글 {args.pages}개, 계정 {len(ACCOUNTS)}개, 요청당 지연 {args.latency}초")
+    for concurrency, (sec, count, fallback_count) in timings.items():
+        print(f"동시 {concurrency:>2}개: {sec:.2f}초 ({count / sec * 60:.0f} 페이지/분), "
+              f"HTTP {count}건 / 폴백 {fallback_count}건")
+    print(f"속도 향상: {timings[1][0] / timings[args.concurrency][0]:.1f}배")
+    print(f"점검 {sum(results)}/{len(results)} 통과")
+
+
+if __name__ == '__main__':
+    main()
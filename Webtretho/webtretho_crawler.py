@@ -0,0 +1,490 @@
+"""
+Webtretho(웹트레토) 커뮤니티 크롤러 (webtretho_ver3.ipynb 를 모듈 + CLI 로 옮김)
+
+노트북은 로그인한 Chrome 하나로 키워드마다 검색 → 'Xem thêm' 더보기 → 글 페이지를 하나씩 열고
+매번 time.sleep 으로 기다려서 글 하나에 1초 넘게 걸렸고, 중간에 멈추면 처음부터 다시 돌려야 했다.
+
+1) 계정마다 한 번만 로그인하고 쿠키를 꺼냄 (계정이 여러 개면 같은 Chrome 에서 차례로 로그인)
+2) 검색 결과 목록은 더보기 버튼(JS)으로만 늘어나므로 Chrome 으로 키워드(섹션)별 글 URL / 날짜를 모으고
+   progress 파일에 저장 → 다시 실행하면 목록 단계를 건너뜀 (--relist 로 새 글 다시 찾기)
+3) 글 페이지는 계정별 로그인 쿠키를 넣은 aiohttp 세션(커넥션 풀)에 돌아가며 나눠서 동시에 받고
+   lxml + 미리 컴파일한 XPath 로 제목 / 본문 추출 (노트북과 같은 선택자)
+4) HTTP 로 본문을 못 찾은 글(JS 로만 그려지는 페이지, 요청 실패)만 같은 Chrome 으로 다시 추출
+5) 레코드는 RecordSink(JSONL)에 바로 추가하고, 제목 / 본문이 모두 없는 글은 progress 에 건너뜀으로 기록
+   → 중단 / 다음 실행 때 저장도 건너뜀도 아닌 글만 다시 받음
+6) 끝나면 노트북과 같은 키워드별 CSV(webtretho_{slug}.csv) + 합본 CSV(webtretho_articles_all.csv)
+
+실행:
+    export WEBTRETHO_ACCOUNTS="id1:pw1,id2:pw2"     # 또는 WEBTRETHO_ID / WEBTRETHO_PW (없으면 비로그인)
+    python webtretho_crawler.py --concurrency 16
+    python webtretho_crawler.py --keywords "Máy lọc không khí" "Nấm mốc" --relist
+"""
+import argparse
+import asyncio
+import json
+import os
+import re
+import sys
+import time
+from datetime import datetime
+
+from lxml import etree, html as lxml_html
+from selenium.common.exceptions import TimeoutException  # type: ignore
+from selenium.webdriver.common.by import By  # type: ignore
+from selenium.webdriver.common.keys import Keys  # type: ignore
+from selenium.webdriver.support import expected_conditions as EC  # type: ignore
+from selenium.webdriver.support.ui import WebDriverWait  # type: ignore
+
+# Chrome 드라이버 / HTTP 수집 / RecordSink 는 네이버 크롤러들과 같은 사이트 무관 공용 모듈을 씀
+SHARED_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '네이버블로그, 지식인')
+sys.path.append(SHARED_DIR)
+
+from driver_factory import ManagedDriver  # noqa: E402
+from http_fetch import HTTP_CONCURRENCY, create_session, fetch_html, first_text, selector_to_xpath  # noqa: E402
+from record_sink import RecordSink, compact_to_csv  # noqa: E402
+
+SCROLL_NUM = 50          # 키워드당 'Xem thêm' 더보기 최대 클릭 수
+PAGE_TIMEOUT = 10        # 검색창 / 글 요소를 기다리는 최대 시간(초)
+MORE_TIMEOUT = 3         # 더보기 버튼을 기다리는 시간(초) - 안 뜨면 목록 끝
+LOGIN_TIMEOUT = 15       # 로그인 후 로그인 페이지를 벗어날 때까지 기다리는 시간(초)
+
+MAIN_URL = "https://www.webtretho.vn/"
+LOGIN_URL = "https://www.webtretho.vn/dang-nhap"
+ACCEPT_LANGUAGE = 'vi-VN,vi;q=0.9'
+
+# housing_keywords_vi = ["ẩm mốc nhà ở", "máy lọc không khí", "mùi hôi nhà bếp"]
+KEYWORDS = [
+    "Nhà thông minh",                 # 스마트홈
+    "IoT",                            # IoT
+    "Thiết bị gia dụng",              # 가전제품
+    "Căn hộ", "Chung cư",             # 아파트
+    "Nhà bếp",                        # 주방
+    "Thông gió",                      # 환기
+    "Nấm mốc",                        # 곰팡이
+    "Mùi hôi",                        # 냄새
+    "Vệ sinh",                        # 위생
+    "Vi khuẩn",                       # 세균
+    "Côn trùng", "Sâu bọ", "Muỗi",    # 벌레 / 해충 / 모기
+    "Mất điện",                       # 정전
+    "Rò rỉ nước",                     # 누수
+    "Nước máy", "Hệ thống nước",      # 수도
+    "Bảo quản",                       # 보관
+    "Khử mùi",                        # 탈취
+    "Đá", "Làm đá",                   # 얼음
+    "Tiết kiệm điện",                 # 절전
+    "Tiết kiệm năng lượng",           # 절약
+    "Hóa đơn tiền điện",              # 전기요금
+    "Máy lọc không khí",              # 공기청정기
+    "Máy điều hòa",                   # 에어컨
+    "Tủ lạnh",                        # 냉장고
+    "Máy lọc nước",                   # 정수기
+    "Máy giặt",                       # 세탁기
+    "Máy sấy",                        # 건조기
+    "Máy hút ẩm",                     # 제습기
+    "Trợ lý", "Người giúp việc",      # 도우미
+    "LG",                             # LG
+    "Chuyên gia",                     # 전문가
+    "Công ty dịch vụ"                 # 서비스업체
+]
+
+# 노트북과 같은 선택자
+SEARCH_BOX_XPATH = '//*[@id="desktop-layout"]/div[1]/div/div/div[3]/div/div/div[2]/input'
+LOGIN_BUTTON_SELECTOR = "#__next > div > div.jsx-1971079523 > div > div > div > div > div > div:nth-child(4) > div > button"
+MORE_SELECTOR = "a.ga-seemore-searched-posts"
+LINK_SELECTOR = "div.tw-flex.tw-text-left.tw-flex-row.tw-items-start a.tw-block"
+DATE_SELECTOR = "div.tw-text-xs.text-gray-blue.tw-mt-1\\.5"
+TITLE_SELECTOR = 'h1.text-wrap.tw-font-bold.text-primary'
+CONTENT_ID = 'post-content'
+
+TITLE_XPATHS = [etree.XPath(selector_to_xpath(TITLE_SELECTOR))]
+CONTENT_XPATHS = [etree.XPath(selector_to_xpath('#' + CONTENT_ID))]
+THREAD_READY = EC.presence_of_element_located((By.ID, CONTENT_ID))
+
+SAVE_DIR = "webtretho_results"
+RECORDS_FILE = "webtretho_records.jsonl"   # SAVE_DIR 안의 파일들
+PROGRESS_FILE = "progress.json"
+LOG_FILE = "error_log.txt"
+CSV_ALL_FILE = "webtretho_articles_all.csv"
+CSV_COLUMNS = ['keyword', 'title', 'content', 'date', 'url']
+
+
+# ================================================================
+# 1) 파일명 / 에러 로그
+# ================================================================
+# 키워드별 파일명 안전 슬러그
+def slugify(text):
+    text = text.strip().lower()
+    text = re.sub(r"\s+", "_", text)
+    text = re.sub(r"[^a-z0-9_\-가-힣ぁ-んァ-ン一-龥ấầẩẫậắằẳẵặếềểễệơờởỡợôốồổỗộưứừửữựđ]", "", text)
+    return text[:60] if len(text) > 60 else text
+
+
+def log_error(log_file, keyword, url, err_msg):
+    with open(log_file, "a", encoding="utf-8") as f:
+        f.write(f"[{time.strftime('%Y-%m-%d %H:%M:%S')}] {keyword} | {url} | {err_msg}\n")
+
+
+# ================================================================
+# 2) 로그인 (계정별 1번) → 쿠키
+# ================================================================
+def parse_accounts(text):
+    """'id1:pw1,id2:pw2' → [(id1, pw1), (id2, pw2)] (비밀번호에 ':' 가 있어도 첫 ':' 로만 나눔)"""
+    accounts = []
+    for item in (text or '').split(','):
+        if ':' in item:
+            username, password = item.split(':', 1)
+            if username.strip():
+                accounts.append((username.strip(), password))
+    return accounts
+
+
+def webtretho_login(driver, username, password, timeout=LOGIN_TIMEOUT):
+    """
+    로그인 페이지에서 아이디 / 비밀번호 입력 후 로그인 (고정 sleep 대신 입력창 / 페이지 이동을 기다림)
+
+    Returns:
+        로그인 성공 여부 (로그인 페이지를 벗어났는지)
+    """
+    driver.get(LOGIN_URL)
+    wait = WebDriverWait(driver, timeout)
+    wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, "input[type='password']")))
+    driver.find_element(By.CSS_SELECTOR, "input[type='text']").send_keys(username)
+    driver.find_element(By.CSS_SELECTOR, "input[type='password']").send_keys(password)
+    buttons = (driver.find_elements(By.CSS_SELECTOR, LOGIN_BUTTON_SELECTOR)
+               or driver.find_elements(By.CSS_SELECTOR, "form button"))
+    if buttons:
+        buttons[0].click()
+    else:
+        driver.find_element(By.CSS_SELECTOR, "input[type='password']").send_keys(Keys.ENTER)
+    try:
+        wait.until(lambda d: "dang-nhap" not in d.current_url)
+    except TimeoutException:
+        return False
+    return True
+
+
+def login_accounts(driver, accounts, log_file, timeout=LOGIN_TIMEOUT):
+    """
+    계정마다 한 번씩 로그인해서 쿠키를 꺼냄 (다음 계정 전에 쿠키를 지움 → 드라이버는 마지막 계정으로 로그인된 상태)
+
+    Returns:
+        계정별 쿠키 리스트의 리스트 (계정이 없거나 모두 실패하면 비로그인 쿠키 1세트)
+    """
+    cookie_sets = []
+    for username, password in accounts:
+        try:
+            if cookie_sets:
+                driver.delete_all_cookies()  # 앞 계정의 로그인 세션 지우기
+            if webtretho_login(driver, username, password, timeout):
+                print(f"✅ 로그인 성공! ({username})")
+                driver.get(MAIN_URL)
+                cookie_sets.append(driver.get_cookies())
+            else:
+                print(f"⚠️ 로그인 실패 — 아이디/비번 확인 필요 ({username})")
+                log_error(log_file, "LOGIN", LOGIN_URL, f"로그인 실패: {username}")
+        except Exception as e:
+            print(f"🚨 로그인 중 에러 ({username}): {e}")
+            log_error(log_file, "LOGIN", LOGIN_URL, str(e))
+    if not cookie_sets:
+        if accounts:
+            print("⚠️ 로그인한 계정이 없어 비로그인으로 수집합니다.")
+        driver.get(MAIN_URL)
+        cookie_sets.append(driver.get_cookies())
+    return cookie_sets
+
+
+# ================================================================
+# 3) 검색 결과 목록 (Chrome)
+# ================================================================
+def search_thread_urls(driver, keyword, scroll_num=SCROLL_NUM, timeout=PAGE_TIMEOUT):
+    """
+    키워드 검색 후 'Xem thêm' 더보기를 scroll_num 번까지 눌러서 글 (URL, 날짜) 목록을 모음
+
+    클릭 뒤 고정 sleep 대신 목록 링크 수가 늘어날 때까지만 기다리고, 버튼이 없거나 늘지 않으면 멈춤
+
+    Returns:
+        [(url, date)] (URL 중복 제거, 목록 순서)
+    """
+    driver.get(MAIN_URL)
+    search_box = WebDriverWait(driver, timeout).until(
+        EC.element_to_be_clickable((By.XPATH, SEARCH_BOX_XPATH)))
+    search_box.click()
+    search_box.clear()
+    search_box.send_keys(keyword + Keys.ENTER)
+    try:
+        WebDriverWait(driver, timeout).until(lambda d: d.find_elements(By.CSS_SELECTOR, LINK_SELECTOR))
+    except TimeoutException:
+        return []  # 검색 결과 없음
+
+    for _ in range(scroll_num):
+        count = len(driver.find_elements(By.CSS_SELECTOR, LINK_SELECTOR))
+        try:
+            xem_them_btn = WebDriverWait(driver, MORE_TIMEOUT).until(
+                EC.element_to_be_clickable((By.CSS_SELECTOR, MORE_SELECTOR)))
+            driver.execute_script("arguments[0].scrollIntoView({block:'center'}); arguments[0].click();",
+                                  xem_them_btn)
+            WebDriverWait(driver, timeout).until(
+                lambda d: len(d.find_elements(By.CSS_SELECTOR, LINK_SELECTOR)) > count)
+        except TimeoutException:
+            break
+
+    url_list = [a.get_attribute("href") for a in driver.find_elements(By.CSS_SELECTOR, LINK_SELECTOR)]
+    date_list = [d.text.strip() for d in driver.find_elements(By.CSS_SELECTOR, DATE_SELECTOR)]
+    url_dates = {}
+    for url, date in zip(url_list, date_list):
+        if url and url not in url_dates:
+            url_dates[url] = date
+    return list(url_dates.items())
+
+
+# ================================================================
+# 4) 글 페이지 (HTTP → 안 되면 Chrome)
+# ================================================================
+def parse_thread_page(page_html):
+    """
+    글 페이지 HTML → (title, content), 못 찾은 값은 None
+
+    본문(#post-content)이 HTML 에 없으면 JS 로 그리는 페이지로 보고 Chrome 으로 다시 추출함
+    """
+    if isinstance(page_html, str):
+        page_html = page_html.encode('utf-8')
+    tree = lxml_html.fromstring(page_html)
+    title = first_text(tree, TITLE_XPATHS)
+    content = first_text(tree, CONTENT_XPATHS)
+    return (None if title == "N/A" else title), (None if content == "N/A" else content)
+
+
+def extract_thread_browser(driver, url, timeout=PAGE_TIMEOUT):
+    """Chrome 으로 글 페이지를 열고 본문 요소가 뜰 때까지만 기다려서 (title, content) 추출"""
+    driver.get(url)
+    try:
+        WebDriverWait(driver, timeout).until(THREAD_READY)
+    except TimeoutException:
+        pass  # 삭제된 글 등 - 있는 것만 추출
+    values = []
+    for by, selector in ((By.CSS_SELECTOR, TITLE_SELECTOR), (By.ID, CONTENT_ID)):
+        elems = driver.find_elements(by, selector)
+        values.append((elems[0].text.strip() or None) if elems else None)
+    return tuple(values)
+
+
+def make_record(keyword, url, date, title, content):
+    """제목 / 본문이 모두 비면 None (노트북과 같은 기준)"""
+    if not (title or '').strip() and not (content or '').strip():
+        return None
+    return {'keyword': keyword, 'title': title or '', 'content': content or '', 'date': date, 'url': url}
+
+
+async def fetch_threads_async(tasks, cookie_sets, on_result, concurrency=HTTP_CONCURRENCY, referer=MAIN_URL):
+    """
+    (keyword, url, date) 목록을 계정별 쿠키 세션에 돌아가며 나눠서 동시에 받음
+
+    세션마다 커넥션 풀을 따로 두고, 동시 요청 수는 전체 합이 concurrency 를 넘지 않게 semaphore 로 제한.
+    쿠키는 도메인 없이 넣으므로 세션은 webtretho 페이지 요청에만 씀.
+    on_result(keyword, url, date, title, content) 는 본문을 찾은 글마다 호출
+
+    Returns:
+        Chrome 으로 다시 시도할 (keyword, url, date) 리스트 (요청 실패 / HTML 에 본문 없음)
+    """
+    fallback = []
+    semaphore = asyncio.Semaphore(concurrency)
+    sessions = []
+    for cookies in cookie_sets:
+        session = create_session(concurrency, referer=referer, accept_language=ACCEPT_LANGUAGE)
+        session.cookie_jar.update_cookies({cookie['name']: cookie['value'] for cookie in cookies})
+        sessions.append(session)
+
+    async def one(order, task):
+        keyword, url, date = task
+        async with semaphore:
+            page_html = await fetch_html(sessions[order % len(sessions)], url, label=url[-50:])
+        title = content = None
+        if page_html is not None:
+            try:
+                title, content = parse_thread_page(page_html)
+            except (etree.ParserError, ValueError):
+                pass
+        if content is None:
+            fallback.append(task)
+            return
+        on_result(keyword, url, date, title, content)
+
+    try:
+        await asyncio.gather(*(one(order, task) for order, task in enumerate(tasks)))
+    finally:
+        for session in sessions:
+            await session.close()
+    return fallback
+
+
+# ================================================================
+# 5) 섹션(키워드)별 진행 상황
+# ================================================================
+class SectionProgress:
+    """
+    키워드(검색 섹션)별 글 목록과 건너뛴 글 (JSON 파일)
+
+    저장한 글은 RecordSink 가 (keyword, url) 로 기억하므로 여기에는 목록과 "제목 / 본문 없음" 글만 둠.
+    오류가 난 글은 어디에도 기록하지 않아서 다음 실행 때 다시 받음.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.sections = {}
+        if os.path.exists(path):
+            try:
+                with open(path, encoding='utf-8') as f:
+                    self.sections = json.load(f)
+            except (OSError, json.JSONDecodeError) as e:
+                print(f"⚠️ 진행 상황 파일을 읽지 못했습니다 ({path}): {e} - 목록부터 다시 수집")
+
+    def url_dates(self, keyword):
+        """저장된 [(url, date)] (목록을 아직 안 모았으면 None)"""
+        section = self.sections.get(keyword)
+        if section is None:
+            return None
+        return [tuple(item) for item in section['urls']]
+
+    def set_urls(self, keyword, url_dates):
+        """새로 모은 목록을 기존 목록 앞에 합침 (--relist 때 예전 글이 검색에서 빠져도 유지)"""
+        section = self.sections.setdefault(keyword, {'urls': [], 'skipped': []})
+        merged = dict(url_dates)
+        for url, date in section['urls']:
+            merged.setdefault(url, date)
+        section['urls'] = [[url, date] for url, date in merged.items()]
+        section['listed'] = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        self.save()
+
+    def is_skipped(self, keyword, url):
+        return url in self.sections.get(keyword, {}).get('skipped', [])
+
+    def mark_skipped(self, keyword, url):
+        self.sections[keyword]['skipped'].append(url)
+        self.save()
+
+    def save(self):
+        tmp_path = self.path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.sections, f, ensure_ascii=False, indent=1)
+        os.replace(tmp_path, self.path)
+
+
+# ================================================================
+# 6) 실행
+# ================================================================
+def crawl_webtretho(keywords=KEYWORDS, save_dir=SAVE_DIR, accounts=(), concurrency=HTTP_CONCURRENCY,
+                    scroll_num=SCROLL_NUM, headless=True, relist=False, browser_fallback=True):
+    """
+    키워드별 검색 목록(Chrome) + 글 페이지(로그인 쿠키 HTTP 풀, 필요할 때만 Chrome) 수집
+
+    Args:
+        keywords: 검색 키워드 (섹션)
+        save_dir: 레코드 / 진행 상황 / 에러 로그 / CSV 저장 폴더
+        accounts: [(아이디, 비밀번호)] - 여러 개면 글 요청을 계정별 세션에 나눔 (없으면 비로그인)
+        concurrency: 동시 HTTP 요청 수 (전체)
+        scroll_num: 키워드당 더보기 최대 클릭 수
+        headless: False 면 Chrome 창을 띄움
+        relist: 이미 목록을 모은 키워드도 다시 검색해서 새 글을 찾음
+        browser_fallback: HTTP 로 본문을 못 찾은 글을 Chrome 으로 다시 추출
+
+    Returns:
+        합본 CSV 행 수
+    """
+    os.makedirs(save_dir, exist_ok=True)
+    log_file = os.path.join(save_dir, LOG_FILE)
+    records_file = os.path.join(save_dir, RECORDS_FILE)
+    progress = SectionProgress(os.path.join(save_dir, PROGRESS_FILE))
+    # 로그인하면 세션이 Chrome 안에 있으므로 재시작하지 않음
+    driver = ManagedDriver(headless=headless, implicit_wait=0, restart_every=0, label="로그인 / 검색 / 폴백")
+    cookie_sets = None
+
+    with RecordSink(records_file, columns=CSV_COLUMNS, key_fields=('keyword', 'url')) as sink:
+        def on_result(keyword, url, date, title, content):
+            record = make_record(keyword, url, date, title, content)
+            if record is None:
+                progress.mark_skipped(keyword, url)
+            else:
+                sink.write(record)
+
+        try:
+            # ===== 1. 로그인 + 키워드별 목록 =====
+            tasks = []
+            for keyword in keywords:
+                url_dates = progress.url_dates(keyword)
+                if url_dates is None or relist:
+                    if cookie_sets is None:
+                        print("🔐 로그인 시도 중...")
+                        cookie_sets = login_accounts(driver, accounts, log_file)
+                    print(f"\n🔎 현재 키워드: {keyword}")
+                    try:
+                        progress.set_urls(keyword, search_thread_urls(driver, keyword, scroll_num))
+                    except Exception as e:
+                        print(f"❌ [{keyword}] 검색 실패: {e}")
+                        log_error(log_file, keyword, "SEARCH", str(e))
+                        continue
+                    url_dates = progress.url_dates(keyword)
+                todo = [(keyword, url, date) for url, date in url_dates
+                        if not sink.saved(keyword=keyword, url=url) and not progress.is_skipped(keyword, url)]
+                print(f"🔗 [{keyword}] 목록 {len(url_dates)}건 중 {len(todo)}건 수집 예정")
+                tasks += todo
+            if not tasks:
+                print("⏭️ 새로 받을 글이 없습니다.")
+            else:
+                if cookie_sets is None:
+                    print("🔐 로그인 시도 중...")
+                    cookie_sets = login_accounts(driver, accounts, log_file)
+
+                # ===== 2. 글 페이지 HTTP (계정별 세션) =====
+                started = time.perf_counter()
+                fallback = asyncio.run(fetch_threads_async(tasks, cookie_sets, on_result, concurrency))
+                elapsed = time.perf_counter() - started
+                print(f"⚡ HTTP 추출: {len(tasks) - len(fallback)}건 / 폴백 대상 {len(fallback)}건 "
+                      f"(계정 {len(cookie_sets)}개, {elapsed:.1f}초, "
+                      f"{(len(tasks) - len(fallback)) / max(elapsed, 1e-9) * 60:.0f} 페이지/분)")
+
+                # ===== 3. JS 페이지만 Chrome =====
+                if fallback and browser_fallback:
+                    print(f"🔁 HTTP 로 본문을 못 찾은 {len(fallback)}건은 브라우저로 다시 시도합니다.")
+                    for keyword, url, date in fallback:
+                        try:
+                            title, content = extract_thread_browser(driver, url)
+                        except Exception as e:
+                            log_error(log_file, keyword, url, str(e))
+                            continue
+                        on_result(keyword, url, date, title, content)
+                elif fallback:
+                    for keyword, url, _ in fallback:
+                        log_error(log_file, keyword, url, "HTTP 본문 없음 (브라우저 폴백 꺼짐)")
+        finally:
+            driver.quit()
+
+    # ===== 4. 키워드별 CSV + 합본 =====
+    for keyword in keywords:
+        path_kw = os.path.join(save_dir, f"webtretho_{slugify(keyword)}.csv")
+        compact_to_csv(records_file, path_kw, keyword=keyword, columns=CSV_COLUMNS)
+    rows = compact_to_csv(records_file, os.path.join(save_dir, CSV_ALL_FILE), columns=CSV_COLUMNS)
+    print(f"🪵 에러 로그: {log_file}")
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Webtretho 크롤러 (계정별 로그인 1번 + 쿠키 HTTP 풀 + 브라우저 폴백)")
+    parser.add_argument('--keywords', nargs='+', default=KEYWORDS, help="검색 키워드 (섹션)")
+    parser.add_argument('--save-dir', default=SAVE_DIR)
+    parser.add_argument('--concurrency', type=int, default=HTTP_CONCURRENCY, help="동시 HTTP 요청 수")
+    parser.add_argument('--scroll-num', type=int, default=SCROLL_NUM, help="키워드당 더보기 최대 클릭 수")
+    parser.add_argument('--relist', action='store_true', help="목록을 모은 키워드도 다시 검색해서 새 글 찾기")
+    parser.add_argument('--no-fallback', action='store_true', help="HTTP 로 못 받은 글을 브라우저로 다시 시도하지 않음")
+    parser.add_argument('--window', action='store_true', help="Chrome 창을 띄워서 실행 (디버깅용)")
+    args = parser.parse_args()
+
+    accounts = parse_accounts(os.environ.get('WEBTRETHO_ACCOUNTS'))
+    if not accounts and os.environ.get('WEBTRETHO_ID'):
+        accounts = [(os.environ['WEBTRETHO_ID'], os.environ.get('WEBTRETHO_PW', ''))]
+    rows = crawl_webtretho(args.keywords, args.save_dir, accounts, args.concurrency, args.scroll_num,
+                           headless=not args.window, relist=args.relist, browser_fallback=not args.no_fallback)
+    print(f"\n🎯 전체 합본 저장 완료! 총 {rows}건")
+
+
+if __name__ == '__main__':
+    main()
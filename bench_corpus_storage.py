@@ -0,0 +1,121 @@
+"""
+CSV vs Parquet 말뭉치 로드 벤치마크
+
+데이터_레딧/*.csv 를 합쳐 (--repeat 배로 늘려) 임시 CSV 와 Parquet 데이터셋을 만든 뒤,
+각 방식으로 load_data 에 해당하는 로드를 별도 프로세스에서 실행해
+소요 시간과 최대 RSS(피크 메모리)를 비교한다.
+
+- csv_full    : 기존 방식 (pd.read_csv 로 전체 컬럼 파싱)
+- csv_usecols : CSV + 컬럼 projection
+- parquet     : Parquet 데이터셋 + 컬럼 projection
+
+실행:
+    python bench_corpus_storage.py --repeat 5
+"""
+import argparse
+import glob
+import json
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import pandas as pd
+
+from corpus_storage import read_table, write_corpus
+
+MODES = ["csv_full", "csv_usecols", "parquet"]
+COLUMNS = ["content"]  # load_data 가 실제로 쓰는 컬럼 (텍스트 + 선택적 ID)
+
+
+def _max_rss_mb() -> float:
+    # ru_maxrss 는 fork 한 부모의 피크가 남아 있을 수 있어서 Linux 에선 VmHWM 을 우선 사용
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def run_child(mode: str, path: str):
+    """자식 프로세스: 로드 1번 후 시간 / RSS 를 JSON 으로 출력"""
+    if mode == "parquet":
+        import pyarrow.dataset  # 라이브러리 로드 비용은 기준 RSS 에 포함
+    base_rss = _max_rss_mb()
+    start = time.perf_counter()
+    if mode == "csv_full":
+        df = pd.read_csv(path, encoding="utf-8-sig")
+    else:
+        df = read_table(path, columns=COLUMNS)
+    elapsed = time.perf_counter() - start
+    print(json.dumps({
+        "rows": len(df),
+        "sec": elapsed,
+        "base_rss_mb": base_rss,
+        "peak_rss_mb": _max_rss_mb(),
+    }))
+
+
+def measure(mode: str, path: str, runs: int) -> dict:
+    results = []
+    for _ in range(runs):
+        out = subprocess.run(
+            [sys.executable, __file__, "--child", mode, path],
+            check=True, capture_output=True, text=True,
+        ).stdout
+        results.append(json.loads(out.strip().splitlines()[-1]))
+    best = min(results, key=lambda r: r["sec"])
+    best["sec_median"] = sorted(r["sec"] for r in results)[len(results) // 2]
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description='CSV vs Parquet 말뭉치 로드 벤치마크')
+    parser.add_argument('--input', type=str, default='데이터_레딧/*.csv',
+                        help='벤치마크에 쓸 CSV glob 패턴')
+    parser.add_argument('--repeat', type=int, default=3,
+                        help='입력 데이터를 몇 배로 늘릴지 (큰 말뭉치 흉내)')
+    parser.add_argument('--runs', type=int, default=3, help='방식별 반복 횟수')
+    parser.add_argument('--child', nargs=2, metavar=('MODE', 'PATH'), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        run_child(*args.child)
+        return
+
+    paths = [p for p in sorted(glob.glob(args.input)) if Path(p).stat().st_size > 16]  # 빈 스냅샷 제외
+    if not paths:
+        print(f"입력 CSV 가 없습니다: {args.input}")
+        return
+    df = pd.concat([pd.read_csv(p, encoding="utf-8-sig", dtype=str) for p in paths], ignore_index=True)
+    df = pd.concat([df] * args.repeat, ignore_index=True)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        csv_path = str(Path(tmp) / "corpus.csv")
+        parquet_root = str(Path(tmp) / "corpus")
+        df.to_csv(csv_path, index=False, encoding="utf-8-sig")
+        write_corpus(df, root=parquet_root, source="reddit")
+
+        csv_mb = Path(csv_path).stat().st_size / 1024 / 1024
+        parquet_mb = sum(p.stat().st_size for p in Path(parquet_root).rglob("*.parquet")) / 1024 / 1024
+
+        results = {mode: measure(mode, parquet_root if mode == "parquet" else csv_path, args.runs)
+                   for mode in MODES}
+
+    print("\n========== 벤치마크 결과 ==========")
+    print(f"행 수: {len(df):,}  (CSV {csv_mb:.1f}MB / Parquet {parquet_mb:.1f}MB)")
+    print(f"{'방식':<12} {'최소(초)':>9} {'중앙값(초)':>10} {'RSS 증가(MB)':>13} {'피크 RSS(MB)':>13}")
+    for mode, r in results.items():
+        print(f"{mode:<12} {r['sec']:>9.3f} {r['sec_median']:>10.3f} "
+              f"{r['peak_rss_mb'] - r['base_rss_mb']:>13.1f} {r['peak_rss_mb']:>13.1f}")
+    base = results["csv_full"]["sec"]
+    print(f"\nParquet 속도 향상 (csv_full 대비): {base / results['parquet']['sec']:.1f}배")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,157 @@
+"""
+crawl_orchestrator 점검 / 벤치마크 (오프라인, 실제 크롤러 대신 시간만 쓰는 가짜 작업 스크립트 사용)
+
+기본 작업 목록과 같은 모양(같은 도메인 / 작업 수)으로 가짜 작업을 만들어서
+1) 모든 작업이 끝나는지, 순서대로 실행한 시간 합보다 얼마나 빨리 끝나는지 (가장 느린 도메인 줄에 가까운지)
+2) 도메인별 동시 실행 수가 max_jobs 를 넘지 않는지 (작업 시작 / 종료 기록으로 확인)
+3) 첫 실행에 실패하는 작업이 공유 재시도 큐로 다시 실행되어 끝나는지
+4) cmd 의 {rate} / {concurrency} 가 도메인 예산 몫으로 바뀌어 넘어가는지,
+   rate / concurrency 를 정하지 않은 도메인(네이버 블로그 / 지식iN)의 작업이 {rate} 를 쓰면 시작 전에 거부하는지
+5) 필요한 환경 변수가 없는 작업은 건너뛰는지, --skip-done 재실행(두 번)은 아무것도 다시 돌리지 않는지
+
+실행:
+    python bench_crawl_orchestrator.py --scale 1.0
+"""
+import argparse
+import json
+import os
+import tempfile
+import time
+
+from crawl_orchestrator import DOMAINS, Orchestrator
+
+FAKE_JOB = r'''
+import json, os, sys, time
+name, seconds, events, fail_marker = sys.argv[1], float(sys.argv[2]), sys.argv[3], sys.argv[4]
+with open(events, 'a') as f:
+    f.write(json.dumps({'name': name, 'event': 'start', 't': time.time(), 'argv': sys.argv[5:]}) + '\n')
+for i in range(5):
+    time.sleep(seconds / 5)
+    print(f"[{name}] {i + 1}/5 단계", flush=True)
+with open(events, 'a') as f:
+    f.write(json.dumps({'name': name, 'event': 'end', 't': time.time()}) + '\n')
+if fail_marker != '-' and not os.path.exists(fail_marker):
+    open(fail_marker, 'w').close()
+    print("연결 끊김 (가짜 실패)", flush=True)
+    sys.exit(3)
+'''
+
+# (이름, 도메인, 걸리는 시간 비율, 첫 실행 실패 여부, 추가 인자)
+FAKE_JOBS = [
+    ('reddit_keywords', ['reddit.com'], 0.6, False, ['--rate', '{rate}', '--concurrency', '{concurrency}']),
+    ('reddit_deaf', ['reddit.com'], 0.6, False, ['--rate', '{rate}']),
+    ('reddit_hard_of_hearing', ['reddit.com'], 0.6, False, ['--rate', '{rate}']),
+    ('reddit_hearingloss', ['reddit.com'], 0.6, False, ['--rate', '{rate}']),
+    ('naver_blog', ['search.naver.com', 'blog.naver.com'], 1.0, False, []),
+    ('naver_kin', ['search.naver.com', 'kin.naver.com'], 1.0, False, []),
+    ('naver_cafe', ['cafe.naver.com'], 0.8, False, ['--workers', '{concurrency}']),
+    ('youtube', ['googleapis.com'], 0.4, False, ['--concurrency', '{concurrency}', '--rate', '{rate}']),
+    ('ablenews', ['ablenews.co.kr'], 0.5, False, ['--concurrency', '{concurrency}']),
+    ('webtretho', ['webtretho.vn'], 0.6, True, ['--concurrency', '{concurrency}']),
+]
+
+
+def make_jobs(tmp_dir, scale):
+    script = os.path.join(tmp_dir, 'fake_job.py')
+    with open(script, 'w', encoding='utf-8') as f:
+        f.write(FAKE_JOB)
+    events = os.path.join(tmp_dir, 'events.jsonl')
+    jobs = []
+    for name, domains, seconds, fail_first, extra in FAKE_JOBS:
+        marker = os.path.join(tmp_dir, f'{name}.failed_once') if fail_first else '-'
+        jobs.append({'name': name, 'cwd': tmp_dir, 'domains': domains,
+                     'cmd': [script, name, str(seconds * scale), events, marker] + extra})
+    jobs.append({'name': 'needs_key', 'cwd': tmp_dir, 'domains': ['googleapis.com'],
+                 'cmd': [script, 'needs_key', '0', events, '-'], 'requires_env': ['BENCH_ORCHESTRATOR_MISSING_KEY']})
+    return jobs, events
+
+
+def read_events(path):
+    with open(path, encoding='utf-8') as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def max_overlap(events, names):
+    """names 작업들의 동시 실행 수 최댓값"""
+    points = sorted((e['t'], 1 if e['event'] == 'start' else -1) for e in events if e['name'] in names)
+    running = peak = 0
+    for _, delta in sorted(points, key=lambda p: (p[0], p[1])):
+        running += delta
+        peak = max(peak, running)
+    return peak
+
+
+def check(name, ok):
+    print(f"{'✅' if ok else '❌'} {name}")
+    return ok
+
+
+def main():
+    parser = argparse.ArgumentParser(description="crawl_orchestrator 점검 / 벤치마크")
+    parser.add_argument('--scale', type=float, default=1.0, help="가짜 작업 시간 배율 (초)")
+    args = parser.parse_args()
+
+    results = []
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        jobs, events_file = make_jobs(tmp_dir, args.scale)
+        out_dir = os.path.join(tmp_dir, 'runs')
+        orchestrator = Orchestrator(jobs, DOMAINS, out_dir, root_dir=tmp_dir, retry_backoff=0.2 * args.scale,
+                                    dashboard_interval=args.scale)
+        started = time.perf_counter()
+        status = orchestrator.run()
+        wall = time.perf_counter() - started
+        events = read_events(events_file)
+
+        ran = [name for name, *_ in FAKE_JOBS]
+        results.append(check("모든 작업 완료", all(status[name]['status'] == 'done' for name in ran)))
+        results.append(check("환경 변수가 없는 작업은 건너뜀", status['needs_key']['status'] == 'skipped'))
+
+        domain_jobs = {}
+        for name, domains, *_ in FAKE_JOBS:
+            for domain in domains:
+                domain_jobs.setdefault(domain, []).append(name)
+        overlaps = {domain: max_overlap(events, names) for domain, names in domain_jobs.items()}
+        results.append(check(f"도메인별 최대 동시 실행 {overlaps}",
+                             all(overlaps[d] <= DOMAINS[d]['max_jobs'] for d in overlaps)
+                             and overlaps['search.naver.com'] == 2))
+
+        results.append(check(f"실패 작업 재시도 후 완료 (webtretho {status['webtretho']['attempts']}회 실행)",
+                             status['webtretho']['attempts'] == 2 and status['webtretho']['status'] == 'done'))
+
+        argv = {e['name']: e['argv'] for e in events if e['event'] == 'start'}
+        results.append(check(f"예산 몫 전달: youtube {argv['youtube']}, naver_cafe {argv['naver_cafe']}, "
+                             f"reddit_keywords {argv['reddit_keywords']}, naver_blog {argv['naver_blog']}",
+                             argv['youtube'] == ['--concurrency', '8', '--rate', '10']
+                             and argv['naver_cafe'] == ['--workers', '4']
+                             and argv['reddit_keywords'] == ['--rate', '0.333333', '--concurrency', '8']
+                             and argv['reddit_deaf'] == ['--rate', '0.333333']
+                             and argv['naver_blog'] == []))
+
+        try:
+            Orchestrator([{'name': 'bad', 'cwd': tmp_dir, 'domains': ['blog.naver.com'], 'cmd': ['x.py', '--rate', '{rate}']}],
+                         DOMAINS, out_dir)
+            rejected = False
+        except ValueError:
+            rejected = True
+        results.append(check("예산에 없는 {rate} 를 쓰는 작업은 시작 전에 거부", rejected))
+
+        # 순서대로 실행했을 때 = 작업별 실제 실행 시간(프로세스 시작 포함, 재시도 포함)의 합
+        sequential = sum(status[name]['elapsed'] for name in ran)
+        reddit_lane = sum(status[name]['elapsed'] for name in ran if name.startswith('reddit'))
+        results.append(check(f"전체 {wall:.1f}초 < 순서대로 {sequential:.1f}초의 절반 "
+                             f"(가장 긴 도메인 줄 reddit.com {reddit_lane:.1f}초)", wall < sequential / 2))
+
+        Orchestrator(jobs, DOMAINS, out_dir, root_dir=tmp_dir, skip_done=True).run()
+        rerun = Orchestrator(jobs, DOMAINS, out_dir, root_dir=tmp_dir, skip_done=True).run()
+        results.append(check("--skip-done 두 번 재실행: 다시 실행한 작업 없음, 완료 상태 유지",
+                             [name for name, s in rerun.items() if s['status'] == 'done'] == ran
+                             and len(read_events(events_file)) == len(events)))
+
+    print("\n========== 벤치마크 결과 ==========")
+    print(f"가짜 작업 {len(FAKE_JOBS)}개: 순서대로 {sequential:.1f}초 → 오케스트레이터 {wall:.1f}초 "
+          f"({sequential / wall:.1f}배)")
+    print(f"점검 {sum(results)}/{len(results)} 통과")
+
+
+if __name__ == '__main__':
+    main()
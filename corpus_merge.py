@@ -0,0 +1,264 @@
+"""
+말뭉치 스냅샷 병합 / 중복 제거 모듈
+데이터_레딧/ 처럼 겹치는 CSV 덤프 여러 개를 하나의 데이터셋으로 합침
+
+- 파일을 청크 단위로 두 번 스트리밍 (전체 행을 메모리에 올리지 않음)
+  1회차: post_id / 정규화 URL 의 64비트 해시 → 최신 행 위치 인덱스 구성
+  2회차: 각 게시글의 최신 행만 골라서 출력에 append
+- 메모리는 총 행 수가 아니라 고유 게시글 수에 비례
+- 최신 기준: 스냅샷 순서 (파일명의 MMDD 날짜, _1/_2 같은 접미 번호 순, 같은 스냅샷 안에서는 뒤쪽 행)
+- 병합 결과와 함께 입력별 행 수 / 중복 수를 담은 manifest(JSON) 저장
+
+사용 예:
+    python corpus_merge.py 데이터_레딧/reddit_hardofhearing_*.csv --output reddit_hardofhearing_merged.csv
+"""
+import argparse
+import glob
+import hashlib
+import json
+import logging
+import os
+import re
+from array import array
+from datetime import datetime
+from typing import Dict, List, Optional
+from urllib.parse import urlsplit
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+CHUNK_SIZE = 20000
+KEY_COLUMNS = ["post_id", "url"]
+SNAPSHOT_PATTERN = re.compile(r"_(\d{4})(?:_(\d+))?(?:_csv)?$")
+HOST_PREFIXES = ("www.", "old.", "new.", "np.", "m.")
+
+
+def normalize_url(url) -> Optional[str]:
+    """
+    같은 게시글의 URL 변형을 하나로 맞춤
+    (스킴 / www·old·np 서브도메인 / 쿼리 / 프래그먼트 / 끝 슬래시 / 호스트 대소문자 무시)
+    """
+    if not isinstance(url, str) or not url.strip():
+        return None
+    parts = urlsplit(url.strip())
+    host = parts.netloc.lower()
+    for prefix in HOST_PREFIXES:
+        if host.startswith(prefix):
+            host = host[len(prefix):]
+            break
+    path = parts.path.rstrip("/")
+    return f"{host}{path}" if host else path or None
+
+
+def _hash_key(kind: str, value: str) -> int:
+    # 64비트 해시만 보관해서 키 문자열 자체는 메모리에 남기지 않음
+    digest = hashlib.blake2b(f"{kind}:{value}".encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "big")
+
+
+def row_keys(post_id, url) -> List[int]:
+    """행 하나의 중복 판별 키 해시 목록 (post_id, 정규화 URL)"""
+    keys = []
+    if isinstance(post_id, str) and post_id.strip():
+        keys.append(_hash_key("id", post_id.strip()))
+    norm = normalize_url(url)
+    if norm:
+        keys.append(_hash_key("url", norm))
+    return keys
+
+
+def snapshot_order(path: str):
+    """파일명에서 (MMDD, 접미 번호) 를 뽑아 정렬 키로 사용. 없으면 수정 시각"""
+    stem = os.path.splitext(os.path.basename(path))[0]
+    m = SNAPSHOT_PATTERN.search(stem)
+    if m:
+        return (0, int(m.group(1)), int(m.group(2) or 0), stem)
+    return (1, os.path.getmtime(path), 0, stem)
+
+
+def iter_chunks(path: str, encoding: str = 'utf-8-sig', chunksize: int = CHUNK_SIZE):
+    """CSV 를 문자열 dtype 청크로 읽기 (빈 파일은 건너뜀)"""
+    try:
+        yield from pd.read_csv(path, encoding=encoding, dtype=str, chunksize=chunksize)
+    except pd.errors.EmptyDataError:
+        logger.warning(f"{path}: 빈 파일, 건너뜀")
+
+
+class SnapshotMerger:
+    """스냅샷 CSV 병합 / 중복 제거 클래스"""
+
+    def __init__(self, paths: List[str], encoding: str = 'utf-8-sig', chunksize: int = CHUNK_SIZE):
+        """
+        Args:
+            paths: 입력 CSV 경로 목록 (snapshot_order 로 오래된 것부터 정렬됨)
+            encoding: 입력 CSV 인코딩
+            chunksize: 한 번에 읽을 행 수
+        """
+        self.paths = sorted(paths, key=snapshot_order)
+        self.encoding = encoding
+        self.chunksize = chunksize
+        self.key_to_entry: Dict[int, int] = {}  # 키 해시 → 게시글 번호
+        self.parent = array("q")                # 게시글 번호 → union-find 부모
+        self.winners = array("q")               # 게시글 번호 → 최신 행 위치 (file_idx << 32 | row_idx), 합쳐진 번호는 -1
+        self.file_stats: List[dict] = []
+        self.columns: List[str] = []            # 모든 입력의 컬럼 합집합 (처음 나온 순서)
+
+    def build_index(self):
+        """1회차: 고유 게시글별 최신 행 위치 인덱스 + 출력 컬럼(모든 파일의 합집합) 구성"""
+        for file_idx, path in enumerate(self.paths):
+            stats = {"path": path, "rows": 0, "rows_without_key": 0}
+            row_idx = 0
+            for chunk in iter_chunks(path, self.encoding, self.chunksize):
+                self.columns.extend(c for c in chunk.columns if c not in self.columns)
+                post_ids = chunk["post_id"] if "post_id" in chunk.columns else [None] * len(chunk)
+                urls = chunk["url"] if "url" in chunk.columns else [None] * len(chunk)
+                for post_id, url in zip(post_ids, urls):
+                    self._add_row(file_idx, row_idx, row_keys(post_id, url), stats)
+                    row_idx += 1
+            stats["rows"] = row_idx
+            self.file_stats.append(stats)
+            logger.info(f"인덱싱 완료: {os.path.basename(path)} ({row_idx}행)")
+
+    def _find(self, entry: int) -> int:
+        # post_id / URL 로 이어진 게시글 번호들을 union-find 로 하나의 대표 번호로 모음
+        root = entry
+        while self.parent[root] != root:
+            root = self.parent[root]
+        while self.parent[entry] != root:
+            self.parent[entry], entry = root, self.parent[entry]
+        return root
+
+    def _add_row(self, file_idx: int, row_idx: int, keys: List[int], stats: dict):
+        location = (file_idx << 32) | row_idx
+        if not keys:
+            # 키가 없는 행은 중복 판별이 불가능하므로 그대로 유지
+            stats["rows_without_key"] += 1
+            self.parent.append(len(self.winners))
+            self.winners.append(location)
+            return
+        roots = {self._find(self.key_to_entry[k]) for k in keys if k in self.key_to_entry}
+        if roots:
+            # post_id 와 URL 이 서로 다른 게시글을 가리키면 하나로 합침
+            entry = min(roots)
+            for other in roots - {entry}:
+                self.parent[other] = entry
+                self.winners[other] = -1
+        else:
+            entry = len(self.winners)
+            self.parent.append(entry)
+            self.winners.append(location)
+        self.winners[entry] = location  # 나중 스냅샷 / 뒤쪽 행이 최신
+        for k in keys:
+            self.key_to_entry.setdefault(k, entry)
+
+    def write(self, output_path: str) -> dict:
+        """
+        2회차: 최신 행만 output_path(CSV)에 저장하고 manifest 반환
+
+        Returns:
+            manifest dict
+        """
+        keep: Dict[int, set] = {}
+        for location in self.winners:
+            if location >= 0:
+                keep.setdefault(location >> 32, set()).add(location & 0xFFFFFFFF)
+
+        out_dir = os.path.dirname(os.path.abspath(output_path))
+        os.makedirs(out_dir, exist_ok=True)
+        tmp_path = output_path + ".tmp"
+        written = 0
+        with open(tmp_path, "w", encoding="utf-8-sig", newline="") as f:
+            for file_idx, path in enumerate(self.paths):
+                rows_to_keep = keep.get(file_idx, set())
+                kept = 0
+                row_idx = 0
+                for chunk in iter_chunks(path, self.encoding, self.chunksize):
+                    mask = [(row_idx + i) in rows_to_keep for i in range(len(chunk))]
+                    row_idx += len(chunk)
+                    part = chunk[mask]
+                    if part.empty:
+                        continue
+                    # 나중 스냅샷에만 있는 컬럼도 빠지지 않도록 합집합 기준으로 맞춤 (없는 값은 빈칸)
+                    part = part.reindex(columns=self.columns)
+                    part.to_csv(f, header=(written == 0), index=False)
+                    written += len(part)
+                    kept += len(part)
+                self.file_stats[file_idx]["kept"] = kept
+        os.replace(tmp_path, output_path)
+
+        total_rows = sum(s["rows"] for s in self.file_stats)
+        manifest = {
+            "created_at": datetime.now().isoformat(timespec="seconds"),
+            "output": output_path,
+            "columns": self.columns,
+            "inputs": self.file_stats,
+            "total_rows": total_rows,
+            "unique_rows": written,
+            "duplicates_removed": total_rows - written,
+            "dedup_keys": KEY_COLUMNS,
+            "newest_rule": "later snapshot (file name MMDD, suffix), then later row",
+        }
+        logger.info(f"병합 완료: {total_rows}행 → {written}행 ({output_path})")
+        return manifest
+
+
+def merge_snapshots(paths: List[str],
+                    output_path: str,
+                    manifest_path: Optional[str] = None,
+                    encoding: str = 'utf-8-sig',
+                    chunksize: int = CHUNK_SIZE) -> dict:
+    """
+    스냅샷 CSV 들을 병합/중복 제거해 output_path 에 저장하고 manifest 도 저장
+
+    Args:
+        paths: 입력 CSV 경로 목록
+        output_path: 병합 결과 CSV 경로
+        manifest_path: manifest JSON 경로 (None 이면 output_path + ".manifest.json")
+        encoding: 입력 CSV 인코딩
+        chunksize: 한 번에 읽을 행 수
+
+    Returns:
+        manifest dict
+    """
+    merger = SnapshotMerger(paths, encoding=encoding, chunksize=chunksize)
+    merger.build_index()
+    manifest = merger.write(output_path)
+
+    manifest_path = manifest_path or output_path + ".manifest.json"
+    with open(manifest_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2)
+    return manifest
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description='스냅샷 CSV 병합 / 중복 제거')
+    parser.add_argument('inputs', nargs='*', default=['데이터_레딧/reddit_*.csv'],
+                        help='입력 CSV 경로 또는 glob 패턴 (기본값: 데이터_레딧/reddit_*.csv)')
+    parser.add_argument('--output', type=str, default='reddit_merged.csv',
+                        help='병합 결과 CSV 경로')
+    parser.add_argument('--manifest', type=str, default=None,
+                        help='manifest JSON 경로 (기본값: <output>.manifest.json)')
+    parser.add_argument('--encoding', type=str, default='utf-8-sig', help='입력 CSV 인코딩')
+    parser.add_argument('--chunksize', type=int, default=CHUNK_SIZE, help='청크 크기(행)')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO,
+                        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+
+    paths = []
+    for pattern in args.inputs:
+        matched = sorted(glob.glob(pattern))
+        paths.extend(matched or [pattern])
+    output_abs = os.path.abspath(args.output)
+    paths = [p for p in dict.fromkeys(paths) if os.path.abspath(p) != output_abs]
+
+    manifest = merge_snapshots(paths, args.output, args.manifest, args.encoding, args.chunksize)
+    print(f"입력 {len(paths)}개 파일, {manifest['total_rows']}행 → "
+          f"{manifest['unique_rows']}행 (중복 {manifest['duplicates_removed']}행 제거)")
+    print(f"저장 완료: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
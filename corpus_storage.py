@@ -0,0 +1,230 @@
+"""
+말뭉치 저장 모듈
+크롤링 결과를 source 별로 파티셔닝된 Parquet 데이터셋으로 저장/로드
+
+- 고정 스키마: post_id, source, keyword, title, content, date, url
+- source / keyword 는 사전(dictionary) 인코딩 → 반복되는 문자열을 한 번만 저장
+- 기존 utf-8-sig CSV(데이터_레딧/*.csv 등) 가져오기
+- 필요한 컬럼만 읽는 read_table (CSV / Parquet 공통, 각 단계의 load_data 에서 사용)
+
+사용 예:
+    python corpus_storage.py import --source reddit --root data/corpus 데이터_레딧/*.csv
+    df = read_table("data/corpus", columns=["post_id", "content"])
+"""
+import argparse
+import logging
+import os
+import uuid
+from pathlib import Path
+from typing import Iterable, List, Optional
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+CORPUS_COLUMNS = ["post_id", "source", "keyword", "title", "content", "date", "url"]
+CATEGORY_COLUMNS = ["source", "keyword"]
+PARTITION_COLUMNS = ["source"]
+DEFAULT_ROOT = "data/corpus"
+PARQUET_SUFFIXES = (".parquet", ".pq")
+
+
+def corpus_schema():
+    """말뭉치 Parquet 스키마 (pyarrow 는 Parquet 를 쓸 때만 필요하므로 지연 import)"""
+    import pyarrow as pa
+
+    fields = []
+    for col in CORPUS_COLUMNS:
+        if col in CATEGORY_COLUMNS:
+            fields.append(pa.field(col, pa.dictionary(pa.int32(), pa.string())))
+        else:
+            fields.append(pa.field(col, pa.string()))
+    return pa.schema(fields)
+
+
+def is_parquet_path(path: str) -> bool:
+    """Parquet 파일이거나 Parquet 데이터셋 디렉토리인지"""
+    return os.path.isdir(path) or str(path).lower().endswith(PARQUET_SUFFIXES)
+
+
+def _csv_encoding(encoding: str) -> str:
+    # 크롤러들이 utf-8-sig 로 저장하므로 utf-8 로 읽으면 첫 컬럼명에 BOM 이 붙음
+    return "utf-8-sig" if encoding.lower().replace("_", "-") == "utf-8" else encoding
+
+
+def read_table(path: str,
+               columns: Optional[List[str]] = None,
+               encoding: str = 'utf-8') -> pd.DataFrame:
+    """
+    CSV 또는 Parquet(파일/데이터셋 디렉토리)에서 필요한 컬럼만 읽기
+
+    Args:
+        path: CSV 파일, Parquet 파일 또는 Parquet 데이터셋 디렉토리 경로
+        columns: 읽을 컬럼 목록 (None 이면 전체, 없는 컬럼은 무시)
+        encoding: CSV 인코딩 (Parquet 에는 사용하지 않음)
+
+    Returns:
+        DataFrame
+    """
+    if is_parquet_path(path):
+        import pyarrow.dataset as ds
+
+        dataset = ds.dataset(path, format="parquet", partitioning="hive")
+        if columns is not None:
+            columns = [c for c in columns if c in dataset.schema.names]
+        return dataset.to_table(columns=columns).to_pandas()
+
+    usecols = None if columns is None else (lambda c: c in columns)
+    return pd.read_csv(path, encoding=_csv_encoding(encoding), usecols=usecols)
+
+
+def normalize_frame(df: pd.DataFrame,
+                    source: Optional[str] = None,
+                    keyword: Optional[str] = None) -> pd.DataFrame:
+    """
+    임의의 크롤링 결과 DataFrame 을 말뭉치 스키마 컬럼으로 맞춤
+
+    Args:
+        df: 크롤링 결과 DataFrame
+        source: source 컬럼이 없을 때 채울 값 (예: "reddit", "naver_blog")
+        keyword: keyword 컬럼이 없을 때 채울 값
+
+    Returns:
+        CORPUS_COLUMNS 순서의 DataFrame (값은 전부 문자열 또는 None)
+    """
+    out = pd.DataFrame(index=df.index)
+    for col in CORPUS_COLUMNS:
+        if col in df.columns:
+            values = df[col]
+        elif col == "source":
+            values = source
+        elif col == "keyword":
+            values = keyword
+        else:
+            values = None
+        out[col] = values
+    out = out.astype(object).where(out.notna(), None)
+    for col in CORPUS_COLUMNS:
+        out[col] = out[col].map(lambda v: v if v is None else str(v))
+    if out["source"].isna().any():
+        raise ValueError("source 컬럼이 없습니다. source 인자를 지정하세요.")
+    return out.reset_index(drop=True)
+
+
+def write_corpus(df: pd.DataFrame,
+                 root: str = DEFAULT_ROOT,
+                 source: Optional[str] = None,
+                 keyword: Optional[str] = None) -> int:
+    """
+    DataFrame 을 source 파티션 Parquet 데이터셋에 추가
+
+    Args:
+        df: 크롤링 결과 DataFrame
+        root: 데이터셋 루트 디렉토리
+        source: source 컬럼이 없을 때 채울 값
+        keyword: keyword 컬럼이 없을 때 채울 값
+
+    Returns:
+        저장한 행 수
+    """
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+
+    frame = normalize_frame(df, source=source, keyword=keyword)
+    table = pa.Table.from_pandas(frame, schema=corpus_schema(), preserve_index=False)
+    ds.write_dataset(
+        table,
+        root,
+        format="parquet",
+        partitioning=PARTITION_COLUMNS,
+        partitioning_flavor="hive",
+        # 기존 파일을 덮어쓰지 않도록 호출마다 고유한 파일명 사용
+        basename_template=f"part-{uuid.uuid4().hex[:12]}-{{i}}.parquet",
+        existing_data_behavior="overwrite_or_ignore",
+    )
+    logger.info(f"Parquet 저장 완료: {root} ({len(frame)}행)")
+    return len(frame)
+
+
+def existing_post_ids(root: str, source: str) -> set:
+    """
+    데이터셋에 이미 저장된 source 파티션의 post_id 집합 (같은 수집 결과를 다시 추가하지 않도록 걸러낼 때 사용)
+
+    Args:
+        root: 데이터셋 루트 디렉토리 (없으면 빈 집합)
+        source: source 파티션 값
+
+    Returns:
+        post_id 문자열 집합
+    """
+    if not os.path.isdir(root):
+        return set()
+    import pyarrow.dataset as ds
+
+    dataset = ds.dataset(root, format="parquet", partitioning="hive")
+    if "source" not in dataset.schema.names:
+        return set()
+    table = dataset.to_table(columns=["post_id"], filter=ds.field("source") == source)
+    return {v for v in table.column("post_id").to_pylist() if v is not None}
+
+
+def import_csv(csv_paths: Iterable[str],
+               root: str = DEFAULT_ROOT,
+               source: Optional[str] = None,
+               encoding: str = 'utf-8-sig') -> int:
+    """
+    기존 CSV 파일들을 Parquet 데이터셋으로 가져오기
+
+    Args:
+        csv_paths: CSV 파일 경로 목록
+        root: 데이터셋 루트 디렉토리
+        source: CSV 에 source 컬럼이 없을 때 채울 값
+        encoding: CSV 인코딩 (실패 시 cp949 재시도)
+
+    Returns:
+        가져온 전체 행 수
+    """
+    total = 0
+    for path in csv_paths:
+        try:
+            df = pd.read_csv(path, encoding=encoding, dtype=str)
+        except UnicodeDecodeError:
+            logger.warning(f"{path}: {encoding} 인코딩 실패, cp949 시도 중...")
+            df = pd.read_csv(path, encoding='cp949', dtype=str)
+        except pd.errors.EmptyDataError:
+            logger.warning(f"{path}: 빈 파일, 건너뜀")
+            continue
+        total += write_corpus(df, root=root, source=source)
+        logger.info(f"가져오기 완료: {Path(path).name} ({len(df)}행)")
+    return total
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description='크롤링 CSV → Parquet 말뭉치 저장소')
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    imp = sub.add_parser('import', help='CSV 파일을 Parquet 데이터셋으로 가져오기')
+    imp.add_argument('csv_paths', nargs='+', help='가져올 CSV 파일 경로')
+    imp.add_argument('--root', type=str, default=DEFAULT_ROOT, help='데이터셋 루트 디렉토리')
+    imp.add_argument('--source', type=str, required=True,
+                     help='source 값 (예: reddit, naver_blog, youtube)')
+    imp.add_argument('--encoding', type=str, default='utf-8-sig', help='CSV 인코딩')
+
+    info = sub.add_parser('info', help='데이터셋 source 별 행 수 출력')
+    info.add_argument('--root', type=str, default=DEFAULT_ROOT, help='데이터셋 루트 디렉토리')
+
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO,
+                        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+
+    if args.command == 'import':
+        total = import_csv(args.csv_paths, root=args.root, source=args.source, encoding=args.encoding)
+        print(f"총 {total}행 가져오기 완료: {args.root}")
+    else:
+        df = read_table(args.root, columns=["source"])
+        print(df["source"].value_counts())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,461 @@
+"""
+다중 소스 크롤링 오케스트레이터
+Reddit / 네이버 블로그 / 지식iN / 네이버 카페 / 유튜브 / 에이블뉴스 / Webtretho 수집 스크립트를 한 번에 스케줄링
+
+스크립트마다 SLEEP_SEC / time.sleep / 동시 요청 수를 따로 맞춰 두고 하나씩 차례로 돌리면 전체 시간이
+모든 소스 시간의 합이 된다. 여기서는 각 스크립트를 작업(job)으로 보고 서로 다른 사이트의 작업을 동시에 돌린다.
+
+- 도메인 예산: 도메인마다 동시에 돌릴 작업 수(max_jobs), 초당 요청 수(rate), 동시 요청 수(concurrency)
+  * 같은 도메인을 쓰는 작업(예: Reddit 스크립트 4개)은 max_jobs 만큼만 함께 실행 → 나머지는 대기
+  * 작업의 cmd 에 {rate} / {concurrency} 를 쓰면 도메인 예산을 max_jobs 로 나눈 값으로 바꿔서 넘김
+    (예: youtube_collector.py --rate {rate}, ablenews_crawler.py --concurrency {concurrency})
+  * rate 는 초당 요청 수를 인자로 받는 스크립트(Reddit, 유튜브)의 도메인에만 정함. 네이버 카페 / 에이블뉴스 /
+    Webtretho 는 동시 요청 수(concurrency)로만, 네이버 블로그 / 지식iN Selenium 스크립트는 작업 수로만 제한
+  * 작업이 여러 도메인을 쓰면(검색 + 본문) 모든 도메인에 자리가 있을 때만 시작
+- 공유 재시도 큐: 실패(0 이 아닌 종료 코드 / 시간 초과)한 작업은 지수 백오프 뒤 다시 실행
+  (각 크롤러가 체크포인트 / 커서 / RecordSink 로 이어받으므로 재시도는 중단한 곳부터)
+- 진행 대시보드: 작업별 상태 / 시도 횟수 / 경과 시간 / 마지막 출력 줄, 도메인별 실행 수를 주기적으로 출력
+  작업 출력 전체는 out_dir/logs/{작업}.log, 상태는 out_dir/orchestrator_state.json
+
+실행:
+    python crawl_orchestrator.py --list                        # 작업 / 도메인 예산 확인
+    python crawl_orchestrator.py                               # 전체 실행
+    python crawl_orchestrator.py --only ablenews webtretho youtube
+    python crawl_orchestrator.py --config crawl_jobs.json      # 도메인 예산 / 작업 목록 바꾸기
+    python crawl_orchestrator.py --skip-done                   # 중단된 실행에서 끝난 작업은 건너뜀
+"""
+import argparse
+import asyncio
+import heapq
+import json
+import os
+import sys
+import time
+from datetime import datetime
+from typing import Dict, List, Optional
+
+ROOT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+MAX_ATTEMPTS = 3            # 작업당 최대 실행 횟수 (첫 실행 포함)
+RETRY_BACKOFF = 60.0        # 첫 재시도까지 대기(초), 이후 2배씩
+DASHBOARD_INTERVAL = 30.0   # 대시보드 출력 간격(초)
+OUT_DIR = "crawl_runs"
+STATE_FILE = "orchestrator_state.json"   # OUT_DIR 안
+
+# 도메인별 예산
+#   max_jobs    : 이 도메인을 쓰는 작업을 동시에 몇 개까지 돌릴지
+#   rate        : 초당 요청 수 (작업 하나에는 rate / max_jobs), 없으면 작업에 넘기지 않음
+#   concurrency : 동시 요청 수 / 워커 수 (작업 하나에는 concurrency // max_jobs, 최소 1), 없으면 작업에 넘기지 않음
+DOMAINS = {
+    'reddit.com':       {'max_jobs': 1, 'rate': 1 / 3, 'concurrency': 8},   # 비로그인 JSON API 한도를 스크립트들이 나눠 씀
+    # 블로그 / 지식iN 은 Selenium 스크립트라 대기 시간이 스크립트에 고정 → 작업 수만 제한
+    'search.naver.com': {'max_jobs': 2},
+    'blog.naver.com':   {'max_jobs': 1},
+    'kin.naver.com':    {'max_jobs': 1},
+    'googleapis.com':   {'max_jobs': 1, 'rate': 10.0, 'concurrency': 8},   # YouTube Data API (일일 할당량 공유)
+    # 카페 / 에이블뉴스 / Webtretho 크롤러는 초당 요청 수 인자가 없음 → 동시 요청 수(워커 수)로만 제한
+    'cafe.naver.com':   {'max_jobs': 1, 'concurrency': 4},                  # 로그인 세션 하나 → 작업 하나
+    'ablenews.co.kr':   {'max_jobs': 1, 'concurrency': 8},
+    'webtretho.vn':     {'max_jobs': 1, 'concurrency': 16},
+}
+DEFAULT_DOMAIN = {'max_jobs': 1, 'rate': 1.0, 'concurrency': 4}   # DOMAINS 에 없는 도메인
+BUDGET_KEYS = ('rate', 'concurrency')   # cmd 의 {rate} / {concurrency} 로 작업에 넘기는 예산
+
+# 작업 목록 (cwd 는 저장소 루트 기준, cmd 는 python 뒤에 붙는 인자)
+#   requires_env / requires_files 가 없으면 실행하지 않고 건너뜀, timeout(초)을 넘기면 실패로 보고 재시도
+JOBS = [
+    {'name': 'reddit_keywords', 'source': 'reddit', 'cwd': 'Reddit',
+     'cmd': ['reddit_crawling.py', '--incremental', '--rate', '{rate}', '--concurrency', '{concurrency}'],
+     'domains': ['reddit.com']},
+    {'name': 'reddit_deaf', 'source': 'reddit', 'cwd': 'Reddit',
+     'cmd': ['6시간_redit_deaf - 복사본.py', '--incremental', '--rate', '{rate}'], 'domains': ['reddit.com']},
+    {'name': 'reddit_hard_of_hearing', 'source': 'reddit', 'cwd': 'Reddit',
+     'cmd': ['6시간_redit_hard_of_hearing - 복사본.py', '--incremental', '--rate', '{rate}'], 'domains': ['reddit.com']},
+    {'name': 'reddit_hearingloss', 'source': 'reddit', 'cwd': 'Reddit',
+     'cmd': ['6시간_redit_hearingloss - 복사본.py', '--incremental', '--rate', '{rate}'], 'domains': ['reddit.com']},
+    {'name': 'naver_blog', 'source': 'naver_blog', 'cwd': '네이버블로그, 지식인',
+     'cmd': ['네이버블로그_청각장애인.py'], 'domains': ['search.naver.com', 'blog.naver.com']},
+    {'name': 'naver_kin', 'source': 'naver_kin', 'cwd': '네이버블로그, 지식인',
+     'cmd': ['네이버지식인_청각장애인.py'], 'domains': ['search.naver.com', 'kin.naver.com']},
+    {'name': 'naver_cafe', 'source': 'naver_cafe', 'cwd': '네이버블로그, 지식인',
+     'cmd': ['naver_cafe_crawler.py', '--workers', '{concurrency}', '--login-headless'],
+     'domains': ['cafe.naver.com'], 'requires_env': ['NAVER_ID', 'NAVER_PW']},
+    {'name': 'youtube', 'source': 'youtube', 'cwd': '유튜브',
+     'cmd': ['youtube_collector.py', '--url-file', 'youtube_urls.txt',
+             '--concurrency', '{concurrency}', '--rate', '{rate}'],
+     'domains': ['googleapis.com'], 'requires_env': ['YOUTUBE_API_KEY'], 'requires_files': ['youtube_urls.txt']},
+    {'name': 'ablenews', 'source': 'ablenews', 'cwd': '에이블 뉴스',
+     'cmd': ['ablenews_crawler.py', '--concurrency', '{concurrency}'], 'domains': ['ablenews.co.kr']},
+    {'name': 'webtretho', 'source': 'webtretho', 'cwd': 'Webtretho',
+     'cmd': ['webtretho_crawler.py', '--concurrency', '{concurrency}'], 'domains': ['webtretho.vn']},
+]
+
+STATUS_ICONS = {'waiting': '⏳', 'running': '🚀', 'retry': '🔁', 'done': '✅', 'failed': '❌', 'skipped': '⏭️'}
+STATUS_NAMES = {'waiting': '대기', 'running': '실행', 'retry': '재시도 대기', 'done': '완료', 'failed': '실패',
+                'skipped': '건너뜀'}
+
+
+class DomainBudget:
+    """도메인 하나의 예산 (동시에 돌릴 작업 수 + 작업 하나에 나눠 줄 요청 속도 / 동시 요청 수)"""
+
+    def __init__(self, name: str, max_jobs: int = 1, rate: Optional[float] = None, concurrency: Optional[int] = None):
+        self.name = name
+        self.max_jobs = max(1, int(max_jobs))
+        self.rate = None if rate is None else float(rate)
+        self.concurrency = None if concurrency is None else int(concurrency)
+        self.running = 0
+
+    def has_slot(self) -> bool:
+        return self.running < self.max_jobs
+
+    def share(self) -> Dict[str, float]:
+        """작업 하나의 몫 (정하지 않은 rate / concurrency 는 빠짐)"""
+        share = {}
+        if self.rate is not None:
+            share['rate'] = self.rate / self.max_jobs
+        if self.concurrency is not None:
+            share['concurrency'] = max(1, self.concurrency // self.max_jobs)
+        return share
+
+
+def job_share(job: dict, budgets: Dict[str, DomainBudget]) -> Dict[str, float]:
+    """작업이 쓰는 도메인들의 몫 중 가장 작은 값 (여러 도메인을 쓰면 가장 빡빡한 예산을 따름)"""
+    shares = [budgets[domain].share() for domain in job['domains']]
+    return {key: min(s[key] for s in shares if key in s)
+            for key in BUDGET_KEYS if any(key in s for s in shares)}
+
+
+def used_share(job: dict, share: Dict[str, float]) -> Dict[str, float]:
+    """몫 중 작업의 cmd 가 실제로 받는 값 ({rate} / {concurrency} 를 쓴 것만)"""
+    return {key: value for key, value in share.items() if any('{' + key + '}' in arg for arg in job['cmd'])}
+
+
+def format_share(share: Dict[str, float]) -> str:
+    if not share:
+        return "속도는 스크립트 설정"
+    parts = []
+    if 'rate' in share:
+        parts.append(f"rate {share['rate']:g}/초")
+    if 'concurrency' in share:
+        parts.append(f"동시 {int(share['concurrency'])}")
+    return ', '.join(parts)
+
+
+def build_command(job: dict, share: Dict[str, float]) -> List[str]:
+    """cmd 의 {rate} / {concurrency} 를 몫으로 바꾼 실행 명령 (다른 중괄호는 그대로 둠)"""
+    values = {}
+    if 'rate' in share:
+        values['rate'] = f"{share['rate']:g}"
+    if 'concurrency' in share:
+        values['concurrency'] = str(int(share['concurrency']))
+    args = []
+    for arg in job['cmd']:
+        for key in BUDGET_KEYS:
+            placeholder = '{' + key + '}'
+            if placeholder in arg:
+                if key not in values:
+                    raise ValueError(f"{job['name']}: cmd 에 {placeholder} 가 있지만 도메인 예산에 {key} 가 없습니다")
+                arg = arg.replace(placeholder, values[key])
+        args.append(arg)
+    return [sys.executable, '-u'] + args
+
+
+def missing_requirements(job: dict, root_dir: str = ROOT_DIR) -> List[str]:
+    """없는 환경 변수 / 파일 목록 (비어 있으면 실행 가능)"""
+    missing = [f"${name}" for name in job.get('requires_env', []) if not os.environ.get(name)]
+    cwd = os.path.join(root_dir, job.get('cwd', '.'))
+    missing += [path for path in job.get('requires_files', []) if not os.path.exists(os.path.join(cwd, path))]
+    return missing
+
+
+def load_config(path: str, domains: dict, jobs: List[dict]):
+    """JSON 설정 {"domains": {...}, "jobs": [...]} - domains 는 기존 값에 덮어쓰고, jobs 가 있으면 목록을 바꿈"""
+    with open(path, encoding='utf-8') as f:
+        config = json.load(f)
+    domains = {name: dict(budget) for name, budget in domains.items()}
+    for name, budget in config.get('domains', {}).items():
+        domains.setdefault(name, dict(DEFAULT_DOMAIN)).update(budget)
+    return domains, config.get('jobs', jobs)
+
+
+def _format_seconds(seconds: float) -> str:
+    seconds = int(seconds)
+    return f"{seconds // 3600:02d}:{seconds % 3600 // 60:02d}:{seconds % 60:02d}"
+
+
+class Orchestrator:
+    """
+    작업들을 도메인 예산 안에서 동시에 실행하는 스케줄러
+
+    작업은 목록 순서대로 시작하되, 도메인 자리가 없는 작업은 건너뛰고 다음 작업을 먼저 시작함
+    (Reddit 작업이 줄을 서 있어도 다른 사이트 작업은 바로 시작). 재시도 큐의 작업은 대기 시간이 지나면
+    새 작업보다 먼저 자리를 받음.
+    """
+
+    def __init__(self, jobs: List[dict], domains: Optional[dict] = None, out_dir: str = OUT_DIR,
+                 root_dir: str = ROOT_DIR, max_attempts: int = MAX_ATTEMPTS, retry_backoff: float = RETRY_BACKOFF,
+                 dashboard_interval: float = DASHBOARD_INTERVAL, skip_done: bool = False):
+        domains = DOMAINS if domains is None else domains
+        self.jobs = {job['name']: job for job in jobs}
+        self.budgets = {}
+        for job in jobs:
+            for domain in job['domains']:
+                if domain not in self.budgets:
+                    self.budgets[domain] = DomainBudget(domain, **domains.get(domain, DEFAULT_DOMAIN))
+        for job in jobs:
+            build_command(job, job_share(job, self.budgets))   # 예산에 없는 {rate} / {concurrency} 는 시작 전에 ValueError
+        self.out_dir = out_dir
+        self.root_dir = root_dir
+        self.max_attempts = max_attempts
+        self.retry_backoff = retry_backoff
+        self.dashboard_interval = dashboard_interval
+        self.state_file = os.path.join(out_dir, STATE_FILE)
+        os.makedirs(os.path.join(out_dir, 'logs'), exist_ok=True)
+
+        previous = {}
+        if skip_done and os.path.exists(self.state_file):
+            try:
+                with open(self.state_file, encoding='utf-8') as f:
+                    previous = json.load(f).get('jobs', {})
+            except (OSError, json.JSONDecodeError) as e:
+                print(f"⚠️ 상태 파일을 읽지 못했습니다 ({self.state_file}): {e} - 모든 작업 실행")
+        self.status = {}
+        self._reused = set()   # 이전 실행에서 완료해서 이번에는 돌리지 않는 작업
+        for name, job in self.jobs.items():
+            if previous.get(name, {}).get('status') == 'done':
+                # 완료 상태를 그대로 두어야 다음 --skip-done 에서도 건너뜀
+                self.status[name] = dict(previous[name], note="이전 실행에서 완료")
+                self._reused.add(name)
+            else:
+                self.status[name] = {'status': 'waiting', 'attempts': 0, 'returncode': None, 'elapsed': 0.0,
+                                     'last_line': '', 'domains': job['domains']}
+        self.retry_queue = []   # (다시 실행할 시각, 순번, 작업 이름)
+        self._retry_seq = 0
+        self._started = None
+        self._attempt_started = {}
+
+    # ---------------- 상태 / 대시보드 ----------------
+    def save_state(self):
+        data = {'updated': datetime.now().strftime('%Y-%m-%d %H:%M:%S'), 'jobs': self.status}
+        tmp_path = self.state_file + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, indent=1)
+        os.replace(tmp_path, self.state_file)
+
+    def counts(self) -> Dict[str, int]:
+        counts = {key: 0 for key in STATUS_NAMES}
+        for status in self.status.values():
+            counts[status['status']] += 1
+        return counts
+
+    def print_dashboard(self):
+        now = time.monotonic()
+        counts = self.counts()
+        print(f"\n📊 [{_format_seconds(now - self._started)}] "
+              + " / ".join(f"{STATUS_NAMES[key]} {count}" for key, count in counts.items() if count))
+        print("  도메인: " + ", ".join(f"{name} {budget.running}/{budget.max_jobs}"
+                                     for name, budget in self.budgets.items()))
+        for name, status in self.status.items():
+            elapsed = status['elapsed']
+            if name in self._attempt_started:
+                elapsed += now - self._attempt_started[name]
+            detail = status.get('note') or status['last_line']
+            print(f"  {STATUS_ICONS[status['status']]} {name:<24} {STATUS_NAMES[status['status']]:<6} "
+                  f"{status['attempts']}회 {_format_seconds(elapsed)}  {detail[:70]}")
+
+    # ---------------- 작업 실행 ----------------
+    def _fits(self, name: str) -> bool:
+        return all(self.budgets[domain].has_slot() for domain in self.jobs[name]['domains'])
+
+    async def _run_attempt(self, name: str) -> int:
+        """작업 한 번 실행 → 종료 코드 (출력은 로그 파일에 쓰고 마지막 줄을 대시보드에 보임)"""
+        job = self.jobs[name]
+        status = self.status[name]
+        command = build_command(job, job_share(job, self.budgets))
+        env = dict(os.environ, PYTHONUNBUFFERED='1', PYTHONIOENCODING='utf-8')
+        log_path = os.path.join(self.out_dir, 'logs', f"{name}.log")
+        with open(log_path, 'a', encoding='utf-8') as log:
+            log.write(f"\n===== {datetime.now():%Y-%m-%d %H:%M:%S} {status['attempts']}회차: "
+                      f"{' '.join(command[2:])} =====\n")
+            proc = await asyncio.create_subprocess_exec(
+                *command, cwd=os.path.join(self.root_dir, job.get('cwd', '.')), env=env,
+                stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.STDOUT, limit=2 ** 20)
+
+            async def pump():
+                async for raw in proc.stdout:
+                    line = raw.decode('utf-8', errors='replace')
+                    log.write(line)
+                    if line.strip():
+                        status['last_line'] = line.strip()
+                return await proc.wait()
+
+            try:
+                return await asyncio.wait_for(pump(), job.get('timeout'))
+            except asyncio.TimeoutError:
+                status['last_line'] = f"시간 초과 ({job['timeout']}초) → 종료"
+                proc.kill()
+                await proc.wait()
+                return -9
+            except asyncio.CancelledError:
+                proc.terminate()
+                await proc.wait()
+                raise
+
+    def _start(self, name: str, tasks: dict):
+        status = self.status[name]
+        for domain in self.jobs[name]['domains']:
+            self.budgets[domain].running += 1
+        status['status'] = 'running'
+        status['attempts'] += 1
+        status['note'] = ''
+        self._attempt_started[name] = time.monotonic()
+        share = used_share(self.jobs[name], job_share(self.jobs[name], self.budgets))
+        print(f"🚀 시작: {name} ({status['attempts']}회차, 도메인 {', '.join(self.jobs[name]['domains'])}, "
+              f"{format_share(share)})")
+        tasks[asyncio.ensure_future(self._run_attempt(name))] = name
+        self.save_state()
+
+    def _finish(self, name: str, returncode: int):
+        status = self.status[name]
+        for domain in self.jobs[name]['domains']:
+            self.budgets[domain].running -= 1
+        attempt_elapsed = time.monotonic() - self._attempt_started.pop(name)
+        status['elapsed'] += attempt_elapsed
+        status['returncode'] = returncode
+        status['finished'] = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        if returncode == 0:
+            status['status'] = 'done'
+            print(f"✅ 완료: {name} ({attempt_elapsed:.1f}초)")
+        elif status['attempts'] < self.max_attempts:
+            wait = self.retry_backoff * 2 ** (status['attempts'] - 1)
+            status['status'] = 'retry'
+            status['note'] = f"종료 코드 {returncode} → {wait:.0f}초 뒤 재시도"
+            heapq.heappush(self.retry_queue, (time.monotonic() + wait, self._retry_seq, name))
+            self._retry_seq += 1
+            print(f"🔁 실패: {name} (종료 코드 {returncode}) → {wait:.0f}초 뒤 재시도 "
+                  f"({status['attempts']}/{self.max_attempts})")
+        else:
+            status['status'] = 'failed'
+            print(f"❌ 최종 실패: {name} (종료 코드 {returncode}, {status['attempts']}회 시도) "
+                  f"- 로그: {os.path.join(self.out_dir, 'logs', name + '.log')}")
+        self.save_state()
+
+    async def run_async(self) -> Dict[str, dict]:
+        self._started = time.monotonic()
+        for name, job in self.jobs.items():
+            missing = missing_requirements(job, self.root_dir)
+            if missing and self.status[name]['status'] == 'waiting':
+                self.status[name].update(status='skipped', note=f"필요한 설정 없음: {', '.join(missing)}")
+                print(f"⏭️ 건너뜀: {name} (필요한 설정 없음: {', '.join(missing)})")
+        self.save_state()
+
+        tasks = {}
+        next_dashboard = self._started + self.dashboard_interval
+        try:
+            while True:
+                now = time.monotonic()
+                # 재시도 큐에서 대기 시간이 지난 작업이 먼저, 그다음 새 작업 (자리가 있는 것만)
+                ready = []
+                while self.retry_queue and self.retry_queue[0][0] <= now:
+                    ready.append(heapq.heappop(self.retry_queue))
+                for item in ready:
+                    if self._fits(item[2]):
+                        self._start(item[2], tasks)
+                    else:
+                        heapq.heappush(self.retry_queue, item)
+                for name, status in self.status.items():
+                    if status['status'] == 'waiting' and self._fits(name):
+                        self._start(name, tasks)
+
+                if not tasks and not self.retry_queue:
+                    break
+                timeout = next_dashboard - now
+                if self.retry_queue:
+                    timeout = min(timeout, max(self.retry_queue[0][0] - now, 0.05))
+                if not tasks:
+                    await asyncio.sleep(max(timeout, 0))
+                    done = set()
+                else:
+                    done, _ = await asyncio.wait(tasks, timeout=max(timeout, 0),
+                                                 return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    name = tasks.pop(task)
+                    try:
+                        returncode = task.result()
+                    except Exception as e:
+                        self.status[name]['last_line'] = f"실행 오류: {e!r}"
+                        returncode = -1
+                    self._finish(name, returncode)
+                if time.monotonic() >= next_dashboard:
+                    self.print_dashboard()
+                    next_dashboard = time.monotonic() + self.dashboard_interval
+        finally:
+            for task in tasks:
+                task.cancel()
+            if tasks:
+                await asyncio.gather(*tasks, return_exceptions=True)
+            self.save_state()
+        return self.status
+
+    def run(self) -> Dict[str, dict]:
+        """모든 작업 실행 후 요약 출력 → 작업별 상태"""
+        status = asyncio.run(self.run_async())
+        wall = time.monotonic() - self._started
+        self.print_dashboard()
+        ran = [s['elapsed'] for name, s in status.items() if s['attempts'] and name not in self._reused]
+        total = sum(ran)
+        slowest = max(ran, default=0.0)
+        print(f"\n⏱️ 전체 {_format_seconds(wall)} (순서대로 실행했다면 약 {_format_seconds(total)}, "
+              f"가장 오래 걸린 작업 {_format_seconds(slowest)})")
+        print(f"📄 작업 로그: {os.path.join(self.out_dir, 'logs')} / 상태: {self.state_file}")
+        return status
+
+
+def main():
+    parser = argparse.ArgumentParser(description="다중 소스 크롤링 오케스트레이터 (도메인별 예산 + 공유 재시도 큐)")
+    parser.add_argument('--config', help='도메인 예산 / 작업 목록 JSON ({"domains": {...}, "jobs": [...]})')
+    parser.add_argument('--only', nargs='+', help="이 작업 이름 / source 만 실행")
+    parser.add_argument('--out-dir', default=OUT_DIR, help="작업 로그 / 상태 저장 폴더")
+    parser.add_argument('--max-attempts', type=int, default=MAX_ATTEMPTS, help="작업당 최대 실행 횟수")
+    parser.add_argument('--retry-backoff', type=float, default=RETRY_BACKOFF, help="첫 재시도까지 대기(초)")
+    parser.add_argument('--dashboard-interval', type=float, default=DASHBOARD_INTERVAL, help="대시보드 출력 간격(초)")
+    parser.add_argument('--skip-done', action='store_true', help="이전 실행에서 완료한 작업은 건너뜀")
+    parser.add_argument('--list', action='store_true', help="작업 / 도메인 예산만 출력")
+    args = parser.parse_args()
+
+    domains, jobs = DOMAINS, JOBS
+    if args.config:
+        domains, jobs = load_config(args.config, domains, jobs)
+    if args.only:
+        jobs = [job for job in jobs if job['name'] in args.only or job.get('source') in args.only]
+    if not jobs:
+        print("⚠️ 실행할 작업이 없습니다.")
+        return
+
+    if args.list:
+        budgets = {}
+        for job in jobs:
+            for domain in job['domains']:
+                budgets.setdefault(domain, DomainBudget(domain, **domains.get(domain, DEFAULT_DOMAIN)))
+        print("도메인 예산:")
+        for name, budget in budgets.items():
+            print(f"  {name:<18} 작업 {budget.max_jobs}개"
+                  + (f", {budget.rate:g}요청/초" if budget.rate is not None else "")
+                  + (f", 동시 {budget.concurrency}" if budget.concurrency is not None else ""))
+        print("\n작업:")
+        for job in jobs:
+            missing = missing_requirements(job)
+            command = build_command(job, job_share(job, budgets))
+            print(f"  {'⏭️' if missing else '🔗'} {job['name']:<24} [{job.get('cwd', '.')}] {' '.join(command[2:])}"
+                  + (f"  (필요한 설정 없음: {', '.join(missing)})" if missing else ""))
+        return
+
+    status = Orchestrator(jobs, domains, args.out_dir, max_attempts=args.max_attempts,
+                          retry_backoff=args.retry_backoff, dashboard_interval=args.dashboard_interval,
+                          skip_done=args.skip_done).run()
+    if any(s['status'] == 'failed' for s in status.values()):
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
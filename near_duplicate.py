@@ -0,0 +1,261 @@
+"""
+근사 중복 탐지 모듈
+MinHash + LSH 로 content 가 거의 같은 문서(크로스포스트, 조금 고친 재게시글)를 묶음
+
+- 문자 n-gram(shingle) 집합의 Jaccard 유사도를 MinHash 서명으로 근사
+- 서명을 band 로 나눠 버킷에 넣고, 같은 버킷에 들어온 후보끼리만 비교 (전체 쌍 비교 없음)
+- 문서를 한 번씩만 보는 스트리밍 방식: add() 할 때 이전 문서들과 바로 매칭
+- 클러스터의 첫 문서를 대표로 남기고 나머지를 근사 중복으로 표시
+
+사용 예:
+    python near_duplicate.py --input data.csv --output data_dedup.csv --clusters 중복클러스터.csv
+    df_kept, df_clusters = drop_near_duplicates(df, text_column="content", threshold=0.8)
+"""
+import argparse
+import logging
+import re
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from corpus_storage import read_table
+
+logger = logging.getLogger(__name__)
+
+NUM_PERM = 128          # MinHash 서명 길이
+SHINGLE_SIZE = 5        # 문자 n-gram 길이 (한국어/영어 공통으로 무난)
+THRESHOLD = 0.8         # 이 이상 Jaccard 유사도면 근사 중복
+MAX_BUCKET_SIZE = 50    # 버킷당 보관할 최대 문서 수 (상용구 때문에 버킷이 커지는 것 방지)
+SHINGLE_CHUNK = 4096    # 서명 계산 시 한 번에 처리할 shingle 수
+SEED = 42
+
+_MASK32 = np.uint64(0xFFFFFFFF)
+_ROLL_BASE = np.uint64(1000003)
+
+
+def choose_bands(num_perm: int, threshold: float) -> Tuple[int, int]:
+    """
+    (1/b)^(1/r) 가 threshold 에 가장 가까운 (band 수, band 당 행 수) 선택
+
+    Args:
+        num_perm: MinHash 서명 길이
+        threshold: 목표 Jaccard 임계값
+
+    Returns:
+        (bands, rows)
+    """
+    best = None
+    for rows in range(1, num_perm + 1):
+        bands = num_perm // rows
+        if bands < 1:
+            break
+        error = abs((1.0 / bands) ** (1.0 / rows) - threshold)
+        if best is None or error < best[0]:
+            best = (error, bands, rows)
+    return best[1], best[2]
+
+
+def normalize_text(text: str) -> str:
+    """대소문자 / 공백 / URL 차이를 무시하도록 정규화"""
+    text = re.sub(r"https?://\S+", " ", text.lower())
+    return re.sub(r"\s+", " ", text).strip()
+
+
+def shingle_hashes(text: str, k: int = SHINGLE_SIZE) -> np.ndarray:
+    """
+    문자 k-gram 들의 32비트 롤링 해시 (중복 제거된 uint64 배열)
+    문서가 k 글자보다 짧으면 문서 전체를 shingle 하나로 사용
+    """
+    codes = np.frombuffer(text.encode("utf-32-le"), dtype=np.uint32).astype(np.uint64)
+    if len(codes) == 0:
+        return codes
+    if len(codes) < k:
+        k = len(codes)
+    n = len(codes) - k + 1
+    h = np.zeros(n, dtype=np.uint64)
+    for j in range(k):
+        h = (h * _ROLL_BASE + codes[j:j + n]) & _MASK32
+    return np.unique(h)
+
+
+class NearDuplicateDetector:
+    """MinHash LSH 근사 중복 탐지 클래스"""
+
+    def __init__(self, threshold: float = THRESHOLD, num_perm: int = NUM_PERM,
+                 shingle_size: int = SHINGLE_SIZE, seed: int = SEED):
+        """
+        Args:
+            threshold: 근사 중복으로 볼 Jaccard 유사도 임계값
+            num_perm: MinHash 서명 길이 (클수록 정확, 느림)
+            shingle_size: 문자 n-gram 길이
+            seed: 해시 함수 난수 시드
+        """
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.shingle_size = shingle_size
+        self.bands, self.rows = choose_bands(num_perm, threshold)
+
+        # multiply-add-shift 해시족: h(x) = ((a*x + b) mod 2^64) >> 32 (a 는 홀수)
+        rng = np.random.RandomState(seed)
+        self._a = (rng.randint(0, 2 ** 32, num_perm, dtype=np.uint64) << np.uint64(32)) \
+            | rng.randint(0, 2 ** 32, num_perm, dtype=np.uint64) | np.uint64(1)
+        self._b = (rng.randint(0, 2 ** 32, num_perm, dtype=np.uint64) << np.uint64(32)) \
+            | rng.randint(0, 2 ** 32, num_perm, dtype=np.uint64)
+
+        self.buckets: List[Dict[bytes, List[int]]] = [{} for _ in range(self.bands)]
+        self.signatures: List[np.ndarray] = []
+        self.parent: List[int] = []
+        self.doc_ids: List = []
+
+    def signature(self, text: str) -> np.ndarray:
+        """문서 하나의 MinHash 서명 (uint32, 길이 num_perm)"""
+        shingles = shingle_hashes(normalize_text(text), self.shingle_size)
+        if len(shingles) == 0:
+            return np.full(self.num_perm, np.iinfo(np.uint32).max, dtype=np.uint32)
+        sig = np.full(self.num_perm, np.iinfo(np.uint64).max, dtype=np.uint64)
+        # 긴 문서에서 (num_perm x shingle 수) 행렬이 너무 커지지 않도록 나눠서 계산
+        for start in range(0, len(shingles), SHINGLE_CHUNK):
+            part = shingles[start:start + SHINGLE_CHUNK]
+            with np.errstate(over="ignore"):
+                hashed = (np.outer(self._a, part) + self._b[:, None]) >> np.uint64(32)
+            np.minimum(sig, hashed.min(axis=1), out=sig)
+        return sig.astype(np.uint32)
+
+    def _find(self, idx: int) -> int:
+        root = idx
+        while self.parent[root] != root:
+            root = self.parent[root]
+        while self.parent[idx] != root:
+            self.parent[idx], idx = root, self.parent[idx]
+        return root
+
+    def add(self, doc_id, text) -> Optional[int]:
+        """
+        문서 하나를 추가하고, 앞서 본 문서와 근사 중복이면 그 클러스터 대표의 순번 반환
+
+        Args:
+            doc_id: 문서 ID (클러스터 출력용)
+            text: 문서 내용
+
+        Returns:
+            대표 문서 순번 (중복 아니면 None)
+        """
+        idx = len(self.signatures)
+        sig = self.signature(text if isinstance(text, str) else "")
+        self.signatures.append(sig)
+        self.parent.append(idx)
+        self.doc_ids.append(doc_id)
+
+        candidates = set()
+        for band in range(self.bands):
+            key = sig[band * self.rows:(band + 1) * self.rows].tobytes()
+            bucket = self.buckets[band].setdefault(key, [])
+            candidates.update(bucket)
+            if len(bucket) < MAX_BUCKET_SIZE:
+                bucket.append(idx)
+
+        # LSH 후보는 서명 일치 비율로 한 번 더 검증 (false positive 제거)
+        roots = {self._find(other) for other in candidates
+                 if np.mean(self.signatures[other] == sig) >= self.threshold}
+        if not roots:
+            return None
+        # 가장 먼저 들어온 문서를 대표로 두고 연결된 클러스터를 하나로 합침
+        matched = min(roots)
+        for root in roots:
+            self.parent[root] = matched
+        self.parent[idx] = matched
+        return matched
+
+    def clusters(self) -> List[List[int]]:
+        """크기 2 이상인 근사 중복 클러스터 목록 (문서 순번, 각 클러스터의 첫 원소가 대표)"""
+        groups: Dict[int, List[int]] = {}
+        for idx in range(len(self.parent)):
+            groups.setdefault(self._find(idx), []).append(idx)
+        return [members for members in groups.values() if len(members) > 1]
+
+    def duplicate_mask(self) -> np.ndarray:
+        """문서 순번별로 대표가 아닌 근사 중복이면 True"""
+        mask = np.zeros(len(self.parent), dtype=bool)
+        for members in self.clusters():
+            mask[members[1:]] = True
+        return mask
+
+
+def drop_near_duplicates(df: pd.DataFrame,
+                         text_column: str = "content",
+                         id_column: Optional[str] = None,
+                         threshold: float = THRESHOLD,
+                         num_perm: int = NUM_PERM) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    DataFrame 에서 근사 중복 문서를 제거 (각 클러스터의 첫 문서만 유지)
+
+    Args:
+        df: 입력 DataFrame
+        text_column: 텍스트 컬럼명
+        id_column: 클러스터 출력에 쓸 ID 컬럼명 (None 이면 행 순번)
+        threshold: Jaccard 유사도 임계값
+        num_perm: MinHash 서명 길이
+
+    Returns:
+        (중복 제거된 DataFrame, 클러스터 DataFrame[cluster_id, doc_id, is_representative])
+    """
+    detector = NearDuplicateDetector(threshold=threshold, num_perm=num_perm)
+    ids = df[id_column].tolist() if id_column and id_column in df.columns else list(range(len(df)))
+    for doc_id, text in zip(ids, df[text_column].tolist()):
+        detector.add(doc_id, text)
+
+    clusters = detector.clusters()
+    rows = [
+        {'cluster_id': cid, 'doc_id': ids[idx], 'is_representative': pos == 0}
+        for cid, members in enumerate(clusters)
+        for pos, idx in enumerate(members)
+    ]
+    df_clusters = pd.DataFrame(rows, columns=['cluster_id', 'doc_id', 'is_representative'])
+
+    mask = detector.duplicate_mask()
+    df_kept = df[~mask].reset_index(drop=True)
+    logger.info(f"근사 중복 제거: {len(df)}개 → {len(df_kept)}개 "
+                f"(클러스터 {len(clusters)}개, threshold={threshold})")
+    return df_kept, df_clusters
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description='MinHash LSH 근사 중복 제거')
+    parser.add_argument('--input', type=str, required=True,
+                       help='입력 CSV 파일 또는 Parquet 데이터셋 경로')
+    parser.add_argument('--output', type=str, required=True,
+                       help='중복 제거된 CSV 저장 경로')
+    parser.add_argument('--clusters', type=str, default=None,
+                       help='중복 클러스터 CSV 저장 경로 (선택적)')
+    parser.add_argument('--text_column', type=str, default='content',
+                       help='텍스트 컬럼명 (기본값: content)')
+    parser.add_argument('--id_column', type=str, default=None,
+                       help='ID 컬럼명 (선택적)')
+    parser.add_argument('--threshold', type=float, default=THRESHOLD,
+                       help=f'Jaccard 유사도 임계값 (기본값: {THRESHOLD})')
+    parser.add_argument('--num_perm', type=int, default=NUM_PERM,
+                       help=f'MinHash 서명 길이 (기본값: {NUM_PERM})')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO,
+                        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+
+    df = read_table(args.input)
+    df = df.dropna(subset=[args.text_column]).reset_index(drop=True)
+
+    df_kept, df_clusters = drop_near_duplicates(
+        df, text_column=args.text_column, id_column=args.id_column,
+        threshold=args.threshold, num_perm=args.num_perm,
+    )
+    df_kept.to_csv(args.output, index=False, encoding='utf-8-sig')
+    if args.clusters:
+        df_clusters.to_csv(args.clusters, index=False, encoding='utf-8-sig')
+
+    print(f"\n근사 중복 제거 완료: {len(df)}개 → {len(df_kept)}개")
+    print(f"저장 위치: {args.output}")
+
+
+if __name__ == '__main__':
+    main()
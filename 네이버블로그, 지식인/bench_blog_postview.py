@@ -0,0 +1,124 @@
+"""
+블로그 PostView HTTP 추출기 점검 / 벤치마크 (오프라인, 저장해 둔 HTML 픽스처 사용)
+
+1) fixtures/blog_postview_*.html 을 parse_postview 로 파싱해서
+   fixtures/blog_postview_expected.json 의 제목 / 본문 / 날짜와 같은지 확인
+2) 픽스처 하나를 여러 번 파싱해서 글당 파싱 시간(ms) 측정
+3) 픽스처를 돌려주는 가짜 PostView 서버(요청당 지연 흉내)에 동시성 1 과 N 으로 요청해서
+   페이지/분과 결과 동일 여부 비교 (비공개 글 픽스처는 브라우저 폴백 대상으로 잡혀야 함)
+
+실행:
+    python bench_blog_postview.py --pages 200 --concurrency 16 --latency 0.1
+"""
+import argparse
+import asyncio
+import json
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+from blog_postview import fetch_posts_async, parse_postview
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+EXPECTED_FILE = os.path.join(FIXTURE_DIR, 'blog_postview_expected.json')
+
+
+def load_fixtures():
+    with open(EXPECTED_FILE, encoding='utf-8') as f:
+        expected = json.load(f)
+    pages = {}
+    for name in expected:
+        with open(os.path.join(FIXTURE_DIR, name), encoding='utf-8') as f:
+            pages[name] = f.read()
+    return pages, expected
+
+
+def check_fixtures(pages, expected):
+    ok = True
+    for name, page_html in pages.items():
+        title, content, date = parse_postview(page_html)
+        got = {'title': title, 'content': content, 'date': date}
+        if got == expected[name]:
+            print(f"  ✅ {name}")
+            continue
+        ok = False
+        print(f"  ❌ {name}")
+        for field, value in expected[name].items():
+            if got[field] != value:
+                print(f"     {field}: 기대값 {value[:40]!r} / 결과 {got[field][:40]!r}")
+    return ok
+
+
+def start_fixture_server(pages, latency, id_param='logNo'):
+    """id_param(글번호) 값을 픽스처 개수로 나눈 나머지로 픽스처를 골라서 돌려주는 가짜 서버"""
+    bodies = [pages[name].encode('utf-8') for name in sorted(pages)]
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            query = parse_qs(urlparse(self.path).query)
+            doc_no = int(query.get(id_param, ['0'])[0])
+            time.sleep(latency)
+            body = bodies[doc_no % len(bodies)]
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/html; charset=utf-8')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}"
+
+
+def run_once(urls, base_url, concurrency):
+    start = time.perf_counter()
+    records, fallback, skipped = asyncio.run(
+        fetch_posts_async(urls, '테스트', concurrency=concurrency, base_url=base_url)
+    )
+    return records, fallback, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="블로그 PostView HTTP 추출기 점검 / 벤치마크")
+    parser.add_argument('--pages', type=int, default=200, help="가짜 서버에 요청할 글 수")
+    parser.add_argument('--concurrency', type=int, default=16)
+    parser.add_argument('--latency', type=float, default=0.1, help="가짜 서버 요청당 지연(초)")
+    parser.add_argument('--parse_repeat', type=int, default=500, help="파싱 시간 측정 반복 횟수")
+    args = parser.parse_args()
+
+    pages, expected = load_fixtures()
+    print("========== 픽스처 파싱 확인 ==========")
+    fixtures_ok = check_fixtures(pages, expected)
+
+    sample = pages['blog_postview_se.html']
+    start = time.perf_counter()
+    for _ in range(args.parse_repeat):
+        parse_postview(sample)
+    parse_ms = (time.perf_counter() - start) / args.parse_repeat * 1000
+    print(f"\n파싱 시간: 글당 {parse_ms:.2f}ms ({args.parse_repeat}회 평균)")
+
+    urls = [f"https://blog.naver.com/bench_blog/{10000 + i}" for i in range(args.pages)]
+    server, base_url = start_fixture_server(pages, args.latency)
+    try:
+        serial = run_once(urls, base_url, 1)
+        pooled = run_once(urls, base_url, args.concurrency)
+    finally:
+        server.shutdown()
+
+    print("\n========== 벤치마크 결과 ==========")
+    print(f"글 수: {len(urls)}, 서버 지연: {args.latency}초")
+    for label, (records, fallback, sec) in (("동시성 1", serial), (f"동시성 {args.concurrency}", pooled)):
+        print(f"{label:<8}: {sec:.2f}초 ({len(urls) / sec * 60:.0f} 페이지/분, "
+              f"수집 {len(records)}건, 폴백 대상 {len(fallback)}건)")
+    print(f"속도 향상: {serial[2] / pooled[2]:.1f}배")
+    print(f"결과 동일 여부: {serial[0] == pooled[0] and serial[1] == pooled[1]}")
+    print(f"픽스처 파싱: {'통과' if fixtures_ok else '실패'}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,152 @@
+"""
+날짜 구간 자동 분할(date_window_planner) 점검 / 벤치마크 (오프라인, 가짜 검색 서버 사용)
+
+가짜 서버는 날짜마다 정해진 수의 글을 갖고 있고(대부분 한산, 일부 기간만 글이 몰림),
+검색 한 번에 --cap 개까지만 결과를 돌려준다 (실제 검색 결과 상한 흉내).
+
+1) 1년 고정 구간(calculate_date_ranges 방식)으로 수집했을 때의 수집률
+2) plan_date_windows 로 분할 / 병합한 구간으로 수집했을 때의 수집률과 검색 페이지 수
+3) 같은 조건으로 다시 실행했을 때 저장된 계획을 써서 분할 과정을 건너뛰는지 확인
+4) 검색 요청이 실패한 구간(URL 0개)은 옆의 한산한 구간과 합쳐지지 않는지 확인
+
+실행:
+    python bench_date_planner.py --cap 300 --latency 0.01
+"""
+import argparse
+import asyncio
+import os
+import random
+import re
+import tempfile
+import threading
+import time
+from datetime import datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import naver_search
+from date_window_planner import merge_windows, plan_date_windows, plan_windows_async, save_plan
+from naver_search import SEARCH_SOURCES, discover_urls_async
+
+START, END = '20200101', '20221231'
+
+
+def daily_posts(seed=7):
+    """날짜 → 그날 글 URL 리스트 (평소 하루 0~3개, 몇몇 달은 하루 20~40개)"""
+    rng = random.Random(seed)
+    day = datetime.strptime(START, '%Y%m%d')
+    end = datetime.strptime(END, '%Y%m%d')
+    busy_months = {(2020, 3), (2021, 7), (2021, 8), (2022, 11)}
+    posts = {}
+    while day <= end:
+        n = rng.randint(20, 40) if (day.year, day.month) in busy_months else rng.randint(0, 3)
+        key = day.strftime('%Y%m%d')
+        posts[key] = [f"https://blog.naver.com/bench{key}/{i + 1}" for i in range(n)]
+        day += timedelta(days=1)
+    return posts
+
+
+def start_search_server(posts, cap, latency):
+    page_size = SEARCH_SOURCES['blog']['page_size']
+    days = sorted(posts)
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            query = parse_qs(urlparse(self.path).query)
+            start, end = re.search(r'from(\d{8})to(\d{8})', query['nso'][0]).groups()
+            found = [url for day in days if start <= day <= end for url in posts[day]][:cap]
+            first = int(query.get('start', ['1'])[0]) - 1
+            links = ''.join(f'<a class="title_link" href="{url}">글</a>' for url in found[first:first + page_size])
+            time.sleep(latency)
+            body = f'<html><body>{links}</body></html>'.encode('utf-8')
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/html; charset=utf-8')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}/search.naver"
+
+
+def fixed_ranges():
+    """calculate_date_ranges 와 같은 1년 단위 구간"""
+    start = datetime.strptime(START, '%Y%m%d')
+    end = datetime.strptime(END, '%Y%m%d')
+    ranges = []
+    while start < end:
+        stop = min(start + timedelta(days=365), end)
+        ranges.append({'start': start.strftime('%Y%m%d'), 'end': stop.strftime('%Y%m%d'), 'period': '1year'})
+        start = stop + timedelta(days=1)
+    return ranges
+
+
+def failed_window_merge_check(cap):
+    """한산한 구간 사이에 검색 실패 구간을 끼워 merge_windows 를 돌림 → 실패 구간은 따로 남아야 함"""
+    days = [('20200101', '20200131', 5, False), ('20200201', '20200229', 0, True), ('20200301', '20200331', 5, False)]
+    windows = [{'start': s, 'end': e, 'period': '1month', 'count': n, 'saturated': False, 'failed': failed}
+               for s, e, n, failed in days]
+    window_urls = {(s, e): [f"https://blog.naver.com/bench{s}/{i + 1}" for i in range(n)] for s, e, n, _ in days}
+    merged, merged_urls = merge_windows(windows, window_urls, cap)
+    failed = [w for w in merged if w['failed']]
+    return len(failed) == 1 and merged_urls[(failed[0]['start'], failed[0]['end'])] == []
+
+
+def main():
+    parser = argparse.ArgumentParser(description="날짜 구간 자동 분할 점검 / 벤치마크")
+    parser.add_argument('--cap', type=int, default=300, help="검색 한 번의 결과 상한")
+    parser.add_argument('--concurrency', type=int, default=4)
+    parser.add_argument('--latency', type=float, default=0.01, help="가짜 서버 요청당 지연(초)")
+    args = parser.parse_args()
+
+    naver_search.PAGE_DELAY = 0  # 오프라인에서는 페이지 간 대기 없이 서버 지연만 측정
+    posts = daily_posts()
+    total = sum(len(urls) for urls in posts.values())
+    ranges = fixed_ranges()
+    server, search_url = start_search_server(posts, args.cap, args.latency)
+    query = '"청각장애" +불편'
+    try:
+        start = time.perf_counter()
+        fixed = asyncio.run(discover_urls_async(query, ranges, 'blog', args.cap, args.concurrency, search_url))
+        fixed_sec = time.perf_counter() - start
+        fixed_found = len({url for urls, _ in fixed.values() for url in urls})
+        fixed_pages = sum(pages for _, pages in fixed.values())
+
+        start = time.perf_counter()
+        windows, window_urls, pages = asyncio.run(
+            plan_windows_async(query, ranges, 'blog', args.cap, args.concurrency, search_url))
+        split_count = len(windows)
+        windows, window_urls = merge_windows(windows, window_urls, args.cap)
+        plan_sec = time.perf_counter() - start
+        plan_found = len({url for urls in window_urls.values() for url in urls})
+
+        # 저장된 계획 재사용 확인 (임시 계획 파일에 위 결과를 저장해 두고 다시 실행)
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            plan_file = os.path.join(tmp_dir, 'plan.json')
+            save_plan(f"blog|{query}|{START}|{END}|{args.cap}", windows, plan_file)
+            start = time.perf_counter()
+            reused, reused_urls = plan_date_windows(query, ranges, 'blog', args.cap, args.concurrency,
+                                                    plan_file=plan_file, search_url=search_url)
+            reuse_sec = time.perf_counter() - start
+    finally:
+        server.shutdown()
+
+    reused_found = len({url for urls in reused_urls.values() for url in urls})
+    print("\n========== 벤치마크 결과 ==========")
+    print(f"전체 글: {total}개, 검색 상한: {args.cap}개, 서버 지연: {args.latency}초")
+    print(f"1년 고정 구간 : {len(ranges)}개 구간, 수집 {fixed_found}개 ({fixed_found / total:.1%}), "
+          f"검색 페이지 {fixed_pages}번, {fixed_sec:.2f}초")
+    print(f"자동 분할     : 분할 {split_count}개 → 병합 {len(windows)}개 구간, 수집 {plan_found}개 "
+          f"({plan_found / total:.1%}), 검색 페이지 {pages}번, {plan_sec:.2f}초")
+    print(f"저장된 계획   : {len(reused)}개 구간, 수집 {reused_found}개, {reuse_sec:.2f}초")
+    print(f"상한 도달 구간: {sum(1 for w in windows if w['saturated'])}개")
+    print(f"계획 재사용 결과 동일 여부: {reused == windows and reused_found == plan_found}")
+    print(f"검색 실패 구간 병합 제외 여부: {failed_window_merge_check(args.cap)}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,71 @@
+"""
+드라이버 옵션별 페이지당 시간 비교 (driver_factory.ManagedDriver 의 타이밍 사용, Chrome / selenium 필요)
+
+같은 URL 목록을 옵션 조합마다 새 Chrome 으로 열어서 로드 시간 / 페이지당 시간을 나란히 출력한다.
+  - 기존 설정 : 리소스 차단 없음 + normal 로드 전략
+  - 차단만    : 이미지 / 미디어 / 폰트 / 광고 차단
+  - eager 만  : DOMContentLoaded 까지만 대기
+  - 전체 적용 : 차단 + eager (크롤러 기본값)
+
+실행:
+    python bench_driver_options.py --urls urls.txt --limit 30
+    python bench_driver_options.py                  # URL 파일이 없으면 fixtures 의 블로그 HTML 을 file:// 로 사용
+"""
+import argparse
+import os
+
+from blog_driver_pool import extract_blog_post
+from driver_factory import ManagedDriver
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+
+CONFIGS = [
+    ('기존 설정', {'block_resources': False, 'page_load_strategy': 'normal'}),
+    ('차단만', {'block_resources': True, 'page_load_strategy': 'normal'}),
+    ('eager 만', {'block_resources': False, 'page_load_strategy': 'eager'}),
+    ('전체 적용', {'block_resources': True, 'page_load_strategy': 'eager'}),
+]
+
+
+def load_urls(path, limit):
+    if path:
+        with open(path, encoding='utf-8') as f:
+            urls = [line.strip() for line in f if line.strip()]
+    else:
+        urls = ['file://' + os.path.join(FIXTURE_DIR, name)
+                for name in sorted(os.listdir(FIXTURE_DIR)) if name.startswith('blog_postview_') and name.endswith('.html')]
+    return urls[:limit]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="드라이버 옵션별 페이지당 시간 비교")
+    parser.add_argument('--urls', help="블로그 글 URL 목록 파일 (한 줄에 하나)")
+    parser.add_argument('--limit', type=int, default=30)
+    parser.add_argument('--window', action='store_true', help="헤드리스 대신 창을 띄워서 측정")
+    args = parser.parse_args()
+
+    urls = load_urls(args.urls, args.limit)
+    results = []
+    for name, options in CONFIGS:
+        driver = ManagedDriver(headless=not args.window, label=name, restart_every=0, **options)
+        ok = 0
+        for url in urls:
+            try:
+                title, content, _ = extract_blog_post(driver, url)
+                ok += content != "N/A"
+            except Exception as e:
+                print(f"  ❌ [{name}] {url[:60]}: {(str(e).strip().splitlines() or [repr(e)])[0][:80]}")
+        summary = driver.timing_summary()
+        driver.quit()
+        results.append((summary, ok))
+
+    base = results[0][0]['page_avg'] or 1e-9
+    print("\n========== 옵션별 페이지당 시간 ==========")
+    print(f"{'설정':<10} {'로드 평균':>9} {'로드 p90':>9} {'페이지당':>9} {'기존 대비':>9}  본문 추출")
+    for summary, ok in results:
+        print(f"{summary['label']:<10} {summary['load_avg']:>8.2f}초 {summary['load_p90']:>8.2f}초 "
+              f"{summary['page_avg']:>8.2f}초 {summary['page_avg'] / base:>8.0%}  {ok}/{len(urls)}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,118 @@
+"""
+지식iN HTTP 추출기 점검 / 벤치마크 (오프라인, 저장해 둔 HTML 픽스처 사용)
+
+1) fixtures/kin_detail_*.html 을 parse_kin_page 로 파싱해서
+   fixtures/kin_detail_expected.json 의 제목 / 질문 / 작성일 / 답변과 같은지 확인
+2) 가짜 지식iN 서버(요청당 지연 흉내)에 HTTP 추출기를 동시성 1 과 N 으로 돌려서 페이지/분 비교
+3) --selenium 을 주면 같은 픽스처를 헤드리스 Chrome 으로 열어서 기존 Selenium 경로(extract_kin_page)의
+   페이지당 시간과 추출 결과를 HTTP 파서와 나란히 비교 (Chrome / selenium 필요)
+
+실행:
+    python bench_kin_http.py --pages 200 --concurrency 16 --latency 0.1
+    python bench_kin_http.py --selenium
+"""
+import argparse
+import asyncio
+import json
+import os
+import time
+
+from bench_blog_postview import FIXTURE_DIR, start_fixture_server
+from kin_http import fetch_kin_pages, parse_kin_page
+
+EXPECTED_FILE = os.path.join(FIXTURE_DIR, 'kin_detail_expected.json')
+
+
+def load_fixtures():
+    with open(EXPECTED_FILE, encoding='utf-8') as f:
+        expected = json.load(f)
+    pages = {}
+    for name in expected:
+        with open(os.path.join(FIXTURE_DIR, name), encoding='utf-8') as f:
+            pages[name] = f.read()
+    return pages, expected
+
+
+def check_fixtures(pages, expected):
+    ok = True
+    for name, page_html in pages.items():
+        got = parse_kin_page(page_html)
+        if got == expected[name]:
+            print(f"  ✅ {name} (답변 {len(got['answers'])}개)")
+            continue
+        ok = False
+        print(f"  ❌ {name}")
+        for field, value in expected[name].items():
+            if got[field] != value:
+                print(f"     {field}: 기대값 {str(value)[:40]!r} / 결과 {str(got[field])[:40]!r}")
+    return ok
+
+
+def run_http(urls, base_url, concurrency):
+    start = time.perf_counter()
+    records, failed = asyncio.run(fetch_kin_pages(urls, '테스트', concurrency=concurrency, base_url=base_url))
+    return records, failed, time.perf_counter() - start
+
+
+def run_selenium(pages):
+    """기존 Selenium 경로로 픽스처 파일을 열어서 페이지당 시간 / 결과 비교"""
+    from blog_driver_pool import create_headless_driver
+    from 네이버지식인_청각장애인 import extract_kin_page
+
+    driver = create_headless_driver()
+    try:
+        print("\n========== Selenium 경로 비교 ==========")
+        print(f"{'픽스처':<28} {'Selenium(초)':>12} {'HTTP 파싱(ms)':>14}  결과 일치")
+        for name, page_html in pages.items():
+            file_url = 'file://' + os.path.join(FIXTURE_DIR, name)
+            start = time.perf_counter()
+            title, content, date = extract_kin_page(driver, file_url)
+            selenium_sec = time.perf_counter() - start
+
+            start = time.perf_counter()
+            parsed = parse_kin_page(page_html)
+            http_ms = (time.perf_counter() - start) * 1000
+
+            same = (title or "N/A", content or "N/A", date or "N/A") == (parsed['title'], parsed['content'], parsed['date'])
+            print(f"{name:<28} {selenium_sec:>12.2f} {http_ms:>14.2f}  {'✅' if same else '❌ ' + repr((title[:20], content[:20], date))}")
+    finally:
+        driver.quit()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="지식iN HTTP 추출기 점검 / 벤치마크")
+    parser.add_argument('--pages', type=int, default=200, help="가짜 서버에 요청할 질문 수")
+    parser.add_argument('--concurrency', type=int, default=16)
+    parser.add_argument('--latency', type=float, default=0.1, help="가짜 서버 요청당 지연(초)")
+    parser.add_argument('--selenium', action='store_true', help="Selenium 경로와 같은 픽스처로 비교 (Chrome 필요)")
+    args = parser.parse_args()
+
+    pages, expected = load_fixtures()
+    print("========== 픽스처 파싱 확인 ==========")
+    fixtures_ok = check_fixtures(pages, expected)
+
+    urls = [f"https://kin.naver.com/qna/detail.naver?d1id=7&dirId=70109&docId={400000 + i}"
+            for i in range(args.pages)]
+    server, base_url = start_fixture_server(pages, args.latency, id_param='docId')
+    try:
+        serial = run_http(urls, base_url, 1)
+        pooled = run_http(urls, base_url, args.concurrency)
+    finally:
+        server.shutdown()
+
+    print("\n========== HTTP 벤치마크 결과 ==========")
+    print(f"질문 수: {len(urls)}, 서버 지연: {args.latency}초")
+    for label, (records, failed, sec) in (("동시성 1", serial), (f"동시성 {args.concurrency}", pooled)):
+        answers = sum(record['answer_count'] for record in records.values())
+        print(f"{label:<8}: {sec:.2f}초 ({len(urls) / sec * 60:.0f} 페이지/분, "
+              f"질문 {len(records)}건 / 답변 {answers}건 / 실패 {len(failed)}건)")
+    print(f"속도 향상: {serial[2] / pooled[2]:.1f}배")
+    print(f"결과 동일 여부: {serial[0] == pooled[0] and serial[1] == pooled[1]}")
+    print(f"픽스처 파싱: {'통과' if fixtures_ok else '실패'}")
+
+    if args.selenium:
+        run_selenium(pages)
+
+
+if __name__ == '__main__':
+    main()
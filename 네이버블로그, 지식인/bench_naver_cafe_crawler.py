@@ -0,0 +1,141 @@
+"""
+naver_cafe_crawler 점검 (오프라인, 로그인 / Chrome 없이 가짜 목록 드라이버 사용, selenium 패키지는 필요)
+
+가짜 카페 게시판(글 번호 최신순 + 상단 고정 공지)을 목록 페이지로 나눠 주는 드라이버로
+list_article_ids → BoardCheckpoint.start / mark_done 을 실행마다 이어서 돌리고 체크포인트 변화를 확인
+1) 느리게 뜨는 목록 페이지(글 링크도 "게시글이 없습니다" 안내도 안 뜸)는 게시판 끝이 아님
+   → 목록 미완료, last_article_id 는 그대로, 처리한 최신 구간만 done_range
+2) 다음 실행에서 나머지를 목록 끝까지 읽으면 done_range 는 건너뛰고, 모두 끝나면 last_article_id 를 구간 위까지
+3) 페이지 상한(max_pages)에 걸린 실행: 번호가 작은 고정 공지가 done_range 를 아래로 넓히지 않음
+4) 오류가 난 글(mark_done 안 됨)은 last_article_id 가 그 아래에서 멈춤
+5) 1페이지부터 못 읽으면 체크포인트를 건드리지 않음
+
+실행:
+    python bench_naver_cafe_crawler.py
+"""
+import os
+import re
+import tempfile
+
+from selenium.common.exceptions import NoSuchElementException  # type: ignore
+from selenium.webdriver.common.by import By  # type: ignore
+
+from naver_cafe_crawler import PAGE_SIZE, BoardCheckpoint, list_article_ids
+
+CLUB_ID = "1"
+MENU_ID = 0
+TIMEOUT = 0.2
+
+
+class FakeLink:
+    def __init__(self, article_id):
+        self.href = f"https://cafe.naver.com/f-e/cafes/{CLUB_ID}/articles/{article_id}"
+
+    def get_attribute(self, name):
+        return self.href if name == 'href' else None
+
+
+class FakeSwitchTo:
+    def frame(self, name):
+        pass
+
+    def default_content(self):
+        pass
+
+
+class FakeListDriver:
+    """게시판 글 번호(최신순)를 PAGE_SIZE 씩 목록 페이지로 보여 주는 드라이버 (slow_pages 는 끝까지 안 뜸)"""
+
+    def __init__(self, article_ids, notices=(), slow_pages=()):
+        self.article_ids = sorted(article_ids, reverse=True)
+        self.notices = list(notices)
+        self.slow_pages = set(slow_pages)
+        self.page = None
+        self.switch_to = FakeSwitchTo()
+
+    def get(self, url):
+        self.page = int(re.search(r'[?&]page=(\d+)', url).group(1))
+
+    def _page_ids(self):
+        if self.page in self.slow_pages:
+            return None
+        ids = self.article_ids[(self.page - 1) * PAGE_SIZE:self.page * PAGE_SIZE]
+        return self.notices + ids if ids else []
+
+    def find_elements(self, by, value):
+        page_ids = self._page_ids()
+        if by == By.CSS_SELECTOR and value == 'a.article' and page_ids:
+            return [FakeLink(article_id) for article_id in page_ids]
+        if by == By.XPATH and page_ids == []:
+            return [object()]   # "게시글이 없습니다" 안내
+        return []
+
+    def find_element(self, by, value):
+        elements = self.find_elements(by, value)
+        if not elements:
+            raise NoSuchElementException(value)
+        return elements[0]
+
+
+def run(checkpoint, driver, done_filter=None, max_pages=None):
+    """한 번의 실행: 목록 → 체크포인트 등록 → (done_filter 를 통과한) 글 처리 완료"""
+    stop_at = checkpoint.last_article_id(CLUB_ID, MENU_ID)
+    ids, floor = list_article_ids(driver, CLUB_ID, MENU_ID, stop_at=stop_at, max_pages=max_pages, timeout=TIMEOUT,
+                                  is_done=lambda article_id: checkpoint.is_done(CLUB_ID, MENU_ID, article_id),
+                                  retries=1)
+    checkpoint.start(CLUB_ID, MENU_ID, ids, floor=floor)
+    for article_id in ids:
+        if done_filter is None or done_filter(article_id):
+            checkpoint.mark_done(CLUB_ID, MENU_ID, article_id)
+    return ids, floor
+
+
+def state(path):
+    checkpoint = BoardCheckpoint(path)   # 파일에서 다시 읽어서 확인
+    return checkpoint.last_article_id(CLUB_ID, MENU_ID), checkpoint.done_range(CLUB_ID, MENU_ID)
+
+
+def check(name, ok):
+    print(f"{'✅' if ok else '❌'} {name}")
+    return ok
+
+
+def main():
+    results = []
+    board = list(range(901, 1001))   # 2페이지 분량
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, 'checkpoint.json')
+
+        # 1) 2페이지가 느리게 뜸 → 미완료
+        ids, floor = run(BoardCheckpoint(path), FakeListDriver(board, slow_pages={2}))
+        results.append(check(f"느린 목록 페이지는 게시판 끝이 아님: 글 {len(ids)}개, floor {floor}, 체크포인트 {state(path)}",
+                             len(ids) == PAGE_SIZE and floor == 951 and state(path) == (0, [951, 1000])))
+
+        # 2) 나머지를 끝까지 읽음 → done_range 건너뛰고 last_article_id 를 1000 까지
+        ids, floor = run(BoardCheckpoint(path), FakeListDriver(board))
+        results.append(check(f"이어서 끝까지: 글 {len(ids)}개 (done_range 제외), 체크포인트 {state(path)}",
+                             sorted(ids) == list(range(901, 951)) and floor == 0 and state(path) == (1000, None)))
+
+        # 3) 새 글 60개 + 고정 공지(번호 5), 1페이지만 읽고 멈춤
+        board += list(range(1001, 1061))
+        ids, floor = run(BoardCheckpoint(path), FakeListDriver(board, notices=[5]), max_pages=1)
+        results.append(check(f"페이지 상한 + 고정 공지: floor {floor}, 체크포인트 {state(path)}",
+                             floor == 1011 and state(path) == (1000, [1011, 1060])))
+
+        # 4) 나머지 새 글 중 1005 가 오류 → 1004 까지만 올림
+        ids, floor = run(BoardCheckpoint(path), FakeListDriver(board, notices=[5]),
+                         done_filter=lambda article_id: article_id != 1005)
+        results.append(check(f"오류 글 아래에서 멈춤: 글 {sorted(ids)}, 체크포인트 {state(path)}",
+                             sorted(ids) == list(range(1001, 1011)) and state(path) == (1004, [1011, 1060])))
+
+        # 5) 1페이지부터 느림 → 그대로
+        before = state(path)
+        ids, floor = run(BoardCheckpoint(path), FakeListDriver(board, slow_pages={1}))
+        results.append(check(f"1페이지를 못 읽으면 그대로: floor {floor}, 체크포인트 {state(path)}",
+                             ids == [] and floor is None and state(path) == before))
+
+    print(f"\n점검 {sum(results)}/{len(results)} 통과")
+
+
+if __name__ == '__main__':
+    main()
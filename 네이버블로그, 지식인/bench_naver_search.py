@@ -0,0 +1,106 @@
+"""
+검색 결과 URL 수집(naver_search) 점검 / 벤치마크 (오프라인, 가짜 검색 서버 사용)
+
+가짜 서버는 날짜 구간(nso)마다 정해진 개수의 블로그 글 링크를 start= 로 나눠서 돌려주고
+(구간 경계에 걸친 글은 양쪽 구간에 모두 나옴), 마지막 페이지 다음에는 빈 결과를 준다.
+
+1) 구간마다 찾은 URL 수가 서버가 가진 글 수와 같은지, 페이지 순서대로인지 확인
+2) 같은 구간들을 동시성 1 과 N 으로 수집해서 걸린 시간 / 결과 동일 여부 비교
+
+실행:
+    python bench_naver_search.py --windows 8 --per_window 300 --concurrency 4 --latency 0.1
+"""
+import argparse
+import asyncio
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import naver_search
+from naver_search import SEARCH_SOURCES, discover_urls_async
+
+
+def window_posts(nso, per_window):
+    """nso(p:fromYYYYMMDDtoYYYYMMDD) 값으로 정해지는 가짜 글 URL 목록 (끝 10개는 다음 구간과 겹침)"""
+    start = int(re.search(r'from(\d{8})', nso).group(1))
+    return [f"https://blog.naver.com/bench{start % 1000}/{start * 10000 + i}" for i in range(per_window + 10)]
+
+
+def start_search_server(per_window, latency):
+    page_size = SEARCH_SOURCES['blog']['page_size']
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            query = parse_qs(urlparse(self.path).query)
+            posts = window_posts(query['nso'][0], per_window)
+            first = int(query.get('start', ['1'])[0]) - 1
+            links = ''.join(
+                f'<li class="bx"><a class="title_link" href="{url}">글</a>'
+                f'<a href="https://blog.naver.com/PostView.naver?blogId=x&amp;logNo=1&amp;redirect=Dlog">원문</a></li>'
+                for url in posts[first:first + page_size]
+            )
+            time.sleep(latency)
+            body = f'<html><body><ul class="lst_view">{links}</ul></body></html>'.encode('utf-8')
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/html; charset=utf-8')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}/search.naver"
+
+
+def run_once(date_ranges, search_url, concurrency):
+    start = time.perf_counter()
+    results = asyncio.run(discover_urls_async('"청각장애" +불편', date_ranges, source='blog',
+                                              concurrency=concurrency, search_url=search_url))
+    return results, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="검색 결과 URL 수집 점검 / 벤치마크")
+    parser.add_argument('--windows', type=int, default=8, help="날짜 구간 수")
+    parser.add_argument('--per_window', type=int, default=300, help="구간마다 가짜 서버가 가진 글 수")
+    parser.add_argument('--concurrency', type=int, default=4)
+    parser.add_argument('--latency', type=float, default=0.1, help="가짜 서버 요청당 지연(초)")
+    args = parser.parse_args()
+
+    naver_search.PAGE_DELAY = 0  # 오프라인에서는 페이지 간 대기 없이 서버 지연만 측정
+    date_ranges = [{'start': f"2024{month:02d}01", 'end': f"2024{month:02d}28"}
+                   for month in range(1, args.windows + 1)]
+    server, search_url = start_search_server(args.per_window, args.latency)
+    try:
+        serial = run_once(date_ranges, search_url, 1)
+        pooled = run_once(date_ranges, search_url, args.concurrency)
+    finally:
+        server.shutdown()
+
+    print("========== 구간별 수집 확인 ==========")
+    ok = True
+    for r in date_ranges:
+        urls, pages = pooled[0][(r['start'], r['end'])]
+        expected = window_posts(f"so:r,p:from{r['start']}to{r['end']}", args.per_window)
+        same = urls == expected
+        ok = ok and same
+        print(f"  {'✅' if same else '❌'} {r['start']} ~ {r['end']}: URL {len(urls)}개 / 기대 {len(expected)}개 "
+              f"(페이지 {pages}번)")
+
+    print("\n========== 벤치마크 결과 ==========")
+    print(f"구간 수: {len(date_ranges)}, 서버 지연: {args.latency}초")
+    for label, (results, sec) in (("동시성 1", serial), (f"동시성 {args.concurrency}", pooled)):
+        pages = sum(p for _, p in results.values())
+        print(f"{label:<8}: {sec:.2f}초 (검색 페이지 {pages}번, {pages / sec * 60:.0f} 페이지/분)")
+    print(f"속도 향상: {serial[1] / pooled[1]:.1f}배")
+    print(f"결과 동일 여부: {serial[0] == pooled[0]}")
+    print(f"구간별 수집: {'통과' if ok else '실패'}")
+
+
+if __name__ == '__main__':
+    main()
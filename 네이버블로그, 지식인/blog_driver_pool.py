@@ -0,0 +1,191 @@
+"""
+네이버 블로그 본문 병렬 추출 (헤드리스 Chrome 드라이버 풀)
+
+- 워커 프로세스 num_workers 개가 각자 헤드리스 Chrome 을 하나씩 띄우고 공유 큐에서 URL 을 꺼내 처리
+- 고정 sleep 대신 WebDriverWait 로 mainFrame iframe / 본문 요소가 뜨는 즉시 추출
+- 추출 결과는 결과 큐로 모아서 메인 프로세스 하나에서만 기록 (단일 writer)
+- 진행 상황과 함께 처리량(페이지/분)을 출력
+
+사용 예:
+    all_data = crawl_blog_posts(href_list, keyword, num_workers=4)
+"""
+import multiprocessing as mp
+import queue
+import time
+
+from selenium.common.exceptions import TimeoutException  # type: ignore
+from selenium.webdriver.common.by import By  # type: ignore
+from selenium.webdriver.support import expected_conditions as EC  # type: ignore
+from selenium.webdriver.support.ui import WebDriverWait  # type: ignore
+
+from blog_fields import CONTENT_SELECTORS, DATE_SELECTORS, TITLE_SELECTORS, make_record, trim_date
+from driver_factory import ManagedDriver, create_driver
+
+NUM_WORKERS = 4          # 동시에 띄우는 Chrome 드라이버(프로세스) 수
+PAGE_TIMEOUT = 10        # 페이지 하나에서 iframe / 본문 요소를 기다리는 최대 시간(초)
+REPORT_EVERY = 50        # 몇 페이지마다 처리량을 출력할지
+
+# 본문 영역 중 하나라도 나타나면 페이지 준비 완료로 봄
+CONTENT_READY = EC.any_of(
+    *(EC.presence_of_element_located((By.CSS_SELECTOR, selector)) for selector in CONTENT_SELECTORS)
+)
+
+
+def create_headless_driver(headless=True):
+    """
+    본문 추출용 Chrome 드라이버 생성 (driver_factory 공통 옵션 + 헤드리스, 이미지 / 폰트 / 광고 차단, eager 로드)
+    """
+    # 대기는 WebDriverWait 로만 (없는 선택자마다 암묵적 대기가 걸리지 않게)
+    return create_driver(headless=headless, implicit_wait=0)
+
+
+def _first_text(driver, selectors, min_length=1):
+    """선택자를 순서대로 시도해서 처음으로 min_length 이상인 텍스트를 반환 (없으면 "N/A")"""
+    for selector in selectors:
+        for elem in driver.find_elements(By.CSS_SELECTOR, selector):
+            try:
+                text = elem.text.strip()
+            except Exception:
+                continue
+            if len(text) >= min_length:
+                return text
+    return "N/A"
+
+
+def extract_blog_post(driver, url, timeout=PAGE_TIMEOUT):
+    """
+    블로그 글 하나의 (title, content, date) 추출
+
+    네이버 블로그는 본문이 'mainFrame' iframe 안에 있으므로 iframe 이 뜨면 바로 전환하고,
+    본문 선택자 중 하나가 나타날 때까지만 기다린다. (iframe 이 없는 글은 현재 문서에서 바로 찾음)
+    """
+    driver.get(url)
+    try:
+        WebDriverWait(driver, timeout).until(EC.frame_to_be_available_and_switch_to_it('mainFrame'))
+    except TimeoutException:
+        pass  # iframe 이 없을 수도 있음
+    try:
+        WebDriverWait(driver, timeout).until(CONTENT_READY)
+
+        title = _first_text(driver, TITLE_SELECTORS)
+
+        content = _first_text(driver, CONTENT_SELECTORS, min_length=11)
+        # 줄바꿈 / 연속 공백을 공백 하나로
+        content = ' '.join(content.split())
+
+        date = trim_date(_first_text(driver, DATE_SELECTORS))
+    finally:
+        # iframe 에서 빠져나와 다음 URL 을 받을 준비
+        driver.switch_to.default_content()
+    return title, content, date
+
+
+def _worker(worker_id, keyword, task_queue, result_queue, headless, timeout):
+    """
+    워커 프로세스: 드라이버 하나로 큐에서 (순번, URL) 을 꺼내 처리하고 결과 큐로 보냄.
+    None 을 받으면 종료. 결과는 (순번, URL, 레코드, 메시지, 걸린 시간, 워커 번호).
+    Chrome 은 RESTART_EVERY 페이지마다 다시 띄우고, 종료할 때 워커별 페이지 로드 시간을 출력.
+    """
+    driver = ManagedDriver(headless=headless, implicit_wait=0, label=f"워커 {worker_id}")
+    try:
+        driver.driver  # Chrome 실행 실패는 여기서 바로 알림
+    except Exception as e:
+        result_queue.put((None, None, None, f"워커 {worker_id} Chrome 실행 실패: {e}", 0.0, worker_id))
+        return
+    try:
+        while True:
+            task = task_queue.get()
+            if task is None:
+                break
+            order, url = task
+            started = time.perf_counter()
+            try:
+                title, content, date = extract_blog_post(driver, url, timeout)
+                record, message = make_record(keyword, url, title, content, date)
+            except Exception as e:
+                # Selenium 예외 메시지는 스택트레이스가 붙어 길어서 첫 줄만
+                first_line = (str(e).strip().splitlines() or [repr(e)])[0]
+                record, message = None, f"오류 발생, 건너뜀: {first_line[:100]}"
+            result_queue.put((order, url, record, message, time.perf_counter() - started, worker_id))
+    finally:
+        driver.quit()
+
+
+def crawl_blog_posts(urls, keyword, num_workers=NUM_WORKERS, headless=True,
+                     timeout=PAGE_TIMEOUT, on_record=None):
+    """
+    블로그 URL 목록을 드라이버 풀로 병렬 추출
+
+    Args:
+        urls: 블로그 글 URL 리스트
+        keyword: 레코드에 함께 저장할 검색 키워드
+        num_workers: 워커 프로세스(Chrome 드라이버) 수
+        headless: False 면 브라우저 창을 띄움 (디버깅용)
+        timeout: 페이지당 최대 대기 시간(초)
+        on_record: 레코드가 하나 끝날 때마다 메인 프로세스에서 호출할 함수 (선택)
+
+    Returns:
+        수집된 레코드 리스트 (입력 URL 순서)
+    """
+    if not urls:
+        return []
+    num_workers = max(1, min(num_workers, len(urls)))
+
+    # Chrome 을 띄우는 자식 프로세스는 fork 보다 spawn 이 안전 (Windows 와 동작도 같음)
+    ctx = mp.get_context('spawn')
+    task_queue = ctx.Queue()
+    result_queue = ctx.Queue()
+    for task in enumerate(urls):
+        task_queue.put(task)
+    for _ in range(num_workers):
+        task_queue.put(None)
+
+    workers = [
+        ctx.Process(target=_worker, args=(i + 1, keyword, task_queue, result_queue, headless, timeout), daemon=True)
+        for i in range(num_workers)
+    ]
+    for worker in workers:
+        worker.start()
+    print(f"🚀 드라이버 풀 시작: 워커 {num_workers}개, URL {len(urls)}개")
+
+    collected = {}
+    done = 0
+    page_seconds = 0.0
+    started = time.perf_counter()
+    try:
+        while done < len(urls):
+            try:
+                order, url, record, message, elapsed, worker_id = result_queue.get(timeout=timeout * 3)
+            except queue.Empty:
+                if not any(worker.is_alive() for worker in workers):
+                    print(f"⚠️  모든 워커가 종료되어 중단합니다. ({done}/{len(urls)} 처리)")
+                    break
+                continue
+            if order is None:
+                print(f"  ❌ {message}")
+                continue
+
+            # 결과 기록은 여기(메인 프로세스)에서만
+            done += 1
+            page_seconds += elapsed
+            if record is not None:
+                collected[order] = record
+                if on_record is not None:
+                    on_record(record)
+                print(f"[{done}/{len(urls)}] ✅ 수집 완료: {record['title'][:30]}... (워커 {worker_id}, {elapsed:.1f}초)")
+            else:
+                print(f"[{done}/{len(urls)}] ⏭️  {message} ({url[:60]})")
+
+            if done % REPORT_EVERY == 0:
+                minutes = (time.perf_counter() - started) / 60
+                print(f"  📈 처리량: {done / minutes:.1f} 페이지/분 (수집 {len(collected)}건)")
+    finally:
+        for worker in workers:
+            worker.join(timeout=5)
+            if worker.is_alive():
+                worker.terminate()
+
+    minutes = max(time.perf_counter() - started, 1e-9) / 60
+    print(f"\n📊 {done}페이지 / {minutes * 60:.1f}초 → {done / minutes:.1f} 페이지/분 "
+          f"(워커 {num_workers}개, 페이지당 평균 {page_seconds / max(done, 1):.2f}초)")
+    return [collected[order] for order in sorted(collected)]
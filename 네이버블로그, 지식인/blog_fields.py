@@ -0,0 +1,33 @@
+"""
+네이버 블로그 글 필드 공통 부분 (selenium 없이 import 가능)
+
+Selenium 드라이버 풀(blog_driver_pool)과 HTTP PostView 추출(blog_postview)이 같은 선택자 / 같은 기준으로
+제목 / 본문 / 날짜를 뽑고 레코드를 만들도록 한곳에 둔다.
+"""
+MIN_CONTENT_LENGTH = 20  # 이보다 짧은 본문은 수집하지 않음
+
+# 제목 / 본문 / 날짜 선택자 (신형 스마트에디터 → 구형 에디터 순서)
+TITLE_SELECTORS = ['.se-title-text', '.pcol1 > span', '.se-title', 'h1']
+CONTENT_SELECTORS = ['.se-main-container', '#postViewArea', '.se-component-content', '.post-view']
+DATE_SELECTORS = ['.se_publishDate', '.date', '.publish_date', '.post-date']
+
+
+def trim_date(date):
+    """날짜 형식 정리 (예: 2025.01.15. 오후 3:00 -> 2025.01.15.)"""
+    if date != "N/A" and '.' in date:
+        date_parts = date.split('.')
+        if len(date_parts) >= 3:
+            date = f"{date_parts[0]}.{date_parts[1]}.{date_parts[2]}."
+    return date
+
+
+def make_record(keyword, url, title, content, date):
+    """
+    수집 조건을 통과하면 (레코드, None), 아니면 (None, 건너뛴 이유) 반환
+    """
+    if content == "N/A" or not content or len(content.strip()) < MIN_CONTENT_LENGTH:
+        return None, f"content 없음 또는 너무 짧음으로 건너뜀: {title[:30]}..."
+    if title == "N/A" or not title or len(title.strip()) == 0:
+        return None, "title 없음으로 건너뜀"
+    # keyword, title, content, date, url 순서
+    return {'keyword': keyword, 'title': title, 'content': content, 'date': date, 'url': url}, None
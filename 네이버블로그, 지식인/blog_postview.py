@@ -0,0 +1,144 @@
+"""
+네이버 블로그 본문 HTTP 추출 (브라우저 없이 PostView 문서 직접 요청)
+
+블로그 글 페이지(blog.naver.com/{블로그ID}/{글번호})는 본문을 'mainFrame' iframe 으로 불러오는데,
+그 iframe 문서(PostView.naver?blogId=...&logNo=...)는 일반 HTTP 요청으로 바로 받을 수 있다.
+
+- URL 을 PostView 형식으로 바꿔서 aiohttp 커넥션 풀로 동시에 요청
+- lxml + 미리 컴파일한 XPath 로 제목 / 본문(se-main-container, 구형 에디터 포함) / 날짜 추출
+- HTTP 로 본문을 못 찾은 글만 Selenium 드라이버 풀(blog_driver_pool)로 다시 추출
+  (드라이버 풀은 폴백할 때만 import → HTTP 경로만 쓰면 selenium 이 없어도 됨)
+- 글 하나당 수 초 → 수십 ms
+
+사용 예:
+    all_data = crawl_blog_posts_http(href_list, keyword, concurrency=16)
+"""
+import asyncio
+import re
+import time
+
+from lxml import etree, html as lxml_html
+
+from blog_fields import CONTENT_SELECTORS, DATE_SELECTORS, TITLE_SELECTORS, make_record, trim_date
+from http_fetch import HTTP_CONCURRENCY, create_session, fetch_html, first_text, selector_to_xpath
+
+BASE_URL = 'https://blog.naver.com'
+POSTVIEW_PATH = '/PostView.naver?blogId={blog_id}&logNo={log_no}&redirect=Dlog&widgetTypeCall=true&directAccess=false'
+BLOG_POST_PATTERN = re.compile(r'https?://(?:m\.)?blog\.naver\.com/(?:PostView\.naver\?blogId=)?([A-Za-z0-9_-]+)(?:/|&logNo=)(\d+)')
+
+MIN_CONTENT_CHARS = 11   # Selenium 경로와 같은 기준: 이보다 짧은 본문 후보는 다음 선택자로
+
+# Selenium 경로(blog_driver_pool)와 같은 선택자를 같은 순서로, 한 번만 컴파일해서 재사용
+TITLE_XPATHS = [etree.XPath(selector_to_xpath(s)) for s in TITLE_SELECTORS]
+CONTENT_XPATHS = [etree.XPath(selector_to_xpath(s)) for s in CONTENT_SELECTORS]
+DATE_XPATHS = [etree.XPath(selector_to_xpath(s)) for s in DATE_SELECTORS]
+
+
+def to_postview_url(url, base_url=BASE_URL):
+    """blog.naver.com/{블로그ID}/{글번호} (또는 m.blog / PostView) → PostView 문서 URL. 블로그 글이 아니면 None"""
+    match = BLOG_POST_PATTERN.search(url or '')
+    if not match:
+        return None
+    return base_url + POSTVIEW_PATH.format(blog_id=match.group(1), log_no=match.group(2))
+
+
+def parse_postview(page_html):
+    """
+    PostView HTML 에서 (title, content, date) 추출 (못 찾은 항목은 "N/A")
+    """
+    if isinstance(page_html, str):
+        page_html = page_html.encode('utf-8')
+    tree = lxml_html.fromstring(page_html)
+    title = first_text(tree, TITLE_XPATHS)
+    content = first_text(tree, CONTENT_XPATHS, min_length=MIN_CONTENT_CHARS)
+    date = trim_date(first_text(tree, DATE_XPATHS))
+    return title, content, date
+
+
+async def fetch_posts_async(urls, keyword, concurrency=HTTP_CONCURRENCY, base_url=BASE_URL, on_record=None):
+    """
+    URL 목록을 HTTP 로 동시에 추출 (base_url 은 오프라인 벤치마크에서 가짜 서버로 바꿀 때만)
+    on_record 를 주면 레코드가 하나 끝날 때마다 호출 (RecordSink.write 등)
+
+    Returns:
+        (records, fallback, skipped)
+        - records: {순번: 레코드}
+        - fallback: 브라우저로 다시 시도할 (순번, URL) 리스트 (요청 실패 / 본문 영역 없음)
+        - skipped: 본문이 너무 짧거나 제목이 없어 수집 조건에서 빠진 건수
+    """
+    records, fallback = {}, []
+    skipped = 0
+    semaphore = asyncio.Semaphore(concurrency)
+    session = create_session(concurrency, referer='https://blog.naver.com/')
+
+    async def one(order, url):
+        nonlocal skipped
+        postview_url = to_postview_url(url, base_url)
+        if postview_url is None:
+            fallback.append((order, url))
+            return
+        async with semaphore:
+            page_html = await fetch_html(session, postview_url, label=url[:60])
+        if page_html is None:
+            fallback.append((order, url))
+            return
+        try:
+            title, content, date = parse_postview(page_html)
+        except (etree.ParserError, ValueError):
+            fallback.append((order, url))
+            return
+        if content == "N/A":
+            # 비공개 / 삭제 / 새 에디터 구조 등 본문 영역을 못 찾은 글은 브라우저로
+            fallback.append((order, url))
+            return
+        record, _ = make_record(keyword, url, title, content, date)
+        if record is None:
+            skipped += 1
+            return
+        records[order] = record
+        if on_record is not None:
+            on_record(record)
+
+    try:
+        await asyncio.gather(*(one(order, url) for order, url in enumerate(urls)))
+    finally:
+        await session.close()
+    return records, sorted(fallback), skipped
+
+
+def crawl_blog_posts_http(urls, keyword, concurrency=HTTP_CONCURRENCY, fallback_workers=None, on_record=None):
+    """
+    HTTP 우선 블로그 본문 추출 (실패한 글만 Selenium 드라이버 풀로)
+
+    Args:
+        urls: 블로그 글 URL 리스트
+        keyword: 레코드에 함께 저장할 검색 키워드
+        concurrency: 동시 HTTP 요청 수
+        fallback_workers: 브라우저 폴백에 쓸 드라이버(프로세스) 수 (None 이면 blog_driver_pool.NUM_WORKERS,
+            0 이면 폴백 안 함)
+        on_record: 레코드가 하나 끝날 때마다 호출할 함수 (HTTP / 폴백 공통, 선택)
+
+    Returns:
+        수집된 레코드 리스트 (입력 URL 순서)
+    """
+    if not urls:
+        return []
+    started = time.perf_counter()
+    records, fallback, skipped = asyncio.run(fetch_posts_async(urls, keyword, concurrency, on_record=on_record))
+    http_sec = time.perf_counter() - started
+    http_done = len(urls) - len(fallback)
+    print(f"⚡ HTTP 추출: {len(records)}건 수집 / {skipped}건 건너뜀 / 폴백 대상 {len(fallback)}건 "
+          f"({http_sec:.1f}초, 글당 {http_sec / max(http_done, 1) * 1000:.0f}ms)")
+
+    if fallback and fallback_workers != 0:
+        from blog_driver_pool import NUM_WORKERS, crawl_blog_posts
+
+        print(f"🔁 HTTP 로 본문을 못 찾은 {len(fallback)}건은 브라우저로 다시 시도합니다.")
+        order_by_url = {url: order for order, url in fallback}
+        for record in crawl_blog_posts([url for _, url in fallback], keyword, num_workers=fallback_workers or NUM_WORKERS,
+                                       on_record=on_record):
+            records[order_by_url[record['url']]] = record
+
+    minutes = max(time.perf_counter() - started, 1e-9) / 60
+    print(f"📊 {len(urls)}페이지 → {len(urls) / minutes:.1f} 페이지/분 (수집 {len(records)}건)")
+    return [records[order] for order in sorted(records)]
@@ -0,0 +1,198 @@
+"""
+네이버 검색 날짜 구간 자동 분할 (결과 수를 재서 꽉 찬 구간은 반으로 나누고, 한산한 구간은 합침)
+
+calculate_date_ranges 의 1년 고정 구간은 글이 많은 해에는 검색 결과 상한(max_urls)에 걸려서 URL 을 놓치고,
+글이 적은 해에는 구간마다 검색을 따로 돌리느라 시간만 쓴다.
+
+1) 시작 구간(calculate_date_ranges 결과)마다 discover_window 로 결과를 cap 개까지 수집
+2) cap 에 닿은(포화된) 구간은 가운데 날짜로 둘로 나눠서 다시 수집 (하루짜리가 될 때까지 재귀)
+3) 나눈 뒤 옆 구간과 합쳐도 cap * MERGE_RATIO 이하인 구간들은 하나로 합침 (이미 모은 URL 은 합집합)
+   검색 요청이 실패한 구간은 URL 을 비워서(→ 브라우저로 다시 검색) 합치지 않고 따로 둠
+4) 결과 구간 목록(시작/끝/결과 수)을 plan_file 에 저장 → 같은 검색어 / 기간으로 다시 돌리면
+   분할 과정 없이 저장된 구간으로 바로 discover_urls 실행
+
+사용 예:
+    date_ranges = calculate_date_ranges('20200101', '20221231')
+    date_ranges, window_urls = plan_date_windows(keyword, date_ranges, source='blog')
+    for r in date_ranges:
+        crawl_naver_blog(keyword, r['start'], r['end'], urls=window_urls.get((r['start'], r['end'])))
+"""
+import asyncio
+import json
+import os
+import time
+from datetime import datetime, timedelta
+
+from http_fetch import create_session
+from naver_search import MAX_URLS, SEARCH_CONCURRENCY, SEARCH_URL, discover_urls, discover_window
+
+PLAN_FILE = 'naver_date_plan.json'    # 구간 계획 저장 파일 (CSV 와 같은 실행 폴더)
+MERGE_RATIO = 0.5                     # 합친 결과 수가 cap 의 이 비율 이하일 때만 합침 (다음 수집 때 늘어날 여유)
+
+
+def _window(start, end, count, saturated=False, failed=False):
+    days = (datetime.strptime(end, '%Y%m%d') - datetime.strptime(start, '%Y%m%d')).days + 1
+    return {'start': start, 'end': end, 'period': f'{days}days', 'count': count, 'saturated': saturated,
+            'failed': failed}
+
+
+def split_window(start, end):
+    """YYYYMMDD 구간을 가운데 날짜 기준으로 둘로 (하루짜리면 None)"""
+    start_day = datetime.strptime(start, '%Y%m%d')
+    end_day = datetime.strptime(end, '%Y%m%d')
+    if end_day <= start_day:
+        return None
+    mid = start_day + (end_day - start_day) // 2
+    return (start, mid.strftime('%Y%m%d')), ((mid + timedelta(days=1)).strftime('%Y%m%d'), end)
+
+
+def merge_windows(windows, window_urls, cap, merge_ratio=MERGE_RATIO):
+    """
+    날짜 순서대로 이어진 구간 중 합쳐도 cap * merge_ratio 이하인 것들을 하나로 합침
+    (포화 / 검색 실패 구간은 합치지 않음 - 실패 구간을 합치면 그 기간이 브라우저로 다시 검색되지 않음)
+
+    Returns:
+        (합친 구간 리스트, {(start, end): URL 리스트})
+    """
+    limit = cap * merge_ratio
+    merged, merged_urls = [], {}
+    for window in windows:
+        key = (window['start'], window['end'])
+        urls = window_urls.get(key, [])
+        mergeable = not window['saturated'] and not window.get('failed')
+        if merged and mergeable and not merged[-1]['saturated'] and not merged[-1].get('failed'):
+            last = merged[-1]
+            last_key = (last['start'], last['end'])
+            combined = list(dict.fromkeys(merged_urls[last_key] + urls))
+            if len(combined) <= limit:
+                del merged_urls[last_key]
+                merged[-1] = _window(last['start'], window['end'], len(combined))
+                merged_urls[(last['start'], window['end'])] = combined
+                continue
+        merged.append(window)
+        merged_urls[key] = urls
+    return merged, merged_urls
+
+
+async def plan_windows_async(query, date_ranges, source='blog', cap=MAX_URLS,
+                             concurrency=SEARCH_CONCURRENCY, search_url=SEARCH_URL):
+    """
+    구간마다 결과를 cap 개까지 수집하면서 포화된 구간을 재귀적으로 둘로 나눔
+
+    Returns:
+        (날짜 순서 구간 리스트, {(start, end): URL 리스트}, 요청한 검색 페이지 수)
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    session = create_session(concurrency, referer='https://search.naver.com/')
+    window_urls = {}
+    failures = set()
+    total_pages = 0
+
+    async def probe(start, end):
+        nonlocal total_pages
+        urls, pages = await discover_window(session, semaphore, source, query, start, end, cap, search_url,
+                                            failures=failures)
+        total_pages += pages
+        if (start, end) in failures:
+            # 일부 URL 만 남기면 crawl_naver_* 가 브라우저 검색을 건너뛰므로 비워서 기간 전체를 다시 검색하게 함
+            print(f"  ⚠️ {start} ~ {end}: 검색 요청 실패 → 브라우저로 다시 검색")
+            window_urls[(start, end)] = []
+            return [_window(start, end, 0, failed=True)]
+        halves = split_window(start, end) if len(urls) >= cap else None
+        if halves is None:
+            # 포화됐지만 하루짜리라 더 못 나누는 구간은 saturated 로 표시 (cap 개만 수집됨)
+            window_urls[(start, end)] = urls
+            return [_window(start, end, len(urls), saturated=len(urls) >= cap)]
+        print(f"  🔁 {start} ~ {end}: 결과 {len(urls)}개로 상한 도달 → "
+              f"{halves[0][0]}~{halves[0][1]} / {halves[1][0]}~{halves[1][1]} 로 분할")
+        left, right = await asyncio.gather(probe(*halves[0]), probe(*halves[1]))
+        return left + right
+
+    try:
+        results = await asyncio.gather(*(probe(r['start'], r['end']) for r in date_ranges))
+    finally:
+        await session.close()
+    windows = [window for result in results for window in result]
+    return windows, window_urls, total_pages
+
+
+def load_plan(plan_key, plan_file=PLAN_FILE):
+    """저장된 구간 계획 (없으면 None)"""
+    if not os.path.exists(plan_file):
+        return None
+    try:
+        with open(plan_file, encoding='utf-8') as f:
+            plans = json.load(f)
+    except (OSError, json.JSONDecodeError) as e:
+        print(f"⚠️ 구간 계획 파일을 읽지 못했습니다 ({plan_file}): {e}")
+        return None
+    return plans.get(plan_key)
+
+
+def save_plan(plan_key, windows, plan_file=PLAN_FILE):
+    """구간 계획을 plan_file 에 검색어 / 기간별로 저장 (다른 검색어의 계획은 유지)"""
+    plans = {}
+    if os.path.exists(plan_file):
+        try:
+            with open(plan_file, encoding='utf-8') as f:
+                plans = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            plans = {}
+    plans[plan_key] = {
+        'created': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+        'windows': windows,
+    }
+    tmp_file = plan_file + '.tmp'
+    with open(tmp_file, 'w', encoding='utf-8') as f:
+        json.dump(plans, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_file, plan_file)
+
+
+def plan_date_windows(query, date_ranges, source='blog', cap=MAX_URLS, concurrency=SEARCH_CONCURRENCY,
+                      plan_file=PLAN_FILE, refresh=False, search_url=SEARCH_URL):
+    """
+    검색 결과 수에 맞춰 날짜 구간을 나누고 / 합친 뒤 구간별 URL 까지 수집
+
+    Args:
+        query: 검색어 (연산자 포함 전체 키워드)
+        date_ranges: calculate_date_ranges 결과 (시작 구간)
+        source: 'blog' 또는 'kin'
+        cap: 검색 한 번에서 모을 수 있는 최대 URL 수 (crawl_naver_* 의 max_urls)
+        concurrency: 동시에 진행할 구간 수
+        plan_file: 구간 계획 저장 파일 (None 이면 저장 / 재사용 안 함)
+        refresh: True 면 저장된 계획이 있어도 다시 분할
+        search_url: 검색 주소 (오프라인 벤치마크에서 가짜 서버로 바꿀 때만)
+
+    Returns:
+        (구간 리스트 [{'start', 'end', 'period', 'count', 'saturated'}, ...], {(start, end): URL 리스트})
+    """
+    if not date_ranges:
+        return [], {}
+    plan_key = f"{source}|{query}|{date_ranges[0]['start']}|{date_ranges[-1]['end']}|{cap}"
+
+    plan = load_plan(plan_key, plan_file) if plan_file and not refresh else None
+    if plan:
+        windows = plan['windows']
+        print(f"\n⏭️ 저장된 구간 계획 사용 ({plan['created']}, {len(windows)}개 구간) - 분할 생략")
+        return windows, discover_urls(query, windows, source, cap, concurrency, search_url)
+
+    print(f"\n🔎 {source} 날짜 구간 분할 ({len(date_ranges)}개 시작 구간, 상한 {cap}개)")
+    started = time.perf_counter()
+    windows, window_urls, pages = asyncio.run(
+        plan_windows_async(query, date_ranges, source, cap, concurrency, search_url))
+    split_count = len(windows)
+    windows, window_urls = merge_windows(windows, window_urls, cap)
+    elapsed = time.perf_counter() - started
+
+    for window in windows:
+        mark = ' ⚠️ 하루 구간도 상한 도달' if window['saturated'] else ''
+        if window.get('failed'):
+            mark = ' ⚠️ 검색 실패 (브라우저로 다시 검색)'
+        print(f"  {window['start']} ~ {window['end']}: URL {window['count']}개{mark}")
+    unique = len(set(url for urls in window_urls.values() for url in urls))
+    print(f"  ✅ 시작 {len(date_ranges)}개 → 분할 {split_count}개 → 병합 후 {len(windows)}개 구간, "
+          f"총 {unique}개 URL (검색 페이지 {pages}번, {elapsed:.1f}초)")
+
+    if plan_file:
+        save_plan(plan_key, windows, plan_file)
+    return windows, window_urls
@@ -0,0 +1,211 @@
+"""
+크롤러 공통 Chrome 드라이버 (블로그 / 지식iN / 네이버 카페 / webtretho 크롤러가 같이 사용)
+
+- create_driver  : 공통 옵션 + 헤드리스 + eager 페이지 로드 전략 + CDP 로 이미지 / 미디어 / 폰트 / 광고 요청 차단
+- ManagedDriver  : 드라이버처럼 쓰는 래퍼 (driver.get / find_element / switch_to 등 그대로 사용)
+    * 필요할 때 처음 Chrome 을 띄우고, 여러 키워드 / 기간에 걸쳐 같은 Chrome 을 재사용
+    * restart_every 페이지마다 Chrome 을 새로 띄워서 메모리 증가를 제한 (on_start 로 로그인 등 다시 수행)
+    * 페이지마다 로드 시간(get)과 다음 페이지로 넘어가기까지의 전체 시간을 기록 → print_timing 으로
+      옵션(헤드리스 / 차단 / 로드 전략)별 페이지당 시간을 비교
+
+사용 예:
+    driver = ManagedDriver(headless=False, implicit_wait=10)
+    for keyword in keywords:
+        crawl_naver_blog(keyword, start, end, driver=driver)
+    driver.quit()   # 타이밍 요약 출력 후 종료
+"""
+import time
+
+from selenium import webdriver as wb  # type: ignore
+
+RESTART_EVERY = 300            # 이 페이지 수마다 Chrome 을 새로 띄움 (0 이면 재시작 안 함)
+PAGE_LOAD_STRATEGY = 'eager'   # DOMContentLoaded 까지만 기다림 (이미지 / 광고 로딩은 기다리지 않음)
+
+# CDP Network.setBlockedURLs 로 막을 요청 (본문 텍스트 수집에 필요 없는 리소스)
+BLOCKED_URLS = [
+    '*.png', '*.jpg', '*.jpeg', '*.gif', '*.webp', '*.bmp', '*.svg', '*.ico',
+    '*.woff', '*.woff2', '*.ttf', '*.otf', '*.eot',
+    '*.mp4', '*.webm', '*.m3u8', '*.ts', '*.mp3', '*.m4a',
+    '*doubleclick.net*', '*googlesyndication.com*', '*google-analytics.com*', '*googletagmanager.com*',
+    '*adcr.naver.com*', '*veta.naver.com*', '*siape.veta.naver.com*', '*facebook.net*',
+]
+
+
+def create_driver(headless=True, block_resources=True, page_load_strategy=PAGE_LOAD_STRATEGY,
+                  implicit_wait=0, window_size='1280,2000'):
+    """
+    공통 옵션으로 Chrome 드라이버 생성
+
+    Args:
+        headless: 창 없이 실행 (False 면 창을 띄우고 최대화)
+        block_resources: 이미지 / 미디어 / 폰트 / 광고 요청 차단
+        page_load_strategy: 'eager' / 'normal' / 'none'
+        implicit_wait: 암묵적 대기(초). 대기를 WebDriverWait 로만 하는 코드는 0
+        window_size: 헤드리스일 때 창 크기
+    """
+    options = wb.ChromeOptions()
+    if headless:
+        options.add_argument('--headless=new')
+        options.add_argument(f'--window-size={window_size}')
+    options.add_argument('--no-sandbox')
+    options.add_argument('--disable-dev-shm-usage')
+    options.add_argument('--disable-blink-features=AutomationControlled')
+    options.add_argument('--disable-gpu')  # GPU 가속 비활성화
+    options.add_argument('--disable-extensions')  # 확장 프로그램 비활성화
+    options.add_argument('--disable-software-rasterizer')
+    options.add_argument('--disable-infobars')
+    # 로그 및 에러 메시지 억제
+    options.add_argument('--log-level=3')  # INFO 레벨 이상만 출력 (FATAL, ERROR만)
+    options.add_argument('--disable-logging')  # 로깅 비활성화
+    options.add_argument('--disable-background-networking')  # 백그라운드 네트워킹 비활성화
+    options.add_argument('--disable-background-timer-throttling')  # 백그라운드 타이머 제한 비활성화
+    options.add_argument('--disable-backgrounding-occluded-windows')  # 가려진 창 백그라운드 처리 비활성화
+    options.add_argument('--disable-breakpad')  # 크래시 리포팅 비활성화
+    options.add_argument('--disable-component-update')  # 컴포넌트 업데이트 비활성화
+    options.add_argument('--disable-default-apps')  # 기본 앱 비활성화
+    options.add_argument('--disable-sync')  # 동기화 비활성화
+    options.add_argument('--disable-background-mode')  # 백그라운드 모드 비활성화
+    options.add_argument('--disable-features=TranslateUI')  # 번역 UI 비활성화
+    options.add_experimental_option("excludeSwitches", ["enable-automation", "enable-logging"])
+    prefs = {
+        'profile.default_content_setting_values.notifications': 2,  # 알림 차단
+        'profile.default_content_settings.popups': 0,  # 팝업 차단
+    }
+    if block_resources:
+        # CDP 차단은 최상위 문서 기준이라 다른 프로세스의 iframe 이미지는 설정으로 한 번 더 막음
+        prefs['profile.managed_default_content_settings.images'] = 2
+    options.add_experimental_option('prefs', prefs)
+    options.add_experimental_option('useAutomationExtension', False)
+    options.page_load_strategy = page_load_strategy
+
+    try:
+        driver = wb.Chrome(options=options)
+    except Exception as e:
+        print(f"⚠️  Chrome 드라이버 실행 실패, 기본 옵션으로 재시도: {e}")
+        driver = wb.Chrome()
+
+    if not headless:
+        driver.maximize_window()
+    driver.implicitly_wait(implicit_wait)
+    if block_resources:
+        try:
+            driver.execute_cdp_cmd('Network.enable', {})
+            driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': BLOCKED_URLS})
+        except Exception as e:
+            print(f"⚠️  리소스 차단 설정 실패 (차단 없이 진행): {e}")
+    return driver
+
+
+class ManagedDriver:
+    """
+    재사용 / 주기적 재시작 / 페이지별 시간 기록을 하는 드라이버 래퍼
+
+    get() 외의 속성(find_element, switch_to, execute_script, current_url ...)은 실제 드라이버로 넘기므로
+    WebDriverWait(driver, ...) 나 기존 추출 함수에 드라이버 대신 그대로 넘겨도 된다.
+    """
+
+    def __init__(self, headless=True, block_resources=True, page_load_strategy=PAGE_LOAD_STRATEGY,
+                 implicit_wait=0, restart_every=RESTART_EVERY, on_start=None, label=None):
+        self.options = {
+            'headless': headless,
+            'block_resources': block_resources,
+            'page_load_strategy': page_load_strategy,
+            'implicit_wait': implicit_wait,
+        }
+        self.restart_every = restart_every
+        self.on_start = on_start  # Chrome 을 (다시) 띄울 때마다 호출 (예: 로그인)
+        self.label = label or (f"{'headless' if headless else 'window'}/"
+                               f"{'block' if block_resources else 'no-block'}/{page_load_strategy}")
+        self.load_times = []   # 페이지별 driver.get 시간(초)
+        self.page_times = []   # 페이지별 get ~ 다음 get(또는 종료)까지 시간(초)
+        self.restarts = 0
+        self._driver = None
+        self._pages_since_start = 0
+        self._page_started = None
+
+    @property
+    def driver(self):
+        """실제 Selenium 드라이버 (처음 쓸 때 Chrome 실행)"""
+        if self._driver is None:
+            self._driver = create_driver(**self.options)
+            self._pages_since_start = 0
+            if self.on_start is not None:
+                self.on_start(self)
+        return self._driver
+
+    def __getattr__(self, name):
+        if name.startswith('_'):
+            raise AttributeError(name)
+        return getattr(self.driver, name)
+
+    def implicitly_wait(self, seconds):
+        """암묵적 대기 변경 (재시작한 Chrome 에도 같은 값 적용)"""
+        self.options['implicit_wait'] = seconds
+        if self._driver is not None:
+            self._driver.implicitly_wait(seconds)
+
+    def _finish_page(self):
+        if self._page_started is not None:
+            self.page_times.append(time.perf_counter() - self._page_started)
+            self._page_started = None
+
+    def _close(self):
+        self._finish_page()
+        if self._driver is None:
+            return False
+        try:
+            self._driver.quit()
+        except Exception:
+            pass
+        self._driver = None
+        return True
+
+    def restart(self):
+        """Chrome 을 닫고 다음 사용 때 새로 띄움"""
+        if self._close():
+            self.restarts += 1
+
+    def get(self, url):
+        """페이지 이동 (restart_every 마다 Chrome 재시작, 로드 시간 기록)"""
+        self._finish_page()
+        if self.restart_every and self._pages_since_start >= self.restart_every:
+            print(f"  🔁 {self._pages_since_start}페이지 처리 → Chrome 재시작 (메모리 정리)")
+            self.restart()
+        driver = self.driver
+        started = time.perf_counter()
+        self._page_started = started
+        try:
+            driver.get(url)
+        finally:
+            self.load_times.append(time.perf_counter() - started)
+            self._pages_since_start += 1
+
+    def timing_summary(self):
+        """{'label', 'pages', 'restarts', 'load_avg', 'load_p90', 'page_avg'} (시간은 초)"""
+        self._finish_page()
+        loads = sorted(self.load_times)
+        return {
+            'label': self.label,
+            'pages': len(loads),
+            'restarts': self.restarts,
+            'load_avg': sum(loads) / len(loads) if loads else 0.0,
+            'load_p90': loads[int(len(loads) * 0.9)] if loads else 0.0,
+            'page_avg': sum(self.page_times) / len(self.page_times) if self.page_times else 0.0,
+        }
+
+    def print_timing(self):
+        s = self.timing_summary()
+        if s['pages']:
+            print(f"⏱️  [{s['label']}] 페이지 {s['pages']}개: 로드 평균 {s['load_avg']:.2f}초 "
+                  f"(p90 {s['load_p90']:.2f}초), 페이지당 평균 {s['page_avg']:.2f}초, 재시작 {s['restarts']}번")
+
+    def quit(self):
+        """타이밍 요약을 출력하고 Chrome 종료 (다시 get 하면 새로 띄움)"""
+        self.print_timing()
+        self._close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.quit()
@@ -0,0 +1,98 @@
+"""
+HTML 페이지 HTTP 수집 공통 부분 (aiohttp 커넥션 풀 + lxml 파싱 도우미, 사이트 무관)
+
+blog_postview.py(블로그 PostView), kin_http.py(지식iN 질문 페이지), naver_search.py / date_window_planner.py
+(네이버 검색), ../Webtretho/webtretho_crawler.py(Webtretho 글 페이지)가 같이 사용한다.
+
+- create_session : 커넥션 풀 크기 / 타임아웃 / 브라우저 헤더(Accept-Language 는 사이트에 맞게)가 설정된 aiohttp 세션
+- fetch_html     : 429 / 5xx / 네트워크 오류는 지수 백오프로 재시도, 실패하면 None
+- selector_to_xpath / node_text / first_text : Selenium 경로와 같은 CSS 선택자를 XPath 로 미리 컴파일해서
+  보이는 텍스트를 한 줄로 뽑는 도우미
+"""
+import asyncio
+import re
+
+import aiohttp
+
+HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 '
+                  '(KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36',
+}
+ACCEPT_LANGUAGE = 'ko-KR,ko;q=0.9'   # 기본 Accept-Language (네이버 등 한국어 사이트)
+
+HTTP_CONCURRENCY = 16    # 동시에 진행할 HTTP 요청 수 (커넥션 풀 크기)
+REQUEST_TIMEOUT = 15     # 요청 하나의 타임아웃(초)
+MAX_RETRIES = 3          # 429 / 5xx / 네트워크 오류 재시도 횟수
+BLOCK_TAGS = {'p', 'div', 'br', 'li', 'ul', 'ol', 'tr', 'td', 'th', 'table', 'blockquote',
+              'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'pre'}
+
+
+def create_session(concurrency=HTTP_CONCURRENCY, referer=None, accept_language=ACCEPT_LANGUAGE):
+    """커넥션을 concurrency 개까지 재사용하는 aiohttp 세션 (이벤트 루프 안에서 호출)"""
+    headers = dict(HEADERS, **{'Accept-Language': accept_language})
+    if referer:
+        headers['Referer'] = referer
+    connector = aiohttp.TCPConnector(limit=concurrency, ttl_dns_cache=300)
+    return aiohttp.ClientSession(headers=headers, connector=connector,
+                                 timeout=aiohttp.ClientTimeout(total=REQUEST_TIMEOUT))
+
+
+async def fetch_html(session, url, label="", params=None):
+    """GET 요청 후 HTML 반환. 429 / 5xx / 네트워크 오류는 지수 백오프로 재시도, 실패하면 None"""
+    for attempt in range(MAX_RETRIES):
+        try:
+            async with session.get(url, params=params) as res:
+                if res.status == 429 or res.status >= 500:
+                    retry_after = res.headers.get('Retry-After')
+                    wait_time = float(retry_after) if retry_after and retry_after.isdigit() else 2 ** attempt
+                    print(f"  > {label} HTTP {res.status}. {wait_time:.1f}초 대기 후 재시도.")
+                    await asyncio.sleep(wait_time)
+                    continue
+                if res.status != 200:
+                    print(f"  > {label} 요청 실패: HTTP {res.status}")
+                    return None
+                return await res.text(errors='replace')
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            print(f"  > {label} 네트워크 오류: {e!r}. 재시도.")
+            await asyncio.sleep(2 ** attempt)
+    return None
+
+
+def selector_to_xpath(selector):
+    """'.클래스', '#아이디', '태그', '태그.클래스', 'A > B' 형태의 간단한 CSS 선택자를 XPath 로 변환"""
+    steps = []
+    for part in selector.split('>'):
+        part = part.strip()
+        tag = re.match(r'[a-zA-Z0-9]*', part).group(0) or '*'
+        conditions = []
+        for kind, name in re.findall(r'([.#])([\w-]+)', part):
+            if kind == '#':
+                conditions.append(f"[@id='{name}']")
+            else:
+                conditions.append(f"[contains(concat(' ', normalize-space(@class), ' '), ' {name} ')]")
+        steps.append(tag + ''.join(conditions))
+    return '//' + '/'.join(steps)
+
+
+def node_text(node):
+    """
+    요소의 보이는 텍스트를 한 줄로 (블록 요소 사이에는 공백, 인라인 span 은 그대로 이어 붙임)
+    """
+    for bad in [el for el in node.iter('script', 'style')]:
+        bad.drop_tree()
+    for el in node.iter():
+        if isinstance(el.tag, str) and el.tag in BLOCK_TAGS:
+            el.text = ' ' + (el.text or '')
+            el.tail = ' ' + (el.tail or '')
+    # 스마트에디터가 빈 문단에 넣는 zero-width space 는 split() 으로 안 지워져서 따로 제거
+    return ' '.join(node.text_content().replace('\u200b', '').split())
+
+
+def first_text(tree, xpaths, min_length=1):
+    """XPath 를 순서대로 시도해서 처음으로 min_length 이상인 텍스트를 반환 (없으면 "N/A")"""
+    for xpath in xpaths:
+        for node in xpath(tree):
+            text = node_text(node)
+            if len(text) >= min_length:
+                return text
+    return "N/A"
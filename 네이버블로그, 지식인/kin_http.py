@@ -0,0 +1,179 @@
+"""
+네이버 지식iN 질문 페이지 HTTP 추출 (브라우저 없이 qna/detail.naver 직접 요청)
+
+- 검색 결과 URL 을 kin.naver.com/qna/detail.naver?d1id=&dirId=&docId= 형태로 정리해서
+  aiohttp 커넥션 풀로 동시에 요청
+- lxml + 미리 컴파일한 XPath 로 제목 / 질문 본문 / 작성일 / 답변(본문, 날짜) 추출
+  (선택자 우선순위는 crawl_naver_kin 의 BeautifulSoup → Selenium 순서와 같음)
+- 레코드는 기존 CSV 컬럼(keyword, title, content, date, url)에 answers / answer_count 가 더 붙은 형태
+  (키워드별 CSV 에는 기존 컬럼만 저장)
+- 요청 실패 / 질문 본문을 못 찾은 페이지는 failed 로 돌려줘서 Selenium 경로로 다시 처리
+
+사용 예:
+    records, failed = crawl_kin_http(href_list, keyword, concurrency=16)
+"""
+import asyncio
+import re
+import time
+from urllib.parse import parse_qs, urlencode, urlparse
+
+from lxml import etree, html as lxml_html
+
+from http_fetch import HTTP_CONCURRENCY, create_session, fetch_html, first_text, selector_to_xpath
+
+BASE_URL = 'https://kin.naver.com'
+DETAIL_PATH = '/qna/detail.naver'
+DETAIL_PARAMS = ('d1id', 'dirId', 'docId')
+DATE_PATTERN = re.compile(r'(\d{4})\.\s*(\d{1,2})\.\s*(\d{1,2})')
+
+# crawl_naver_kin 과 같은 선택자 / 같은 우선순위
+TITLE_SELECTORS = ['.title', '.question-title', '.c-heading__title', 'h2.title', 'h2', 'h1']
+QUESTION_SELECTORS = ['.questionDetail', '.c-heading__content', '.question-content', '.content', '.question_text']
+DATE_XPATHS = [
+    # div.userInfo.userInfo__bullet > span:nth-child(3) / (2)
+    etree.XPath(selector_to_xpath('div.userInfo.userInfo__bullet') + '/*[3][self::span]'),
+    etree.XPath(selector_to_xpath('div.userInfo.userInfo__bullet') + '/*[2][self::span]'),
+] + [etree.XPath(selector_to_xpath(s)) for s in ['.c-userinfo__date', '.question-date', '.date', '.c-heading__date']]
+
+PAGE_TITLE_XPATH = etree.XPath('//head/title')
+TITLE_XPATHS = [etree.XPath(selector_to_xpath(s)) for s in TITLE_SELECTORS]
+QUESTION_XPATHS = [etree.XPath(selector_to_xpath(s)) for s in QUESTION_SELECTORS]
+ANSWER_XPATH = etree.XPath(selector_to_xpath('._answer'))
+ANSWER_BODY_XPATHS = [etree.XPath('.' + selector_to_xpath(s)) for s in ['.se-main-container', '._endContentsText']]
+ANSWER_DATE_XPATHS = [etree.XPath('.' + selector_to_xpath('.c-heading-answer__content-date'))]
+
+
+def to_kin_detail_url(url, base_url=BASE_URL):
+    """qna/detail.naver / qna/question.naver URL → d1id, dirId, docId 만 남긴 detail URL (docId 가 없으면 None)"""
+    parsed = urlparse(url or '')
+    if 'kin.naver.com' not in parsed.netloc or '/qna/' not in parsed.path:
+        return None
+    qs = parse_qs(parsed.query)
+    if not qs.get('docId'):
+        return None
+    params = {key: qs[key][0] for key in DETAIL_PARAMS if qs.get(key)}
+    return f"{base_url}{DETAIL_PATH}?{urlencode(params)}"
+
+
+def clean_kin_date(date):
+    """'작성일 2021.03.04 12:00' → '2021.03.04.' (Selenium 경로와 같은 형식)"""
+    match = DATE_PATTERN.search(date)
+    if match:
+        return f"{match.group(1)}.{match.group(2)}.{match.group(3)}."
+    return date.replace('작성일', '').strip() or "N/A"
+
+
+def parse_kin_page(page_html):
+    """
+    지식iN 질문 페이지 HTML 에서 질문 / 답변 추출
+
+    Returns:
+        {'title', 'content', 'date', 'answers': [{'content', 'date'}, ...]} (못 찾은 항목은 "N/A")
+    """
+    if isinstance(page_html, str):
+        page_html = page_html.encode('utf-8')
+    tree = lxml_html.fromstring(page_html)
+
+    # 제목: <title> 에서 ' : 지식iN' 을 뗀 것 → 본문 제목 요소
+    title = "N/A"
+    for node in PAGE_TITLE_XPATH(tree):
+        text = node.text_content().replace(': 지식iN', '').replace('지식iN', '').strip()
+        if text:
+            title = text
+            break
+    if title == "N/A":
+        title = first_text(tree, TITLE_XPATHS)
+
+    # 답변 영역을 먼저 떼어서 파싱 (질문 선택자 '.content' 등이 답변까지 잡지 않도록)
+    answers = []
+    for node in ANSWER_XPATH(tree):
+        answer_content = first_text(node, ANSWER_BODY_XPATHS)
+        answer_date = clean_kin_date(first_text(node, ANSWER_DATE_XPATHS))
+        node.drop_tree()
+        if answer_content != "N/A":
+            answers.append({'content': answer_content, 'date': answer_date})
+
+    content = first_text(tree, QUESTION_XPATHS)
+    date = clean_kin_date(first_text(tree, DATE_XPATHS))
+    return {'title': title, 'content': content, 'date': date, 'answers': answers}
+
+
+def make_kin_record(keyword, url, parsed):
+    """수집 조건(crawl_naver_kin 과 같음)을 통과하면 레코드, 아니면 None"""
+    if parsed['content'] == "N/A" or not parsed['content'].strip():
+        return None
+    if parsed['title'] == "N/A" or not parsed['title'].strip():
+        return None
+    return {
+        'keyword': keyword,
+        'title': parsed['title'],
+        'content': parsed['content'],
+        'date': parsed['date'],
+        'url': url,
+        'answers': parsed['answers'],
+        'answer_count': len(parsed['answers']),
+    }
+
+
+async def fetch_kin_pages(urls, keyword, concurrency=HTTP_CONCURRENCY, base_url=BASE_URL, on_record=None):
+    """
+    지식iN URL 목록을 HTTP 로 동시에 추출 (base_url 은 오프라인 벤치마크에서 가짜 서버로 바꿀 때만)
+    on_record 를 주면 레코드가 하나 끝날 때마다 호출 (RecordSink.write 등)
+
+    Returns:
+        (records, failed) - records: {순번: 레코드}, failed: Selenium 으로 다시 시도할 (순번, URL) 리스트
+    """
+    records, failed = {}, []
+    semaphore = asyncio.Semaphore(concurrency)
+    session = create_session(concurrency, referer='https://kin.naver.com/')
+
+    async def one(order, url):
+        detail_url = to_kin_detail_url(url, base_url)
+        if detail_url is None:
+            failed.append((order, url))
+            return
+        async with semaphore:
+            page_html = await fetch_html(session, detail_url, label=url[:60])
+        if page_html is None:
+            failed.append((order, url))
+            return
+        try:
+            record = make_kin_record(keyword, url, parse_kin_page(page_html))
+        except (etree.ParserError, ValueError):
+            record = None
+        if record is None:
+            failed.append((order, url))
+            return
+        records[order] = record
+        if on_record is not None:
+            on_record(record)
+
+    try:
+        await asyncio.gather(*(one(order, url) for order, url in enumerate(urls)))
+    finally:
+        await session.close()
+    return records, sorted(failed)
+
+
+def crawl_kin_http(urls, keyword, concurrency=HTTP_CONCURRENCY, on_record=None):
+    """
+    지식iN 질문 페이지 HTTP 추출
+
+    Args:
+        urls: 지식iN 질문 URL 리스트
+        keyword: 레코드에 함께 저장할 검색 키워드
+        concurrency: 동시 HTTP 요청 수
+        on_record: 레코드가 하나 끝날 때마다 호출할 함수 (선택)
+
+    Returns:
+        (레코드 리스트(입력 URL 순서), Selenium 으로 다시 시도할 URL 리스트)
+    """
+    if not urls:
+        return [], []
+    started = time.perf_counter()
+    records, failed = asyncio.run(fetch_kin_pages(urls, keyword, concurrency, on_record=on_record))
+    elapsed = time.perf_counter() - started
+    answers = sum(record['answer_count'] for record in records.values())
+    print(f"⚡ HTTP 추출: 질문 {len(records)}건 (답변 {answers}건) / 실패 {len(failed)}건 "
+          f"({elapsed:.1f}초, {len(urls) / max(elapsed, 1e-9) * 60:.0f} 페이지/분)")
+    return [records[order] for order in sorted(records)], [url for _, url in failed]
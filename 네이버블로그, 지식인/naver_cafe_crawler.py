@@ -0,0 +1,634 @@
+"""
+네이버 카페 게시판 크롤러 (네이버/naver_Cafe_ver2_1.ipynb 를 모듈 + CLI 로 옮김)
+
+노트북은 로그인한 Chrome 하나로 목록 페이지 → 글 페이지를 차례로 열고 매번 time.sleep 으로 기다려서
+글 하나에 몇 초씩 걸렸고, 끝까지 돌아야 CSV 가 생겼다.
+
+1) 한 번만 로그인 (아이디 / 비밀번호를 주면 자동 입력, 캡차 / 2단계 인증은 창에서 직접 처리)하고 쿠키를 꺼냄
+2) 게시판(menu)별 목록 페이지에서 글 번호를 모음 - 저장된 체크포인트 이하 번호만 나오는 페이지에서 멈춤
+   (페이지 오류 / --max-pages 로 그 전에 멈추면 체크포인트는 그대로 두고 처리한 구간만 따로 기록 → 다음 실행에서 이어서)
+3) 글 번호를 헤드리스 Chrome 워커 풀(blog_driver_pool 과 같은 spawn 프로세스 + 공유 큐)에 나눠 주고,
+   워커마다 Chrome 을 (다시) 띄울 때 같은 로그인 쿠키를 넣음 (ManagedDriver on_start)
+4) 결과는 메인 프로세스 하나에서만 RecordSink(JSONL)에 바로 추가하고, 게시판별로 "여기까지는 모두 처리"한
+   마지막 글 번호를 체크포인트 파일에 저장 → 중단 / 다음 실행 때 새 글만 수집
+5) 끝나면 노트북과 같은 CSV(board, title, content, date + keyword, url)로 정리
+
+실행:
+    export NAVER_ID=... NAVER_PW=...
+    python naver_cafe_crawler.py --club-id 28211985 --cafe itsokssd --workers 4
+    python naver_cafe_crawler.py --club-id 28211985 --cafe itsokssd --menus 3 7   # 게시판 지정 (기본 0 = 전체글)
+"""
+import argparse
+import functools
+import json
+import multiprocessing as mp
+import os
+import queue
+import re
+import time
+import traceback
+from datetime import datetime
+
+from selenium.common.exceptions import TimeoutException  # type: ignore
+from selenium.webdriver.common.by import By  # type: ignore
+from selenium.webdriver.support import expected_conditions as EC  # type: ignore
+from selenium.webdriver.support.ui import WebDriverWait  # type: ignore
+
+from driver_factory import ManagedDriver
+from record_sink import RecordSink, compact_to_csv
+
+CAFE_NAME = "itsokssd"       # 카페 주소 이름 (https://cafe.naver.com/itsokssd) - CSV keyword 컬럼 값
+CLUB_ID = "28211985"         # itsokssd 카페 clubid
+MENU_IDS = [0]               # 수집할 게시판 번호 (0 = 전체글보기)
+LOGIN_URL = "https://nid.naver.com/nidlogin.login"
+COOKIE_URL = "https://www.naver.com/robots.txt"   # add_cookie 전에 열어 둘 .naver.com 페이지 (가벼운 파일)
+LIST_URL = "https://cafe.naver.com/f-e/cafes/{club_id}/menus/{menu_id}?viewType=L&page={page}&size={size}"
+ARTICLE_URL = "https://cafe.naver.com/f-e/cafes/{club_id}/articles/{article_id}"
+ARTICLE_ID_PATTERN = re.compile(r'(?:articles/|[?&](?:articleid|articleId)=)(\d+)')
+
+NUM_WORKERS = 4          # 동시에 띄우는 헤드리스 Chrome(프로세스) 수
+PAGE_SIZE = 50           # 목록 페이지당 글 수
+PAGE_TIMEOUT = 10        # 페이지 하나에서 iframe / 본문 요소를 기다리는 최대 시간(초)
+LIST_RETRIES = 2         # 목록 페이지 하나를 읽는 최대 시도 수 (모두 실패하면 목록 수집을 미완료로 멈춤)
+LOGIN_TIMEOUT = 120      # 로그인(캡차 / 2단계 인증 직접 처리 포함)을 기다리는 최대 시간(초)
+REPORT_EVERY = 100       # 몇 글마다 처리량을 출력할지
+
+SKIP_BOARDS = [
+    "가입인사",
+    "공지사항",
+]
+
+# 게시판명 / 제목 / 날짜 / 본문 선택자 (노트북과 같은 순서, 본문은 스마트에디터 → 구형 에디터 → body)
+BOARD_SELECTORS = ['a.link_board', 'span.category', 'span.brd_name', 'a#linkBoard']
+TITLE_SELECTORS = ['.title_text']
+DATE_SELECTORS = ['.date']
+CONTENT_SELECTORS = ['.se-main-container', '#tbody', 'body']
+
+# 제목이나 본문 영역 중 하나라도 나타나면 글 페이지 준비 완료로 봄
+ARTICLE_READY = EC.any_of(
+    *(EC.presence_of_element_located((By.CSS_SELECTOR, selector))
+      for selector in ['.title_text', '.se-main-container', '#tbody'])
+)
+# 목록 페이지 준비 완료 = 글 링크가 뜨거나, "게시글이 없습니다" 안내가 뜸 (마지막 페이지 이후)
+# 둘 다 안 뜨면 느리게 뜨는 페이지일 수 있으므로 게시판 끝으로 보지 않음
+LIST_EMPTY_XPATH = "//*[contains(text(), '게시글이 없습니다') or contains(text(), '등록된 글이 없습니다')]"
+LIST_READY = EC.any_of(
+    EC.presence_of_element_located((By.CSS_SELECTOR, 'a.article')),
+    EC.presence_of_element_located((By.XPATH, LIST_EMPTY_XPATH)),
+)
+
+OUT_DIR = f"{CAFE_NAME}_cafe_result"
+RECORDS_FILE = "records.jsonl"           # out_dir 안의 파일들
+CHECKPOINT_FILE = "checkpoint.json"
+ERROR_LOG_FILE = "crawl_errors.log"
+CSV_COLUMNS = ['keyword', 'board', 'title', 'content', 'date', 'url']
+
+
+def log_error(error_log_file, stage, msg="", url=None, exc=None):
+    """에러 로그 파일에 기록하는 함수 (exc 를 주면 traceback 까지)"""
+    ts = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    lines = [f"[{ts}] [{stage}]"]
+    if url:
+        lines.append(f"url={url}")
+    if msg:
+        lines.append(f"msg={msg}")
+    if exc is not None:
+        lines.append("traceback:")
+        lines.append(''.join(traceback.format_exception(type(exc), exc, exc.__traceback__)))
+    with open(error_log_file, "a", encoding="utf-8") as f:
+        f.write(" | ".join(lines) + "\n")
+
+
+# ================================
+# 로그인 / 쿠키
+# ================================
+def _logged_in(driver):
+    return any(cookie.get('name') == 'NID_AUT' for cookie in driver.get_cookies())
+
+
+def naver_login(driver, user_id=None, password=None, timeout=LOGIN_TIMEOUT):
+    """
+    네이버 로그인. 아이디 / 비밀번호가 있으면 입력 후 로그인 버튼을 누르고,
+    없거나 캡차 / 2단계 인증이 뜨면 창에서 직접 로그인할 때까지 timeout 초 기다림.
+
+    Returns:
+        로그인 성공 여부 (NID_AUT 쿠키 확인)
+    """
+    driver.get(LOGIN_URL)
+    if user_id and password:
+        # 값은 인자로 넘김 (비밀번호에 따옴표가 있어도 스크립트가 깨지지 않게)
+        driver.execute_script("document.getElementsByName('id')[0].value = arguments[0]", user_id)
+        time.sleep(0.5)
+        driver.execute_script("document.getElementsByName('pw')[0].value = arguments[0]", password)
+        time.sleep(0.5)
+        driver.find_element(By.ID, "log.login").click()
+    else:
+        print(f"🔐 브라우저 창에서 직접 로그인하세요 (최대 {timeout}초 대기)")
+    try:
+        WebDriverWait(driver, timeout).until(_logged_in)
+    except TimeoutException:
+        return False
+    print("✅ 로그인 완료!")
+    return True
+
+
+def apply_cookies(driver, cookies):
+    """
+    로그인 쿠키를 새로 띄운 Chrome 에 넣음 (ManagedDriver on_start 로 사용 → 재시작 때마다 다시 넣음)
+
+    CDP Network.setCookies 는 페이지 이동 없이 모든 도메인 쿠키를 한 번에 넣고,
+    CDP 를 못 쓰면 .naver.com 페이지를 열고 add_cookie 로 넣음.
+    """
+    cdp_cookies = []
+    for cookie in cookies:
+        cdp_cookie = {key: cookie[key] for key in ('name', 'value', 'domain', 'path', 'secure', 'httpOnly')
+                      if key in cookie}
+        if 'expiry' in cookie:
+            cdp_cookie['expires'] = cookie['expiry']
+        cdp_cookies.append(cdp_cookie)
+    try:
+        driver.execute_cdp_cmd('Network.setCookies', {'cookies': cdp_cookies})
+        return
+    except Exception:
+        pass
+    driver.get(COOKIE_URL)
+    for cookie in cookies:
+        try:
+            driver.add_cookie({key: cookie[key] for key in ('name', 'value', 'domain', 'path', 'secure', 'expiry')
+                               if key in cookie})
+        except Exception:
+            continue  # 현재 페이지와 도메인이 안 맞는 쿠키 (cafe.naver.com 전용 등)
+
+
+# ================================
+# 목록 / 글 페이지
+# ================================
+def article_id_from_href(href):
+    """글 링크에서 글 번호 (없으면 None)"""
+    match = ARTICLE_ID_PATTERN.search(href or '')
+    return int(match.group(1)) if match else None
+
+
+def article_url(club_id, article_id):
+    return ARTICLE_URL.format(club_id=club_id, article_id=article_id)
+
+
+def _wait_cafe_page(driver, ready, timeout):
+    """
+    cafe_main iframe 또는 ready 요소가 뜰 때까지 기다렸다가, iframe 이면 들어가서 ready 요소를 기다림
+    (신형 f-e 화면은 iframe 이 없으므로 iframe 만 기다리지 않음). 끝까지 안 뜨면 False
+    """
+    try:
+        WebDriverWait(driver, timeout).until(
+            EC.any_of(EC.presence_of_element_located((By.ID, 'cafe_main')), ready))
+        if driver.find_elements(By.ID, 'cafe_main'):
+            driver.switch_to.frame('cafe_main')
+            WebDriverWait(driver, timeout).until(ready)
+        return True
+    except TimeoutException:
+        return False
+
+
+def _read_list_page(driver, url, timeout):
+    """
+    목록 페이지 하나의 글 번호 (글 없음 안내가 뜬 페이지는 빈 리스트 = 마지막 페이지 이후)
+    글 링크도 안내도 timeout 안에 안 뜨면 TimeoutException → list_article_ids 가 다시 시도 / 미완료로 멈춤
+    """
+    try:
+        driver.get(url)
+        if not _wait_cafe_page(driver, LIST_READY, timeout):
+            raise TimeoutException(f"목록 페이지가 {timeout}초 안에 뜨지 않음")
+        page_ids = []
+        for tag in driver.find_elements(By.CSS_SELECTOR, "a.article"):
+            article_id = article_id_from_href(tag.get_attribute("href"))
+            if article_id is not None:
+                page_ids.append(article_id)
+        return page_ids
+    finally:
+        driver.switch_to.default_content()
+
+
+def list_article_ids(driver, club_id, menu_id, stop_at=0, max_pages=None, timeout=PAGE_TIMEOUT,
+                     error_log_file=None, is_done=None, retries=LIST_RETRIES):
+    """
+    게시판 목록을 1페이지(최신)부터 넘기면서 stop_at 보다 큰 글 번호를 모음
+
+    페이지의 글 번호가 모두 stop_at 이하이거나(지난번에 여기까지 처리), stop_at 보다 큰 번호가 더 없으면
+    (마지막 페이지 이후) 끝까지 읽은 것으로 봄. 상단 고정 공지는 번호가 작아도 다른 글과 같이 나오므로
+    페이지 단위로 판단함. is_done(article_id) 이 True 인 번호(지난 미완료 실행에서 처리한 구간)는 빼고,
+    그런 번호만 있는 페이지는 max_pages 에 세지 않음 → 페이지 상한이 있어도 실행마다 더 오래된 글로 나아감.
+
+    Returns:
+        (글 번호 리스트 (최신순), floor) - floor 보다 큰 글은 모두 목록에 잡혔다는 뜻
+        (stop_at / 게시판 끝까지 닿으면 stop_at, 목록 페이지를 retries 번 모두 읽지 못했거나 max_pages 에
+        걸려 멈추면 마지막으로 읽은 페이지의 가장 오래된 글 번호, 1페이지도 못 읽었으면 None)
+    """
+    found = {}
+    listed = set()
+    floor = None
+    page = 1
+    counted = 0
+    while True:
+        if max_pages is not None and counted >= max_pages:
+            print(f"  ⏹️ 게시판 {menu_id}: 목록 페이지 상한 {max_pages}에 걸려 멈춤")
+            return list(found), floor
+        url = LIST_URL.format(club_id=club_id, menu_id=menu_id, page=page, size=PAGE_SIZE)
+        page_ids = None
+        for attempt in range(1, retries + 1):
+            try:
+                page_ids = _read_list_page(driver, url, timeout)
+                break
+            except Exception as e:
+                if error_log_file:
+                    log_error(error_log_file, "URL 수집", msg=f"목록 페이지 오류 p={page} ({attempt}/{retries})",
+                              url=url, exc=e)
+        if page_ids is None:
+            print(f"  ⚠️ 게시판 {menu_id} {page}페이지를 읽지 못해 목록 수집을 멈춤 (다음 실행에서 이어서)")
+            return list(found), floor
+
+        above = [article_id for article_id in page_ids if article_id > stop_at and article_id not in listed]
+        listed.update(above)
+        new_ids = [article_id for article_id in above if not (is_done and is_done(article_id))]
+        for article_id in new_ids:
+            found[article_id] = True
+        print(f"  📄 게시판 {menu_id} {page}페이지: 새 글 {len(new_ids)}개 (누적 {len(found)}개)")
+        if not above:
+            return list(found), stop_at
+        floor = page_ids[-1]  # 고정 공지는 페이지 위쪽에 나오므로 마지막 글이 이 페이지의 가장 오래된 일반 글
+        if new_ids:
+            counted += 1
+        page += 1
+
+
+def _first_text(driver, selectors):
+    """선택자를 순서대로 시도해서 처음으로 비어 있지 않은 텍스트 (없으면 None)"""
+    for selector in selectors:
+        for elem in driver.find_elements(By.CSS_SELECTOR, selector):
+            try:
+                text = elem.text.strip()
+            except Exception:
+                continue
+            if text:
+                return text
+    return None
+
+
+def extract_cafe_article(driver, url, timeout=PAGE_TIMEOUT):
+    """
+    카페 글 하나의 (board, title, content, date) 추출
+
+    cafe_main iframe 이 뜨면 바로 전환하고, 제목 / 본문 요소가 나타날 때까지만 기다림 (고정 sleep 없음)
+    삭제 / 권한 없는 글은 요소가 안 떠서 제목 / 본문 없음으로 처리됨
+    """
+    driver.get(url)
+    try:
+        _wait_cafe_page(driver, ARTICLE_READY, timeout)
+        board = _first_text(driver, BOARD_SELECTORS)
+        title = _first_text(driver, TITLE_SELECTORS)
+        date = _first_text(driver, DATE_SELECTORS)
+        content = _first_text(driver, CONTENT_SELECTORS)
+    finally:
+        driver.switch_to.default_content()
+    return board, title, content, date
+
+
+def make_record(keyword, menu_id, article_id, url, board, title, content, date):
+    """
+    수집 조건을 통과하면 (레코드, None), 아니면 (None, 건너뛴 이유) 반환
+    """
+    if board in SKIP_BOARDS:
+        return None, f"{board} 게시판 건너뜀"
+    # 제목 + 내용이 있는 경우만 사용
+    if not title or not content:
+        return None, "제목 / 본문 없음 (삭제 / 권한 없는 글)"
+    return {'keyword': keyword, 'board': board, 'title': title, 'content': content, 'date': date, 'url': url,
+            'menu_id': menu_id, 'article_id': article_id}, None
+
+
+# ================================
+# 체크포인트
+# ================================
+class BoardCheckpoint:
+    """
+    게시판별 "이 번호까지는 모두 처리" 한 마지막 글 번호 (JSON 파일)
+
+    워커들이 순서 없이 끝내므로 끝난 번호를 모아 두고, 오래된 번호부터 빈틈없이 끝난 데까지만 올림.
+    오류가 난 글은 끝난 것으로 치지 않아서 다음 실행 때 다시 목록에 잡힘.
+
+    목록을 체크포인트 / 게시판 끝까지 읽지 못한 실행(페이지 오류, max_pages)에서는 그 아래에 아직 목록에
+    안 잡힌 글이 있으므로 last_article_id 를 올리지 않고, 최신 글부터 빈틈없이 끝난 구간을 done_range
+    [low, high] 로만 기록함. 다음 실행은 이 구간을 건너뛰며 계속 내려가고, 목록을 끝까지 읽어서
+    구간 아래가 모두 끝나면 last_article_id 를 high 까지 올림.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.boards = {}
+        if os.path.exists(path):
+            try:
+                with open(path, encoding='utf-8') as f:
+                    self.boards = json.load(f)
+            except (OSError, json.JSONDecodeError) as e:
+                print(f"⚠️ 체크포인트 파일을 읽지 못했습니다 ({path}): {e} - 처음부터 수집")
+        self._pending = {}   # board_key → 아직 안 끝난 번호 (오름차순)
+        self._done = {}      # board_key → 끝났지만 앞 번호가 안 끝나서 기다리는 번호
+        self._floor = {}     # board_key → 이번 실행 목록의 floor (이보다 큰 글은 모두 목록에 잡힘)
+        self._top = {}       # board_key → 이번 실행 목록의 가장 최신 번호
+
+    @staticmethod
+    def key(club_id, menu_id):
+        return f"{club_id}/{menu_id}"
+
+    def last_article_id(self, club_id, menu_id):
+        return self.boards.get(self.key(club_id, menu_id), {}).get('last_article_id', 0)
+
+    def done_range(self, club_id, menu_id):
+        """지난 미완료 실행에서 처리한 구간 [low, high] (없으면 None)"""
+        return self.boards.get(self.key(club_id, menu_id), {}).get('done_range')
+
+    def is_done(self, club_id, menu_id, article_id):
+        done_range = self.done_range(club_id, menu_id)
+        return bool(done_range) and done_range[0] <= article_id <= done_range[1]
+
+    def start(self, club_id, menu_id, article_ids, floor=0):
+        """
+        이번 실행에서 목록에 잡힌 번호 등록 (이미 저장된 글도 포함해서 mark_done, done_range 안의 번호는 빼고)
+        floor 는 list_article_ids 가 돌려준 값 (last_article_id 이하면 목록을 끝까지 읽은 것)
+        """
+        key = self.key(club_id, menu_id)
+        done_range = self.done_range(club_id, menu_id)
+        self._pending[key] = sorted(article_ids)
+        self._done[key] = set()
+        self._floor[key] = floor
+        self._top[key] = max(list(article_ids) + ([done_range[1]] if done_range else []), default=None)
+        self._advance(key)
+
+    def mark_done(self, club_id, menu_id, article_id):
+        key = self.key(club_id, menu_id)
+        self._done[key].add(article_id)
+        self._advance(key)
+
+    def _advance(self, key):
+        floor = self._floor[key]
+        if floor is not None and floor <= self.boards.get(key, {}).get('last_article_id', 0):
+            self._advance_last(key)
+        else:
+            self._advance_range(key)
+
+    def _advance_last(self, key):
+        """목록을 끝까지 읽은 실행: 오래된 번호부터 빈틈없이 끝난 데까지 last_article_id 를 올림"""
+        pending, done = self._pending[key], self._done[key]
+        entry = self.boards.get(key, {})
+        last = None
+        while pending and pending[0] in done:
+            last = pending.pop(0)
+            done.discard(last)
+        done_range = entry.get('done_range')
+        if done_range and (not pending or pending[0] > done_range[1]):
+            # done_range 아래 번호가 모두 끝남 → 구간까지 한 번에 올림
+            last = max(last or 0, done_range[1])
+        if last is not None and last > entry.get('last_article_id', 0):
+            self.boards[key] = {'last_article_id': last, 'updated': datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
+            if done_range and done_range[1] > last:
+                self.boards[key]['done_range'] = done_range
+            self.save()
+
+    def _advance_range(self, key):
+        """목록이 중간에 멈춘 실행: 최신 번호부터 빈틈없이 끝난 구간을 done_range 로 기록 (last_article_id 는 그대로)"""
+        pending, done = self._pending[key], self._done[key]
+        entry = self.boards.get(key, {})
+        low = None
+        while pending and pending[-1] in done:
+            low = pending.pop()
+            done.discard(low)
+        floor = self._floor[key]
+        if floor is None:
+            return  # 목록을 한 페이지도 읽지 못함
+        if low is not None:
+            # floor 아래 번호(고정 공지)는 목록이 이어진 구간이 아니므로 구간을 floor 밑으로 넓히지 않음
+            low = max(low, floor)
+        old_range = entry.get('done_range')
+        if old_range:
+            if floor > old_range[1] or (pending and pending[-1] > old_range[1]):
+                return  # 아직 지난 구간까지 이어지지 않음 (끝난 글은 RecordSink 에 있어서 다시 열지 않음)
+            low = old_range[0] if low is None else min(low, old_range[0])
+        if low is None:
+            return
+        done_range = [low, self._top[key]]
+        if done_range != old_range:
+            self.boards[key] = {'last_article_id': entry.get('last_article_id', 0), 'done_range': done_range,
+                                'updated': datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
+            self.save()
+
+    def save(self):
+        tmp_path = self.path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.boards, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, self.path)
+
+
+# ================================
+# 워커 풀
+# ================================
+def _worker(worker_id, cookies, keyword, task_queue, result_queue, headless, timeout):
+    """
+    워커 프로세스: 로그인 쿠키를 넣은 헤드리스 Chrome 으로 큐에서 (menu_id, 글 번호, URL) 을 꺼내 처리.
+    None 을 받으면 종료. 결과는 (menu_id, 글 번호, URL, 레코드, 메시지, 걸린 시간, 워커 번호).
+    """
+    driver = ManagedDriver(headless=headless, implicit_wait=0, label=f"워커 {worker_id}",
+                           on_start=functools.partial(apply_cookies, cookies=cookies))
+    try:
+        driver.driver  # Chrome 실행 실패는 여기서 바로 알림
+    except Exception as e:
+        result_queue.put((None, None, None, None, f"워커 {worker_id} Chrome 실행 실패: {e}", 0.0, worker_id))
+        return
+    try:
+        while True:
+            task = task_queue.get()
+            if task is None:
+                break
+            menu_id, article_id, url = task
+            started = time.perf_counter()
+            try:
+                board, title, content, date = extract_cafe_article(driver, url, timeout)
+                if 'nidlogin' in driver.current_url:
+                    record, message = None, "오류 발생: 로그인 세션 만료"
+                else:
+                    record, message = make_record(keyword, menu_id, article_id, url, board, title, content, date)
+            except Exception as e:
+                # Selenium 예외 메시지는 스택트레이스가 붙어 길어서 첫 줄만
+                first_line = (str(e).strip().splitlines() or [repr(e)])[0]
+                record, message = None, f"오류 발생: {first_line[:100]}"
+            result_queue.put((menu_id, article_id, url, record, message, time.perf_counter() - started, worker_id))
+    finally:
+        driver.quit()
+
+
+def crawl_articles(tasks, cookies, keyword, on_result, num_workers=NUM_WORKERS, headless=True,
+                   timeout=PAGE_TIMEOUT):
+    """
+    (menu_id, 글 번호, URL) 목록을 로그인 쿠키를 공유하는 헤드리스 드라이버 풀로 병렬 추출
+
+    on_result(menu_id, article_id, url, record, message) 는 메인 프로세스에서만 호출 (단일 writer)
+
+    Returns:
+        처리한 글 수
+    """
+    if not tasks:
+        return 0
+    num_workers = max(1, min(num_workers, len(tasks)))
+
+    # Chrome 을 띄우는 자식 프로세스는 fork 보다 spawn 이 안전 (Windows 와 동작도 같음)
+    ctx = mp.get_context('spawn')
+    task_queue = ctx.Queue()
+    result_queue = ctx.Queue()
+    for task in tasks:
+        task_queue.put(task)
+    for _ in range(num_workers):
+        task_queue.put(None)
+
+    workers = [
+        ctx.Process(target=_worker, args=(i + 1, cookies, keyword, task_queue, result_queue, headless, timeout),
+                    daemon=True)
+        for i in range(num_workers)
+    ]
+    for worker in workers:
+        worker.start()
+    print(f"🚀 드라이버 풀 시작: 워커 {num_workers}개, 글 {len(tasks)}개")
+
+    done = 0
+    page_seconds = 0.0
+    started = time.perf_counter()
+    try:
+        while done < len(tasks):
+            try:
+                menu_id, article_id, url, record, message, elapsed, worker_id = result_queue.get(timeout=timeout * 3)
+            except queue.Empty:
+                if not any(worker.is_alive() for worker in workers):
+                    print(f"⚠️  모든 워커가 종료되어 중단합니다. ({done}/{len(tasks)} 처리)")
+                    break
+                continue
+            if article_id is None:
+                print(f"  ❌ {message}")
+                continue
+
+            done += 1
+            page_seconds += elapsed
+            on_result(menu_id, article_id, url, record, message)
+            if record is not None:
+                print(f"[{done}/{len(tasks)}] ✅ {record['title'][:30]}... (워커 {worker_id}, {elapsed:.1f}초)")
+            else:
+                print(f"[{done}/{len(tasks)}] ⏭️  {message} ({url})")
+
+            if done % REPORT_EVERY == 0:
+                minutes = (time.perf_counter() - started) / 60
+                print(f"  📈 처리량: {done / minutes:.1f} 글/분")
+    finally:
+        for worker in workers:
+            worker.join(timeout=5)
+            if worker.is_alive():
+                worker.terminate()
+
+    minutes = max(time.perf_counter() - started, 1e-9) / 60
+    print(f"\n📊 {done}글 / {minutes * 60:.1f}초 → {done / minutes:.1f} 글/분 "
+          f"(워커 {num_workers}개, 글당 평균 {page_seconds / max(done, 1):.2f}초)")
+    return done
+
+
+def crawl_cafe(club_id=CLUB_ID, menu_ids=MENU_IDS, keyword=CAFE_NAME, out_dir=OUT_DIR, num_workers=NUM_WORKERS,
+               user_id=None, password=None, login_headless=False, headless=True, max_pages=None,
+               timeout=PAGE_TIMEOUT):
+    """
+    카페 게시판들을 로그인 1번 + 헤드리스 드라이버 풀로 수집 (체크포인트 이후 새 글만)
+
+    Args:
+        club_id: 카페 clubid
+        menu_ids: 게시판 번호 목록 (0 = 전체글보기)
+        keyword: CSV keyword 컬럼 값 (카페 이름)
+        out_dir: 레코드 / 체크포인트 / 에러 로그 / CSV 저장 폴더
+        num_workers: 헤드리스 Chrome 워커 수
+        user_id, password: 네이버 계정 (없으면 창에서 직접 로그인)
+        login_headless: 로그인도 헤드리스로 (아이디 / 비밀번호 자동 입력이 통할 때만)
+        headless: False 면 워커 브라우저 창을 띄움 (디버깅용)
+        max_pages: 게시판당 목록 페이지 상한 (None 이면 새 글이 없을 때까지)
+
+    Returns:
+        CSV 행 수
+    """
+    os.makedirs(out_dir, exist_ok=True)
+    error_log_file = os.path.join(out_dir, ERROR_LOG_FILE)
+    checkpoint = BoardCheckpoint(os.path.join(out_dir, CHECKPOINT_FILE))
+    records_file = os.path.join(out_dir, RECORDS_FILE)
+
+    with RecordSink(records_file, columns=CSV_COLUMNS) as sink:
+        # ===== 1. 로그인 + 글 번호 수집 (로그인한 Chrome 하나) =====
+        print("웹드라이버를 실행하고 네이버에 로그인")
+        # 재시작하면 로그인이 풀리므로 목록 수집 동안에는 재시작하지 않음
+        login_driver = ManagedDriver(headless=login_headless, implicit_wait=0, restart_every=0, label="로그인 / 목록")
+        try:
+            if not naver_login(login_driver, user_id, password):
+                log_error(error_log_file, "로그인", msg="로그인 실패 / 시간 초과", url=login_driver.current_url)
+                print("❌ 로그인 실패 - 중단합니다.")
+                return 0
+
+            tasks = []
+            for menu_id in menu_ids:
+                last_id = checkpoint.last_article_id(club_id, menu_id)
+                done_range = checkpoint.done_range(club_id, menu_id)
+                print(f"\n🔎 게시판 {menu_id} 글 번호 수집 (체크포인트: {last_id or '없음'}"
+                      + (f", 처리한 구간 {done_range[0]}~{done_range[1]} 건너뜀)" if done_range else ")"))
+                article_ids, floor = list_article_ids(
+                    login_driver, club_id, menu_id, last_id, max_pages, timeout, error_log_file,
+                    is_done=functools.partial(checkpoint.is_done, club_id, menu_id))
+                checkpoint.start(club_id, menu_id, article_ids, floor)
+                todo = []
+                for article_id in article_ids:
+                    if sink.saved(url=article_url(club_id, article_id)):
+                        # 중단된 실행에서 이미 저장한 글은 다시 열지 않음
+                        checkpoint.mark_done(club_id, menu_id, article_id)
+                    else:
+                        todo.append(article_id)
+                print(f"🔗 게시판 {menu_id}: 새 글 {len(article_ids)}개 중 {len(todo)}개 수집 예정")
+                tasks += [(menu_id, article_id, article_url(club_id, article_id)) for article_id in todo]
+            # 카페 페이지에 있을 때 꺼내서 .naver.com 로그인 쿠키와 cafe.naver.com 쿠키를 같이 넘김
+            cookies = login_driver.get_cookies()
+        finally:
+            login_driver.quit()
+
+        # ===== 2. 본문 크롤링 (헤드리스 워커 풀, 기록은 여기서만) =====
+        def on_result(menu_id, article_id, url, record, message):
+            if record is not None:
+                sink.write(record)
+            elif message.startswith("오류 발생"):
+                log_error(error_log_file, "본문 크롤링", msg=message, url=url)
+                return  # 체크포인트를 넘기지 않음 → 다음 실행 때 다시 시도
+            # 체크포인트가 저장 안 된 레코드를 앞지르지 않도록 먼저 내려씀
+            sink.flush()
+            checkpoint.mark_done(club_id, menu_id, article_id)
+
+        crawl_articles(tasks, cookies, keyword, on_result, num_workers, headless, timeout)
+
+    # ===== 3. CSV 정리 =====
+    return compact_to_csv(records_file, os.path.join(out_dir, f"{keyword}_all_posts.csv"), columns=CSV_COLUMNS)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="네이버 카페 게시판 크롤러 (로그인 1번 + 헤드리스 드라이버 풀)")
+    parser.add_argument('--club-id', default=CLUB_ID, help="카페 clubid")
+    parser.add_argument('--cafe', default=CAFE_NAME, help="카페 주소 이름 (CSV keyword 컬럼 / 출력 폴더 이름)")
+    parser.add_argument('--menus', type=int, nargs='+', default=MENU_IDS, help="게시판 번호 (0 = 전체글보기)")
+    parser.add_argument('--workers', type=int, default=NUM_WORKERS, help="헤드리스 Chrome 워커 수")
+    parser.add_argument('--max-pages', type=int, help="게시판당 목록 페이지 상한")
+    parser.add_argument('--out-dir', help="저장 폴더 (기본: {카페}_cafe_result)")
+    parser.add_argument('--login-headless', action='store_true', help="로그인 창도 띄우지 않음")
+    parser.add_argument('--window', action='store_true', help="워커도 창을 띄워서 실행 (디버깅용)")
+    args = parser.parse_args()
+
+    rows = crawl_cafe(args.club_id, args.menus, args.cafe, args.out_dir or f"{args.cafe}_cafe_result",
+                      args.workers, os.environ.get('NAVER_ID'), os.environ.get('NAVER_PW'),
+                      login_headless=args.login_headless, headless=not args.window, max_pages=args.max_pages)
+    print(f"\n🎉 모든 작업 완료! (CSV {rows}행)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,180 @@
+"""
+네이버 블로그 / 지식iN 검색 결과 URL 수집 (스크롤 없이 HTTP 페이지 요청)
+
+브라우저에서 검색 결과를 끝까지 스크롤하는 대신 검색 결과 페이지를 start= 파라미터로 넘기면서 요청하고,
+여러 날짜 구간(calculate_date_ranges 결과)을 동시에 진행한다.
+
+- 응답이 HTML 이면 그 안의 글 링크를, JSON(무한 스크롤 API)이면 결과 HTML 조각(contents / html)의 링크를 뽑고
+  nextUrl 이 있으면 그 주소로 다음 페이지를 요청
+- 블로그는 blog.naver.com/{블로그ID}/{글번호}, 지식iN 은 qna/detail.naver?d1id=&dirId=&docId= 형태로 정리해서
+  중복 제거 (브라우저 경로의 collect_blog_urls / collect_kin_urls 와 같은 URL 집합)
+- 새 URL 이 안 나오는 페이지를 만나거나 max_urls 에 닿으면 그 구간은 종료
+
+사용 예:
+    windows = discover_urls('"청각장애" +불편', date_ranges, source='blog')
+    for (start, end), urls in windows.items():
+        crawl_naver_blog(keyword, start, end, urls=urls)
+"""
+import asyncio
+import html
+import json
+import re
+import time
+from urllib.parse import unquote, urljoin
+
+from http_fetch import create_session, fetch_html
+from kin_http import to_kin_detail_url
+
+SEARCH_URL = 'https://search.naver.com/search.naver'
+SEARCH_CONCURRENCY = 4    # 동시에 진행할 날짜 구간 수 (구간 안의 페이지는 순서대로)
+MAX_URLS = 2500           # 구간 하나에서 모을 최대 URL 수 (crawl_naver_* 의 max_urls 와 같음)
+PAGE_DELAY = 0.3          # 같은 구간에서 다음 페이지를 요청하기 전 대기(초)
+
+# 소스별 검색 파라미터 / 한 페이지 결과 수 / 글 URL 패턴
+SEARCH_SOURCES = {
+    'blog': {
+        'params': {'ssc': 'tab.blog.all', 'sm': 'tab_opt'},
+        'page_size': 30,
+        'pattern': re.compile(r'https?://(?:m\.)?blog\.naver\.com/([A-Za-z0-9_-]+)/(\d+)'),
+    },
+    'kin': {
+        'params': {'where': 'kin', 'sm': 'tab_opt'},
+        'page_size': 10,
+        'pattern': re.compile(r'https?://kin\.naver\.com/qna/(?:detail|question)\.naver\?[^"\'\s<>\\]+'),
+    },
+}
+
+
+def search_params(source, query, start_date, end_date, start=1):
+    """검색 결과 페이지 요청 파라미터 (브라우저 경로와 같은 정렬 / 기간 옵션)"""
+    params = dict(SEARCH_SOURCES[source]['params'])
+    params.update({
+        'query': query,
+        'nso': f'so:r,p:from{start_date}to{end_date}',
+        'start': start,
+    })
+    return params
+
+
+def normalize_url(source, raw_url):
+    """검색 결과 링크 → 중복 제거용 정규 URL (글 링크가 아니면 None)"""
+    if source == 'blog':
+        match = SEARCH_SOURCES['blog']['pattern'].search(raw_url)
+        return f"https://blog.naver.com/{match.group(1)}/{match.group(2)}" if match else None
+    if 'profileLink' in raw_url:
+        return None
+    return to_kin_detail_url(html.unescape(raw_url).split('#')[0])
+
+
+def extract_result_urls(source, page_text):
+    """
+    검색 결과 응답(HTML 또는 JSON)에서 (정규 URL 리스트(페이지 순서), nextUrl) 추출
+    """
+    next_url = None
+    body = page_text
+    if page_text.lstrip().startswith('{'):
+        try:
+            data = json.loads(page_text)
+        except json.JSONDecodeError:
+            data = {}
+        body = data.get('contents') or data.get('html') or ''
+        if isinstance(body, list):
+            body = ' '.join(str(item) for item in body)
+        next_url = data.get('nextUrl') or None
+
+    urls = []
+    seen = set()
+    pattern = SEARCH_SOURCES[source]['pattern']
+    # 리다이렉트 링크(u=https%3A%2F%2F...) 안에 인코딩된 주소도 같이 찾음
+    for text in (body, unquote(body)):
+        for match in pattern.finditer(text):
+            url = normalize_url(source, match.group(0))
+            if url and url not in seen:
+                seen.add(url)
+                urls.append(url)
+    return urls, next_url
+
+
+async def discover_window(session, semaphore, source, query, start_date, end_date,
+                          max_urls=MAX_URLS, search_url=SEARCH_URL, failures=None):
+    """
+    날짜 구간 하나의 검색 결과를 페이지 끝까지 넘기면서 URL 수집
+    failures(set)를 주면 검색 페이지 요청이 실패해서 중간에 멈춘 구간의 (start_date, end_date) 를 넣음
+
+    Returns:
+        (URL 리스트(검색 결과 순서), 요청한 페이지 수)
+    """
+    page_size = SEARCH_SOURCES[source]['page_size']
+    found, seen = [], set()
+    start, next_url, pages = 1, None, 0
+    label = f"[{source} {start_date}~{end_date}]"
+
+    async with semaphore:
+        while len(found) < max_urls:
+            if next_url:
+                page_text = await fetch_html(session, urljoin(search_url, next_url), label=label)
+            else:
+                page_text = await fetch_html(session, search_url, label=label,
+                                             params=search_params(source, query, start_date, end_date, start))
+            pages += 1
+            if page_text is None:
+                if failures is not None:
+                    failures.add((start_date, end_date))
+                break
+            urls, next_url = extract_result_urls(source, page_text)
+            new_urls = [url for url in urls if url not in seen]
+            if not new_urls:
+                break  # 마지막 페이지를 지났거나 같은 결과가 반복됨
+            seen.update(new_urls)
+            found.extend(new_urls)
+            start += page_size
+            await asyncio.sleep(PAGE_DELAY)
+
+    return found[:max_urls], pages
+
+
+async def discover_urls_async(query, date_ranges, source='blog', max_urls=MAX_URLS,
+                              concurrency=SEARCH_CONCURRENCY, search_url=SEARCH_URL):
+    """discover_urls 의 코루틴 버전 (search_url 은 오프라인 벤치마크에서 가짜 서버로 바꿀 때만)"""
+    semaphore = asyncio.Semaphore(concurrency)
+    session = create_session(concurrency, referer='https://search.naver.com/')
+    try:
+        results = await asyncio.gather(*(
+            discover_window(session, semaphore, source, query, r['start'], r['end'], max_urls, search_url)
+            for r in date_ranges
+        ))
+    finally:
+        await session.close()
+    return {(r['start'], r['end']): result for r, result in zip(date_ranges, results)}
+
+
+def discover_urls(query, date_ranges, source='blog', max_urls=MAX_URLS, concurrency=SEARCH_CONCURRENCY,
+                  search_url=SEARCH_URL):
+    """
+    여러 날짜 구간의 검색 결과 URL 을 HTTP 로 한꺼번에 수집
+
+    Args:
+        query: 검색어 (연산자 포함 전체 키워드, 예: '"청각장애" +불편 -광고')
+        date_ranges: calculate_date_ranges 결과 ([{'start': 'YYYYMMDD', 'end': 'YYYYMMDD', ...}, ...])
+        source: 'blog' 또는 'kin'
+        max_urls: 구간 하나에서 모을 최대 URL 수
+        concurrency: 동시에 진행할 구간 수
+        search_url: 검색 주소 (오프라인 벤치마크에서 가짜 서버로 바꿀 때만)
+
+    Returns:
+        {(start, end): URL 리스트} (URL 을 하나도 못 찾은 구간은 빈 리스트 → 브라우저 경로로 다시 수집)
+    """
+    started = time.perf_counter()
+    results = asyncio.run(discover_urls_async(query, date_ranges, source, max_urls, concurrency, search_url))
+    elapsed = time.perf_counter() - started
+
+    windows = {}
+    total_pages = 0
+    print(f"\n🔎 {source} 검색 결과 URL 수집 ({len(date_ranges)}개 구간, {elapsed:.1f}초)")
+    for (start, end), (urls, pages) in results.items():
+        windows[(start, end)] = urls
+        total_pages += pages
+        print(f"  {start} ~ {end}: URL {len(urls)}개 (페이지 {pages}번 요청)")
+    unique = len(set(url for urls in windows.values() for url in urls))
+    print(f"  ✅ 총 {unique}개 (구간 간 중복 제외), 검색 페이지 {total_pages}번 요청")
+    return windows
@@ -0,0 +1,238 @@
+"""
+크롤링 레코드 스트리밍 저장 (글 하나를 추출할 때마다 파일에 바로 추가)
+
+키워드 하나를 다 모은 뒤 save_data 로 한 번에 CSV 를 쓰면 중간에 죽었을 때 전부 잃고,
+all_data 가 키워드 전체 크기만큼 메모리에 쌓인다. RecordSink 는 레코드를 받는 즉시 버퍼에 넣고
+flush_every 건 / flush_interval 초마다 파일에 내려쓴다.
+
+- JSONL (기본, *.jsonl) : 한 줄에 레코드 하나. answers 같은 추가 필드도 그대로 보존
+- Parquet (*.parquet 디렉토리) : flush 한 번이 part 파일 하나(행 그룹 하나). 다 쓴 part 만 보이도록
+  임시 파일에 쓰고 이름을 바꿈 → 중간에 죽어도 이미 쓴 part 는 온전함 (corpus_storage.read_table 로 읽힘)
+- fsync: 'flush' (flush 마다 디스크까지 기록), 'close' (닫을 때만), 'never'
+- 다시 실행하면 이미 저장된 레코드의 키(기본 url, 키워드별 저장이면 keyword + url)를 읽어 두고 같은 키는 건너뜀
+  (sink.saved(url=...) 로 미리 걸러서 재수집 생략 가능)
+- compact_to_csv : 모은 레코드를 분석 스크립트가 읽는 CSV(keyword, title, content, date, url / utf-8-sig)로 정리
+
+사용 예:
+    with RecordSink('네이버블로그_records.jsonl') as sink:
+        crawl_naver_blog(keyword, start, end, on_record=sink.write)
+    compact_to_csv('네이버블로그_records.jsonl', '네이버블로그_청각장애(2).csv', keyword_cleaner=clean_keyword)
+"""
+import csv
+import json
+import os
+import time
+
+CSV_COLUMNS = ['keyword', 'title', 'content', 'date', 'url']
+FLUSH_EVERY = 50        # 이 건수만큼 모이면 파일에 내려씀
+FLUSH_INTERVAL = 10     # 마지막으로 내려쓴 뒤 이 시간(초)이 지나면 다음 레코드에서 내려씀
+FSYNC_POLICIES = ('flush', 'close', 'never')
+
+
+def _is_parquet(path):
+    return str(path).lower().endswith(('.parquet', '.pq'))
+
+
+def iter_records(path):
+    """저장된 레코드를 하나씩 (JSONL 은 줄 단위, Parquet 는 part 파일 단위로 읽음)"""
+    if not os.path.exists(path):
+        return
+    if _is_parquet(path):
+        import pyarrow.parquet as pq
+
+        for name in sorted(os.listdir(path)):
+            if not name.endswith('.parquet'):
+                continue
+            for row in pq.read_table(os.path.join(path, name)).to_pylist():
+                extra = row.pop('extra', None)
+                if extra:
+                    row.update(json.loads(extra))
+                yield row
+        return
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError:
+                continue  # 쓰다가 끊긴 마지막 줄
+
+
+class RecordSink:
+    """
+    레코드를 받는 즉시 JSONL / Parquet part 파일로 내려쓰는 저장소
+
+    write(record) 는 key_fields 값이 같은 레코드가 이미 저장돼 있으면 False 를 반환하고 건너뛴다.
+    """
+
+    def __init__(self, path, flush_every=FLUSH_EVERY, flush_interval=FLUSH_INTERVAL, fsync='flush',
+                 columns=CSV_COLUMNS, key_fields=('url',)):
+        if fsync not in FSYNC_POLICIES:
+            raise ValueError(f"fsync 는 {FSYNC_POLICIES} 중 하나여야 합니다: {fsync!r}")
+        self.path = path
+        self.parquet = _is_parquet(path)
+        self.flush_every = flush_every
+        self.flush_interval = flush_interval
+        self.fsync = fsync
+        self.columns = list(columns)
+        self.key_fields = tuple(key_fields)
+        self.written = 0
+        self.buffer = []
+        self.keys = {self._key(record) for record in iter_records(path)}
+        self._last_flush = time.monotonic()
+        self._file = None
+        self._part = 0
+
+        if self.parquet:
+            os.makedirs(path, exist_ok=True)
+            self._part = sum(1 for name in os.listdir(path) if name.endswith('.parquet'))
+        else:
+            self._repair_tail()
+            self._file = open(path, 'a', encoding='utf-8')
+        if self.keys:
+            print(f"⏭️ 기존 레코드 {len(self.keys)}건 확인 ({path}) - 같은 {'+'.join(self.key_fields)} 는 건너뜀")
+
+    def _key(self, record):
+        return tuple(record.get(field) for field in self.key_fields)
+
+    def saved(self, **fields):
+        """이미 저장된 레코드인지 (예: sink.saved(url=url), sink.saved(keyword=keyword, url=url))"""
+        return self._key(fields) in self.keys
+
+    def _repair_tail(self):
+        """쓰다가 끊긴 마지막 줄(개행 없음)을 잘라서 다음 레코드가 붙지 않게 함"""
+        if not os.path.exists(self.path) or os.path.getsize(self.path) == 0:
+            return
+        with open(self.path, 'rb+') as f:
+            f.seek(-1, os.SEEK_END)
+            if f.read(1) == b'\n':
+                return
+            f.seek(0)
+            data = f.read()
+            f.truncate(data.rfind(b'\n') + 1)
+
+    def write(self, record):
+        """레코드 하나 추가 (이미 저장된 레코드면 False)"""
+        key = self._key(record)
+        if key in self.keys:
+            return False
+        self.keys.add(key)
+        self.buffer.append(record)
+        if len(self.buffer) >= self.flush_every or time.monotonic() - self._last_flush >= self.flush_interval:
+            self.flush()
+        return True
+
+    def _sync(self, f):
+        f.flush()
+        os.fsync(f.fileno())
+
+    def _write_part(self):
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        rows = {col: [] for col in self.columns + ['extra']}
+        for record in self.buffer:
+            for col in self.columns:
+                value = record.get(col)
+                rows[col].append(None if value is None else str(value))
+            extra = {key: value for key, value in record.items() if key not in self.columns}
+            rows['extra'].append(json.dumps(extra, ensure_ascii=False) if extra else None)
+        table = pa.table(rows, schema=pa.schema([pa.field(col, pa.string()) for col in rows]))
+
+        name = os.path.join(self.path, f'part-{self._part:05d}.parquet')
+        tmp_name = name + '.tmp'
+        with open(tmp_name, 'wb') as f:
+            pq.write_table(table, f)
+            if self.fsync == 'flush':
+                self._sync(f)
+        os.replace(tmp_name, name)
+        self._part += 1
+
+    def flush(self):
+        """버퍼에 모인 레코드를 파일에 내려씀"""
+        if self.buffer:
+            if self.parquet:
+                self._write_part()
+            else:
+                self._file.write(''.join(json.dumps(record, ensure_ascii=False) + '\n' for record in self.buffer))
+                if self.fsync == 'flush':
+                    self._sync(self._file)
+                else:
+                    self._file.flush()
+            self.written += len(self.buffer)
+            self.buffer = []
+        self._last_flush = time.monotonic()
+
+    def close(self):
+        self.flush()
+        if self._file is not None:
+            if self.fsync != 'never':
+                self._sync(self._file)
+            self._file.close()
+            self._file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def compact_to_csv(path, csv_filename, keyword=None, keyword_cleaner=None, append=False, chunk_size=5000,
+                   columns=CSV_COLUMNS):
+    """
+    저장된 레코드를 분석 스크립트용 CSV(keyword, title, content, date, url / utf-8-sig)로 정리
+
+    Args:
+        path: RecordSink 경로 (JSONL 파일 또는 Parquet 디렉토리)
+        csv_filename: 만들 CSV 파일
+        keyword: 주면 이 keyword 의 레코드만
+        keyword_cleaner: keyword 컬럼 정리 함수 (예: clean_keyword)
+        append: True 면 기존 CSV 행을 먼저 두고 새 레코드를 뒤에 추가 (URL 기준 중복 제거, 기존 행 우선)
+        chunk_size: 이 행 수마다 CSV 에 내려씀 (전체를 메모리에 올리지 않음)
+        columns: CSV 컬럼 (keyword_cleaner 는 keyword 컬럼에 적용)
+
+    Returns:
+        CSV 행 수
+    """
+    tmp_filename = csv_filename + '.tmp'
+    seen = set()
+    rows = 0
+    with open(tmp_filename, 'w', encoding='utf-8-sig', newline='') as out:
+        writer = csv.writer(out)
+        writer.writerow(columns)
+
+        def records():
+            if append and os.path.exists(csv_filename):
+                with open(csv_filename, encoding='utf-8-sig', newline='') as f:
+                    yield from csv.DictReader(f)
+            for record in iter_records(path):
+                if keyword is None or record.get('keyword') == keyword:
+                    yield record
+
+        chunk = []
+        for record in records():
+            url = record.get('url')
+            if url in seen:
+                continue
+            seen.add(url)
+            row = [record.get(col, '') for col in columns]
+            if keyword_cleaner is not None and 'keyword' in columns:
+                index = columns.index('keyword')
+                row[index] = keyword_cleaner(row[index])
+            chunk.append(row)
+            if len(chunk) >= chunk_size:
+                writer.writerows(chunk)
+                rows += len(chunk)
+                chunk = []
+        writer.writerows(chunk)
+        rows += len(chunk)
+    if rows == 0:
+        os.remove(tmp_filename)
+        print(f"저장할 데이터가 없습니다. ({csv_filename})")
+        return 0
+    os.replace(tmp_filename, csv_filename)
+    print(f"✅ CSV 저장 완료: {csv_filename} ({rows}행)")
+    return rows
@@ -1,5 +1,4 @@
 # --- 데이터 수집(Crawling)을 위한 라이브러리 ---
-from selenium import webdriver as wb  # type: ignore
 from selenium.webdriver.common.by import By  # type: ignore
 from selenium.webdriver.common.keys import Keys  # type: ignore
 from selenium.common.exceptions import NoSuchElementException, TimeoutException  # type: ignore
@@ -14,7 +13,13 @@ from datetime import datetime, timedelta
 from urllib.parse import quote
 import pickle
 import sys
-import os
+
+from blog_driver_pool import NUM_WORKERS, crawl_blog_posts, extract_blog_post
+from blog_fields import make_record
+from driver_factory import ManagedDriver
+from record_sink import RecordSink, compact_to_csv
+from blog_postview import crawl_blog_posts_http
+from date_window_planner import plan_date_windows
 
 if sys.platform == 'win32':
     try:
@@ -154,9 +159,69 @@ def calculate_date_ranges(start_date_str='20230101', end_date_str='20251114', ma
     
     return date_ranges
 
-def crawl_naver_blog(keyword, start_date, end_date, max_urls=2500):
+def extract_blog_posts(href_list, keyword, num_workers=NUM_WORKERS, use_http=True, driver=None, on_record=None):
+    """
+    블로그 URL 목록에서 본문 추출
+    - use_http: PostView HTTP 요청으로 먼저 추출하고 본문을 못 찾은 글만 드라이버 풀로
+    - num_workers: 드라이버 풀 크기 (use_http=False 이고 1이면 driver 하나로 순차 추출)
+    - driver: 검색에 쓰던 브라우저 (순차 추출이면 그대로 재사용, 닫는 것은 crawl_naver_blog / main 에서)
+    - on_record: 글 하나를 수집할 때마다 호출 (record_sink.RecordSink.write 로 바로 파일에 추가)
+    """
+    print(f"\n{'='*60}")
+    print("블로그 포스트 데이터 추출 시작...")
+    print(f"{'='*60}\n")
+    
+    if use_http or num_workers > 1:
+        # 결과는 메인 프로세스에서만 모음 (검색용 브라우저는 다음 기간 / 키워드 검색에 재사용)
+        if use_http:
+            # PostView HTTP 요청으로 추출 (본문을 못 찾은 글만 드라이버 풀로)
+            return crawl_blog_posts_http(href_list, keyword, fallback_workers=num_workers, on_record=on_record)
+        return crawl_blog_posts(href_list, keyword, num_workers=num_workers, on_record=on_record)
+    
+    own_driver = driver is None
+    if own_driver:
+        driver = ManagedDriver(headless=True, implicit_wait=0)
+    all_data = []
+    driver.implicitly_wait(0)  # 대기는 WebDriverWait 로만 (없는 선택자마다 10초씩 기다리지 않게)
+    started = time.perf_counter()
+    
+    try:
+        for i, url in enumerate(href_list, 1):
+            try:
+                print(f"[{i}/{len(href_list)}] 처리 중: {url[:60]}...")
+                # mainFrame iframe / 본문 요소가 뜨는 즉시 추출 (고정 sleep 없음)
+                title, content, date = extract_blog_post(driver, url)
+                
+                record, message = make_record(keyword, url, title, content, date)
+                if record is None:
+                    print(f"  ⏭️  {message}")
+                    continue
+                
+                all_data.append(record)
+                if on_record is not None:
+                    on_record(record)
+                print(f"  ✅ 수집 완료: {title[:30]}...")
+                
+            except Exception as e:
+                print(f"  ❌ 오류 발생, 건너뜀: {e}")
+                # 오류 발생 시 데이터 저장하지 않고 건너뜀
+                continue
+    finally:
+        if own_driver:
+            driver.quit()
+    
+    minutes = max(time.perf_counter() - started, 1e-9) / 60
+    print(f"\n📊 처리량: {len(href_list) / minutes:.1f} 페이지/분")
+    return all_data
+
+def crawl_naver_blog(keyword, start_date, end_date, max_urls=2500, num_workers=NUM_WORKERS, use_http=True, urls=None, driver=None, on_record=None):
     """
     네이버 블로그 크롤링
+    - num_workers: 본문 추출에 쓸 헤드리스 드라이버(프로세스) 수 (1이면 검색용 브라우저 하나로 순차 추출)
+    - use_http: True 면 본문을 PostView 문서 HTTP 요청으로 먼저 추출하고, 실패한 글만 드라이버 풀로 추출
+    - urls: 이 기간의 검색 결과 URL 을 미리 모아 왔으면 (naver_search.discover_urls / date_window_planner.plan_date_windows) 브라우저 검색 / 스크롤 생략
+    - driver: 여러 번 호출에 걸쳐 재사용할 브라우저 (driver_factory.ManagedDriver, 없으면 이번 호출에서만 띄우고 닫음)
+    - on_record: 글 하나를 수집할 때마다 호출 (RecordSink.write)
     """
     print(f"\n{'='*60}")
     print(f"네이버 블로그 크롤링 시작")
@@ -165,6 +230,13 @@ def crawl_naver_blog(keyword, start_date, end_date, max_urls=2500):
     print(f"최대 URL 수: {max_urls}")
     print(f"{'='*60}\n")
     
+    if urls:
+        href_list = list(urls)[:max_urls]
+        print(f"✅ 미리 수집한 블로그 URL {len(href_list)}개 사용 (브라우저 검색 생략)")
+        all_data = extract_blog_posts(href_list, keyword, num_workers, use_http, driver=driver, on_record=on_record)
+        print(f"\n✅ 총 {len(all_data)}개의 블로그 포스트 데이터 수집 완료!")
+        return all_data
+    
     # URL 인코딩 (특수문자 포함 키워드 제대로 인코딩)
     encoded_keyword = quote(keyword, safe='')
     
@@ -173,42 +245,12 @@ def crawl_naver_blog(keyword, start_date, end_date, max_urls=2500):
     
     print(f"생성된 URL: {blog_search_url}\n")
     
-    # 크롬 브라우저 실행 (옵션 설정 - 안정성 강화 및 로그 억제)
-    options = wb.ChromeOptions()
-    options.add_argument('--no-sandbox')
-    options.add_argument('--disable-dev-shm-usage')
-    options.add_argument('--disable-blink-features=AutomationControlled')
-    options.add_argument('--disable-gpu')  # GPU 가속 비활성화
-    options.add_argument('--disable-extensions')  # 확장 프로그램 비활성화
-    options.add_argument('--disable-software-rasterizer')
-    options.add_argument('--disable-infobars')
-    # 로그 및 에러 메시지 억제
-    options.add_argument('--log-level=3')  # INFO 레벨 이상만 출력 (FATAL, ERROR만)
-    options.add_argument('--disable-logging')  # 로깅 비활성화
-    options.add_argument('--disable-background-networking')  # 백그라운드 네트워킹 비활성화
-    options.add_argument('--disable-background-timer-throttling')  # 백그라운드 타이머 제한 비활성화
-    options.add_argument('--disable-backgrounding-occluded-windows')  # 가려진 창 백그라운드 처리 비활성화
-    options.add_argument('--disable-breakpad')  # 크래시 리포팅 비활성화
-    options.add_argument('--disable-component-update')  # 컴포넌트 업데이트 비활성화
-    options.add_argument('--disable-default-apps')  # 기본 앱 비활성화
-    options.add_argument('--disable-sync')  # 동기화 비활성화
-    options.add_argument('--disable-background-mode')  # 백그라운드 모드 비활성화
-    options.add_argument('--disable-features=TranslateUI')  # 번역 UI 비활성화
-    options.add_experimental_option("excludeSwitches", ["enable-automation", "enable-logging"])
-    options.add_experimental_option('prefs', {
-        'profile.default_content_setting_values.notifications': 2,  # 알림 차단
-        'profile.default_content_settings.popups': 0,  # 팝업 차단
-    })
-    options.add_experimental_option('useAutomationExtension', False)
-    options.page_load_strategy = 'normal'  # 페이지 로드 전략
+    # 크롬 브라우저 (driver_factory 공통 옵션: 이미지 / 폰트 / 광고 차단 + eager 로드)
+    # driver 를 넘겨받으면 키워드 / 기간이 바뀌어도 같은 Chrome 을 재사용하고 여기서 닫지 않음
+    own_driver = driver is None
+    if own_driver:
+        driver = ManagedDriver(headless=False, implicit_wait=10)
     
-    try:
-        driver = wb.Chrome(options=options)
-    except Exception as e:
-        print(f"⚠️  Chrome 드라이버 실행 실패, 기본 옵션으로 재시도: {e}")
-        driver = wb.Chrome()
-    
-    driver.maximize_window()
     driver.implicitly_wait(10)  # 암묵적 대기 시간 설정
     
     # 블로그 URL 패턴 정규식
@@ -334,120 +376,7 @@ def crawl_naver_blog(keyword, start_date, end_date, max_urls=2500):
             print(f"⚠️  최대 URL 수({max_urls})로 제한: {len(href_list)}개")
         
         # 각 블로그 포스트에서 데이터 추출
-        print(f"\n{'='*60}")
-        print("블로그 포스트 데이터 추출 시작...")
-        print(f"{'='*60}\n")
-        
-        all_data = []
-        
-        for i, url in enumerate(href_list, 1):
-            try:
-                print(f"[{i}/{len(href_list)}] 처리 중: {url[:60]}...")
-                driver.get(url)
-                time.sleep(2)  # 페이지 로딩 대기
-                
-                # 네이버 블로그는 본문이 'mainFrame'이라는 iframe 안에 있음
-                try:
-                    driver.switch_to.frame('mainFrame')
-                except:
-                    pass  # iframe이 없을 수도 있음
-                
-                # 제목 추출 (신형/구형 에디터 모두 시도)
-                title = "N/A"
-                title_selectors = [
-                    (By.CSS_SELECTOR, '.se-title-text'),
-                    (By.CSS_SELECTOR, '.pcol1 > span'),
-                    (By.CSS_SELECTOR, '.se-title'),
-                    (By.TAG_NAME, 'h1')
-                ]
-                
-                for selector_type, selector in title_selectors:
-                    try:
-                        title_elem = driver.find_element(selector_type, selector)
-                        title = title_elem.text.strip()
-                        if title and title != "N/A":
-                            break
-                    except:
-                        continue
-                
-                # 본문 추출 (신형/구형 에디터 모두 시도)
-                content = "N/A"
-                content_selectors = [
-                    (By.CSS_SELECTOR, '.se-main-container'),
-                    (By.CSS_SELECTOR, '#postViewArea'),
-                    (By.CSS_SELECTOR, '.se-component-content'),
-                    (By.CSS_SELECTOR, '.post-view')
-                ]
-                
-                for selector_type, selector in content_selectors:
-                    try:
-                        content_elem = driver.find_element(selector_type, selector)
-                        content = content_elem.text.strip()
-                        # 줄바꿈을 공백으로 변경
-                        content = content.replace('\n', ' ').replace('\r', ' ')
-                        # 연속된 공백 제거
-                        content = ' '.join(content.split())
-                        if content and len(content) > 10:
-                            break
-                    except:
-                        continue
-                
-                # 날짜 추출 (신형/구형 에디터 모두 시도)
-                date = "N/A"
-                date_selectors = [
-                    (By.CSS_SELECTOR, '.se_publishDate'),
-                    (By.CSS_SELECTOR, '.date'),
-                    (By.CSS_SELECTOR, '.publish_date'),
-                    (By.CSS_SELECTOR, '.post-date')
-                ]
-                
-                for selector_type, selector in date_selectors:
-                    try:
-                        date_elem = driver.find_element(selector_type, selector)
-                        date = date_elem.text.strip()
-                        if date and date != "N/A":
-                            # 날짜 형식 정리 (예: 2025.01.15. 오후 3:00 -> 2025.01.15.)
-                            if '.' in date:
-                                date_parts = date.split('.')
-                                if len(date_parts) >= 3:
-                                    date = f"{date_parts[0]}.{date_parts[1]}.{date_parts[2]}."
-                            break
-                    except:
-                        continue
-                
-                # iframe에서 빠져나와 기본 콘텐츠로 전환
-                driver.switch_to.default_content()
-                
-                # content가 너무 짧거나 없으면 제외
-                if content == "N/A" or not content or len(content.strip()) < 20:
-                    print(f"  ⏭️  content 없음 또는 너무 짧음으로 건너뜀: {title[:30]}...")
-                    continue
-                
-                # title이 없으면 제외
-                if title == "N/A" or not title or len(title.strip()) == 0:
-                    print(f"  ⏭️  title 없음으로 건너뜀")
-                    continue
-                
-                # 데이터 저장 (keyword, title, content, date, url 순서)
-                all_data.append({
-                    'keyword': keyword,
-                    'title': title,
-                    'content': content,
-                    'date': date,
-                    'url': url
-                })
-                
-                print(f"  ✅ 수집 완료: {title[:30]}...")
-                
-            except Exception as e:
-                print(f"  ❌ 오류 발생, 건너뜀: {e}")
-                # iframe에서 빠져나오기
-                try:
-                    driver.switch_to.default_content()
-                except:
-                    pass
-                # 오류 발생 시 데이터 저장하지 않고 건너뜀
-                continue
+        all_data = extract_blog_posts(href_list, keyword, num_workers, use_http, driver=driver, on_record=on_record)
         
         print(f"\n✅ 총 {len(all_data)}개의 블로그 포스트 데이터 수집 완료!")
         
@@ -459,8 +388,9 @@ def crawl_naver_blog(keyword, start_date, end_date, max_urls=2500):
         traceback.print_exc()
         return []
     finally:
-        # 브라우저 종료
-        driver.quit()
+        # 이번 호출에서 띄운 브라우저만 종료 (넘겨받은 브라우저는 main 에서 닫음)
+        if own_driver:
+            driver.quit()
 
 def clean_keyword(keyword):
     """
@@ -502,42 +432,6 @@ def create_safe_keyword_name(keyword):
     # 너무 긴 파일명 방지
     return safe_name[:50]  # 파일명 길이 제한
 
-def save_data(all_data, keyword, source_type='네이버블로그'):
-    """
-    데이터를 CSV 파일로 저장
-    파일명: 네이버블로그_청각장애(2).csv
-    """
-    if not all_data:
-        print("저장할 데이터가 없습니다.")
-        return
-    
-    # DataFrame 생성 (keyword, title, content, date, url 순서)
-    df_final = pd.DataFrame(all_data, columns=['keyword', 'title', 'content', 'date', 'url'])
-    
-    # keyword 컬럼 정리 (제외 키워드 제거)
-    df_final['keyword'] = df_final['keyword'].apply(clean_keyword)
-    
-    # 파일명: 네이버블로그_청각장애(2).csv
-    csv_filename = '네이버블로그_청각장애(2).csv'
-    
-    # CSV 저장 (기존 파일이 있으면 append, 없으면 새로 생성)
-    if os.path.exists(csv_filename):
-        # 기존 파일 읽기
-        df_existing = pd.read_csv(csv_filename, encoding='utf-8-sig')
-        # 기존 파일의 keyword도 정리
-        if 'keyword' in df_existing.columns:
-            df_existing['keyword'] = df_existing['keyword'].apply(clean_keyword)
-        # 새 데이터와 통합
-        df_final = pd.concat([df_existing, df_final], ignore_index=True)
-        # 중복 제거 (URL 기준)
-        df_final = df_final.drop_duplicates(subset=['url'], keep='first')
-        print(f"  기존 파일에 추가하여 저장합니다.")
-    
-    df_final.to_csv(csv_filename, index=False, encoding='utf-8-sig')
-    print(f"✅ CSV 저장 완료: {csv_filename} ({len(df_final)}행)")
-    
-    return csv_filename
-
 def main():
     """
     메인 함수 - 네이버 블로그 크롤링 실행
@@ -557,6 +451,10 @@ def main():
     # 2023.01.01 이후 데이터는 이미 수집했으므로 주석처리
     # date_ranges_2023 = calculate_date_ranges(start_date_str='20230101', end_date_str='20251114', max_urls=2500)
     
+    # 검색 결과 URL 을 스크롤 없이 HTTP 로 모든 기간 한꺼번에 수집 (False 면 기간마다 브라우저로 스크롤)
+    # 결과가 상한(2500개)에 닿는 기간은 자동으로 나누고, 적은 기간은 합침 (계획은 naver_date_plan.json 에 저장)
+    use_http_search = True
+    
     print(f"\n{'='*60}")
     print("네이버 블로그 크롤링 시작")
     print(f"{'='*60}")
@@ -571,39 +469,67 @@ def main():
     print(f"\n크롤링을 시작합니다...\n")
     
     # 각 키워드별로 크롤링 실행
-    all_keywords_data = []
+    total_count = 0
+    
+    # 수집한 글은 바로 JSONL 에 추가 (중간에 멈춰도 보존, 다시 실행하면 이미 저장된 URL 은 건너뜀)
+    records_file = '네이버블로그_청각장애(2).jsonl'
+    # with: 중간에 예외가 나도 버퍼를 flush / fsync 하고 닫음
+    with RecordSink(records_file) as sink:
+        # 검색 / 순차 추출용 브라우저 하나를 모든 키워드 / 기간에 재사용 (RESTART_EVERY 페이지마다 자동 재시작)
+        driver = ManagedDriver(headless=False, implicit_wait=10)
+        try:
+            for keyword_idx, keyword in enumerate(keywords, 1):
+                print(f"\n{'='*80}")
+                print(f"키워드 {keyword_idx}/{len(keywords)}: {keyword}")
+                print(f"{'='*80}\n")
+
+                keyword_count = 0
+
+                # URL 을 못 찾은 기간은 빈 리스트 → crawl_naver_blog 가 브라우저로 다시 검색
+                if use_http_search:
+                    keyword_ranges, window_urls = plan_date_windows(keyword, date_ranges, source='blog', cap=2500)
+                else:
+                    keyword_ranges, window_urls = date_ranges, {}
+
+                for date_range in keyword_ranges:
+                    print(f"\n{'='*60}")
+                    print(f"기간: {date_range['start']} ~ {date_range['end']}")
+                    print(f"{'='*60}")
+
+                    urls = window_urls.get((date_range['start'], date_range['end']))
+                    if urls:
+                        # 이전 실행에서 이미 저장한 글은 다시 추출하지 않음
+                        pending = [url for url in urls if not sink.saved(url=url)]
+                        if not pending:
+                            print(f"⏭️  이미 저장된 기간이라 건너뜀 (URL {len(urls)}개)")
+                            continue
+                        urls = pending
+
+                    all_data = crawl_naver_blog(
+                        keyword=keyword,
+                        start_date=date_range['start'],
+                        end_date=date_range['end'],
+                        max_urls=2500,
+                        urls=urls,
+                        driver=driver,
+                        on_record=sink.write
+                    )
+                    keyword_count += len(all_data)
+                    sink.flush()
+
+                total_count += keyword_count
+                print(f"\n✅ 키워드 '{keyword}' 크롤링 완료! 총 {keyword_count}개의 데이터를 수집했습니다.\n")
+        finally:
+            # 페이지당 로드 시간 요약 출력 후 브라우저 종료 (예외가 나도 Chrome 을 남기지 않음)
+            driver.quit()
     
-    for keyword_idx, keyword in enumerate(keywords, 1):
-        print(f"\n{'='*80}")
-        print(f"키워드 {keyword_idx}/{len(keywords)}: {keyword}")
-        print(f"{'='*80}\n")
-        
-        keyword_all_data = []
-        
-        for date_range in date_ranges:
-            print(f"\n{'='*60}")
-            print(f"기간: {date_range['start']} ~ {date_range['end']}")
-            print(f"{'='*60}")
-            
-            all_data = crawl_naver_blog(
-                keyword=keyword,
-                start_date=date_range['start'],
-                end_date=date_range['end'],
-                max_urls=2500
-            )
-            if all_data:
-                keyword_all_data.extend(all_data)
-        
-        # 각 키워드별 전체 데이터 통합 저장 (CSV, Excel, Pickle 동일 데이터)
-        if keyword_all_data:
-            print(f"\n{'='*60}")
-            print(f"키워드 '{keyword}' 전체 데이터 저장")
-            print(f"{'='*60}")
-            save_data(keyword_all_data, keyword, source_type='네이버블로그')
-            all_keywords_data.extend(keyword_all_data)
-            print(f"\n✅ 키워드 '{keyword}' 크롤링 완료! 총 {len(keyword_all_data)}개의 데이터를 수집했습니다.\n")
-    
-    print(f"\n✅ 모든 크롤링 완료! 총 {len(all_keywords_data)}개의 데이터를 수집했습니다.")
+    # 모은 레코드를 분석용 CSV 로 정리 (기존 CSV 행은 유지, URL 기준 중복 제거, keyword 는 제외 키워드 제거)
+    print(f"\n{'='*60}")
+    print("전체 데이터 CSV 저장")
+    print(f"{'='*60}")
+    compact_to_csv(records_file, '네이버블로그_청각장애(2).csv', keyword_cleaner=clean_keyword, append=True)
+    
+    print(f"\n✅ 모든 크롤링 완료! 총 {total_count}개의 데이터를 수집했습니다.")
 
 if __name__ == "__main__":
     main()
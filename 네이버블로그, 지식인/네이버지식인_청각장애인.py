@@ -1,5 +1,4 @@
 # --- 데이터 수집(Crawling)을 위한 라이브러리 ---
-from selenium import webdriver as wb
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
 from selenium.common.exceptions import NoSuchElementException, TimeoutException  # type: ignore
@@ -8,8 +7,12 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from bs4 import BeautifulSoup as bs  # BeautifulSoup 추가
 
+from driver_factory import ManagedDriver
+from record_sink import RecordSink, compact_to_csv
+from kin_http import crawl_kin_http
+from date_window_planner import plan_date_windows
+
 # --- 데이터 처리 및 분석을 위한 라이브러리 ---
-import pandas as pd
 import time
 from datetime import datetime, timedelta
 from urllib.parse import quote, urlparse, parse_qs, unquote
@@ -250,9 +253,290 @@ def calculate_date_ranges(start_date_str='20230101', end_date_str='20251114', ma
     return date_ranges
 
 
-def crawl_naver_kin(keyword, start_date, end_date, max_urls=2500):
+def extract_kin_page(driver, url):
+    """
+    지식인 질문 페이지 하나에서 (title, content, date) 추출 (Selenium + BeautifulSoup)
+    """
+    driver.get(url)
+    time.sleep(2)
+    
+    # -----------------------------
+    # 제목 추출 (노트북 방식 + Selenium)
+    # -----------------------------
+    title = "N/A"
+    
+    # 1순위: <title>에서 추출
+    try:
+        html = driver.page_source
+        soup = bs(html, 'lxml')
+        title_elem = soup.select_one('title')
+        if title_elem:
+            title = title_elem.get_text(strip=True)
+            title = title.replace(': 지식iN', '').strip()
+    except Exception:
+        pass
+    
+    # 2순위: Selenium 셀렉터
+    if title == "N/A" or not title:
+        title_selectors = [
+            (By.CSS_SELECTOR, '.title'),
+            (By.CSS_SELECTOR, '.question-title'),
+            (By.CSS_SELECTOR, '.c-heading__title'),
+            (By.CSS_SELECTOR, 'h2.title'),
+            (By.TAG_NAME, 'h2'),
+            (By.TAG_NAME, 'h1')
+        ]
+    
+        for selector_type, selector in title_selectors:
+            try:
+                title_elem = driver.find_element(selector_type, selector)
+                t = title_elem.text.strip()
+                if t:
+                    title = t
+                    break
+            except:
+                continue
+    
+    # -----------------------------
+    # 내용(content) 추출
+    # -----------------------------
+    content = ""
+    
+    # 1순위: BeautifulSoup으로 .questionDetail
+    try:
+        html = driver.page_source
+        soup = bs(html, 'lxml')
+        question_detail = soup.select_one('.questionDetail')
+        if question_detail:
+            tmp = question_detail.get_text(" ", strip=True)
+            if tmp:
+                content = tmp
+    except Exception:
+        pass
+    
+    # 2순위: .questionDetail 안의 p.se-text-paragraph (Selenium)
+    if not content:
+        try:
+            detail = driver.find_element(By.CSS_SELECTOR, '.questionDetail')
+            paragraphs = detail.find_elements(By.CSS_SELECTOR, 'p.se-text-paragraph')
+            texts = []
+            for p in paragraphs:
+                txt = p.text.strip()
+                if txt:
+                    texts.append(txt)
+            if texts:
+                content = ' '.join(texts)
+        except Exception:
+            pass
+    
+    # 3순위: 기존 selector 백업 (질문 본문)
+    if not content:
+        try:
+            content_selectors = [
+                (By.CSS_SELECTOR, '.c-heading__content'),
+                (By.CSS_SELECTOR, '.question-content'),
+                (By.CSS_SELECTOR, '.content'),
+                (By.CSS_SELECTOR, '.question_text'),
+                (By.CSS_SELECTOR, '#answer-content')
+            ]
+    
+            for selector_type, selector in content_selectors:
+                try:
+                    content_elem = driver.find_element(selector_type, selector)
+                    tmp = content_elem.text.strip()
+                    tmp = tmp.replace('\n', ' ').replace('\r', ' ')
+                    tmp = ' '.join(tmp.split())
+                    if tmp:
+                        content = tmp
+                        break
+                except:
+                    continue
+        except Exception:
+            pass
+    
+    # 4순위: BeautifulSoup으로 주요 영역 텍스트 한 번 더 시도
+    if not content:
+        try:
+            html = driver.page_source
+            soup = bs(html, 'lxml')
+            for selector in ['.c-heading__content', '.question-content', '.content', '.question_text']:
+                elem = soup.select_one(selector)
+                if elem:
+                    tmp = elem.get_text(" ", strip=True)
+                    if tmp:
+                        content = ' '.join(tmp.split())
+                        break
+        except Exception:
+            pass
+    
+    # 5순위: 최후의 보루 - 페이지 주요 영역 전체 텍스트
+    if not content:
+        try:
+            html = driver.page_source
+            soup = bs(html, 'lxml')
+            main = (
+                soup.select_one('div#content')
+                or soup.select_one('div#main_content')
+                or soup.body
+            )
+            if main:
+                tmp = main.get_text(" ", strip=True)
+                if tmp:
+                    content = ' '.join(tmp.split())
+        except Exception:
+            pass
+    
+    # content 후처리
+    if content:
+        content = content.replace('\n', ' ').replace('\r', ' ').replace('\t', ' ')
+        content = ' '.join(content.split())
+    
+    # -----------------------------
+    # 날짜(date) 추출
+    # -----------------------------
+    date = "N/A"
+    
+    # 1순위: BeautifulSoup
+    try:
+        html = driver.page_source
+        soup = bs(html, 'lxml')
+        try:
+            date_elem = soup.select_one('div.userInfo.userInfo__bullet > span:nth-child(3)')
+            if date_elem:
+                date = date_elem.get_text(strip=True)
+                date = date.replace('작성일', '').strip()
+            else:
+                date_elem = soup.select_one('div.userInfo.userInfo__bullet > span:nth-child(2)')
+                if date_elem:
+                    date = date_elem.get_text(strip=True)
+                    date = date.replace('작성일', '').strip()
+        except:
+            pass
+    except Exception:
+        pass
+    
+    # 2순위: Selenium
+    if date == "N/A" or not date:
+        date_selectors = [
+            (By.CSS_SELECTOR, 'div.userInfo.userInfo__bullet > span:nth-child(3)'),
+            (By.CSS_SELECTOR, 'div.userInfo.userInfo__bullet > span:nth-child(2)'),
+            (By.CSS_SELECTOR, '.c-userinfo__date'),
+            (By.CSS_SELECTOR, '.question-date'),
+            (By.CSS_SELECTOR, '.date'),
+            (By.CSS_SELECTOR, '.c-heading__date')
+        ]
+    
+        for selector_type, selector in date_selectors:
+            try:
+                date_elem = driver.find_element(selector_type, selector)
+                d = date_elem.text.strip()
+                if d and d != "N/A":
+                    d = d.replace('작성일', '').strip()
+                    if '.' in d:
+                        date_parts = d.split('.')
+                        if len(date_parts) >= 3:
+                            d = f"{date_parts[0]}.{date_parts[1]}.{date_parts[2]}."
+                    date = d
+                    break
+            except:
+                continue
+    
+    return title, content, date
+
+
+def extract_kin_posts(href_list, keyword, use_http=True, driver=None, on_record=None):
+    """
+    지식인 질문 URL 목록에서 질문 데이터 추출
+    - use_http: qna/detail.naver 를 HTTP 로 먼저 추출하고 (kin_http), 실패한 페이지만 Selenium 으로 추출
+    - driver: 검색에 쓰던 브라우저 (없으면 Selenium 으로 추출할 페이지가 있을 때만 헤드리스로 새로 띄움)
+    - on_record: 질문 하나를 수집할 때마다 호출 (record_sink.RecordSink.write 로 바로 파일에 추가)
+    """
+    print(f"\n{'='*60}")
+    print("지식인 질문 데이터 추출 시작...")
+    print(f"{'='*60}\n")
+    
+    # 유효한 qna 질문 URL 만 (중복 / 프로필 링크 제외)
+    targets = []
+    seen_urls = set()
+    for i, url in enumerate(href_list, 1):
+        if not url or url.strip() == "":
+            print(f"[{i}/{len(href_list)}] ⏭️  유효하지 않은 URL로 건너뜀: {url}")
+            continue
+        
+        if url in seen_urls:
+            print(f"[{i}/{len(href_list)}] ⏭️  중복 URL로 건너뜀: {url[:60]}...")
+            continue
+        
+        # qna/detail, qna/question만
+        if '/qna/' not in url:
+            print(f"[{i}/{len(href_list)}] ⏭️  qna 페이지가 아니라 건너뜀: {url[:60]}...")
+            continue
+        if 'search/profileLink' in url or '/profileLink' in url:
+            print(f"[{i}/{len(href_list)}] ⏭️  프로필 링크 건너뜀: {url[:60]}...")
+            continue
+        
+        seen_urls.add(url)
+        targets.append(url)
+    
+    all_data = []
+    
+    if use_http and targets:
+        # qna/detail.naver 를 HTTP 로 먼저 추출 (답변까지 포함), 못 가져온 페이지만 브라우저로
+        all_data, targets = crawl_kin_http(targets, keyword, on_record=on_record)
+        if targets:
+            print(f"🔁 HTTP 로 못 가져온 {len(targets)}건은 브라우저로 다시 시도합니다.")
+    
+    own_driver = driver is None and bool(targets)
+    if own_driver:
+        driver = ManagedDriver(headless=True, implicit_wait=0)
+    
+    try:
+        for i, url in enumerate(targets, 1):
+            try:
+                print(f"[{i}/{len(targets)}] 처리 중: {url[:60]}...")
+                title, content, date = extract_kin_page(driver, url)
+                
+                # -----------------------------
+                # 최종 필터링
+                # -----------------------------
+                # ✨ 요구사항: "내용 좀 짧아도 괜찮고, N/A만 아니면 긁어오기"
+                if not content or content.strip() == "":
+                    print(f"  ⏭️  content 없음으로 건너뜀: {title[:30]}...")
+                    continue
+                
+                if title == "N/A" or not title or len(title.strip()) == 0:
+                    print(f"  ⏭️  title 없음으로 건너뜀")
+                    continue
+                
+                all_data.append({
+                    'keyword': keyword,
+                    'title': title,
+                    'content': content,
+                    'date': date,
+                    'url': url
+                })
+                if on_record is not None:
+                    on_record(all_data[-1])
+                
+                print(f"  ✅ 수집 완료: {title[:30]}...")
+            
+            except Exception as e:
+                print(f"  ❌ 오류 발생, 건너뜀: {e}")
+                continue
+    finally:
+        if own_driver:
+            driver.quit()
+    
+    return all_data
+
+
+def crawl_naver_kin(keyword, start_date, end_date, max_urls=2500, use_http=True, urls=None, driver=None, on_record=None):
     """
     네이버 지식인 크롤링
+    - use_http: True 면 질문 페이지를 HTTP 로 먼저 추출하고 (kin_http), 실패한 페이지만 Selenium 으로 추출
+    - urls: 이 기간의 검색 결과 URL 을 미리 모아 왔으면 (naver_search.discover_urls / date_window_planner.plan_date_windows) 브라우저 검색 / 스크롤 생략
+    - driver: 여러 번 호출에 걸쳐 재사용할 브라우저 (driver_factory.ManagedDriver, 없으면 이번 호출에서만 띄우고 닫음)
+    - on_record: 질문 하나를 수집할 때마다 호출 (RecordSink.write)
     """
     full_keyword = keyword
     keyword = parse_keyword_for_display(full_keyword)
@@ -265,45 +549,24 @@ def crawl_naver_kin(keyword, start_date, end_date, max_urls=2500):
     print(f"최대 URL 수: {max_urls}")
     print(f"{'='*60}\n")
     
+    if urls:
+        href_list = list(urls)[:max_urls]
+        print(f"✅ 미리 수집한 지식인 URL {len(href_list)}개 사용 (브라우저 검색 생략)")
+        all_data = extract_kin_posts(href_list, keyword, use_http, driver=driver, on_record=on_record)
+        print(f"\n✅ 총 {len(all_data)}개의 지식인 질문 데이터 수집 완료!")
+        return all_data
+    
     encoded_keyword = quote(full_keyword, safe='')
     kin_search_url = f'https://search.naver.com/search.naver?where=kin&query={encoded_keyword}&sm=tab_opt&nso=so%3Ar%2Cp%3Afrom{start_date}to{end_date}'
     
     print(f"생성된 URL: {kin_search_url}\n")
     
-    options = wb.ChromeOptions()
-    options.add_argument('--no-sandbox')
-    options.add_argument('--disable-dev-shm-usage')
-    options.add_argument('--disable-blink-features=AutomationControlled')
-    options.add_argument('--disable-gpu')
-    options.add_argument('--disable-extensions')
-    options.add_argument('--disable-software-rasterizer')
-    options.add_argument('--disable-infobars')
-    options.add_argument('--log-level=3')
-    options.add_argument('--disable-logging')
-    options.add_argument('--disable-background-networking')
-    options.add_argument('--disable-background-timer-throttling')
-    options.add_argument('--disable-backgrounding-occluded-windows')
-    options.add_argument('--disable-breakpad')
-    options.add_argument('--disable-component-update')
-    options.add_argument('--disable-default-apps')
-    options.add_argument('--disable-sync')
-    options.add_argument('--disable-background-mode')
-    options.add_argument('--disable-features=TranslateUI')
-    options.add_experimental_option("excludeSwitches", ["enable-automation", "enable-logging"])
-    options.add_experimental_option('prefs', {
-        'profile.default_content_setting_values.notifications': 2,
-        'profile.default_content_settings.popups': 0,
-    })
-    options.add_experimental_option('useAutomationExtension', False)
-    options.page_load_strategy = 'normal'
+    # 크롬 브라우저 (driver_factory 공통 옵션: 이미지 / 폰트 / 광고 차단 + eager 로드)
+    # driver 를 넘겨받으면 키워드 / 기간이 바뀌어도 같은 Chrome 을 재사용하고 여기서 닫지 않음
+    own_driver = driver is None
+    if own_driver:
+        driver = ManagedDriver(headless=False, implicit_wait=10)
     
-    try:
-        driver = wb.Chrome(options=options)
-    except Exception as e:
-        print(f"⚠️  Chrome 드라이버 실행 실패, 기본 옵션으로 재시도: {e}")
-        driver = wb.Chrome()
-    
-    driver.maximize_window()
     driver.implicitly_wait(10)
     
     # 🔥 qna/detail 또는 qna/question만 허용
@@ -448,242 +711,7 @@ def crawl_naver_kin(keyword, start_date, end_date, max_urls=2500):
             href_list = href_list[:max_urls]
             print(f"⚠️  최대 URL 수({max_urls})로 제한: {len(href_list)}개")
         
-        print(f"\n{'='*60}")
-        print("지식인 질문 데이터 추출 시작...")
-        print(f"{'='*60}\n")
-        
-        all_data = []
-        seen_urls = set()
-        
-        for i, url in enumerate(href_list, 1):
-            try:
-                if not url or url.strip() == "":
-                    print(f"[{i}/{len(href_list)}] ⏭️  유효하지 않은 URL로 건너뜀: {url}")
-                    continue
-                
-                if url in seen_urls:
-                    print(f"[{i}/{len(href_list)}] ⏭️  중복 URL로 건너뜀: {url[:60]}...")
-                    continue
-                
-                # qna/detail, qna/question만
-                if '/qna/' not in url:
-                    print(f"[{i}/{len(href_list)}] ⏭️  qna 페이지가 아니라 건너뜀: {url[:60]}...")
-                    continue
-                if 'search/profileLink' in url or '/profileLink' in url:
-                    print(f"[{i}/{len(href_list)}] ⏭️  프로필 링크 건너뜀: {url[:60]}...")
-                    continue
-                
-                seen_urls.add(url)
-                print(f"[{i}/{len(href_list)}] 처리 중: {url[:60]}...")
-                driver.get(url)
-                time.sleep(2)
-                
-                # -----------------------------
-                # 제목 추출 (노트북 방식 + Selenium)
-                # -----------------------------
-                title = "N/A"
-                
-                # 1순위: <title>에서 추출
-                try:
-                    html = driver.page_source
-                    soup = bs(html, 'lxml')
-                    title_elem = soup.select_one('title')
-                    if title_elem:
-                        title = title_elem.get_text(strip=True)
-                        title = title.replace(': 지식iN', '').strip()
-                except Exception:
-                    pass
-                
-                # 2순위: Selenium 셀렉터
-                if title == "N/A" or not title:
-                    title_selectors = [
-                        (By.CSS_SELECTOR, '.title'),
-                        (By.CSS_SELECTOR, '.question-title'),
-                        (By.CSS_SELECTOR, '.c-heading__title'),
-                        (By.CSS_SELECTOR, 'h2.title'),
-                        (By.TAG_NAME, 'h2'),
-                        (By.TAG_NAME, 'h1')
-                    ]
-                    
-                    for selector_type, selector in title_selectors:
-                        try:
-                            title_elem = driver.find_element(selector_type, selector)
-                            t = title_elem.text.strip()
-                            if t:
-                                title = t
-                                break
-                        except:
-                            continue
-                
-                # -----------------------------
-                # 내용(content) 추출
-                # -----------------------------
-                content = ""
-                
-                # 1순위: BeautifulSoup으로 .questionDetail
-                try:
-                    html = driver.page_source
-                    soup = bs(html, 'lxml')
-                    question_detail = soup.select_one('.questionDetail')
-                    if question_detail:
-                        tmp = question_detail.get_text(" ", strip=True)
-                        if tmp:
-                            content = tmp
-                except Exception:
-                    pass
-                
-                # 2순위: .questionDetail 안의 p.se-text-paragraph (Selenium)
-                if not content:
-                    try:
-                        detail = driver.find_element(By.CSS_SELECTOR, '.questionDetail')
-                        paragraphs = detail.find_elements(By.CSS_SELECTOR, 'p.se-text-paragraph')
-                        texts = []
-                        for p in paragraphs:
-                            txt = p.text.strip()
-                            if txt:
-                                texts.append(txt)
-                        if texts:
-                            content = ' '.join(texts)
-                    except Exception:
-                        pass
-                
-                # 3순위: 기존 selector 백업 (질문 본문)
-                if not content:
-                    try:
-                        content_selectors = [
-                            (By.CSS_SELECTOR, '.c-heading__content'),
-                            (By.CSS_SELECTOR, '.question-content'),
-                            (By.CSS_SELECTOR, '.content'),
-                            (By.CSS_SELECTOR, '.question_text'),
-                            (By.CSS_SELECTOR, '#answer-content')
-                        ]
-                        
-                        for selector_type, selector in content_selectors:
-                            try:
-                                content_elem = driver.find_element(selector_type, selector)
-                                tmp = content_elem.text.strip()
-                                tmp = tmp.replace('\n', ' ').replace('\r', ' ')
-                                tmp = ' '.join(tmp.split())
-                                if tmp:
-                                    content = tmp
-                                    break
-                            except:
-                                continue
-                    except Exception:
-                        pass
-                
-                # 4순위: BeautifulSoup으로 주요 영역 텍스트 한 번 더 시도
-                if not content:
-                    try:
-                        html = driver.page_source
-                        soup = bs(html, 'lxml')
-                        for selector in ['.c-heading__content', '.question-content', '.content', '.question_text']:
-                            elem = soup.select_one(selector)
-                            if elem:
-                                tmp = elem.get_text(" ", strip=True)
-                                if tmp:
-                                    content = ' '.join(tmp.split())
-                                    break
-                    except Exception:
-                        pass
-                
-                # 5순위: 최후의 보루 - 페이지 주요 영역 전체 텍스트
-                if not content:
-                    try:
-                        html = driver.page_source
-                        soup = bs(html, 'lxml')
-                        main = (
-                            soup.select_one('div#content')
-                            or soup.select_one('div#main_content')
-                            or soup.body
-                        )
-                        if main:
-                            tmp = main.get_text(" ", strip=True)
-                            if tmp:
-                                content = ' '.join(tmp.split())
-                    except Exception:
-                        pass
-                
-                # content 후처리
-                if content:
-                    content = content.replace('\n', ' ').replace('\r', ' ').replace('\t', ' ')
-                    content = ' '.join(content.split())
-                
-                # -----------------------------
-                # 날짜(date) 추출
-                # -----------------------------
-                date = "N/A"
-                
-                # 1순위: BeautifulSoup
-                try:
-                    html = driver.page_source
-                    soup = bs(html, 'lxml')
-                    try:
-                        date_elem = soup.select_one('div.userInfo.userInfo__bullet > span:nth-child(3)')
-                        if date_elem:
-                            date = date_elem.get_text(strip=True)
-                            date = date.replace('작성일', '').strip()
-                        else:
-                            date_elem = soup.select_one('div.userInfo.userInfo__bullet > span:nth-child(2)')
-                            if date_elem:
-                                date = date_elem.get_text(strip=True)
-                                date = date.replace('작성일', '').strip()
-                    except:
-                        pass
-                except Exception:
-                    pass
-                
-                # 2순위: Selenium
-                if date == "N/A" or not date:
-                    date_selectors = [
-                        (By.CSS_SELECTOR, 'div.userInfo.userInfo__bullet > span:nth-child(3)'),
-                        (By.CSS_SELECTOR, 'div.userInfo.userInfo__bullet > span:nth-child(2)'),
-                        (By.CSS_SELECTOR, '.c-userinfo__date'),
-                        (By.CSS_SELECTOR, '.question-date'),
-                        (By.CSS_SELECTOR, '.date'),
-                        (By.CSS_SELECTOR, '.c-heading__date')
-                    ]
-                    
-                    for selector_type, selector in date_selectors:
-                        try:
-                            date_elem = driver.find_element(selector_type, selector)
-                            d = date_elem.text.strip()
-                            if d and d != "N/A":
-                                d = d.replace('작성일', '').strip()
-                                if '.' in d:
-                                    date_parts = d.split('.')
-                                    if len(date_parts) >= 3:
-                                        d = f"{date_parts[0]}.{date_parts[1]}.{date_parts[2]}."
-                                date = d
-                                break
-                        except:
-                            continue
-                
-                # -----------------------------
-                # 최종 필터링
-                # -----------------------------
-                # ✨ 요구사항: "내용 좀 짧아도 괜찮고, N/A만 아니면 긁어오기"
-                if not content or content.strip() == "":
-                    print(f"  ⏭️  content 없음으로 건너뜀: {title[:30]}...")
-                    continue
-                
-                if title == "N/A" or not title or len(title.strip()) == 0:
-                    print(f"  ⏭️  title 없음으로 건너뜀")
-                    continue
-                
-                all_data.append({
-                    'keyword': keyword,
-                    'title': title,
-                    'content': content,
-                    'date': date,
-                    'url': url
-                })
-                
-                print(f"  ✅ 수집 완료: {title[:30]}...")
-                
-            except Exception as e:
-                print(f"  ❌ 오류 발생, 건너뜀: {e}")
-                continue
+        all_data = extract_kin_posts(href_list, keyword, use_http, driver=driver, on_record=on_record)
         
         print(f"\n✅ 총 {len(all_data)}개의 지식인 질문 데이터 수집 완료!")
         
@@ -695,7 +723,9 @@ def crawl_naver_kin(keyword, start_date, end_date, max_urls=2500):
         traceback.print_exc()
         return []
     finally:
-        driver.quit()
+        # 이번 호출에서 띄운 브라우저만 종료 (넘겨받은 브라우저는 main 에서 닫음)
+        if own_driver:
+            driver.quit()
 
 
 def parse_keyword_for_display(full_keyword):
@@ -746,42 +776,6 @@ def create_safe_keyword_name(parsed_keyword):
     return safe_name[:50]
 
 
-def save_data(all_data, keyword, source_type='네이버지식인'):
-    """
-    데이터를 CSV 파일로 저장 (Pickle, Excel 저장 제거)
-    파일명 형식: 크롤링데이터(네이버지식인, 키워드명)
-    """
-    if not all_data:
-        print("저장할 데이터가 없습니다.")
-        return
-    
-    df_final = pd.DataFrame(all_data, columns=['keyword', 'title', 'content', 'date', 'url'])
-    
-    safe_keyword = create_safe_keyword_name(keyword)
-    base_filename = f'크롤링데이터({source_type}, {safe_keyword})'
-    
-    csv_filename = f'{base_filename}(2).csv'
-    df_final.to_csv(csv_filename, index=False, encoding='utf-8-sig')
-    print(f"✅ CSV 저장 완료: {csv_filename} ({len(df_final)}행)")
-    
-    # Pickle 저장 제거
-    # pkl_filename = f'{base_filename}.pkl'
-    # with open(pkl_filename, 'wb') as f:
-    #     pickle.dump(df_final, f)
-    # print(f"✅ Pickle 저장 완료: {pkl_filename} ({len(df_final)}행)")
-    
-    # Excel 저장 제거
-    # excel_filename = f'{base_filename}.xlsx'
-    # try:
-    #     df_final.to_excel(excel_filename, index=False, engine='openpyxl')
-    #     print(f"✅ Excel 저장 완료: {excel_filename} ({len(df_final)}행)")
-    # except Exception as e:
-    #     print(f"⚠️  Excel 저장 실패: {e}")
-    #     print("   openpyxl 설치 필요: pip install openpyxl")
-    
-    return csv_filename
-
-
 def main():
     """
     메인 함수 - 네이버 지식인 크롤링 실행
@@ -800,6 +794,10 @@ def main():
     # 나머지 년도 주석처리
     # date_ranges = calculate_date_ranges(start_date_str='20230101', end_date_str='20251115', max_urls=2500)
     
+    # 검색 결과 URL 을 스크롤 없이 HTTP 로 모든 기간 한꺼번에 수집 (False 면 기간마다 브라우저로 스크롤)
+    # 결과가 상한(2500개)에 닿는 기간은 자동으로 나누고, 적은 기간은 합침 (계획은 naver_date_plan.json 에 저장)
+    use_http_search = True
+    
     print(f"\n{'='*60}")
     print("네이버 지식인 크롤링 시작")
     print(f"{'='*60}")
@@ -813,39 +811,72 @@ def main():
     
     print(f"\n크롤링을 시작합니다...\n")
     
-    all_keywords_data = []
+    total_count = 0
     
-    for keyword_idx, keyword in enumerate(keywords, 1):
-        print(f"\n{'='*80}")
-        print(f"키워드 {keyword_idx}/{len(keywords)}: {keyword}")
-        print(f"{'='*80}\n")
-        
-        keyword_all_data = []
-        
-        for date_range in date_ranges:
-            print(f"\n{'='*60}")
-            print(f"기간: {date_range['start']} ~ {date_range['end']}")
-            print(f"{'='*60}")
-            
-            all_data = crawl_naver_kin(
-                keyword=keyword,
-                start_date=date_range['start'],
-                end_date=date_range['end'],
-                max_urls=2500
-            )
-            if all_data:
-                keyword_all_data.extend(all_data)
-        
-        if keyword_all_data:
-            print(f"\n{'='*60}")
-            print(f"키워드 '{keyword}' 전체 데이터 저장")
-            print(f"{'='*60}")
-            display_keyword = keyword_all_data[0]['keyword'] if keyword_all_data else keyword
-            save_data(keyword_all_data, display_keyword, source_type='네이버지식인')
-            all_keywords_data.extend(keyword_all_data)
-            print(f"\n✅ 키워드 '{keyword}' 크롤링 완료! 총 {len(keyword_all_data)}개의 데이터를 수집했습니다.\n")
-    
-    print(f"\n✅ 모든 크롤링 완료! 총 {len(all_keywords_data)}개의 데이터를 수집했습니다.")
+    # 수집한 질문은 바로 JSONL 에 추가 (중간에 멈춰도 보존, 다시 실행하면 이미 저장된 질문은 건너뜀)
+    # CSV 를 키워드별로 따로 만들므로 같은 질문도 키워드가 다르면 따로 저장
+    records_file = '크롤링데이터(네이버지식인)(2).jsonl'
+    # with: 중간에 예외가 나도 버퍼를 flush / fsync 하고 닫음
+    with RecordSink(records_file, key_fields=('keyword', 'url')) as sink:
+        # 검색 / 브라우저 추출용 Chrome 하나를 모든 키워드 / 기간에 재사용 (RESTART_EVERY 페이지마다 자동 재시작)
+        driver = ManagedDriver(headless=False, implicit_wait=10)
+        try:
+            for keyword_idx, keyword in enumerate(keywords, 1):
+                print(f"\n{'='*80}")
+                print(f"키워드 {keyword_idx}/{len(keywords)}: {keyword}")
+                print(f"{'='*80}\n")
+
+                keyword_count = 0
+                display_keyword = parse_keyword_for_display(keyword)
+
+                # URL 을 못 찾은 기간은 빈 리스트 → crawl_naver_kin 이 브라우저로 다시 검색
+                if use_http_search:
+                    keyword_ranges, window_urls = plan_date_windows(keyword, date_ranges, source='kin', cap=2500)
+                else:
+                    keyword_ranges, window_urls = date_ranges, {}
+
+                for date_range in keyword_ranges:
+                    print(f"\n{'='*60}")
+                    print(f"기간: {date_range['start']} ~ {date_range['end']}")
+                    print(f"{'='*60}")
+
+                    urls = window_urls.get((date_range['start'], date_range['end']))
+                    if urls:
+                        # 이전 실행에서 이미 저장한 질문은 다시 추출하지 않음
+                        pending = [url for url in urls if not sink.saved(keyword=display_keyword, url=url)]
+                        if not pending:
+                            print(f"⏭️  이미 저장된 기간이라 건너뜀 (URL {len(urls)}개)")
+                            continue
+                        urls = pending
+
+                    all_data = crawl_naver_kin(
+                        keyword=keyword,
+                        start_date=date_range['start'],
+                        end_date=date_range['end'],
+                        max_urls=2500,
+                        urls=urls,
+                        driver=driver,
+                        on_record=sink.write
+                    )
+                    keyword_count += len(all_data)
+                    sink.flush()
+
+                total_count += keyword_count
+                print(f"\n✅ 키워드 '{keyword}' 크롤링 완료! 총 {keyword_count}개의 데이터를 수집했습니다.\n")
+        finally:
+            # 페이지당 로드 시간 요약 출력 후 브라우저 종료 (예외가 나도 Chrome 을 남기지 않음)
+            driver.quit()
+    
+    # 키워드별 CSV 로 정리 (크롤링데이터(네이버지식인, 키워드)(2).csv, 기존 컬럼, 레코드의 keyword 는 표시용 키워드)
+    print(f"\n{'='*60}")
+    print("키워드별 데이터 CSV 저장")
+    print(f"{'='*60}")
+    for keyword in keywords:
+        display_keyword = parse_keyword_for_display(keyword)
+        csv_filename = f'크롤링데이터(네이버지식인, {create_safe_keyword_name(display_keyword)})(2).csv'
+        compact_to_csv(records_file, csv_filename, keyword=display_keyword)
+    
+    print(f"\n✅ 모든 크롤링 완료! 총 {total_count}개의 데이터를 수집했습니다.")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,452 @@
+"""
+에이블뉴스 오피니언 연재 증분 크롤러 (ablenews_ver2.ipynb 의 수집 부분을 HTTP 로 옮김)
+
+노트북은 실행할 때마다 Selenium 으로 목록 MAX_PAGE 페이지와 모든 기사를 time.sleep 을 두고 다시 열었고,
+수집 뒤에 TF-IDF / 워드클라우드까지 노트북 안에서 직접 계산했다.
+
+- 목록 / 기사 페이지를 aiohttp 커넥션 풀로 받아서 lxml 로 파싱 (브라우저 없음)
+  목록은 연재(카테고리)별로 한 페이지씩, 한 페이지의 새 기사들은 동시에 받음 / 연재끼리도 동시에 진행
+- 연재별 기사 게시일 인덱스(idxno → 게시일)를 index 파일에 저장
+  → 다시 실행하면 목록 1페이지부터 보다가 인덱스에 없는 기사가 없는 페이지에서 멈추고, 새 기사만 받음
+    (연재의 과거 기사를 한 번 끝까지 받은 뒤에만 - 그 전에는 목록 / 기사 요청 실패, 중단, --max-page 로
+     빠진 뒤쪽 페이지가 있을 수 있으므로 새 기사가 없는 페이지도 넘기며 끝까지 봄)
+  → MIN_DATE 보다 오래된 기사만 있는 페이지에서도 멈춤 (그 뒤 페이지는 더 오래됨)
+- 기사는 받는 즉시 레코드 JSONL 에 추가, 끝나면 말뭉치 컬럼 CSV(연재별 + 전체)로 정리
+  → TF-IDF / 형태소 분석 / 워드클라우드는 공통 분석 파이프라인에서:
+     python 1_형태소분석_TFIDF.py --input "에이블 뉴스/ablenews_result/ablenews_ALL.csv" --text_column content
+
+실행:
+    python ablenews_crawler.py                      # 기본 연재 (SRN182, SRN181), 2022년 이후
+    python ablenews_crawler.py --codes SRN181 --min-date 2023-01-01 --concurrency 8
+"""
+import argparse
+import asyncio
+import csv
+import json
+import os
+import re
+import time
+import traceback
+from datetime import datetime
+from urllib.parse import urljoin
+
+import aiohttp
+from lxml import etree, html
+
+# ================================================================
+# 1. 초기 설정
+# ================================================================
+CATEGORY_CODES = ["SRN182", "SRN181"]
+
+MIN_YEAR = 2022
+MIN_DATE = datetime(MIN_YEAR, 1, 1)
+
+BASE_URL = "https://www.ablenews.co.kr"
+BASE_LIST_URL = (
+    "https://www.ablenews.co.kr/news/articleList.html"
+    "?sc_serial_code={code}&sc_sub_section_code=S2N3&sc_section_code=S1N2"
+    "&view_type=sm&page={page}"
+)
+
+MAX_PAGE = 100           # 연재당 목록 페이지 상한 (보통은 인덱스 / MIN_DATE 조건으로 먼저 멈춤)
+HTTP_CONCURRENCY = 8     # 동시에 진행할 HTTP 요청 수 (커넥션 풀 크기)
+REQUEST_TIMEOUT = 15     # 요청 하나의 타임아웃(초)
+MAX_RETRIES = 3          # 429 / 5xx / 네트워크 오류 재시도 횟수
+SOURCE = "ablenews"      # 말뭉치 source 값
+
+HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 '
+                  '(KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36',
+    'Accept-Language': 'ko-KR,ko;q=0.9',
+}
+
+out_dir = "ablenews_result"
+INDEX_FILE = "ablenews_index.json"        # 연재별 idxno → 게시일 인덱스 (out_dir 안)
+BACKFILL_KEY = "_backfill_done"           # 인덱스 안: 연재별 과거 기사를 빠짐없이 끝까지 받은 시각
+RECORDS_FILE = "ablenews_records.jsonl"   # 수집한 기사 레코드 (out_dir 안)
+ERROR_LOG_FILE = "ablenews_crawl_errors.log"
+
+CORPUS_COLUMNS = ["post_id", "source", "keyword", "title", "content", "date", "url"]
+CSV_COLUMNS = CORPUS_COLUMNS + ["category", "date_raw"]
+
+# 노트북의 CSS 선택자와 같은 위치
+LIST_LINK_XPATH = etree.XPath(
+    '//*[@id="section-list"]//ul[contains(concat(" ", normalize-space(@class), " "), " type2 ")]/li'
+    '//div[contains(concat(" ", normalize-space(@class), " "), " view-cont ")]'
+    '//h4[contains(concat(" ", normalize-space(@class), " "), " titles ")]/a/@href'
+)
+ARTICLE_HEADER = '//*[@id="articleViewCon"]/article[contains(concat(" ", normalize-space(@class), " "), " body ")]/header'
+TITLE_XPATH = etree.XPath(ARTICLE_HEADER + '/h3')
+DATE_XPATH = etree.XPath(ARTICLE_HEADER + '/ul/li[2]')
+CONTENT_XPATH = etree.XPath('//*[@id="article-view-content-div"]')
+# 본문에서 빼는 요소 (사진 / 캡션 / 광고 / 스크립트)
+STRIP_TAGS = ['script', 'style', 'iframe', 'figure', 'figcaption', 'noscript', 'ins']
+COPYRIGHT_PATTERN = re.compile(r'[<＜(]?\s*저작권자\s*[ⓒ©].*$')
+IDXNO_PATTERN = re.compile(r'idxno=(\d+)')
+
+
+# ================================================================
+# 2. 에러 로그 함수
+# ================================================================
+def log_error(error_log_file, stage, msg="", cat=None, url=None, exc=None):
+    ts = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    lines = [f"[{ts}] [{stage}]"]
+    if cat:
+        lines.append(f"category={cat}")
+    if url:
+        lines.append(f"url={url}")
+    if msg:
+        lines.append(f"msg={msg}")
+    if exc is not None:
+        lines.append("traceback:")
+        lines.append(''.join(traceback.format_exception(type(exc), exc, exc.__traceback__)))
+
+    with open(error_log_file, "a", encoding="utf-8") as f:
+        f.write(" | ".join(lines) + "\n")
+
+
+# ================================================================
+# 3. 날짜 파싱 / 페이지 파싱
+# ================================================================
+def parse_article_date(date_text: str):
+    if not date_text:
+        return None
+
+    txt = date_text.strip()
+    for prefix in ["입력", "등록", "수정"]:
+        if txt.startswith(prefix):
+            txt = txt[len(prefix):].strip()
+            break
+
+    txt = txt.replace("·", " ")
+    txt = txt.replace("년", "-").replace("월", "-").replace("일", "")
+    txt = txt.replace(".", "-").strip()
+
+    for fmt in ["%Y-%m-%d %H:%M", "%Y-%m-%d"]:
+        try:
+            return datetime.strptime(txt, fmt)
+        except ValueError:
+            pass
+
+    return None
+
+
+def article_idxno(url):
+    """기사 URL 의 idxno (없으면 None)"""
+    match = IDXNO_PATTERN.search(url or '')
+    return match.group(1) if match else None
+
+
+def parse_list_page(page_html, page_url):
+    """목록 페이지 → 기사 절대 URL 리스트 (페이지 순서, 중복 제거)"""
+    if not page_html or not page_html.strip():
+        return []
+    doc = html.fromstring(page_html)
+    return list(dict.fromkeys(urljoin(page_url, href.strip()) for href in LIST_LINK_XPATH(doc) if href.strip()))
+
+
+def clean_article_text(node):
+    """본문 노드 → 사진 / 캡션 / 스크립트와 저작권 문구를 뺀 한 줄 텍스트"""
+    for bad in node.xpath(' | '.join(f'.//{tag}' for tag in STRIP_TAGS)):
+        bad.drop_tree()
+    lines = []
+    for line in node.text_content().splitlines():
+        line = ' '.join(line.split())
+        if line:
+            lines.append(line)
+    text = ' '.join(lines)
+    return COPYRIGHT_PATTERN.sub('', text).strip()
+
+
+def _first_text(nodes):
+    for node in nodes:
+        text = ' '.join(node.text_content().split())
+        if text:
+            return text
+    return None
+
+
+def parse_article(page_html):
+    """기사 페이지 → (title, date_raw, content), 없는 값은 None"""
+    if not page_html or not page_html.strip():
+        return None, None, None
+    doc = html.fromstring(page_html)
+    title = _first_text(TITLE_XPATH(doc))
+    date_raw = _first_text(DATE_XPATH(doc))
+    content_nodes = CONTENT_XPATH(doc)
+    content = clean_article_text(content_nodes[0]) if content_nodes else None
+    return title, date_raw, content or None
+
+
+def make_record(cat_code, url, title, date_raw, content, parsed_date):
+    """말뭉치 컬럼 레코드 (post_id 는 idxno)"""
+    return {
+        "post_id": article_idxno(url) or url,
+        "source": SOURCE,
+        "keyword": cat_code,
+        "title": title,
+        "content": content,
+        "date": parsed_date.strftime("%Y-%m-%d %H:%M") if parsed_date else None,
+        "url": url,
+        "category": cat_code,
+        "date_raw": date_raw,
+    }
+
+
+# ================================================================
+# 4. 인덱스 / 레코드 저장
+# ================================================================
+def load_index(path):
+    """{카테고리: {idxno: 게시일('YYYY-MM-DD HH:MM', 날짜를 못 읽었으면 '')}, BACKFILL_KEY: {카테고리: 시각}}"""
+    if not os.path.exists(path):
+        return {}
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, json.JSONDecodeError) as e:
+        print(f"⚠️ 인덱스 파일을 읽지 못했습니다 ({path}): {e} - 처음부터 수집")
+        return {}
+
+
+def save_index(index, path):
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(index, f, ensure_ascii=False, indent=1, sort_keys=True)
+    os.replace(tmp_path, path)
+
+
+def append_records(path, records):
+    """레코드를 JSONL 에 추가하고 디스크까지 기록 (인덱스보다 먼저 → 중간에 죽으면 다시 받아서 CSV 정리 때 중복 제거)"""
+    if not records:
+        return
+    with open(path, "a", encoding="utf-8") as f:
+        f.write("".join(json.dumps(record, ensure_ascii=False) + "\n" for record in records))
+        f.flush()
+        os.fsync(f.fileno())
+
+
+def iter_records(path):
+    if not os.path.exists(path):
+        return
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError:
+                continue  # 쓰다가 끊긴 마지막 줄
+
+
+def export_csvs(records_file, result_dir, cat_codes):
+    """레코드 JSONL → 연재별 ablenews_{code}.csv + 전체 ablenews_ALL.csv (post_id 중복 제거, 최신 게시일 순)"""
+    records = {}
+    for record in iter_records(records_file):
+        records[record["post_id"]] = record
+    rows = sorted(records.values(), key=lambda r: r.get("date") or "", reverse=True)
+
+    def write(filename, selected):
+        path = os.path.join(result_dir, filename)
+        with open(path, "w", encoding="utf-8-sig", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=CSV_COLUMNS, extrasaction="ignore")
+            writer.writeheader()
+            writer.writerows(selected)
+        return path
+
+    for cat_code in cat_codes:
+        selected = [r for r in rows if r["category"] == cat_code]
+        if selected:
+            print(f"✅ [{cat_code}] 유효 데이터 {len(selected)}건 → {write(f'ablenews_{cat_code}.csv', selected)}")
+        else:
+            print(f"⚠️ [{cat_code}] 유효 데이터가 없습니다.")
+    if not rows:
+        print("\n⚠️ 전체 합칠 데이터가 없습니다.")
+        return None
+    total_csv = write("ablenews_ALL.csv", rows)
+    print(f"\n🎯 전체 합치기 완료 → {total_csv} (총 {len(rows)}건)")
+    return total_csv
+
+
+# ================================================================
+# 5. HTTP 수집
+# ================================================================
+def create_session(concurrency=HTTP_CONCURRENCY):
+    """커넥션을 concurrency 개까지 재사용하는 aiohttp 세션 (이벤트 루프 안에서 호출)"""
+    connector = aiohttp.TCPConnector(limit=concurrency, ttl_dns_cache=300)
+    return aiohttp.ClientSession(headers=HEADERS, connector=connector,
+                                 timeout=aiohttp.ClientTimeout(total=REQUEST_TIMEOUT))
+
+
+async def fetch_html(session, semaphore, url):
+    """GET 요청 후 HTML 반환. 429 / 5xx / 네트워크 오류는 지수 백오프로 재시도, 실패하면 None"""
+    for attempt in range(MAX_RETRIES):
+        try:
+            async with semaphore:
+                async with session.get(url) as res:
+                    if res.status == 429 or res.status >= 500:
+                        retry_after = res.headers.get('Retry-After')
+                        wait_time = float(retry_after) if retry_after and retry_after.isdigit() else 2 ** attempt
+                        print(f"  > HTTP {res.status}. {wait_time:.1f}초 대기 후 재시도. ({url})")
+                    elif res.status != 200:
+                        print(f"  > 요청 실패: HTTP {res.status} ({url})")
+                        return None
+                    else:
+                        return await res.text(errors='replace')
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            wait_time = 2 ** attempt
+            print(f"  > 네트워크 오류: {e!r}. 재시도. ({url})")
+        await asyncio.sleep(wait_time)
+    return None
+
+
+async def crawl_category(session, semaphore, cat_code, index, result_dir, min_date=MIN_DATE, max_page=MAX_PAGE,
+                         list_url=BASE_LIST_URL):
+    """
+    연재 하나를 목록 1페이지부터 증분 수집
+
+    "새 기사가 없는 페이지에서 멈춤" 은 과거 기사를 한 번 끝까지 받은 연재(BACKFILL_KEY)에만 적용.
+    표시는 실행을 시작할 때 지우고(첫 페이지 저장 때 같이 기록 → 중간에 죽어도 남지 않음),
+    MIN_DATE 이전 / 목록 끝까지 목록 / 기사 요청 실패 없이 닿았을 때만 다시 남김.
+
+    Returns:
+        (받은 목록 페이지 수, 받은 기사 수, 저장한 레코드 수)
+    """
+    known = index.setdefault(cat_code, {})
+    backfill = index.setdefault(BACKFILL_KEY, {})
+    backfill_done = backfill.pop(cat_code, None) is not None
+    records_file = os.path.join(result_dir, RECORDS_FILE)
+    error_log_file = os.path.join(result_dir, ERROR_LOG_FILE)
+    index_file = os.path.join(result_dir, INDEX_FILE)
+    pages = fetched = saved = 0
+    failed = reached_end = False
+    prev_urls = None
+
+    async def fetch_article(url):
+        try:
+            page_html = await fetch_html(session, semaphore, url)
+            if page_html is None:
+                log_error(error_log_file, "본문 크롤링", "요청 실패", cat=cat_code, url=url)
+                return url, None
+            return url, parse_article(page_html)
+        except Exception as e:
+            log_error(error_log_file, "본문 크롤링", "오류", cat=cat_code, url=url, exc=e)
+            return url, None
+
+    for page in range(1, max_page + 1):
+        page_url = list_url.format(code=cat_code, page=page)
+        page_html = await fetch_html(session, semaphore, page_url)
+        pages += 1
+        if page_html is None:
+            log_error(error_log_file, "URL 수집", f"목록 {page}페이지 요청 실패", cat=cat_code, url=page_url)
+            failed = True
+            break
+        urls = [url for url in parse_list_page(page_html, page_url) if article_idxno(url)]
+        if not urls or urls == prev_urls:  # 마지막 페이지 다음 (빈 목록 / 마지막 페이지 반복)
+            print(f"⏭️ [{cat_code}] {page}페이지: 목록 끝")
+            reached_end = True
+            break
+        prev_urls = urls
+        new_urls = [url for url in urls if article_idxno(url) not in known]
+        if not new_urls and backfill_done:
+            print(f"⏭️ [{cat_code}] {page}페이지: 새 기사 없음 → 중단")
+            reached_end = True
+            break
+
+        records = []
+        for url, parsed in await asyncio.gather(*(fetch_article(url) for url in new_urls)):
+            if parsed is None:
+                failed = True
+                continue  # 인덱스에 안 넣음 → 다음 실행 때 다시 시도
+            fetched += 1
+            title, date_raw, content = parsed
+            parsed_date = parse_article_date(date_raw)
+            known[article_idxno(url)] = parsed_date.strftime("%Y-%m-%d %H:%M") if parsed_date else ''
+            if parsed_date and parsed_date < min_date:
+                continue
+            if not title or not content or not date_raw:
+                continue
+            records.append(make_record(cat_code, url, title, date_raw, content, parsed_date))
+        if new_urls:
+            append_records(records_file, records)
+            save_index(index, index_file)
+            saved += len(records)
+            print(f"✅ [{cat_code}] {page}페이지: 새 기사 {len(new_urls)}개 중 {len(records)}건 저장")
+        else:
+            print(f"⏭️ [{cat_code}] {page}페이지: 새 기사 없음 (과거 기사 수집이 안 끝나서 다음 페이지로)")
+
+        # 이 페이지 기사가 모두 MIN_DATE 이전이면 다음 페이지는 더 오래된 기사뿐
+        dates = [known.get(article_idxno(url)) for url in urls]
+        if dates and all(d and d < min_date.strftime("%Y-%m-%d %H:%M") for d in dates):
+            print(f"⏭️ [{cat_code}] {page}페이지: 모두 {min_date:%Y-%m-%d} 이전 기사 → 중단")
+            reached_end = True
+            break
+
+    if reached_end and not failed:
+        backfill[cat_code] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    elif backfill_done:
+        print(f"⚠️ [{cat_code}] 요청 실패 / 페이지 상한으로 끝까지 못 봄 → 다음 실행은 새 기사가 없는 페이지도 넘기며 확인")
+    save_index(index, index_file)
+    return pages, fetched, saved
+
+
+async def crawl_async(cat_codes, index, result_dir, concurrency=HTTP_CONCURRENCY, min_date=MIN_DATE,
+                      max_page=MAX_PAGE, list_url=BASE_LIST_URL):
+    semaphore = asyncio.Semaphore(concurrency)
+    session = create_session(concurrency)
+    try:
+        results = await asyncio.gather(*(
+            crawl_category(session, semaphore, code, index, result_dir, min_date, max_page, list_url)
+            for code in cat_codes))
+    finally:
+        await session.close()
+    return dict(zip(cat_codes, results))
+
+
+def crawl_ablenews(cat_codes=CATEGORY_CODES, result_dir=out_dir, concurrency=HTTP_CONCURRENCY, min_date=MIN_DATE,
+                   max_page=MAX_PAGE, list_url=BASE_LIST_URL):
+    """
+    연재들을 증분 수집하고 CSV 로 정리
+
+    Returns:
+        전체 CSV 경로 (데이터가 없으면 None)
+    """
+    os.makedirs(result_dir, exist_ok=True)
+    index_file = os.path.join(result_dir, INDEX_FILE)
+    index = load_index(index_file)
+    known = sum(len(index.get(code, {})) for code in cat_codes)
+    pending = [code for code in cat_codes if code not in index.get(BACKFILL_KEY, {})]
+    if pending:
+        print(f"📚 과거 기사 수집이 안 끝난 연재 {pending}: 새 기사가 없는 페이지도 넘기며 목록 끝까지 확인")
+    if known:
+        print(f"⏭️ 인덱스의 기존 기사 {known}개는 건너뜀 ({index_file})")
+
+    started = time.perf_counter()
+    results = asyncio.run(crawl_async(cat_codes, index, result_dir, concurrency, min_date, max_page, list_url))
+    elapsed = time.perf_counter() - started
+    for code, (pages, fetched, saved) in results.items():
+        latest = max((d for d in index.get(code, {}).values() if d), default='-')
+        print(f"📊 [{code}] 목록 {pages}페이지, 기사 {fetched}개 요청, {saved}건 저장 (최신 게시일 {latest})")
+    print(f"⏱️ 수집 {elapsed:.1f}초")
+    return export_csvs(os.path.join(result_dir, RECORDS_FILE), result_dir, cat_codes)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="에이블뉴스 오피니언 연재 증분 크롤러 (HTTP)")
+    parser.add_argument('--codes', nargs='+', default=CATEGORY_CODES, help="연재 코드 (sc_serial_code)")
+    parser.add_argument('--min-date', default=MIN_DATE.strftime('%Y-%m-%d'), help="이 날짜 이후 기사만 (YYYY-MM-DD)")
+    parser.add_argument('--concurrency', type=int, default=HTTP_CONCURRENCY)
+    parser.add_argument('--max-page', type=int, default=MAX_PAGE)
+    parser.add_argument('--out-dir', default=out_dir)
+    args = parser.parse_args()
+
+    total_csv = crawl_ablenews(args.codes, args.out_dir, args.concurrency,
+                               datetime.strptime(args.min_date, '%Y-%m-%d'), args.max_page)
+    if total_csv:
+        print("\n👉 TF-IDF / 형태소 분석은 저장소 루트의 분석 파이프라인으로:")
+        print(f'   python 1_형태소분석_TFIDF.py --input "{os.path.abspath(total_csv)}" --text_column content')
+        print(f'   python corpus_storage.py import --source {SOURCE} --root data/corpus "{os.path.abspath(total_csv)}"')
+
+
+if __name__ == '__main__':
+    main()
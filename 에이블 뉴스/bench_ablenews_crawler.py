@@ -0,0 +1,194 @@
+"""
+ablenews_crawler 점검 / 벤치마크 (오프라인, 가짜 에이블뉴스 서버 사용)
+
+1) 파싱: fixtures 의 실제 구조 목록 / 기사 페이지에서 링크 / 제목 / 게시일 / 본문(사진 캡션, 스크립트, 저작권 문구 제외)
+2) 속도: 연재 2개 × 기사 --articles 개를 동시 요청 1개(노트북처럼 하나씩) vs --concurrency 개로 수집
+3) 증분: 같은 폴더로 다시 실행 → 목록 1페이지씩만 받고 기사는 다시 받지 않는지,
+         새 기사를 추가하고 다시 실행 → 새 기사만 받는지
+4) 첫 실행에서 목록 2페이지가 실패 → 다음 실행이 새 기사 없는 1페이지에서 멈추지 않고 뒤쪽 기사까지 받는지
+
+실행:
+    python bench_ablenews_crawler.py --articles 120 --latency 0.05 --concurrency 8
+"""
+import argparse
+import os
+import re
+import tempfile
+import threading
+import time
+from datetime import datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import ablenews_crawler
+from ablenews_crawler import crawl_ablenews, iter_records, parse_article, parse_list_page
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+PAGE_SIZE = 20
+CODES = ['SRN182', 'SRN181']
+
+
+def read_fixture(name):
+    with open(os.path.join(FIXTURE_DIR, name), encoding='utf-8') as f:
+        return f.read()
+
+
+class FakeAblenews:
+    """연재별 기사 목록(최신순)을 fixture 와 같은 구조의 목록 / 기사 HTML 로 돌려주는 서버"""
+
+    def __init__(self, articles_per_code, latency):
+        self.latency = latency
+        self.articles = {}   # code → [(idxno, 게시일)] 최신순
+        self.requests = {'list': 0, 'article': 0}
+        self.fail_once = set()   # (연재, 목록 페이지) - 한 번만 404 로 실패
+        self.lock = threading.Lock()
+        self.next_idxno = 300000
+        start = datetime(2021, 6, 1)
+        for code in CODES:
+            self.articles[code] = []
+        for i in range(articles_per_code):
+            for code in CODES:
+                self.add(code, start + timedelta(days=7 * i))
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                url = urlparse(self.path)
+                body = fake.respond(url.path, {k: v[0] for k, v in parse_qs(url.query).items()})
+                if body is None:
+                    self.send_response(404)
+                    self.end_headers()
+                    return
+                body = body.encode('utf-8')
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/html; charset=utf-8')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.base = f"http://127.0.0.1:{self.server.server_address[1]}"
+        self.list_url = (self.base + "/news/articleList.html?sc_serial_code={code}&sc_sub_section_code=S2N3"
+                         "&sc_section_code=S1N2&view_type=sm&page={page}")
+
+    def add(self, code, published):
+        self.next_idxno += 1
+        self.articles[code].insert(0, (str(self.next_idxno), published))
+
+    def respond(self, path, query):
+        time.sleep(self.latency)
+        if path.endswith('articleList.html'):
+            with self.lock:
+                self.requests['list'] += 1
+            page = int(query.get('page', 1))
+            with self.lock:
+                if (query['sc_serial_code'], page) in self.fail_once:
+                    self.fail_once.discard((query['sc_serial_code'], page))
+                    return None
+            items = self.articles[query['sc_serial_code']][(page - 1) * PAGE_SIZE:page * PAGE_SIZE]
+            lis = ''.join(
+                f'<li><div class="view-cont"><h4 class="titles"><a href="/news/articleView.html?idxno={idxno}">'
+                f'기사 {idxno}</a></h4><span class="byline"><em>{published:%Y.%m.%d %H:%M}</em></span></div></li>'
+                for idxno, published in items)
+            return f'<html><body><section id="section-list"><ul class="type2">{lis}</ul></section></body></html>'
+        with self.lock:
+            self.requests['article'] += 1
+        idxno = query['idxno']
+        published = next(p for items in self.articles.values() for i, p in items if i == idxno)
+        return (f'<html><body><div id="articleViewCon"><article class="grid body"><header><h3>기사 {idxno}</h3>'
+                f'<ul><li>칼럼니스트</li><li>입력 {published:%Y.%m.%d %H:%M}</li></ul></header>'
+                f'<article id="article-view-content-div"><p>{idxno}번 기사 본문입니다. ' + '장애인 이동권 ' * 30 +
+                '</p><figure><figcaption>사진 설명</figcaption></figure></article></article></div></body></html>')
+
+    def shutdown(self):
+        self.server.shutdown()
+
+
+def check(name, ok):
+    print(f"{'✅' if ok else '❌'} {name}")
+    return ok
+
+
+def run(site, result_dir, concurrency):
+    site.requests = {'list': 0, 'article': 0}
+    start = time.perf_counter()
+    crawl_ablenews(CODES, result_dir, concurrency, datetime(2022, 1, 1), list_url=site.list_url)
+    return time.perf_counter() - start, dict(site.requests)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="ablenews_crawler 점검 / 벤치마크")
+    parser.add_argument('--articles', type=int, default=120, help="연재당 기사 수")
+    parser.add_argument('--latency', type=float, default=0.05, help="가짜 서버 요청당 지연(초)")
+    parser.add_argument('--concurrency', type=int, default=8)
+    args = parser.parse_args()
+
+    results = []
+    # 1) 파싱
+    page_url = 'https://www.ablenews.co.kr/news/articleList.html?sc_serial_code=SRN181&page=1'
+    links = parse_list_page(read_fixture('list_SRN181_page1.html'), page_url)
+    results.append(check(f"목록 링크 {len(links)}개 (사이드바 제외)",
+                         [re.search(r'idxno=(\d+)', u).group(1) for u in links] == ['213057', '212841', '212510']
+                         and links[0].startswith('https://www.ablenews.co.kr/news/articleView.html')))
+    title, date_raw, content = parse_article(read_fixture('article_212841.html'))
+    results.append(check(f"제목 / 게시일: {title} / {date_raw}",
+                         title == '청각장애인에게 안내방송은 없는 것과 같다'
+                         and ablenews_crawler.parse_article_date(date_raw) == datetime(2024, 4, 18, 10, 25)))
+    results.append(check(f"본문 {len(content)}자 (캡션 / 스크립트 / 저작권 문구 제외)",
+                         content.startswith('출근길 지하철이 멈춰 섰다. 객실 안에는 안내방송이 흘러나왔지만 청각장애인')
+                         and content.endswith('같은 정보를 얻을 수 있다.')
+                         and 'ⓒ' not in content and 'googletag' not in content))
+
+    # 2) 속도
+    site = FakeAblenews(args.articles, args.latency)
+    expected = sum(1 for items in site.articles.values() for _, p in items if p >= datetime(2022, 1, 1))
+    timings = {}
+    try:
+        for concurrency in (1, args.concurrency):
+            with tempfile.TemporaryDirectory() as tmp_dir:
+                timings[concurrency] = run(site, tmp_dir, concurrency)
+                saved = len(list(iter_records(os.path.join(tmp_dir, ablenews_crawler.RECORDS_FILE))))
+        results.append(check(f"2022년 이후 기사 {saved}건 저장 (기대 {expected}건)", saved == expected))
+
+        # 3) 증분
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            run(site, tmp_dir, args.concurrency)
+            _, again = run(site, tmp_dir, args.concurrency)
+            results.append(check(f"재실행: 목록 {again['list']}페이지, 기사 {again['article']}개 요청",
+                                 again == {'list': len(CODES), 'article': 0}))
+            for code in CODES:
+                for _ in range(3):
+                    site.add(code, datetime(2030, 1, 1))
+            _, added = run(site, tmp_dir, args.concurrency)
+            total = len({r['post_id'] for r in iter_records(os.path.join(tmp_dir, ablenews_crawler.RECORDS_FILE))})
+            results.append(check(f"새 기사 6개 추가 후: 목록 {added['list']}페이지, 기사 {added['article']}개 요청, "
+                                 f"누적 {total}건", added['article'] == 6 and total == expected + 6))
+
+        # 4) 목록 페이지 실패 뒤 재실행
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            site.fail_once = {(code, 2) for code in CODES}
+            run(site, tmp_dir, args.concurrency)
+            first = len(list(iter_records(os.path.join(tmp_dir, ablenews_crawler.RECORDS_FILE))))
+            run(site, tmp_dir, args.concurrency)
+            total = len({r['post_id'] for r in iter_records(os.path.join(tmp_dir, ablenews_crawler.RECORDS_FILE))})
+            _, again = run(site, tmp_dir, args.concurrency)
+            results.append(check(f"목록 2페이지 실패 → 첫 실행 {first}건, 재실행 후 {total}건, 그다음은 목록 "
+                                 f"{again['list']}페이지만", first < total == expected + 6
+                                 and again == {'list': len(CODES), 'article': 0}))
+    finally:
+        site.shutdown()
+
+    print("\n========== 벤치마크 결과 ==========")
+    print(f"연재 {len(CODES)}개 × 기사 {args.articles}개, 요청당 지연 {args.latency}초")
+    for concurrency, (sec, requests) in timings.items():
+        print(f"동시 {concurrency:>2}개: {sec:.2f}초 (목록 {requests['list']}페이지, 기사 {requests['article']}개)")
+    print(f"속도 향상: {timings[1][0] / timings[args.concurrency][0]:.1f}배")
+    print(f"점검 {sum(results)}/{len(results)} 통과")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,216 @@
+"""
+youtube_collector 점검 / 벤치마크 (오프라인, fixtures 의 Data API 응답을 돌려주는 가짜 서버 사용)
+
+fixtures/
+  commentThreads_{video_id}_{n}.json : commentThreads.list 응답 페이지 (nextPageToken 으로 이어짐)
+  videos.json                         : videos.list 응답
+  transcript_{video_id}.json          : 자막 구간 [{text, start, duration}]
+  error_commentsDisabled.json / error_quotaExceeded.json : 403 오류 응답
+
+1) 파싱: fixture 영상 2개 + 댓글 막힌 영상 1개 → 레코드 수 / 컬럼 / 커서 상태가 fixture 와 맞는지
+2) 재개: 서버 할당량을 중간에 소진시켜 멈춘 뒤 다시 실행 → 중복 / 누락 없이 이어서 끝나는지, 요청을 다시 하지 않는지
+3) 속도: 같은 fixture 를 복제한 영상 N개를 동시 처리 수 1(노트북처럼 하나씩) vs --concurrency 로 수집
+
+실행:
+    python bench_youtube_collector.py --videos 40 --latency 0.05 --concurrency 8
+"""
+import argparse
+import asyncio
+import glob
+import json
+import os
+import re
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+from youtube_collector import CSV_COLUMNS, collect_async, export_csv, iter_records
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+VIDEO_A, VIDEO_B, VIDEO_DISABLED = 'lxZsn3cwdAU', 'dFRXcYJVfMM', 'kE9pW2rT0aZ'
+
+
+def load_fixture(name):
+    with open(os.path.join(FIXTURE_DIR, name), encoding='utf-8') as f:
+        return json.load(f)
+
+
+def load_pages():
+    """video_id → 페이지 리스트, nextPageToken → 다음 페이지 번호"""
+    pages, tokens = {}, {}
+    for path in sorted(glob.glob(os.path.join(FIXTURE_DIR, 'commentThreads_*_*.json'))):
+        video_id, _ = re.match(r'commentThreads_(.+)_(\d+)\.json', os.path.basename(path)).groups()
+        pages.setdefault(video_id, []).append(load_fixture(os.path.basename(path)))
+    for video_pages in pages.values():
+        for i, page in enumerate(video_pages):
+            if page.get('nextPageToken'):
+                tokens[page['nextPageToken']] = i + 1
+    return pages, tokens
+
+
+class FakeYouTube:
+    """fixture 를 돌려주는 Data API 서버 (bench 로 시작하는 video_id 는 VIDEO_A 의 페이지를 복제해서 응답)"""
+
+    def __init__(self, latency=0.0, quota=None):
+        self.pages, self.tokens = load_pages()
+        self.videos = {item['id']: item for item in load_fixture('videos.json')['items']}
+        self.latency = latency
+        self.quota = quota      # 이 요청 수를 넘으면 quotaExceeded (None 이면 무제한)
+        self.requests = 0
+        self.lock = threading.Lock()
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                url = urlparse(self.path)
+                status, body = fake.respond(url.path.rsplit('/', 1)[-1],
+                                            {k: v[0] for k, v in parse_qs(url.query).items()})
+                data = json.dumps(body, ensure_ascii=False).encode('utf-8')
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json; charset=utf-8')
+                self.send_header('Content-Length', str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}/youtube/v3"
+
+    def respond(self, endpoint, query):
+        time.sleep(self.latency)
+        with self.lock:
+            self.requests += 1
+            if self.quota is not None and self.requests > self.quota:
+                return 403, load_fixture('error_quotaExceeded.json')
+        if endpoint == 'videos':
+            items = []
+            for vid in query['id'].split(','):
+                item = json.loads(json.dumps(self.videos.get(vid) or self.videos[VIDEO_A]))
+                item['id'] = vid
+                items.append(item)
+            return 200, {'kind': 'youtube#videoListResponse', 'items': items}
+
+        vid = query['videoId']
+        base = VIDEO_A if vid.startswith('bench') else vid
+        if base not in self.pages:
+            return 403, load_fixture('error_commentsDisabled.json')
+        page = json.loads(json.dumps(self.pages[base][self.tokens.get(query.get('pageToken'), 0)]))
+        if base != vid:
+            for item in page['items']:
+                item['id'] = f"{item['id']}_{vid}"
+        return 200, page
+
+    def shutdown(self):
+        self.server.shutdown()
+
+
+class NoTranscriptFound(Exception):
+    """youtube_transcript_api 의 같은 이름 예외 흉내 (자막 없음 → 완료 처리)"""
+
+
+def fake_transcript_fetcher(latency):
+    segments = load_fixture(f'transcript_{VIDEO_A}.json')
+
+    def fetch(video_id, languages):
+        time.sleep(latency)
+        if video_id != VIDEO_A and not video_id.startswith('bench'):
+            raise NoTranscriptFound(video_id)
+        return ' '.join(seg['text'] for seg in segments)
+    return fetch
+
+
+def run(server, video_ids, tmp_dir, concurrency, latency, daily_quota=10000):
+    return asyncio.run(collect_async(
+        video_ids, 'FAKE_KEY', keyword='청각장애',
+        records_file=os.path.join(tmp_dir, 'records.jsonl'), state_file=os.path.join(tmp_dir, 'state.json'),
+        concurrency=concurrency, daily_quota=daily_quota, rate=1000,
+        transcript_fetcher=fake_transcript_fetcher(latency), api_url=server.url))
+
+
+def check(name, ok):
+    print(f"{'✅' if ok else '❌'} {name}")
+    return ok
+
+
+def main():
+    parser = argparse.ArgumentParser(description="youtube_collector 점검 / 벤치마크")
+    parser.add_argument('--videos', type=int, default=40, help="속도 측정에 쓸 영상 수")
+    parser.add_argument('--latency', type=float, default=0.05, help="가짜 서버 / 자막 요청당 지연(초)")
+    parser.add_argument('--concurrency', type=int, default=8)
+    args = parser.parse_args()
+
+    pages, _ = load_pages()
+    expected = {vid: sum(len(p['items']) for p in video_pages) for vid, video_pages in pages.items()}
+    results = []
+
+    # 1) 파싱
+    server = FakeYouTube()
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        summary = run(server, [VIDEO_A, VIDEO_B, VIDEO_DISABLED], tmp_dir, 3, 0)
+        records = list(iter_records(os.path.join(tmp_dir, 'records.jsonl')))
+        with open(os.path.join(tmp_dir, 'state.json'), encoding='utf-8') as f:
+            state = json.load(f)['videos']
+        csv_rows = export_csv(os.path.join(tmp_dir, 'records.jsonl'), os.path.join(tmp_dir, 'out.csv'))
+    server.shutdown()
+    comments = [r for r in records if r['type'] == 'comment']
+    scripts = [r for r in records if r['type'] == 'script']
+    results.append(check(f"댓글 수 fixture 와 일치 ({len(comments)} == {sum(expected.values())})",
+                         len(comments) == sum(expected.values())))
+    results.append(check("자막은 자막 있는 영상 1개만", [r['video_id'] for r in scripts] == [VIDEO_A]))
+    results.append(check("말뭉치 컬럼 / source / 제목 채움",
+                         all(set(CSV_COLUMNS) <= set(r) and r['source'] == 'youtube' and r['title'] for r in records)))
+    results.append(check("커서 상태: 모두 완료, 마지막 nextPageToken 없음",
+                         all(v['comments_done'] and v['page_token'] is None for v in state.values())
+                         and state[VIDEO_A]['pages'] == len(pages[VIDEO_A])))
+    results.append(check(f"CSV 행 수 ({csv_rows})", csv_rows == len(records) and summary['complete']))
+
+    # 2) 재개 (서버 할당량 소진 → 다시 실행)
+    resume_ids = [f'bench{i:06d}' for i in range(12)]
+    server = FakeYouTube()
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        run(server, resume_ids, tmp_dir, 4, 0)
+        full_requests = server.requests
+        full_records = len(list(iter_records(os.path.join(tmp_dir, 'records.jsonl'))))
+    server.shutdown()
+
+    server = FakeYouTube(quota=full_requests // 2)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        first = run(server, resume_ids, tmp_dir, 4, 0)
+        server.quota = None
+        second = run(server, resume_ids, tmp_dir, 4, 0)
+        post_ids = [r['post_id'] for r in iter_records(os.path.join(tmp_dir, 'records.jsonl'))]
+    server.shutdown()
+    results.append(check(f"1차 실행은 할당량 소진으로 중단 (완료 {first['done']}/{len(resume_ids)})",
+                         not first['complete']))
+    results.append(check(f"2차 실행으로 완료, 레코드 {len(post_ids)} == 한 번에 수집 {full_records}, 중복 없음",
+                         second['complete'] and len(post_ids) == full_records == len(set(post_ids))))
+    # 할당량 초과로 거절된 요청(소진 시점에 진행 중이던 최대 동시 처리 수만큼)만 더 요청함
+    results.append(check(f"이어받기 요청 수 {server.requests} (한 번에 수집 {full_requests} + 거절 최대 4)",
+                         full_requests < server.requests <= full_requests + 4))
+
+    # 3) 속도
+    bench_ids = [f'bench{i:06d}' for i in range(args.videos)]
+    server = FakeYouTube(latency=args.latency)
+    timings = {}
+    for concurrency in (1, args.concurrency):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            start = time.perf_counter()
+            summary = run(server, bench_ids, tmp_dir, concurrency, args.latency)
+            timings[concurrency] = (time.perf_counter() - start, summary['records'])
+    server.shutdown()
+
+    print("\n========== 벤치마크 결과 ==========")
+    print(f"영상 {args.videos}개 (영상당 댓글 {len(pages[VIDEO_A])}페이지 + 자막), 요청당 지연 {args.latency}초")
+    for concurrency, (sec, count) in timings.items():
+        print(f"동시 {concurrency:>2}개: {sec:.2f}초, 레코드 {count}개")
+    print(f"속도 향상: {timings[1][0] / timings[args.concurrency][0]:.1f}배")
+    print(f"점검 {sum(results)}/{len(results)} 통과")
+
+
+if __name__ == '__main__':
+    main()
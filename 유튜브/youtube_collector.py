@@ -0,0 +1,604 @@
+"""
+유튜브 댓글 + 자막 수집기 (youtube_ver4.ipynb 의 fetch_all_comments_for_video / fetch_full_transcript /
+collect_data_from_urls 를 모듈 + CLI 로 옮김)
+
+노트북은 영상 하나씩 자막 → 댓글 전체 페이지를 차례로 받아서, 영상이 많으면 대부분의 시간을 응답 대기로 보낸다.
+- 여러 영상의 댓글 페이지 / 자막을 동시에 수집 (영상 동시 처리 수 concurrency)
+- 모든 요청이 하나의 QuotaLimiter 를 공유: 초당 요청 수(토큰 버킷) + Data API 하루 할당량(단위) 예산
+  (commentThreads / videos 호출 1번 = 1단위, 자막은 Data API 가 아니라 0단위 / 속도 제한만 적용)
+- 페이지를 받을 때마다 레코드를 JSONL 에 바로 추가하고, 영상별 nextPageToken 을 상태 파일에 저장
+  → 할당량 소진 / 중단 후 다시 실행하면 끝난 영상은 건너뛰고 남은 영상은 저장된 커서부터 이어서 수집
+- 레코드는 말뭉치 공통 컬럼(post_id, source, keyword, title, content, date, url)에
+  video_id / type(comment, script) / author / like_count 를 더한 형식
+  → 끝나면 같은 컬럼의 CSV 로 정리 (corpus_storage.py import --source youtube 로 그대로 가져올 수 있음)
+
+실행:
+    export YOUTUBE_API_KEY=...
+    python youtube_collector.py https://www.youtube.com/shorts/lxZsn3cwdAU https://www.youtube.com/watch?v=dFRXcYJVfMM
+    python youtube_collector.py --url-file urls.txt --keyword 청각장애 --concurrency 8 --quota 10000
+
+사용 예:
+    summary = collect_videos(urls, api_key, keyword='청각장애', out_dir='youtube_results_commentsADDscript')
+"""
+import argparse
+import asyncio
+import csv
+import json
+import os
+import re
+import time
+from datetime import datetime
+from zoneinfo import ZoneInfo
+
+import aiohttp
+
+API_URL = "https://www.googleapis.com/youtube/v3"
+API_KEY_ENV = "YOUTUBE_API_KEY"      # --api-key 를 안 주면 이 환경변수 사용
+SOURCE = "youtube"                   # 말뭉치 source 값
+
+VIDEO_CONCURRENCY = 8        # 동시에 처리할 영상 수
+TRANSCRIPT_CONCURRENCY = 4   # 동시에 받을 자막 수 (youtube_transcript_api 는 동기 → 스레드에서 실행)
+REQUESTS_PER_SEC = 10.0      # 전체 요청 속도 (자막 포함)
+BURST = 10                   # 토큰 버킷 최대 용량
+DAILY_QUOTA = 10000          # 프로젝트 하루 기본 할당량(단위)
+QUOTA_COST = {"commentThreads": 1, "videos": 1}
+QUOTA_TZ = ZoneInfo("America/Los_Angeles")  # 할당량은 태평양 시간 자정에 초기화됨
+MAX_RESULTS = 100            # 댓글 페이지당 최대 개수 (API 상한)
+MAX_RETRIES = 4              # 429 / 5xx / 네트워크 오류 재시도 횟수
+REQUEST_TIMEOUT = 30         # 요청 타임아웃(초)
+TRANSCRIPT_LANGUAGES = ["ko", "en"]  # 한국어 > 영어 우선
+
+RESULT_DIR = "youtube_results_commentsADDscript"
+RECORDS_FILE = "youtube_records.jsonl"
+STATE_FILE = "youtube_collect_state.json"
+CSV_FILE = "youtube_all_videos_script_comments.csv"
+
+CORPUS_COLUMNS = ["post_id", "source", "keyword", "title", "content", "date", "url"]
+CSV_COLUMNS = CORPUS_COLUMNS + ["video_id", "type", "author", "like_count"]
+
+QUOTA_REASONS = {"quotaExceeded", "dailyLimitExceeded"}
+RATE_REASONS = {"rateLimitExceeded", "userRateLimitExceeded"}
+# 다시 요청해도 결과가 같은 오류 → 그 영상 댓글은 완료로 표시
+SKIP_REASONS = {"commentsDisabled", "videoNotFound", "forbidden"}
+# youtube_transcript_api 에서 자막이 없다는 뜻의 예외 (그 외 예외는 다음 실행 때 다시 시도)
+NO_TRANSCRIPT_ERRORS = {"TranscriptsDisabled", "NoTranscriptFound", "VideoUnavailable",
+                        "VideoUnplayable", "InvalidVideoId", "AgeRestricted"}
+
+_VIDEO_ID = re.compile(r"^[A-Za-z0-9_-]{11}$")
+
+
+class QuotaExceeded(Exception):
+    """하루 할당량(단위) 소진 - 진행 상황을 저장하고 수집 중단"""
+
+
+class YouTubeApiError(Exception):
+    def __init__(self, status, reason, message=""):
+        super().__init__(f"HTTP {status} {reason}: {message}")
+        self.status = status
+        self.reason = reason
+
+
+class QuotaLimiter:
+    """
+    모든 코루틴이 공유하는 속도 + 할당량 제한
+
+    - 토큰 버킷으로 초당 요청 수 제한 (Reddit/reddit_async.py 의 TokenBucket 과 같은 방식)
+    - acquire(cost) 는 요청 전에 할당량 단위를 먼저 예약 → 동시에 기다리는 요청들이 예산을 넘기지 않음
+    - 예산이 모자라거나 API 가 quotaExceeded 를 돌려주면(exhaust) 이후 acquire 는 QuotaExceeded
+    """
+
+    def __init__(self, rate=REQUESTS_PER_SEC, capacity=BURST, daily_quota=DAILY_QUOTA, used=0):
+        self.rate = rate
+        self.capacity = capacity
+        self.daily_quota = daily_quota
+        self.used = used
+        self.exhausted = False
+        self.tokens = float(capacity)
+        self.updated = time.monotonic()
+        self.blocked_until = 0.0
+        self._lock = asyncio.Lock()
+
+    @property
+    def remaining(self):
+        return max(self.daily_quota - self.used, 0)
+
+    def _refill(self, now):
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    async def acquire(self, cost=0):
+        """할당량 cost 단위를 예약하고 토큰 1개를 얻을 때까지 대기"""
+        if self.exhausted or self.used + cost > self.daily_quota:
+            self.exhausted = True
+            raise QuotaExceeded(f"할당량 {self.used}/{self.daily_quota}단위 사용")
+        self.used += cost
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                if now < self.blocked_until:
+                    await asyncio.sleep(self.blocked_until - now)
+                    continue
+                self._refill(now)
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+    def block_for(self, seconds):
+        """429 / rateLimitExceeded 때 전체 요청을 잠시 멈춤"""
+        self.blocked_until = max(self.blocked_until, time.monotonic() + seconds)
+        self.tokens = 0.0
+
+    def exhaust(self):
+        """API 가 할당량 소진을 알려왔을 때 (이후 요청은 모두 QuotaExceeded)"""
+        self.exhausted = True
+
+
+# ================================
+# URL / 레코드 변환
+# ================================
+def extract_video_id(url):
+    """
+    유튜브 일반 영상 / 쇼츠 / youtu.be URL 또는 video_id 자체에서 video_id 추출 (못 찾으면 None)
+    """
+    url = url.strip()
+    if _VIDEO_ID.match(url):
+        return url
+
+    # 쿼리파라미터(?) 제거용
+    base = url.split("?")[0]
+
+    # shorts 형식: https://www.youtube.com/shorts/VIDEO_ID
+    if "shorts/" in base:
+        return base.split("shorts/")[1].strip("/") or None
+
+    # 짧은 주소: https://youtu.be/VIDEO_ID
+    if "youtu.be/" in base:
+        return base.split("youtu.be/")[1].strip("/") or None
+
+    # 일반 영상 형식: https://www.youtube.com/watch?v=VIDEO_ID
+    if "watch" in base and "v=" in url:
+        return url.split("v=")[1].split("&")[0] or None
+
+    return None
+
+
+def video_url(video_id):
+    return f"https://www.youtube.com/watch?v={video_id}"
+
+
+def comment_record(item, video_id, keyword="", title=""):
+    """commentThreads 응답 items[] 하나 → 레코드"""
+    snippet = item["snippet"]["topLevelComment"]["snippet"]
+    return {
+        "post_id": item["id"],
+        "source": SOURCE,
+        "keyword": keyword,
+        "title": title,
+        "content": snippet.get("textDisplay") or snippet.get("textOriginal") or "",
+        "date": snippet.get("publishedAt"),
+        "url": f"{video_url(video_id)}&lc={item['id']}",
+        "video_id": video_id,
+        "type": "comment",
+        "author": snippet.get("authorDisplayName"),
+        "like_count": snippet.get("likeCount"),
+    }
+
+
+def script_record(video_id, text, keyword="", title="", published_at=None):
+    """자막 전체 → 레코드 (영상당 1행)"""
+    return {
+        "post_id": f"{video_id}_script",
+        "source": SOURCE,
+        "keyword": keyword,
+        "title": title,
+        "content": text,
+        "date": published_at,
+        "url": video_url(video_id),
+        "video_id": video_id,
+        "type": "script",
+        "author": None,
+        "like_count": None,
+    }
+
+
+def fetch_full_transcript(video_id, languages=None):
+    """
+    youtube_transcript_api 의 api.fetch 로 전체 자막을 하나의 문자열로 합쳐서 반환 (비어 있으면 None)
+    자막이 없거나 받지 못하면 youtube_transcript_api 의 예외를 그대로 올림
+    """
+    from youtube_transcript_api import YouTubeTranscriptApi  # 자막을 받을 때만 필요
+
+    if languages is None:
+        languages = TRANSCRIPT_LANGUAGES
+    segments = YouTubeTranscriptApi().fetch(video_id, languages=languages)
+    texts = []
+    for seg in segments:
+        # 신버전은 FetchedTranscriptSnippet(.text), 구버전 / 녹화 데이터는 dict
+        text = seg.get("text") if isinstance(seg, dict) else getattr(seg, "text", "")
+        if text:
+            texts.append(text)
+    full_text = " ".join(texts)
+    return full_text if full_text.strip() else None
+
+
+# ================================
+# 상태 / 레코드 저장
+# ================================
+def quota_day():
+    """할당량 기준 날짜 (태평양 시간)"""
+    return datetime.now(QUOTA_TZ).strftime("%Y-%m-%d")
+
+
+def load_state(path):
+    """
+    {'quota': {'day', 'used'}, 'videos': {video_id: {'title', 'published_at', 'page_token',
+     'comments_done', 'comments', 'pages', 'transcript_done'}}}
+    """
+    state = {"quota": {"day": quota_day(), "used": 0}, "videos": {}}
+    if os.path.exists(path):
+        try:
+            with open(path, encoding="utf-8") as f:
+                state.update(json.load(f))
+        except (OSError, json.JSONDecodeError) as e:
+            print(f"⚠️ 상태 파일을 읽지 못했습니다 ({path}): {e} - 처음부터 수집")
+    if state["quota"].get("day") != quota_day():
+        state["quota"] = {"day": quota_day(), "used": 0}  # 날짜가 바뀌면 할당량 초기화
+    return state
+
+
+def save_state(state, path):
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(state, f, ensure_ascii=False, indent=1)
+    os.replace(tmp_path, path)
+
+
+def iter_records(path):
+    if not os.path.exists(path):
+        return
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError:
+                continue  # 쓰다가 끊긴 마지막 줄
+
+
+class JsonlSink:
+    """
+    레코드를 페이지 단위로 JSONL 에 추가 (post_id 중복은 건너뜀)
+
+    커서는 레코드를 디스크에 쓴 뒤에 저장하므로, 그 사이에 죽으면 같은 페이지를 한 번 더 받게 되고
+    그때 생기는 중복을 post_id 로 걸러냄.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.post_ids = {record.get("post_id") for record in iter_records(path)}
+        self.written = 0
+        if os.path.exists(path) and os.path.getsize(path):
+            with open(path, "rb+") as f:
+                # 쓰다가 끊긴 마지막 줄(개행 없음)은 잘라서 다음 레코드가 붙지 않게 함
+                f.seek(-1, os.SEEK_END)
+                if f.read(1) != b"\n":
+                    f.seek(0)
+                    data = f.read()
+                    f.truncate(data.rfind(b"\n") + 1)
+        self._file = open(path, "a", encoding="utf-8")
+
+    def write_many(self, records):
+        """새 레코드만 추가하고 디스크까지 기록, 추가한 건수 반환"""
+        new = [r for r in records if r["post_id"] not in self.post_ids]
+        if not new:
+            return 0
+        self._file.write("".join(json.dumps(r, ensure_ascii=False) + "\n" for r in new))
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self.post_ids.update(r["post_id"] for r in new)
+        self.written += len(new)
+        return len(new)
+
+    def close(self):
+        self._file.close()
+
+
+# ================================
+# API 호출
+# ================================
+def _error_reason(data):
+    error = (data or {}).get("error") or {}
+    errors = error.get("errors") or [{}]
+    return errors[0].get("reason", ""), error.get("message", "")
+
+
+async def api_get(session, limiter, endpoint, params, api_url=API_URL):
+    """
+    Data API GET (할당량 예약 → 요청 → JSON)
+    429 / 5xx / rateLimitExceeded 는 Retry-After(없으면 지수 백오프)만큼 전체를 멈추고 재시도,
+    quotaExceeded 는 QuotaExceeded, 나머지 오류는 YouTubeApiError
+    """
+    status, reason, message = None, "", ""
+    for attempt in range(MAX_RETRIES):
+        await limiter.acquire(QUOTA_COST.get(endpoint, 1))
+        try:
+            async with session.get(f"{api_url}/{endpoint}", params=params) as res:
+                status = res.status
+                retry_after = res.headers.get("Retry-After")
+                data = await res.json(content_type=None)
+        except (aiohttp.ClientError, asyncio.TimeoutError, json.JSONDecodeError) as e:
+            status, reason, message = None, type(e).__name__, str(e)
+            await asyncio.sleep(2 ** attempt)
+            continue
+
+        if status == 200:
+            return data
+        reason, message = _error_reason(data)
+        if reason in QUOTA_REASONS:
+            limiter.exhaust()
+            raise QuotaExceeded(message or reason)
+        if status == 429 or status >= 500 or reason in RATE_REASONS:
+            wait = float(retry_after) if retry_after else 2 ** attempt
+            print(f"  ⚠️ {endpoint} HTTP {status} {reason} → {wait:.0f}초 대기 후 재시도 ({attempt + 1}/{MAX_RETRIES})")
+            limiter.block_for(wait)
+            continue
+        raise YouTubeApiError(status, reason, message)
+    raise YouTubeApiError(status, reason or "retries", message or f"{MAX_RETRIES}번 재시도 실패")
+
+
+async def fetch_video_info(session, limiter, api_key, video_ids, api_url=API_URL):
+    """videos.list 로 제목 / 게시일 조회 (50개씩 1단위) → {video_id: {'title', 'published_at'}}"""
+    info = {}
+    for i in range(0, len(video_ids), 50):
+        batch = video_ids[i:i + 50]
+        data = await api_get(session, limiter, "videos",
+                             {"part": "snippet", "id": ",".join(batch), "key": api_key}, api_url)
+        for item in data.get("items", []):
+            snippet = item.get("snippet", {})
+            info[item["id"]] = {"title": snippet.get("title", ""), "published_at": snippet.get("publishedAt")}
+    return info
+
+
+class _Collector:
+    """한 번의 수집 실행에서 공유하는 세션 / 리미터 / 저장소 / 상태"""
+
+    def __init__(self, session, limiter, sink, state, state_file, api_key, keyword, api_url,
+                 transcript_fetcher, languages, transcript_concurrency):
+        self.session = session
+        self.limiter = limiter
+        self.sink = sink
+        self.state = state
+        self.state_file = state_file
+        self.api_key = api_key
+        self.keyword = keyword
+        self.api_url = api_url
+        self.transcript_fetcher = transcript_fetcher
+        self.languages = languages
+        self.transcript_semaphore = asyncio.Semaphore(transcript_concurrency)
+        self.stopped = False
+
+    def save(self):
+        self.state["quota"]["used"] = self.limiter.used
+        save_state(self.state, self.state_file)
+
+    async def comments(self, video_id):
+        """댓글 전체 페이지 수집 (저장된 nextPageToken 부터)"""
+        progress = self.state["videos"][video_id]
+        while not progress["comments_done"]:
+            params = {
+                "part": "snippet",
+                "videoId": video_id,
+                "maxResults": MAX_RESULTS,
+                "textFormat": "plainText",
+                "key": self.api_key,
+            }
+            if progress["page_token"]:
+                params["pageToken"] = progress["page_token"]
+            try:
+                data = await api_get(self.session, self.limiter, "commentThreads", params, self.api_url)
+            except YouTubeApiError as e:
+                if e.reason in SKIP_REASONS:
+                    print(f"⏭️ {video_id} 댓글 수집 불가 ({e.reason}) - 건너뜀")
+                    progress["comments_done"] = True
+                    self.save()
+                else:
+                    print(f"❌ {video_id} 댓글 수집 실패 (다음 실행 때 이어서): {e}")
+                return
+
+            records = [comment_record(item, video_id, self.keyword, progress["title"])
+                       for item in data.get("items", [])]
+            self.sink.write_many(records)
+            next_token = data.get("nextPageToken")
+            progress["page_token"] = next_token
+            progress["comments_done"] = not next_token or not records
+            progress["comments"] += len(records)
+            progress["pages"] += 1
+            self.save()
+        print(f"✅ {video_id} 댓글 {progress['comments']}개 ({progress['pages']}페이지)")
+
+    async def transcript(self, video_id):
+        progress = self.state["videos"][video_id]
+        if progress["transcript_done"]:
+            return
+        await self.limiter.acquire(0)
+        async with self.transcript_semaphore:
+            try:
+                text = await asyncio.to_thread(self.transcript_fetcher, video_id, self.languages)
+            except Exception as e:
+                if type(e).__name__ not in NO_TRANSCRIPT_ERRORS:
+                    print(f"⚠️ {video_id} 자막 수집 실패 (다음 실행 때 다시 시도): {type(e).__name__}: {e}")
+                    return
+                text = None
+        if text:
+            self.sink.write_many([script_record(video_id, text, self.keyword,
+                                                progress["title"], progress["published_at"])])
+            print(f"📜 {video_id} 스크립트 {len(text)}자")
+        else:
+            print(f"⚠️ {video_id} 스크립트 없음")
+        progress["transcript_done"] = True
+        self.save()
+
+    async def video(self, semaphore, video_id):
+        async with semaphore:
+            if self.stopped:
+                return
+            try:
+                await asyncio.gather(self.comments(video_id), self.transcript(video_id))
+            except QuotaExceeded as e:
+                if not self.stopped:
+                    print(f"\n⚠️ 할당량 소진 ({e}) - 진행 상황 저장 후 중단, 내일(태평양 시간 자정 이후) 다시 실행하면 이어서 수집")
+                self.stopped = True
+                self.save()
+
+
+async def collect_async(video_ids, api_key, keyword="", records_file=RECORDS_FILE, state_file=STATE_FILE,
+                        concurrency=VIDEO_CONCURRENCY, daily_quota=DAILY_QUOTA, rate=REQUESTS_PER_SEC,
+                        transcripts=True, transcript_fetcher=fetch_full_transcript,
+                        languages=TRANSCRIPT_LANGUAGES, transcript_concurrency=TRANSCRIPT_CONCURRENCY,
+                        api_url=API_URL):
+    """
+    여러 영상의 댓글 / 자막을 동시에 수집해서 records_file 에 추가
+
+    Returns:
+        {'videos', 'done', 'records', 'quota_used', 'complete'}
+    """
+    state = load_state(state_file)
+    videos = state["videos"]
+    for vid in video_ids:
+        videos.setdefault(vid, {"title": None, "published_at": None, "page_token": None, "comments_done": False,
+                                "comments": 0, "pages": 0, "transcript_done": not transcripts})
+        if not transcripts:
+            videos[vid]["transcript_done"] = True
+
+    def finished(vid):
+        return videos[vid]["comments_done"] and videos[vid]["transcript_done"]
+
+    pending = [vid for vid in video_ids if not finished(vid)]
+    skipped = len(video_ids) - len(pending)
+    if skipped:
+        print(f"⏭️ 이미 수집 완료된 영상 {skipped}개 건너뜀")
+
+    limiter = QuotaLimiter(rate, BURST, daily_quota, used=state["quota"]["used"])
+    sink = JsonlSink(records_file)
+    session = aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=REQUEST_TIMEOUT),
+                                    connector=aiohttp.TCPConnector(limit=concurrency * 2))
+    collector = _Collector(session, limiter, sink, state, state_file, api_key, keyword, api_url,
+                           transcript_fetcher, languages, transcript_concurrency)
+    try:
+        no_info = [vid for vid in pending if videos[vid]["title"] is None]
+        if no_info:
+            try:
+                info = await fetch_video_info(session, limiter, api_key, no_info, api_url)
+            except (QuotaExceeded, YouTubeApiError) as e:
+                print(f"⚠️ 영상 정보 조회 실패 (제목 / 게시일 없이 진행): {e}")
+                info = {}
+            for vid in no_info:
+                videos[vid].update(info.get(vid, {"title": "", "published_at": None}))
+        semaphore = asyncio.Semaphore(concurrency)
+        await asyncio.gather(*(collector.video(semaphore, vid) for vid in pending))
+    finally:
+        collector.save()
+        await session.close()
+        sink.close()
+
+    done = sum(1 for vid in video_ids if finished(vid))
+    print(f"\n📊 영상 {done}/{len(video_ids)}개 완료, 새 레코드 {sink.written}개, "
+          f"할당량 {limiter.used}/{daily_quota}단위 사용")
+    return {"videos": len(video_ids), "done": done, "records": sink.written,
+            "quota_used": limiter.used, "complete": done == len(video_ids)}
+
+
+def export_csv(records_file, csv_filename, video_ids=None):
+    """모은 레코드를 말뭉치 컬럼 CSV(utf-8-sig)로 정리 (video_ids 를 주면 그 영상만), 행 수 반환"""
+    wanted = set(video_ids) if video_ids is not None else None
+    tmp_filename = csv_filename + ".tmp"
+    rows = 0
+    with open(tmp_filename, "w", encoding="utf-8-sig", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=CSV_COLUMNS, extrasaction="ignore")
+        writer.writeheader()
+        for record in iter_records(records_file):
+            if wanted is None or record.get("video_id") in wanted:
+                writer.writerow(record)
+                rows += 1
+    os.replace(tmp_filename, csv_filename)
+    print(f"💾 CSV 저장 완료: {csv_filename} ({rows}행)")
+    return rows
+
+
+def collect_videos(urls, api_key, keyword="", out_dir=RESULT_DIR, csv_name=CSV_FILE, **kwargs):
+    """
+    URL(또는 video_id) 목록 수집 → out_dir 에 레코드 JSONL / 상태 파일 / CSV 저장
+
+    kwargs 는 collect_async 로 그대로 전달 (concurrency, daily_quota, transcripts ...)
+    """
+    video_ids = []
+    for url in urls:
+        vid = extract_video_id(url)
+        if vid is None:
+            print(f"⚠️ URL에서 video_id를 추출하지 못했습니다. 건너뜀: {url}")
+        elif vid not in video_ids:
+            video_ids.append(vid)
+    print(f"🎬 추출된 video_id {len(video_ids)}개")
+
+    os.makedirs(out_dir, exist_ok=True)
+    records_file = os.path.join(out_dir, RECORDS_FILE)
+    summary = asyncio.run(collect_async(video_ids, api_key, keyword, records_file,
+                                        os.path.join(out_dir, STATE_FILE), **kwargs))
+    summary["csv"] = os.path.join(out_dir, csv_name)
+    summary["rows"] = export_csv(records_file, summary["csv"], video_ids)
+    return summary
+
+
+def main():
+    parser = argparse.ArgumentParser(description="유튜브 댓글 + 자막 동시 수집")
+    parser.add_argument("urls", nargs="*", help="영상 URL 또는 video_id")
+    parser.add_argument("--url-file", help="URL 목록 파일 (한 줄에 하나)")
+    parser.add_argument("--api-key", default=os.environ.get(API_KEY_ENV), help=f"Data API 키 (기본: ${API_KEY_ENV})")
+    parser.add_argument("--keyword", default="", help="말뭉치 keyword 컬럼 값")
+    parser.add_argument("--out-dir", default=RESULT_DIR)
+    parser.add_argument("--concurrency", type=int, default=VIDEO_CONCURRENCY, help="동시에 처리할 영상 수")
+    parser.add_argument("--rate", type=float, default=REQUESTS_PER_SEC, help="초당 요청 수")
+    parser.add_argument("--quota", type=int, default=DAILY_QUOTA, help="하루 할당량(단위)")
+    parser.add_argument("--no-transcript", action="store_true", help="자막은 받지 않음")
+    parser.add_argument("--corpus-root", help="주면 CSV 를 corpus_storage 말뭉치(Parquet)에도 추가")
+    args = parser.parse_args()
+
+    urls = list(args.urls)
+    if args.url_file:
+        with open(args.url_file, encoding="utf-8") as f:
+            urls += [line.strip() for line in f if line.strip() and not line.startswith("#")]
+    if not urls:
+        parser.error("수집할 URL 이 없습니다.")
+    if not args.api_key:
+        parser.error(f"API 키가 없습니다. --api-key 또는 {API_KEY_ENV} 환경변수를 지정하세요.")
+
+    summary = collect_videos(urls, args.api_key, args.keyword, args.out_dir,
+                             concurrency=args.concurrency, rate=args.rate, daily_quota=args.quota,
+                             transcripts=not args.no_transcript)
+    if args.corpus_root and not summary["complete"]:
+        print("⏭️ 아직 남은 영상이 있어 말뭉치 저장은 모두 끝난 뒤에 합니다.")
+    elif args.corpus_root:
+        try:
+            import pandas as pd
+            # 저장소 루트에서 python -m 유튜브.youtube_collector 로 실행할 때
+            from corpus_storage import existing_post_ids, write_corpus
+        except ImportError:
+            print(f"⚠️ corpus_storage 를 찾지 못했습니다. 저장소 루트에서 다음으로 가져오세요:\n"
+                  f"   python corpus_storage.py import --source {SOURCE} --root {args.corpus_root} {summary['csv']}")
+        else:
+            # CSV 에는 URL 목록의 모든 영상이 들어 있으므로, 이전 실행에서 이미 말뭉치에 넣은 post_id 는 빼고 추가
+            df = pd.read_csv(summary["csv"], encoding="utf-8-sig", dtype=str)
+            df = df[~df["post_id"].isin(existing_post_ids(args.corpus_root, SOURCE))]
+            if df.empty:
+                print(f"⏭️ 말뭉치에 새로 추가할 레코드가 없습니다: {args.corpus_root}")
+            else:
+                print(f"✅ 말뭉치 저장: {args.corpus_root} ({write_corpus(df, root=args.corpus_root, source=SOURCE)}행)")
+    if not summary["complete"]:
+        print("⏭️ 남은 영상은 같은 명령으로 다시 실행하면 저장된 커서부터 이어서 수집합니다.")
+
+
+if __name__ == "__main__":
+    main()